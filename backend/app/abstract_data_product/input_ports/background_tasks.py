@@ -1,4 +1,6 @@
 import asyncio
+from datetime import date
+from typing import NamedTuple
 
 from sqlalchemy import select
 from sqlalchemy.orm import Session, selectinload
@@ -7,44 +9,78 @@ from app.abstract_data_product.input_ports.enums import InputPortStatus
 from app.abstract_data_product.input_ports.model import InputPort
 from app.core.context import close_event_context, open_event_context, pop_events
 from app.core.logging import logger
+from app.core.scheduler.scheduler import Job, every
+from app.core.webhooks.events import V2Event
 from app.core.webhooks.v2 import emit_all_events
 from app.database.database import SessionLocal
+from app.settings import settings
 
-CHECK_INTERVAL_SECONDS = 24 * 60 * 60
 
+class _ExpiryBatch(NamedTuple):
+    size: int
+    expired: int
+    events: list[V2Event]
 
-async def expire_input_ports(db: Session) -> None:
+
+def _expire_batch(db: Session) -> _ExpiryBatch:
+    # The status is recomputed against the current date as well, so every
+    # selected input port either expires or gets a later grant expiry.
+    today = date.today()
     token = open_event_context()
     try:
-        candidates = (
+        lapsed = (
             db.execute(
                 select(InputPort)
-                .where(InputPort.status == InputPortStatus.APPROVED)
+                .where(
+                    InputPort.status == InputPortStatus.APPROVED,
+                    InputPort.grant_expires_on < today,
+                )
+                .order_by(InputPort.grant_expires_on, InputPort.id)
+                .limit(settings.INPUT_PORT_EXPIRY_BATCH_SIZE)
                 .options(selectinload(InputPort.requests))
+                .with_for_update(of=InputPort, skip_locked=True)
             )
             .scalars()
             .unique()
             .all()
         )
-        for input_port in candidates:
+        expired = 0
+        for input_port in lapsed:
+            # A renewed grant keeps the input port approved, with a later expiry
             input_port.recompute_status()
             if input_port.status == InputPortStatus.EXPIRED:
+                expired += 1
                 logger.info(
                     f"[InputPort Expiry] Expired input port {input_port.id} "
                     f"for consuming data product {input_port.consuming_abstract_data_product_id}"
                 )
         db.commit()
-        events = pop_events()
+        return _ExpiryBatch(len(lapsed), expired, pop_events())
     finally:
         close_event_context(token)
-    await emit_all_events(events)
 
 
-async def expire_input_ports_task() -> None:
+async def expire_input_ports(db: Session) -> int:
+    """Recomputes the status of approved input ports whose grants lapsed before
+    today, a batch per transaction. Returns the number of expired input ports.
+    The batches are processed in a worker thread, their events sent from the loop.
+    """
+    expired = 0
     while True:
-        try:
-            with SessionLocal() as db:
-                await expire_input_ports(db)
-        except Exception as e:
-            logger.warning(f"[InputPort Expiry] Expiry check failed: {e}")
-        await asyncio.sleep(CHECK_INTERVAL_SECONDS)
+        batch = await asyncio.to_thread(_expire_batch, db)
+        expired += batch.expired
+        await emit_all_events(batch.events)
+        if batch.size < settings.INPUT_PORT_EXPIRY_BATCH_SIZE:
+            return expired
+
+
+async def expire_lapsed_input_ports() -> None:
+    with SessionLocal() as db:
+        await expire_input_ports(db)
+
+
+expire_input_ports_job = Job(
+    "expire_input_ports",
+    expire_lapsed_input_ports,
+    every(settings.INPUT_PORT_EXPIRY_INTERVAL_SECONDS),
+)
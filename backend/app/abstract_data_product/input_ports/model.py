@@ -9,8 +9,10 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     Text,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -44,6 +46,19 @@ class InputPort(
         Enum(InputPortStatus, native_enum=False),
         default=InputPortStatus.PENDING,
     )
+    # Last day of access under the current grants, None while a grant is permanent.
+    # Maintained by recompute_status, so lapsed grants are found with an index.
+    grant_expires_on: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+
+    __table_args__ = (
+        Index(
+            "idx_input_ports_grant_expires_on",
+            "grant_expires_on",
+            postgresql_where=text(
+                "status = 'APPROVED' AND grant_expires_on IS NOT NULL"
+            ),
+        ),
+    )
 
     consuming_abstract_data_product_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("abstract_data_products.id")
@@ -157,7 +172,22 @@ class InputPort(
         if self.status != status:
             self.status = status
 
+    def _grant_expiry(self) -> Optional[date]:
+        today = date.today()
+        grants = [
+            request
+            for request in self.requests
+            if request.decision == InputPortRequestDecision.APPROVED
+            and request.revoked_at is None
+            and (request.valid_from is None or request.valid_from <= today)
+            and (request.valid_until is None or request.valid_until >= today)
+        ]
+        if not grants or any(grant.valid_until is None for grant in grants):
+            return None
+        return max(grant.valid_until for grant in grants if grant.valid_until)
+
     def recompute_status(self) -> None:
+        self.grant_expires_on = self._grant_expiry()
         if self.active_grant is not None:
             self._set_status(InputPortStatus.APPROVED)
             return
@@ -3,10 +3,23 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query
 from pydantic.json_schema import SkipJsonSchema
+from sqlalchemy.orm import Session
 
-from app.authorization.schema_response import AccessResponse, IsAdminResponse
+from app.authorization.schema_request import AccessBatchRequest
+from app.authorization.schema_response import (
+    AccessBatchResponse,
+    AccessResponse,
+    IsAdminResponse,
+)
 from app.core.auth.auth import get_authenticated_user
 from app.core.authz import Action, Authorization
+from app.core.authz.resolvers import (
+    DataProductResolver,
+    DatasetResolver,
+    EmptyResolver,
+    SubjectResolver,
+)
+from app.database.database import get_db_session
 from app.users.schema import User
 
 router = APIRouter(tags=["Authorization"], prefix="/v2/authz")
@@ -46,6 +59,34 @@ def check_access(
     return AccessResponse(allowed=result)
 
 
+@router.post("/access/{action}/batch")
+def check_access_batch(
+    action: Action,
+    request: AccessBatchRequest,
+    user: User = Depends(get_authenticated_user),
+    db: Session = Depends(get_db_session),
+) -> AccessBatchResponse:
+    """Checks the access of the requesting user to many resources at once.
+    The domains of the resources are looked up based on the action.
+    """
+    resources = [str(resource) for resource in request.resources]
+    domains = _resolver_for(action).resolve_domains(db, resources)
+
+    authorizer = Authorization()
+    result = authorizer.has_access_many(sub=str(user.id), objects=domains, act=action)
+    return AccessBatchResponse(
+        allowed={resource: result[str(resource)] for resource in request.resources}
+    )
+
+
+def _resolver_for(action: Action) -> type[SubjectResolver]:
+    if action.name.startswith("DATA_PRODUCT__"):
+        return DataProductResolver
+    if action.name.startswith("OUTPUT_PORT__"):
+        return DatasetResolver
+    return EmptyResolver
+
+
 @router.get(
     "/admin",
 )
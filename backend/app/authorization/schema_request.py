@@ -0,0 +1,7 @@
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class AccessBatchRequest(BaseModel):
+    resources: list[UUID] = Field(max_length=1000)
@@ -1,4 +1,5 @@
 from typing import Optional
+from uuid import UUID
 
 from pydantic import BaseModel
 
@@ -7,6 +8,10 @@ class AccessResponse(BaseModel):
     allowed: bool
 
 
+class AccessBatchResponse(BaseModel):
+    allowed: dict[UUID, bool]
+
+
 class IsAdminResponse(BaseModel):
     is_admin: bool
     time: Optional[str] = None
@@ -1,32 +1,34 @@
-from typing import TYPE_CHECKING
+from itertools import batched
+from typing import TYPE_CHECKING, Iterator
 
 from casbin_sqlalchemy_adapter import Adapter, CasbinRule
-from sqlalchemy import delete, func, select
+from sqlalchemy import delete, func, insert, select
 from sqlalchemy.orm import Session
 
-from app.authorization.role_assignments.data_product.auth import (
-    DataProductAuthAssignment,
-)
-from app.authorization.role_assignments.data_product.service import (
-    RoleAssignmentService as DataProductRoleAssignmentService,
+from app.authorization.role_assignments.data_product.model import (
+    DataProductRoleAssignment,
 )
 from app.authorization.role_assignments.enums import DecisionStatus
-from app.authorization.role_assignments.global_.auth import GlobalAuthAssignment
-from app.authorization.role_assignments.global_.service import (
-    RoleAssignmentService as GlobalRoleAssignmentService,
-)
-from app.authorization.role_assignments.output_port.auth import DatasetAuthAssignment
-from app.authorization.role_assignments.output_port.service import (
-    RoleAssignmentService as DatasetRoleAssignmentService,
+from app.authorization.role_assignments.global_.model import GlobalRoleAssignment
+from app.authorization.role_assignments.output_port.model import (
+    DatasetRoleAssignment,
 )
-from app.authorization.roles.auth import AuthRole
-from app.authorization.roles.service import RoleService
+from app.authorization.roles import ADMIN_UUID
+from app.authorization.roles.model import Role
+from app.authorization.roles.schema import Prototype
 from app.core.authz import Authorization
 from app.core.logging import logger
 
 if TYPE_CHECKING:
     from casbin import Enforcer
 
+Rule = tuple[str, ...]
+
+RULE_FIELDS = ("v0", "v1", "v2", "v3", "v4", "v5")
+# Only one replica at a time synchronises the casbin table
+SYNC_LOCK_ID = 0x0CA5B2
+SYNC_BATCH_SIZE = 5000
+
 
 class AuthorizationService:
     def __init__(self, db: Session) -> None:
@@ -34,34 +36,85 @@ class AuthorizationService:
         self.authorizer = Authorization()
 
     def reload_enforcer(self) -> None:
-        removed = self._clear_casbin_table()
-        logger.info(f"Removed {removed} rows from the casbin table")
-
-        changed_roles, total_roles = self._sync_roles()
-        logger.info(f"Synced {changed_roles}/{total_roles} roles to the casbin table")
-
-        changed_product_a, total_product_a = self._sync_product_assignments()
-        logger.info(
-            f"Synced {changed_product_a}/{total_product_a}"
-            " product assignments to the casbin table"
-        )
+        """Brings the casbin table in line with the roles and role assignments.
+        Only the rules that differ are deleted or inserted, in bulk.
+        """
+        if not self.db.scalar(select(func.pg_try_advisory_xact_lock(SYNC_LOCK_ID))):
+            logger.info("Another replica is syncing the casbin table, waiting")
+            self.db.execute(select(func.pg_advisory_xact_lock(SYNC_LOCK_ID)))
+            self.db.commit()
+            self.authorizer.reload_policy()
+            return
+
+        desired = set(self._desired_rules())
+        existing: dict[Rule, int] = {}
+        stale: list[int] = []
+        for row in self.db.execute(
+            select(
+                CasbinRule.id,
+                CasbinRule.ptype,
+                *(getattr(CasbinRule, field) for field in RULE_FIELDS),
+            )
+        ):
+            rule = self._trim((row.ptype, *row[2:]))
+            if rule in desired and rule not in existing:
+                existing[rule] = row.id
+            else:
+                stale.append(row.id)
+        missing = [rule for rule in desired if rule not in existing]
+
+        for ids in batched(stale, SYNC_BATCH_SIZE):
+            self.db.execute(delete(CasbinRule).where(CasbinRule.id.in_(ids)))
+        for rules in batched(missing, SYNC_BATCH_SIZE):
+            self.db.execute(
+                insert(CasbinRule),
+                [
+                    {"ptype": ptype, **dict(zip(RULE_FIELDS, values))}
+                    for ptype, *values in rules
+                ],
+            )
+        self.db.commit()
+        self.authorizer.reload_policy()
 
-        changed_dataset_a, total_dataset_a = self._sync_dataset_assignments()
         logger.info(
-            f"Synced {changed_dataset_a}/{total_dataset_a}"
-            " dataset assignments to the casbin table"
+            f"Authorization reload done - removed {len(stale)} and added"
+            f" {len(missing)} rows, the casbin table now contains"
+            f" {len(desired)} rows"
         )
 
-        changed_global_a, total_global_a = self._sync_global_assignments()
-        logger.info(
-            f"Synced {changed_global_a}/{total_global_a}"
-            " global assignments to the casbin table"
-        )
+    def _desired_rules(self) -> Iterator[Rule]:
+        for role_id, prototype, permissions in self.db.execute(
+            select(Role.id, Role.prototype, Role.permissions)
+        ):
+            subject = "*" if prototype == Prototype.EVERYONE else str(role_id)
+            for action in permissions or ():
+                yield "p", subject, str(action)
+
+        for assignment, resource_id in (
+            (DataProductRoleAssignment, DataProductRoleAssignment.data_product_id),
+            (DatasetRoleAssignment, DatasetRoleAssignment.output_port_id),
+        ):
+            for user_id, role_id, resource in self.db.execute(
+                select(assignment.user_id, assignment.role_id, resource_id)
+                .where(assignment.decision == DecisionStatus.APPROVED)
+                .where(assignment.role_id.is_not(None))
+            ):
+                yield "g", str(user_id), str(role_id), str(resource)
+
+        for user_id, role_id in self.db.execute(
+            select(GlobalRoleAssignment.user_id, GlobalRoleAssignment.role_id)
+            .where(GlobalRoleAssignment.decision == DecisionStatus.APPROVED)
+            .where(GlobalRoleAssignment.role_id.is_not(None))
+        ):
+            yield "g3", str(user_id), "*" if role_id == ADMIN_UUID else str(role_id)
 
-        logger.info(
-            "Authorization reload done - the casbin table"
-            f" now contains {self._casbin_row_count(self.db)} rows"
-        )
+    @staticmethod
+    def _trim(rule: tuple) -> Rule:
+        """Rules are stored with trailing empty values, which casbin ignores."""
+        values = list(rule)
+        while values and values[-1] in (None, ""):
+            values.pop()
+        return tuple(values)
 
     @classmethod
     def _clear_casbin_table(cls) -> int:
@@ -73,6 +126,9 @@ class AuthorizationService:
         adapter: Adapter = enforcer.adapter
 
         enforcer.clear_policy()
+        # Clearing the policy keeps the role links, these are rebuilt from scratch
+        enforcer.build_role_links()
+        authorizer._after_update()
         with adapter._session_scope() as session:
             count = cls._casbin_row_count(session)
             session.execute(delete(CasbinRule))
@@ -81,49 +137,3 @@ class AuthorizationService:
     @staticmethod
     def _casbin_row_count(session: Session) -> int:
         return session.scalar(select(func.count()).select_from(CasbinRule))
-
-    def _sync_roles(self) -> tuple[int, int]:
-        service = RoleService(self.db)
-        roles = service.get_roles()
-
-        changes = 0
-        for role in roles:
-            if AuthRole(role).sync():
-                changes += 1
-        return changes, len(roles)
-
-    def _sync_product_assignments(self) -> tuple[int, int]:
-        service = DataProductRoleAssignmentService(self.db)
-        product_assignments = service.list_assignments(
-            data_product_id=None, user_id=None, decision=DecisionStatus.APPROVED
-        )
-
-        changes = 0
-        for assignment in product_assignments:
-            if DataProductAuthAssignment(assignment).add():
-                changes += 1
-        return changes, len(product_assignments)
-
-    def _sync_dataset_assignments(self) -> tuple[int, int]:
-        service = DatasetRoleAssignmentService(self.db)
-        dataset_assignments = service.list_assignments(
-            dataset_id=None, user_id=None, decision=DecisionStatus.APPROVED
-        )
-
-        changes = 0
-        for assignment in dataset_assignments:
-            if DatasetAuthAssignment(assignment).add():
-                changes += 1
-        return changes, len(dataset_assignments)
-
-    def _sync_global_assignments(self) -> tuple[int, int]:
-        service = GlobalRoleAssignmentService(self.db)
-        global_assignments = service.list_assignments(
-            user_id=None, decision=DecisionStatus.APPROVED
-        )
-
-        changes = 0
-        for assignment in global_assignments:
-            if GlobalAuthAssignment(assignment).add():
-                changes += 1
-        return changes, len(global_assignments)
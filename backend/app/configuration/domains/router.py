@@ -7,6 +7,7 @@ from app.configuration.domains.schema_request import DomainCreate, DomainUpdate
 from app.configuration.domains.schema_response import (
     CreateDomainResponse,
     GetDomainResponse,
+    GetDomainsItem,
     GetDomainsResponse,
     UpdateDomainResponse,
 )
@@ -14,6 +15,7 @@ from app.configuration.domains.service import DomainService
 from app.core.authz import Action, Authorization
 from app.core.authz.resolvers import EmptyResolver
 from app.database.database import get_db_session
+from app.shared.pagination import PageParams, list_response, page_params
 
 router = APIRouter(tags=["Configuration - Domains"], prefix="/v2/configuration/domains")
 
@@ -81,9 +83,17 @@ def migrate_domain(
 
 
 @router.get("")
-def get_domains(db: Session = Depends(get_db_session)) -> GetDomainsResponse:
-    return GetDomainsResponse(
-        domains=DomainService(db).get_domains(),
+def get_domains(
+    db: Session = Depends(get_db_session),
+    page: PageParams = Depends(page_params),
+) -> GetDomainsResponse:
+    return list_response(
+        page,
+        DomainService(db).get_domains_page,
+        GetDomainsResponse,
+        "domains",
+        GetDomainsItem,
+        db,
     )
 
 
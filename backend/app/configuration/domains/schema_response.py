@@ -1,6 +1,7 @@
 from typing import Sequence
 from uuid import UUID
 
+from app.shared.pagination import PaginatedResponse
 from app.shared.schema import ORMModel
 
 
@@ -18,7 +19,7 @@ class GetDomainsItem(BaseDomainGet):
     abstract_data_product_count: int
 
 
-class GetDomainsResponse(ORMModel):
+class GetDomainsResponse(PaginatedResponse):
     domains: Sequence[GetDomainsItem]
 
 
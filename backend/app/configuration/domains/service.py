@@ -1,4 +1,4 @@
-from typing import Sequence
+from typing import Optional, Sequence
 from uuid import UUID
 
 from fastapi import HTTPException, status
@@ -14,6 +14,10 @@ from app.configuration.domains.schema_response import (
     GetDomainsItem,
     UpdateDomainResponse,
 )
+from app.shared.pagination import Keyset, Page, PageRequest
+from app.shared.search import keyword_document, keyword_query, keyword_score
+
+_keyset = Keyset(DomainModel.name, DomainModel.id)
 
 
 class DomainService:
@@ -21,17 +25,28 @@ class DomainService:
         self.db = db
 
     def get_domains(self) -> Sequence[GetDomainsItem]:
-        return (
-            self.db.scalars(
-                select(DomainModel)
-                .options(
-                    undefer(DomainModel.abstract_data_product_count),
-                )
-                .order_by(DomainModel.name)
-            )
-            .unique()
-            .all()
+        return self.get_domains_page(PageRequest()).items
+
+    def get_domains_page(self, page: PageRequest) -> Page[DomainModel]:
+        return _keyset.fetch(
+            self.db,
+            select(DomainModel).options(
+                undefer(DomainModel.abstract_data_product_count),
+            ),
+            page,
+        )
+
+    def search_domains(self, query: Optional[str], limit: int) -> Sequence[DomainModel]:
+        """Best keyword matches first, or all domains by name without a query."""
+        stmt = select(DomainModel).options(
+            undefer(DomainModel.abstract_data_product_count),
         )
+        ordered_by = [DomainModel.name.asc(), DomainModel.id]
+        if (ts_query := keyword_query(query)) is not None:
+            document = keyword_document(DomainModel.name, DomainModel.description)
+            stmt = stmt.where(document.op("@@")(ts_query))
+            ordered_by.insert(0, keyword_score(document, ts_query).desc())
+        return self.db.scalars(stmt.order_by(*ordered_by).limit(limit)).all()
 
     def get_domain(self, id: UUID) -> GetDomainResponse:
         domain = self.db.get(
@@ -1,12 +1,19 @@
+import hashlib
 import json
+import threading
+import time
+from typing import Any, Optional
 
+import httpx
 import jwt
+from cachetools import TTLCache
 from jwt.algorithms import RSAAlgorithm
 from jwt.exceptions import ExpiredSignatureError, PyJWTError
 from pydantic import BaseModel
 
 from app.core.auth.oidc import OIDCConfiguration
 from app.core.logging import logger
+from app.settings import settings
 
 oidc = OIDCConfiguration()
 
@@ -20,6 +27,125 @@ class JWTToken(BaseModel):
     token: str
 
 
+class JWKSCache:
+    """The public signing keys of the identity provider, parsed once per key id.
+
+    The key set is refetched once it is older than the TTL, or when a token is
+    signed with an unknown key id after a key rotation. There is at most one
+    refetch per refresh interval, so forged tokens cannot flood the identity
+    provider. A single thread refetches, outside the lock, while the others keep
+    being served the current keys.
+    """
+
+    def __init__(self) -> None:
+        self._keys: dict[str, Any] = {}
+        self._fetched_at: Optional[float] = None
+        self._attempted_at: Optional[float] = None
+        self._refreshing = False
+        self._lock = threading.Lock()
+
+    def get_key(self, kid: str) -> Optional[Any]:
+        with self._lock:
+            now = time.monotonic()
+            if self._fetched_at is None:
+                self._load(get_oidc().jwks_keys, now)
+                fetched_at = now
+            else:
+                fetched_at = self._fetched_at
+            refresh = (
+                not self._refreshing
+                and self._may_refresh(now)
+                and (
+                    kid not in self._keys
+                    or now - fetched_at >= settings.OIDC_JWKS_CACHE_TTL_SECONDS
+                )
+            )
+            if not refresh:
+                return self._keys.get(kid)
+            self._refreshing = True
+            self._attempted_at = now
+
+        jwks: Optional[dict[str, Any]] = None
+        try:
+            jwks = self._fetch()
+        finally:
+            with self._lock:
+                self._refreshing = False
+                if jwks is not None:
+                    self._load(jwks, now)
+                key = self._keys.get(kid)
+        return key
+
+    def clear(self) -> None:
+        with self._lock:
+            self._keys = {}
+            self._fetched_at = None
+            self._attempted_at = None
+
+    def _may_refresh(self, now: float) -> bool:
+        return (
+            self._attempted_at is None
+            or now - self._attempted_at >= settings.OIDC_JWKS_REFRESH_INTERVAL_SECONDS
+        )
+
+    @staticmethod
+    def _fetch() -> Optional[dict[str, Any]]:
+        try:
+            return httpx.get(
+                url=get_oidc().jwks_uri,
+                timeout=settings.OIDC_JWKS_FETCH_TIMEOUT_SECONDS,
+            ).json()
+        except Exception as e:
+            logger.warning(f"Could not refresh the JWKS signing keys: {e}")
+            return None
+
+    def _load(self, jwks: dict[str, Any], now: float) -> None:
+        self._keys = {
+            jwk["kid"]: RSAAlgorithm.from_jwk(json.dumps(jwk)) for jwk in jwks["keys"]
+        }
+        self._fetched_at = now
+
+
+class VerifiedTokenCache:
+    """The claims of recently verified tokens, keyed by the hash of the token.
+    Claims are never returned after the token expired.
+    """
+
+    def __init__(self) -> None:
+        self._claims: TTLCache[str, dict[str, Any]] = TTLCache(
+            maxsize=settings.OIDC_TOKEN_CACHE_SIZE,
+            ttl=settings.OIDC_TOKEN_CACHE_TTL_SECONDS,
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: bytes) -> str:
+        return hashlib.sha256(token).hexdigest()
+
+    def get(self, token: bytes) -> Optional[dict[str, Any]]:
+        key = self._key(token)
+        with self._lock:
+            claims = self._claims.get(key)
+            if claims is not None and claims.get("exp", 0) <= time.time():
+                del self._claims[key]
+                return None
+        return claims
+
+    def put(self, token: bytes, claims: dict[str, Any]) -> None:
+        if "exp" not in claims:
+            return
+        with self._lock:
+            self._claims[self._key(token)] = claims
+
+    def clear(self) -> None:
+        with self._lock:
+            self._claims.clear()
+
+
+jwks_cache = JWKSCache()
+verified_tokens = VerifiedTokenCache()
+
+
 class JWTTokenValid:
     def __init__(self, token: str):
         self.oidc = get_oidc()
@@ -30,16 +156,15 @@ class JWTTokenValid:
     def is_valid(self) -> bool:
         verifiable_token = bytes(self.token[len("Bearer ") :], encoding="utf-8")
 
-        public_keys = {}
-        for jwk in self.oidc.jwks_keys["keys"]:
-            kid = jwk["kid"]
-            public_keys[kid] = RSAAlgorithm.from_jwk(json.dumps(jwk))
+        if (claims := verified_tokens.get(verifiable_token)) is not None:
+            self.valid_jwt_token = claims
+            return True
 
-        kid = jwt.get_unverified_header(verifiable_token)["kid"]
         try:
+            kid = jwt.get_unverified_header(verifiable_token)["kid"]
             self.valid_jwt_token = jwt.decode(
                 jwt=verifiable_token,
-                key=public_keys[kid],
+                key=jwks_cache.get_key(kid),
                 algorithms=["RS256"],
                 issuer=self.oidc.authority,
                 audience=self.oidc.audience,
@@ -53,4 +178,5 @@ class JWTTokenValid:
         except Exception as e:
             self.logger.debug("Generic exception: Problem parsing jwt token", e)
             return False
+        verified_tokens.put(verifiable_token, self.valid_jwt_token)
         return True
@@ -1,12 +1,26 @@
+import functools
+import threading
 from pathlib import Path
-from typing import Awaitable, Callable, Sequence, TypeAlias, Union
+from typing import (
+    Awaitable,
+    Callable,
+    Concatenate,
+    Mapping,
+    Optional,
+    ParamSpec,
+    Sequence,
+    TypeAlias,
+    TypeVar,
+    Union,
+)
 from uuid import UUID
 
 import casbin_sqlalchemy_adapter as sqlalchemy_adapter
-from cachetools import Cache, LRUCache, cachedmethod
 from casbin import Enforcer
+from casbin.model.policy_op import PolicyOp
 from fastapi import Depends, HTTPException, Request, status
 from opentelemetry import trace
+from sqlalchemy import create_engine
 from sqlalchemy.orm import Session
 
 from app.core.auth.auth import get_authenticated_user
@@ -16,30 +30,59 @@ from app.settings import settings
 from app.users.schema import User
 from app.utils.singleton import Singleton
 
+from . import policy_changes
 from .actions import AuthorizationAction
+from .cache import Decision, DecisionCache
+from .context import get_request_decisions
+from .policy_changes import PolicyChange
 from .resolvers import SubjectResolver
 
 ID: TypeAlias = Union[str, UUID]
+P = ParamSpec("P")
+R = TypeVar("R")
+
+MODEL_LOCATION = Path(__file__).parent / "rbac_model.conf"
 
 tracer = trace.get_tracer(__name__)
 
 
+def _changes_policy(
+    method: Callable[Concatenate["Authorization", P], R],
+) -> Callable[Concatenate["Authorization", P], R]:
+    """Keeps local changes from being made while the policy is reloaded,
+    they would otherwise be lost when the reloaded enforcer is swapped in.
+    """
+
+    @functools.wraps(method)
+    def inner(self: "Authorization", *args: P.args, **kwargs: P.kwargs) -> R:
+        with self._policy_lock:
+            return method(self, *args, **kwargs)
+
+    return inner
+
+
 class Authorization(metaclass=Singleton):
     def __init__(self) -> None:
         self._enforcer: Enforcer = self._initialize()
-        self._cache: Cache = LRUCache(maxsize=settings.AUTHORIZER_CACHE_SIZE)
+        self._cache = DecisionCache(maxsize=settings.AUTHORIZER_CACHE_SIZE)
+        self._policy_lock = threading.RLock()
 
     @classmethod
     def _initialize(cls) -> Enforcer:
-        model_location = Path(__file__).parent / "rbac_model.conf"
-        enforcer = cls._construct_enforcer(str(model_location))
+        enforcer = cls._construct_enforcer(str(MODEL_LOCATION))
         enforcer.load_policy()
         return enforcer
 
     @staticmethod
     def _construct_enforcer(model: str) -> Enforcer:
         """Initializes the casbin table in the DB and constructs the enforcer."""
-        adapter = sqlalchemy_adapter.Adapter(database.get_url())
+        engine = create_engine(
+            database.get_url(),
+            connect_args={"application_name": policy_changes.ORIGIN},
+        )
+        adapter = sqlalchemy_adapter.Adapter(engine)
+        if settings.AUTHORIZER_CHANGE_NOTIFICATIONS:
+            policy_changes.install_change_notifications(engine)
         return Enforcer(model, adapter)
 
     @classmethod
@@ -71,13 +114,87 @@ class Authorization(metaclass=Singleton):
 
         return inner
 
-    @cachedmethod(lambda self: self._cache)
     def has_access(
         self, *, sub: str, dom: str, obj: str, act: AuthorizationAction
     ) -> bool:
+        key = Decision(str(sub), str(dom), str(obj), str(act))
+        generation = self._cache.generation
+        if (decision := self._lookup(key, generation)) is not None:
+            return decision
+
         with tracer.start_as_current_span("has_access"):
             enforcer: Enforcer = self._enforcer
-            return enforcer.enforce(sub, dom, obj, str(act))
+            decision = enforcer.enforce(key.sub, key.dom, key.obj, key.act)
+        self._store(key, decision, generation)
+        return decision
+
+    def has_access_many(
+        self, *, sub: str, objects: Mapping[str, str], act: AuthorizationAction
+    ) -> dict[str, bool]:
+        """Determines for each object, mapped to its domain, whether the subject
+        can perform the action. The decisions that are not cached yet are made
+        together, in a single pass over the role assignments of the subject.
+        """
+        generation = self._cache.generation
+        decisions: dict[str, bool] = {}
+        pending: dict[str, Decision] = {}
+        for obj, dom in objects.items():
+            key = Decision(str(sub), str(dom), str(obj), str(act))
+            if (decision := self._lookup(key, generation)) is not None:
+                decisions[obj] = decision
+            else:
+                pending[obj] = key
+        if not pending:
+            return decisions
+
+        with tracer.start_as_current_span("has_access_many"):
+            allowed_everywhere, resources, domains = self._grants(str(sub), str(act))
+        for obj, key in pending.items():
+            decision = allowed_everywhere or key.obj in resources or key.dom in domains
+            self._store(key, decision, generation)
+            decisions[obj] = decision
+        return decisions
+
+    def _grants(self, sub: str, act: str) -> tuple[bool, set[str], set[str]]:
+        """Evaluates the matcher of the model for every object at once. Returns
+        whether the action is allowed on all objects, and otherwise on which
+        resources and in which domains the subject holds a role allowing it.
+        """
+        enforcer: Enforcer = self._enforcer
+        roles = {rule[0] for rule in enforcer.get_filtered_policy(1, act)}
+        global_roles = {
+            rule[1]
+            for rule in enforcer.get_filtered_named_grouping_policy("g3", 0, sub)
+        }
+        if "*" in roles or "*" in global_roles or roles & global_roles:
+            return True, set(), set()
+
+        resources = {
+            rule[2]
+            for rule in enforcer.get_filtered_named_grouping_policy("g", 0, sub)
+            if rule[1] in roles
+        }
+        domains = {
+            rule[2]
+            for rule in enforcer.get_filtered_named_grouping_policy("g2", 0, sub)
+            if rule[1] in roles
+        }
+        return False, resources, domains
+
+    def _lookup(self, key: Decision, generation: int) -> Optional[bool]:
+        request_decisions = get_request_decisions()
+        if request_decisions is None:
+            return self._cache.lookup(key)
+        if (decision := request_decisions.get(key, generation)) is None:
+            decision = self._cache.lookup(key)
+            if decision is not None:
+                request_decisions.store(key, decision, generation)
+        return decision
+
+    def _store(self, key: Decision, decision: bool, generation: int) -> None:
+        if (request_decisions := get_request_decisions()) is not None:
+            request_decisions.store(key, decision, generation)
+        self._cache.store(key, decision, generation)
 
     def _after_update(self) -> None:
         """The cache should be purged when the casbin database is altered,
@@ -85,16 +202,71 @@ class Authorization(metaclass=Singleton):
         """
         self._cache.clear()
 
+    def _invalidate(self, ptype: str, rule: Sequence[str]) -> None:
+        """Evicts the cached decisions a single changed policy rule can affect."""
+        if ptype == "p":
+            self._cache.invalidate(act=rule[1])
+        elif ptype == "g":
+            self._cache.invalidate(sub=rule[0], obj=rule[2])
+        elif ptype == "g2":
+            self._cache.invalidate(sub=rule[0], dom=rule[2])
+        elif ptype == "g3":
+            self._cache.invalidate(sub=rule[0])
+        else:
+            self._after_update()
+
+    @_changes_policy
+    def reload_policy(self) -> None:
+        """Reloads the complete policy from the casbin table.
+
+        The policy is loaded into a new enforcer, which replaces the current one
+        once it is complete: casbin clears the policy and role links in place when
+        reloading, so decisions made meanwhile could be denied.
+        """
+        self._enforcer = Enforcer(str(MODEL_LOCATION), self._enforcer.adapter)
+        self._after_update()
+
+    @_changes_policy
+    def apply_policy_change(self, change: PolicyChange) -> bool:
+        """Applies a change another replica made to the casbin table,
+        without reloading the complete policy.
+        """
+        if change.origin == policy_changes.ORIGIN:
+            return False
+
+        enforcer: Enforcer = self._enforcer
+        if change.op == "INSERT":
+            op = PolicyOp.Policy_add
+            updated = enforcer.model.add_policy(
+                change.section, change.ptype, change.rule
+            )
+        else:
+            op = PolicyOp.Policy_remove
+            updated = enforcer.model.remove_policy(
+                change.section, change.ptype, change.rule
+            )
+
+        if updated and change.section == "g":
+            enforcer.model.build_incremental_role_links(
+                enforcer.rm_map[change.ptype], op, "g", change.ptype, [change.rule]
+            )
+        if updated:
+            self._invalidate(change.ptype, change.rule)
+        return updated
+
+    @_changes_policy
     def sync_role_permissions(
         self, *, role_id: ID, actions: Sequence[AuthorizationAction]
     ) -> bool:
         """Creates or updates the permissions for the chosen role."""
         enforcer: Enforcer = self._enforcer
+        removed = enforcer.get_filtered_policy(0, str(role_id))
         enforcer.remove_filtered_policy(0, role_id)
 
         policies = [(str(role_id), str(action)) for action in actions]
         updated = enforcer.add_policies(policies)
-        self._after_update()
+        for rule in {tuple(rule) for rule in removed}.symmetric_difference(policies):
+            self._invalidate("p", rule)
         return updated
 
     def sync_everyone_role_permissions(
@@ -107,6 +279,7 @@ class Authorization(metaclass=Singleton):
         """Removes all the permissions for the chosen role."""
         return self.sync_role_permissions(role_id=role_id, actions=())
 
+    @_changes_policy
     def assign_resource_role(
         self, *, user_id: ID, role_id: ID, resource_id: ID
     ) -> bool:
@@ -116,9 +289,11 @@ class Authorization(metaclass=Singleton):
         updated = enforcer.add_named_grouping_policy(
             "g", str(user_id), str(role_id), str(resource_id)
         )
-        self._after_update()
+        if updated:
+            self._invalidate("g", [str(user_id), str(role_id), str(resource_id)])
         return updated
 
+    @_changes_policy
     def revoke_resource_role(
         self, *, user_id: ID, role_id: ID, resource_id: ID
     ) -> bool:
@@ -128,7 +303,8 @@ class Authorization(metaclass=Singleton):
         updated = enforcer.remove_named_grouping_policy(
             "g", str(user_id), str(role_id), str(resource_id)
         )
-        self._after_update()
+        if updated:
+            self._invalidate("g", [str(user_id), str(role_id), str(resource_id)])
         return updated
 
     def has_resource_role(self, *, user_id: ID, role_id: ID, resource_id: ID) -> bool:
@@ -138,6 +314,7 @@ class Authorization(metaclass=Singleton):
             "g", str(user_id), str(role_id), str(resource_id)
         )
 
+    @_changes_policy
     def assign_domain_role(self, *, user_id: ID, role_id: ID, domain_id: ID) -> bool:
         """Creates an entry in the casbin table,
         assigning the user a role for the chosen domain."""
@@ -145,9 +322,11 @@ class Authorization(metaclass=Singleton):
         updated = enforcer.add_named_grouping_policy(
             "g2", str(user_id), str(role_id), str(domain_id)
         )
-        self._after_update()
+        if updated:
+            self._invalidate("g2", [str(user_id), str(role_id), str(domain_id)])
         return updated
 
+    @_changes_policy
     def revoke_domain_role(self, *, user_id: ID, role_id: ID, domain_id: ID) -> bool:
         """Deletes the entry in the casbin table,
         revoking the role for the chosen domain and user."""
@@ -155,7 +334,8 @@ class Authorization(metaclass=Singleton):
         updated = enforcer.remove_named_grouping_policy(
             "g2", str(user_id), str(role_id), str(domain_id)
         )
-        self._after_update()
+        if updated:
+            self._invalidate("g2", [str(user_id), str(role_id), str(domain_id)])
         return updated
 
     def has_domain_role(self, *, user_id: ID, role_id: ID, domain_id: ID) -> bool:
@@ -165,14 +345,17 @@ class Authorization(metaclass=Singleton):
             "g2", str(user_id), str(role_id), str(domain_id)
         )
 
+    @_changes_policy
     def assign_global_role(self, *, user_id: ID, role_id: ID) -> bool:
         """Creates an entry in the casbin table,
         assigning the user the chosen global role."""
         enforcer: Enforcer = self._enforcer
         updated = enforcer.add_named_grouping_policy("g3", str(user_id), str(role_id))
-        self._after_update()
+        if updated:
+            self._invalidate("g3", [str(user_id), str(role_id)])
         return updated
 
+    @_changes_policy
     def revoke_global_role(self, *, user_id: ID, role_id: ID) -> bool:
         """Deletes the entry in the casbin table,
         revoking the chosen global role for the user."""
@@ -180,7 +363,8 @@ class Authorization(metaclass=Singleton):
         updated = enforcer.remove_named_grouping_policy(
             "g3", str(user_id), str(role_id)
         )
-        self._after_update()
+        if updated:
+            self._invalidate("g3", [str(user_id), str(role_id)])
         return updated
 
     def has_global_role(self, *, user_id: ID, role_id: ID) -> bool:
@@ -200,6 +384,7 @@ class Authorization(metaclass=Singleton):
         """Determines whether the admin role is assigned to the chosen user."""
         return self.has_global_role(user_id=user_id, role_id="*")
 
+    @_changes_policy
     def clear_assignments_for_user(self, *, user_id: ID) -> bool:
         """Removes all role assignments for a user inside the casbin table.
         Should be called when a user is removed.
@@ -210,36 +395,43 @@ class Authorization(metaclass=Singleton):
         resource_updates = enforcer.remove_filtered_named_grouping_policy("g", 0, value)
         domain_updates = enforcer.remove_filtered_named_grouping_policy("g2", 0, value)
         global_updates = enforcer.remove_filtered_named_grouping_policy("g3", 0, value)
-        self._after_update()
+        self._cache.invalidate(sub=value)
         return bool(resource_updates or domain_updates or global_updates)
 
+    @_changes_policy
     def clear_assignments_for_resource_role(self, *, role_id: ID) -> bool:
         """Removes all assignments of a resource role inside the casbin table.
         Should be called when a resource role is removed.
         """
         enforcer: Enforcer = self._enforcer
         updates = enforcer.remove_filtered_named_grouping_policy("g", 1, str(role_id))
-        self._after_update()
+        for rule in updates:
+            self._invalidate("g", rule)
         return bool(updates)
 
+    @_changes_policy
     def clear_assignments_for_domain_role(self, *, role_id: ID) -> bool:
         """Removes all assignments of a domain role inside the casbin table.
         Should be called when a domain role is removed.
         """
         enforcer: Enforcer = self._enforcer
         updates = enforcer.remove_filtered_named_grouping_policy("g2", 1, str(role_id))
-        self._after_update()
+        for rule in updates:
+            self._invalidate("g2", rule)
         return bool(updates)
 
+    @_changes_policy
     def clear_assignments_for_global_role(self, *, role_id: ID) -> bool:
         """Removes all assignments of a global role inside the casbin table.
         Should be called when a global role is removed.
         """
         enforcer: Enforcer = self._enforcer
         updates = enforcer.remove_filtered_named_grouping_policy("g3", 1, str(role_id))
-        self._after_update()
+        for rule in updates:
+            self._invalidate("g3", rule)
         return bool(updates)
 
+    @_changes_policy
     def clear_assignments_for_resource(self, *, resource_id: ID) -> bool:
         """Removes all assignments to a resource inside the casbin table.
         Should be called when a resource is removed.
@@ -248,9 +440,11 @@ class Authorization(metaclass=Singleton):
         updates = enforcer.remove_filtered_named_grouping_policy(
             "g", 2, str(resource_id)
         )
-        self._after_update()
+        for rule in updates:
+            self._invalidate("g", rule)
         return bool(updates)
 
+    @_changes_policy
     def clear_assignments_for_domain(self, *, domain_id: ID) -> bool:
         """Removes all assignments to a domain inside the casbin table.
         Should be called when a domain is removed.
@@ -259,5 +453,6 @@ class Authorization(metaclass=Singleton):
         updates = enforcer.remove_filtered_named_grouping_policy(
             "g2", 2, str(domain_id)
         )
-        self._after_update()
+        for rule in updates:
+            self._invalidate("g2", rule)
         return bool(updates)
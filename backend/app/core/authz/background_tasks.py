@@ -1,18 +1,25 @@
 import asyncio
 from datetime import datetime, timezone
+from typing import Optional
 
+import asyncpg
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.core.authz import policy_changes
 from app.core.authz.authorization import Authorization
+from app.core.authz.policy_changes import PolicyChange
 from app.core.logging import logger
-from app.database.database import SessionLocal
+from app.core.scheduler.scheduler import Job, every
+from app.database.database import SessionLocal, get_url
+from app.settings import settings
 from app.users.model import User as UserModel
 
 CHECK_INTERVAL_SECONDS = 60  # run every minute
+RECONNECT_INTERVAL_SECONDS = 5
 
 
-async def revoke_expired_admins(db: Session) -> None:
+def revoke_expired_admins(db: Session) -> None:
     authorizer = Authorization()
     expired = (
         db.execute(
@@ -33,13 +40,75 @@ async def revoke_expired_admins(db: Session) -> None:
         logger.info(f"[Auth] Revoked {len(expired)} expired admin role(s)")
 
 
-async def check_expired_admins() -> None:
+def check_expired_admins() -> None:
+    with SessionLocal() as db:
+        revoke_expired_admins(db)
+
+
+check_expired_admins_job = Job(
+    "check_expired_admins", check_expired_admins, every(CHECK_INTERVAL_SECONDS)
+)
+
+
+async def _apply_policy_changes(
+    authorizer: Authorization, changes: "asyncio.Queue[Optional[str]]"
+) -> None:
+    """Applies the queued policy changes one at a time, in the order they were
+    received, in a worker thread: they wait for local changes and reloads holding
+    the policy lock. ``None`` reloads the complete policy instead.
+    """
     while True:
+        payload = await changes.get()
+        if payload is None:
+            try:
+                await asyncio.to_thread(authorizer.reload_policy)
+            except Exception as e:
+                logger.warning(f"[Auth] Could not reload the policy: {e}")
+            continue
         try:
-            with SessionLocal() as db:
-                await revoke_expired_admins(db)
+            await asyncio.to_thread(
+                authorizer.apply_policy_change, PolicyChange.parse(payload)
+            )
         except Exception as e:
-            # don't crash the loop if something fails
-            logger.warning(f"[Auth] Expiry check failed: {e}")
+            logger.warning(f"[Auth] Could not apply policy change {payload}: {e}")
+
+
+async def listen_for_policy_changes() -> None:
+    """Applies the changes other replicas make to the casbin table
+    to the enforcer of this process, as they are committed.
+    """
+    if not settings.AUTHORIZER_CHANGE_NOTIFICATIONS:
+        return
+
+    changes: asyncio.Queue[Optional[str]] = asyncio.Queue()
+    applier = asyncio.create_task(_apply_policy_changes(Authorization(), changes))
+
+    def on_notification(connection, pid, channel, payload: str) -> None:
+        changes.put_nowait(payload)
+
+    try:
+        while True:
+            try:
+                connection = await asyncpg.connect(get_url())
+                try:
+                    await connection.add_listener(
+                        policy_changes.CHANNEL, on_notification
+                    )
+                    # Changes committed while not listening are only picked up by
+                    # a full reload. Notifications received after it are applied
+                    # on top of the reloaded policy; reapplying a change the reload
+                    # already read has no effect.
+                    changes.put_nowait(None)
+                    while not connection.is_closed():
+                        await asyncio.sleep(
+                            settings.AUTHORIZER_CHANGE_LISTENER_HEALTHCHECK_SECONDS
+                        )
+                        await connection.execute("SELECT 1")
+                finally:
+                    await connection.close()
+            except Exception as e:
+                logger.warning(f"[Auth] Policy change listener failed: {e}")
 
-        await asyncio.sleep(CHECK_INTERVAL_SECONDS)
+            await asyncio.sleep(RECONNECT_INTERVAL_SECONDS)
+    finally:
+        applier.cancel()
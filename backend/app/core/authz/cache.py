@@ -0,0 +1,106 @@
+import threading
+from collections import defaultdict
+from typing import NamedTuple, Optional
+
+from cachetools import LRUCache
+from opentelemetry import metrics
+
+meter = metrics.get_meter(__name__)
+
+
+class Decision(NamedTuple):
+    sub: str
+    dom: str
+    obj: str
+    act: str
+
+
+class DecisionCache(LRUCache):
+    """An LRU cache of access decisions, indexed by the subject, domain, object
+    and action they were made for. A policy change then only evicts the
+    decisions it can affect, instead of purging the complete cache.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        super().__init__(maxsize=maxsize)
+        self._index: defaultdict[tuple[str, str], set[Decision]] = defaultdict(set)
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        # Bumped on every invalidation, decisions made before are not stored
+        self.generation = 0
+        self._requests = meter.create_counter(
+            "authz.cache.requests",
+            description="Access decision cache lookups, by result",
+        )
+        self._evicted = meter.create_counter(
+            "authz.cache.evictions",
+            description="Access decisions removed from the cache, by reason",
+        )
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def lookup(self, key: Decision) -> Optional[bool]:
+        with self._lock:
+            decision = super().get(key)
+            if decision is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        self._requests.add(1, {"result": "miss" if decision is None else "hit"})
+        return decision
+
+    def store(self, key: Decision, decision: bool, generation: int) -> None:
+        """Caches a decision, unless the policy changed while it was being made."""
+        with self._lock:
+            if generation == self.generation:
+                self[key] = decision
+
+    def __setitem__(self, key: Decision, value: bool) -> None:
+        with self._lock:
+            super().__setitem__(key, value)
+            for field, item in key._asdict().items():
+                self._index[(field, item)].add(key)
+
+    def __delitem__(self, key: Decision) -> None:
+        with self._lock:
+            super().__delitem__(key)
+            for field, item in key._asdict().items():
+                keys = self._index[(field, item)]
+                keys.discard(key)
+                if not keys:
+                    del self._index[(field, item)]
+
+    def popitem(self) -> tuple[Decision, bool]:
+        with self._lock:
+            item = super().popitem()
+            self.evictions += 1
+        self._evicted.add(1, {"reason": "capacity"})
+        return item
+
+    def invalidate(self, **criteria: str) -> int:
+        """Evicts the decisions matching all criteria, e.g. `sub` and `obj`."""
+        with self._lock:
+            self.generation += 1
+            keys: Optional[set[Decision]] = None
+            for field, item in criteria.items():
+                matches = self._index.get((field, item), set())
+                keys = matches.copy() if keys is None else keys & matches
+            for key in keys or ():
+                del self[key]
+            evicted = len(keys or ())
+            self.invalidations += evicted
+        if evicted:
+            self._evicted.add(evicted, {"reason": "invalidation"})
+        return evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            while len(self):
+                super().popitem()
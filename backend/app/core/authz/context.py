@@ -0,0 +1,41 @@
+from contextvars import ContextVar, Token
+from typing import Optional
+
+from .cache import Decision
+
+
+class RequestDecisions:
+    """The access decisions made during a single request. These are dropped as soon
+    as the policy changes, which is tracked by the generation of the decision cache.
+    """
+
+    def __init__(self) -> None:
+        self.generation = -1
+        self.decisions: dict[Decision, bool] = {}
+
+    def get(self, key: Decision, generation: int) -> Optional[bool]:
+        if generation != self.generation:
+            self.decisions.clear()
+            self.generation = generation
+        return self.decisions.get(key)
+
+    def store(self, key: Decision, decision: bool, generation: int) -> None:
+        if generation == self.generation:
+            self.decisions[key] = decision
+
+
+_request_decisions: ContextVar[RequestDecisions | None] = ContextVar(
+    "request_decisions", default=None
+)
+
+
+def open_decision_context() -> Token:
+    return _request_decisions.set(RequestDecisions())
+
+
+def close_decision_context(token: Token) -> None:
+    _request_decisions.reset(token)
+
+
+def get_request_decisions() -> RequestDecisions | None:
+    return _request_decisions.get()
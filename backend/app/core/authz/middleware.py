@@ -0,0 +1,23 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .context import close_decision_context, open_decision_context
+
+
+class RequestDecisionsMiddleware:
+    """Remembers the access decisions made during a request,
+    so repeated checks within the same request are free.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = open_decision_context()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            close_decision_context(token)
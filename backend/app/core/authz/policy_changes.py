@@ -0,0 +1,93 @@
+"""Notifications of changes to the casbin table, shared between replicas.
+
+Every replica keeps its own in-memory enforcer. A trigger on the casbin table
+publishes every inserted or deleted rule on a Postgres NOTIFY channel, so the
+other replicas can apply the same change to their enforcer.
+"""
+
+import json
+from dataclasses import dataclass
+from typing import Literal
+from uuid import uuid4
+
+from sqlalchemy import Engine, func, select, text
+
+CHANNEL = "casbin_rule_changes"
+# Connections of this process identify themselves with this application name,
+# so the process can skip the changes it already applied to its own enforcer
+ORIGIN = f"authz-{uuid4()}"
+INSTALL_LOCK_ID = 0x0CA5B1
+
+_NOTIFY_FUNCTION = text(
+    """
+    CREATE OR REPLACE FUNCTION notify_casbin_rule_change() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('DELETE', 'UPDATE') THEN
+            PERFORM pg_notify(TG_ARGV[0], json_build_object(
+                'op', 'DELETE',
+                'origin', current_setting('application_name'),
+                'ptype', OLD.ptype,
+                'rule', json_build_array(OLD.v0, OLD.v1, OLD.v2, OLD.v3, OLD.v4, OLD.v5)
+            )::text);
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            PERFORM pg_notify(TG_ARGV[0], json_build_object(
+                'op', 'INSERT',
+                'origin', current_setting('application_name'),
+                'ptype', NEW.ptype,
+                'rule', json_build_array(NEW.v0, NEW.v1, NEW.v2, NEW.v3, NEW.v4, NEW.v5)
+            )::text);
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """
+)
+_CREATE_TRIGGER = text(
+    f"""
+    CREATE TRIGGER {CHANNEL} AFTER INSERT OR UPDATE OR DELETE ON casbin_rule
+    FOR EACH ROW EXECUTE FUNCTION notify_casbin_rule_change('{CHANNEL}')
+    """
+)
+
+
+@dataclass(frozen=True)
+class PolicyChange:
+    op: Literal["INSERT", "DELETE"]
+    origin: str
+    ptype: str
+    rule: list[str]
+
+    @property
+    def section(self) -> str:
+        return self.ptype[0]
+
+    @classmethod
+    def parse(cls, payload: str) -> "PolicyChange":
+        change = json.loads(payload)
+        rule = []
+        for value in change["rule"]:
+            if value is None:
+                break
+            rule.append(value)
+        return cls(
+            op=change["op"],
+            origin=change["origin"],
+            ptype=change["ptype"],
+            rule=rule,
+        )
+
+
+def install_change_notifications(engine: Engine) -> None:
+    """Creates the trigger publishing the changes to the casbin table, if missing.
+    Replicas starting at the same time are serialized by an advisory lock.
+    """
+    with engine.begin() as connection:
+        connection.execute(select(func.pg_advisory_xact_lock(INSTALL_LOCK_ID)))
+        connection.execute(_NOTIFY_FUNCTION)
+        installed = connection.scalar(
+            text("SELECT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = :name)"),
+            {"name": CHANNEL},
+        )
+        if not installed:
+            connection.execute(_CREATE_TRIGGER)
@@ -1,5 +1,5 @@
 from abc import ABC
-from typing import Type, TypeAlias, Union, cast
+from typing import Any, Iterable, Sequence, Type, TypeAlias, Union, cast
 
 from fastapi import Depends, Request
 from sqlalchemy import select
@@ -57,6 +57,29 @@ class SubjectResolver(ABC):
         domain = db.scalar(select(cls.model.domain_id).where(cls.model.id == id_))
         return cls.DEFAULT if domain is None else str(domain)
 
+    @classmethod
+    def resolve_domains(cls, db: Session, ids: Sequence[str]) -> dict[str, str]:
+        """Resolves the domains of many objects in a single query."""
+        if cls.model is None:
+            return dict.fromkeys(ids, cls.DEFAULT)
+        domains = db.execute(
+            select(cls.model.id, cls.model.domain_id).where(
+                cls.model.id.in_(cls._lookups(ids))
+            )
+        )
+        return cls._with_default(ids, domains)
+
+    @classmethod
+    def _lookups(cls, ids: Sequence[str]) -> list[str]:
+        return [id_ for id_ in ids if id_ != cls.DEFAULT]
+
+    @classmethod
+    def _with_default(
+        cls, ids: Sequence[str], domains: Iterable[tuple[Any, Any]]
+    ) -> dict[str, str]:
+        found = {str(id_): str(domain) for id_, domain in domains if domain is not None}
+        return {id_: found.get(str(id_), cls.DEFAULT) for id_ in ids}
+
 
 class EmptyResolver(SubjectResolver):
     @classmethod
@@ -134,6 +157,15 @@ class DatasetResolver(SubjectResolver):
         )
         return cls.DEFAULT if domain is None else str(domain)
 
+    @classmethod
+    def resolve_domains(cls, db: Session, ids: Sequence[str]) -> dict[str, str]:
+        domains = db.execute(
+            select(cls.model.id, DataProduct.domain_id)
+            .join(cls.model)
+            .where(cls.model.id.in_(cls._lookups(ids)))
+        )
+        return cls._with_default(ids, domains)
+
 
 class DataProductNameResolver(SubjectResolver):
     model: Model = DataProduct
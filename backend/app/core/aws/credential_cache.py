@@ -0,0 +1,144 @@
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable, NamedTuple
+from uuid import UUID
+
+import boto3
+from botocore.client import BaseClient
+from cachetools import LRUCache
+
+from app.core.auth.credentials import AWSCredentials
+from app.settings import settings
+
+
+class AWSCredentialsKey(NamedTuple):
+    user_id: UUID
+    data_product_id: UUID
+    environment: str
+    role_arn: str
+
+
+@dataclass
+class _Refresh:
+    # Held by the thread refreshing the credentials
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    # Threads refreshing or waiting for the refresh
+    users: int = 0
+
+
+class AWSCredentialCache:
+    """Temporary credentials assumed with STS, and the boto3 clients built with them.
+
+    Credentials are refreshed by a single thread once they get within the refresh
+    margin of their expiry; other threads keep using the still valid credentials
+    meanwhile, or wait for the refresh when there are none. Clients are cached per
+    service and access key, so refreshed credentials get new clients. They are
+    built from a session of their own, outside the lock guarding the cache.
+    """
+
+    def __init__(self) -> None:
+        size = settings.AWS_CREDENTIALS_CACHE_SIZE
+        self._credentials: LRUCache[AWSCredentialsKey, AWSCredentials] = LRUCache(
+            maxsize=size
+        )
+        # Only kept while in use, so a refresh in progress is never forgotten
+        self._refreshing: dict[AWSCredentialsKey, _Refresh] = {}
+        self._clients: LRUCache[tuple[str, str], BaseClient] = LRUCache(maxsize=size)
+        self._lock = threading.Lock()
+        # Creating clients from a boto3 session is not thread safe
+        self._session = boto3.session.Session()
+        self._session_lock = threading.Lock()
+
+    def get(
+        self, key: AWSCredentialsKey, assume: Callable[[], AWSCredentials]
+    ) -> AWSCredentials:
+        """The cached credentials for ``key``, calling ``assume`` for new ones once
+        they are due for a refresh.
+        """
+        with self._lock:
+            credentials = self._credentials.get(key)
+            if credentials is not None and not self._due(credentials):
+                return credentials
+            refresh = self._refreshing.setdefault(key, _Refresh())
+            refresh.users += 1
+
+        try:
+            if credentials is not None and not self._expired(credentials):
+                if not refresh.lock.acquire(blocking=False):
+                    return credentials
+            else:
+                refresh.lock.acquire()
+            try:
+                with self._lock:
+                    current = self._credentials.get(key)
+                if current is not None and not self._due(current):
+                    return current
+                credentials = assume()
+                with self._lock:
+                    self._credentials[key] = credentials
+                return credentials
+            finally:
+                refresh.lock.release()
+        finally:
+            with self._lock:
+                refresh.users -= 1
+                if not refresh.users:
+                    del self._refreshing[key]
+
+    def client(self, service_name: str, credentials: AWSCredentials) -> BaseClient:
+        key = (service_name, credentials.AccessKeyId)
+        with self._lock:
+            if (client := self._clients.get(key)) is not None:
+                return client
+
+        with self._session_lock:
+            with self._lock:
+                if (client := self._clients.get(key)) is not None:
+                    return client
+            client = self._session.client(
+                service_name,
+                region_name=settings.AWS_DEFAULT_REGION,
+                aws_access_key_id=credentials.AccessKeyId,
+                aws_secret_access_key=credentials.SecretAccessKey,
+                aws_session_token=credentials.SessionToken,
+            )
+        with self._lock:
+            self._clients[key] = client
+        return client
+
+    def invalidate(self, user_id: UUID) -> None:
+        """Drops the credentials of a user, e.g. once their access was revoked."""
+        with self._lock:
+            for key in [key for key in self._credentials if key.user_id == user_id]:
+                credentials = self._credentials.pop(key)
+                for client_key in [
+                    client_key
+                    for client_key in self._clients
+                    if client_key[1] == credentials.AccessKeyId
+                ]:
+                    del self._clients[client_key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._credentials.clear()
+            self._clients.clear()
+
+    @staticmethod
+    def _remaining(credentials: AWSCredentials) -> float:
+        expiration = credentials.Expiration
+        if expiration.tzinfo is None:
+            expiration = expiration.replace(tzinfo=timezone.utc)
+        return (expiration - datetime.now(timezone.utc)).total_seconds()
+
+    def _due(self, credentials: AWSCredentials) -> bool:
+        return (
+            self._remaining(credentials)
+            <= settings.AWS_CREDENTIALS_REFRESH_MARGIN_SECONDS
+        )
+
+    def _expired(self, credentials: AWSCredentials) -> bool:
+        return self._remaining(credentials) <= 0
+
+
+aws_credentials = AWSCredentialCache()
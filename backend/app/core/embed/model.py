@@ -1,14 +1,211 @@
+import asyncio
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from functools import cache
+from typing import Iterator, Optional, Sequence
 
+from cachetools import Cache, LRUCache, TTLCache
 from fastembed import TextEmbedding
+from opentelemetry import metrics
+
+from app.settings import settings
 
 EMBEDDING_MODEL = "BAAI/bge-small-en-v1.5"
 
+meter = metrics.get_meter(__name__)
+
+Embedding = list[float]
+
+
+def normalize_query(query: str) -> str:
+    """The model's tokenizer is uncased and ignores surrounding whitespace,
+    so these variations of a query share one embedding."""
+    return " ".join(query.split()).lower()
+
+
+class QueryEmbeddingCache:
+    """A thread-safe LRU cache, with optional TTL, of query embeddings."""
+
+    def __init__(self, maxsize: int, ttl: Optional[int] = None) -> None:
+        self._cache: Cache = (
+            TTLCache(maxsize=maxsize, ttl=ttl) if ttl else LRUCache(maxsize=maxsize)
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._requests = meter.create_counter(
+            "embedding.query_cache.requests",
+            description="Query embedding cache lookups, by result",
+        )
+
+    def get(self, model_name: str, query: str) -> Optional[Embedding]:
+        with self._lock:
+            embedding = self._cache.get((model_name, query))
+            if embedding is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        self._requests.add(
+            1, {"model": model_name, "result": "miss" if embedding is None else "hit"}
+        )
+        return embedding
+
+    def put(self, model_name: str, query: str, embedding: Embedding) -> None:
+        with self._lock:
+            self._cache[(model_name, query)] = embedding
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+class EmbeddingEngine:
+    """A bounded pool of embedding model sessions.
+
+    Every call borrows a session for the duration of the inference, so concurrent requests
+    run in parallel on up to ``pool_size`` sessions instead of contending on a single model.
+    Callers that find all sessions busy wait in line, which is reported as the queue depth.
+    """
+
+    def __init__(
+        self,
+        model_name: str = EMBEDDING_MODEL,
+        *,
+        pool_size: int,
+        threads: Optional[int],
+        batch_size: int,
+        query_cache: Optional[QueryEmbeddingCache] = None,
+    ) -> None:
+        self.model_name = model_name
+        self.query_cache = query_cache
+        self.pool_size = pool_size
+        self.batch_size = batch_size
+        self._sessions: queue.LifoQueue[TextEmbedding] = queue.LifoQueue()
+        for _ in range(pool_size):
+            self._sessions.put(TextEmbedding(model_name, threads=threads))
+        self._executor = ThreadPoolExecutor(
+            max_workers=pool_size, thread_name_prefix="embedding"
+        )
+        self._waiting = 0
+        self._waiting_lock = threading.Lock()
+
+        self._queue_depth = meter.create_up_down_counter(
+            "embedding.queue.depth",
+            description="Embedding calls waiting for a free model session",
+        )
+        self._inference_duration = meter.create_histogram(
+            "embedding.inference.duration",
+            unit="s",
+            description="Duration of embedding model inference",
+        )
+
+    @property
+    def queue_depth(self) -> int:
+        return self._waiting
+
+    def _track_waiting(self, delta: int) -> None:
+        with self._waiting_lock:
+            self._waiting += delta
+        self._queue_depth.add(delta, {"model": self.model_name})
+
+    @contextmanager
+    def _session(self) -> Iterator[TextEmbedding]:
+        self._track_waiting(1)
+        try:
+            session = self._sessions.get()
+        finally:
+            self._track_waiting(-1)
+        try:
+            yield session
+        finally:
+            self._sessions.put(session)
+
+    def embed_documents(self, documents: Sequence[str]) -> list[Embedding]:
+        if not documents:
+            return []
+        with self._session() as session:
+            start_time = time.perf_counter()
+            embeddings = [
+                embedding.tolist()
+                for embedding in session.embed(documents, batch_size=self.batch_size)
+            ]
+            self._inference_duration.record(
+                time.perf_counter() - start_time,
+                {"model": self.model_name, "kind": "documents"},
+            )
+        return embeddings
+
+    def embed_query(self, query: str) -> Embedding:
+        query = normalize_query(query)
+        if self.query_cache is not None and (
+            cached := self.query_cache.get(self.model_name, query)
+        ):
+            return list(cached)
+
+        with self._session() as session:
+            start_time = time.perf_counter()
+            (embedding,) = session.embed([query])
+            self._inference_duration.record(
+                time.perf_counter() - start_time,
+                {"model": self.model_name, "kind": "query"},
+            )
+        result = embedding.tolist()
+        if self.query_cache is not None:
+            self.query_cache.put(self.model_name, query, result)
+        return list(result)
+
+    async def aembed_documents(self, documents: Sequence[str]) -> list[Embedding]:
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self.embed_documents, documents
+        )
+
+    async def aembed_query(self, query: str) -> Embedding:
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self.embed_query, query
+        )
+
+    def warm(self) -> None:
+        """Runs a first inference on every session, so no request pays the model loading."""
+        sessions = [self._sessions.get() for _ in range(self.pool_size)]
+        try:
+            for session in sessions:
+                next(iter(session.embed(["warmup"])), None)
+        finally:
+            for session in sessions:
+                self._sessions.put(session)
+
+
+def session_threads(pool_size: int, threads: Optional[int] = None) -> int:
+    """ONNX threads per model session, sharing the cores between the pooled sessions
+    unless set explicitly, as concurrent sessions would otherwise oversubscribe them.
+    """
+    if threads is not None:
+        return threads
+    return max(1, (os.cpu_count() or 1) // pool_size)
+
 
 @cache
-def get_text_embedding_model() -> TextEmbedding:
-    return TextEmbedding(EMBEDDING_MODEL)
+def get_embedding_engine() -> EmbeddingEngine:
+    return EmbeddingEngine(
+        pool_size=settings.EMBEDDING_POOL_SIZE,
+        threads=session_threads(
+            settings.EMBEDDING_POOL_SIZE, settings.EMBEDDING_THREADS
+        ),
+        batch_size=settings.EMBEDDING_BATCH_SIZE,
+        query_cache=QueryEmbeddingCache(
+            maxsize=settings.EMBEDDING_QUERY_CACHE_SIZE,
+            ttl=settings.EMBEDDING_QUERY_CACHE_TTL_SECONDS,
+        )
+        if settings.EMBEDDING_QUERY_CACHE_SIZE > 0
+        else None,
+    )
 
 
 def warm_text_embedding_model() -> None:
-    next(iter(get_text_embedding_model().embed(["warmup"])), None)
+    get_embedding_engine().warm()
@@ -1,8 +1,5 @@
-import asyncio
-from datetime import datetime, timedelta
 from typing import Any, Optional
 
-import pytz
 from posthog import Posthog
 from sqlalchemy import func, select
 
@@ -10,6 +7,7 @@ from app.abstract_data_product.input_ports.model import InputPort as InputPortMo
 from app.abstract_data_product.model import AbstractDataProduct
 from app.authorization.role_assignments.enums import DecisionStatus
 from app.core.logging import logger
+from app.core.scheduler.scheduler import Job, daily
 from app.database.database import SessionLocal
 from app.settings import settings
 
@@ -24,14 +22,6 @@ def get_posthog_client() -> Optional[Posthog]:
     return None
 
 
-def _seconds_until_next_midnight_utc() -> float:
-    now = datetime.now(tz=pytz.utc)
-    next_midnight = (now + timedelta(days=1)).replace(
-        hour=0, minute=0, second=0, microsecond=0
-    )
-    return (next_midnight - now).total_seconds()
-
-
 def consumption_metrics() -> dict[str, Any]:
     with SessionLocal() as db:
         rows = db.execute(
@@ -106,17 +96,18 @@ def _do_report_daily_metrics(posthog: Posthog) -> None:
     )
 
 
-async def report_daily_metrics() -> None:
+def report_daily_metrics() -> None:
     """
-    Daily background task that reports metrics to the Data Product Portal team.
+    Daily background job that reports metrics to the Data Product Portal team.
     """
     posthog = get_posthog_client()
     if not posthog:
         return
-    while True:
-        await asyncio.sleep(_seconds_until_next_midnight_utc())
-        try:
-            _do_report_daily_metrics(posthog)
-        except Exception as e:
-            logger.warning(f"Failed to report daily metrics: {e}")
-        await asyncio.sleep(1)
+    try:
+        _do_report_daily_metrics(posthog)
+    finally:
+        # Sends the queued event before the client is discarded
+        posthog.shutdown()
+
+
+report_daily_metrics_job = Job("report_daily_metrics", report_daily_metrics, daily())
@@ -0,0 +1,7 @@
+from enum import UNIQUE, StrEnum, verify
+
+
+@verify(UNIQUE)
+class JobOutcome(StrEnum):
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
@@ -0,0 +1,32 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, Enum, Float, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.scheduler.enums import JobOutcome
+from app.database.database import Base
+
+
+class ScheduledJob(Base):
+    """The last run of a background job, by whichever replica ran it."""
+
+    __tablename__ = "scheduled_jobs"
+
+    name: Mapped[str] = mapped_column(String, primary_key=True)
+    last_started_on: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=False)
+    )
+    last_finished_on: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=False)
+    )
+    last_duration_seconds: Mapped[Optional[float]] = mapped_column(Float)
+    last_outcome: Mapped[Optional[JobOutcome]] = mapped_column(
+        Enum(JobOutcome, native_enum=False)
+    )
+    last_error: Mapped[Optional[str]] = mapped_column(Text)
+    # Host and process id of the replica that ran the job last
+    last_run_by: Mapped[Optional[str]] = mapped_column(String)
+    consecutive_failures: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0"
+    )
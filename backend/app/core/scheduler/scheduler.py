@@ -0,0 +1,245 @@
+import asyncio
+import inspect
+import os
+import socket
+import time
+import zlib
+from collections.abc import Awaitable, Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import NamedTuple, Optional
+
+from sqlalchemy import Connection, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+
+from app.core.logging import logger
+from app.core.scheduler.enums import JobOutcome
+from app.core.scheduler.model import ScheduledJob
+from app.database import database
+from app.settings import settings
+
+# Jobs are locked on this namespace and a hash of their name
+JOB_LOCK_NAMESPACE = 0x5C4ED
+
+# Computes when a job is due next, from the start of its last run on any replica
+Schedule = Callable[[Optional[datetime]], datetime]
+
+
+def _utcnow() -> datetime:
+    return datetime.now(tz=timezone.utc).replace(tzinfo=None)
+
+
+def every(seconds: float) -> Schedule:
+    """Runs a job straight away, then every ``seconds`` after it started."""
+
+    def next_run(last_started_on: Optional[datetime]) -> datetime:
+        if last_started_on is None:
+            return datetime.min
+        return last_started_on + timedelta(seconds=seconds)
+
+    return next_run
+
+
+def daily() -> Schedule:
+    """Runs a job at midnight UTC, or straight away when a midnight was missed."""
+
+    def next_run(last_started_on: Optional[datetime]) -> datetime:
+        return (last_started_on or _utcnow()).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        ) + timedelta(days=1)
+
+    return next_run
+
+
+@dataclass(frozen=True)
+class Job:
+    """A function run on a schedule, by one replica at a time.
+
+    Functions run in the thread pool of the scheduler, coroutine functions on the
+    event loop; these have to keep blocking work off the loop themselves.
+    """
+
+    name: str
+    run: Callable[[], None] | Callable[[], Awaitable[None]]
+    schedule: Schedule
+
+    @property
+    def lock_id(self) -> int:
+        # Advisory lock keys are signed 32-bit integers
+        key = zlib.crc32(self.name.encode())
+        return key - (1 << 32) if key >= 1 << 31 else key
+
+
+class _Claim(NamedTuple):
+    # Holds the advisory lock of the job for as long as it runs
+    connection: Connection
+    started_at: float
+
+
+class JobScheduler:
+    """Runs background jobs on every replica, while a Postgres advisory lock and
+    the recorded start of the last run keep each job from running more than once
+    per schedule across replicas. Every run is recorded in ``scheduled_jobs``.
+    """
+
+    def __init__(self, jobs: Sequence[Job]) -> None:
+        self._jobs = jobs
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._tasks: list[asyncio.Task[None]] = []
+        self._owner = f"{socket.gethostname()}:{os.getpid()}"
+
+    def start(self) -> None:
+        """Schedules the jobs, call from within the running event loop."""
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.SCHEDULER_MAX_WORKERS, thread_name_prefix="scheduler"
+        )
+        self._tasks = [
+            asyncio.create_task(self._schedule(job), name=f"job:{job.name}")
+            for job in self._jobs
+        ]
+
+    async def stop(self) -> None:
+        """Cancels the scheduled jobs and waits for those running in threads."""
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+        self._tasks = []
+        if self._executor is not None:
+            await asyncio.to_thread(self._executor.shutdown, cancel_futures=True)
+            self._executor = None
+
+    async def run(self, job: Job) -> bool:
+        """Runs the job when it is due and not running on another replica.
+        Returns whether it ran.
+        """
+        loop = asyncio.get_running_loop()
+        if not inspect.iscoroutinefunction(job.run):
+            return await loop.run_in_executor(self._executor, self._run_sync, job)
+
+        claim = await loop.run_in_executor(self._executor, self._claim, job)
+        if claim is None:
+            return False
+        error: Optional[BaseException] = None
+        try:
+            await job.run()
+        except asyncio.CancelledError as e:
+            error = e
+            raise
+        except Exception as e:
+            error = e
+        finally:
+            await loop.run_in_executor(self._executor, self._release, job, claim, error)
+        return True
+
+    async def _schedule(self, job: Job) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                next_run = await loop.run_in_executor(
+                    self._executor, self._next_run, job
+                )
+                delay = (next_run - _utcnow()).total_seconds()
+                if delay <= 0 and not await self.run(job):
+                    # It is running on another replica, or just ran there
+                    delay = settings.SCHEDULER_RETRY_INTERVAL_SECONDS
+            except Exception as e:
+                logger.warning(f"[Scheduler] Scheduling job {job.name} failed: {e}")
+                delay = settings.SCHEDULER_RETRY_INTERVAL_SECONDS
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+    def _run_sync(self, job: Job) -> bool:
+        claim = self._claim(job)
+        if claim is None:
+            return False
+        error: Optional[BaseException] = None
+        try:
+            job.run()
+        except Exception as e:
+            error = e
+        finally:
+            self._release(job, claim, error)
+        return True
+
+    def _next_run(self, job: Job) -> datetime:
+        with database.SessionLocal() as db:
+            return job.schedule(self._last_started_on(db.connection(), job))
+
+    @staticmethod
+    def _last_started_on(connection: Connection, job: Job) -> Optional[datetime]:
+        return connection.scalar(
+            select(ScheduledJob.last_started_on).where(ScheduledJob.name == job.name)
+        )
+
+    def _claim(self, job: Job) -> Optional[_Claim]:
+        """Takes the lock of a job that is due, and records its start."""
+        connection = database.engine.connect()
+        try:
+            if not connection.scalar(
+                select(func.pg_try_advisory_lock(JOB_LOCK_NAMESPACE, job.lock_id))
+            ):
+                connection.close()
+                return None
+            started_on = _utcnow()
+            if job.schedule(self._last_started_on(connection, job)) > started_on:
+                self._unlock(connection, job)
+                return None
+            connection.execute(
+                insert(ScheduledJob)
+                .values(
+                    name=job.name, last_started_on=started_on, last_run_by=self._owner
+                )
+                .on_conflict_do_update(
+                    index_elements=[ScheduledJob.name],
+                    set_={"last_started_on": started_on, "last_run_by": self._owner},
+                )
+            )
+            connection.commit()
+        except BaseException:
+            # Closing the underlying connection releases the lock
+            connection.invalidate()
+            connection.close()
+            raise
+        return _Claim(connection, time.perf_counter())
+
+    def _release(self, job: Job, claim: _Claim, error: Optional[BaseException]) -> None:
+        duration = time.perf_counter() - claim.started_at
+        if error is None:
+            logger.info(f"[Scheduler] Job {job.name} finished in {duration:.2f}s")
+        else:
+            logger.warning(f"[Scheduler] Job {job.name} failed: {error!r}")
+        connection = claim.connection
+        try:
+            connection.execute(
+                update(ScheduledJob)
+                .where(ScheduledJob.name == job.name)
+                .values(
+                    last_finished_on=_utcnow(),
+                    last_duration_seconds=duration,
+                    last_outcome=(
+                        JobOutcome.SUCCEEDED if error is None else JobOutcome.FAILED
+                    ),
+                    last_error=None if error is None else repr(error),
+                    consecutive_failures=(
+                        0 if error is None else ScheduledJob.consecutive_failures + 1
+                    ),
+                )
+            )
+            connection.commit()
+            self._unlock(connection, job)
+        except Exception as e:
+            logger.warning(f"[Scheduler] Recording job {job.name} failed: {e}")
+            connection.invalidate()
+            connection.close()
+
+    @staticmethod
+    def _unlock(connection: Connection, job: Job) -> None:
+        connection.execute(
+            select(func.pg_advisory_unlock(JOB_LOCK_NAMESPACE, job.lock_id))
+        )
+        connection.commit()
+        connection.close()
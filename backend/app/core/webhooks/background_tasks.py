@@ -0,0 +1,101 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any, NamedTuple
+
+import pytz
+from sqlalchemy.orm import Session
+
+from app.core.logging import logger
+from app.core.scheduler.scheduler import Job, every
+from app.core.webhooks.service import WebhookOutboxService
+from app.core.webhooks.v2 import deliver
+from app.database.database import SessionLocal
+from app.settings import settings
+
+PURGE_INTERVAL_SECONDS = 3600
+
+
+class _ClaimedEvent(NamedTuple):
+    id: int
+    ordering_key: str
+    envelope: dict[str, Any]
+
+
+def _claim_batch(db: Session) -> list[_ClaimedEvent]:
+    pending = WebhookOutboxService(db).claim_pending_events(
+        settings.WEBHOOK_V2_OUTBOX_BATCH_SIZE
+    )
+    claimed = [
+        _ClaimedEvent(event.id, event.ordering_key, event.to_envelope())
+        for event in pending
+    ]
+    db.commit()
+    return claimed
+
+
+def _record_outcome(db: Session, delivered: list[int], failed: list[int]) -> None:
+    service = WebhookOutboxService(db)
+    service.mark_delivered(delivered)
+    service.retry_later(failed)
+    db.commit()
+
+
+async def relay_outbox(db: Session) -> int:
+    """Delivers a batch of pending outbox events and returns how many were delivered.
+
+    The batch is claimed in a committed transaction before it is delivered, so
+    no locks are held meanwhile; a replica crashing halfway only delays it until
+    the claim lapses. The database work runs in a worker thread.
+    """
+    if not (url := settings.WEBHOOK_V2_URL):
+        return 0
+    claimed = await asyncio.to_thread(_claim_batch, db)
+    if not claimed:
+        return 0
+    handled = await deliver(
+        url, [(event.ordering_key, event.envelope) for event in claimed]
+    )
+    delivered = [event.id for event in claimed if event.envelope["id"] in handled]
+    failed = [event.id for event in claimed if event.envelope["id"] not in handled]
+    await asyncio.to_thread(_record_outcome, db, delivered, failed)
+    return len(delivered)
+
+
+async def relay_outbox_task() -> None:
+    """
+    Relays the webhook outbox. Every replica runs a relay, the claims keep them
+    from delivering the same events, or events with the same ordering key at
+    the same time. Full batches are drained back-to-back, otherwise the task
+    polls for new events.
+    """
+    while True:
+        relayed = 0
+        try:
+            with SessionLocal() as db:
+                relayed = await relay_outbox(db)
+        except Exception as e:
+            logger.warning(f"[Webhooks] Relaying outbox events failed: {e}")
+        if relayed < settings.WEBHOOK_V2_OUTBOX_BATCH_SIZE:
+            await asyncio.sleep(settings.WEBHOOK_V2_OUTBOX_POLL_INTERVAL_SECONDS)
+
+
+def purge_outbox() -> None:
+    """
+    Removes delivered events past their retention,
+    they can no longer be replayed afterwards.
+    """
+    with SessionLocal() as db:
+        purge_delivered_outbox_events(db)
+
+
+def purge_delivered_outbox_events(db: Session) -> None:
+    now = datetime.now(tz=pytz.utc).replace(tzinfo=None)
+    cutoff = now - timedelta(days=settings.WEBHOOK_V2_OUTBOX_RETENTION_DAYS)
+    if purged := WebhookOutboxService(db).purge_delivered_events(cutoff):
+        logger.info(f"[Webhooks] Purged {purged} delivered outbox events")
+    db.commit()
+
+
+purge_outbox_job = Job(
+    "purge_webhook_outbox", purge_outbox, every(PURGE_INTERVAL_SECONDS)
+)
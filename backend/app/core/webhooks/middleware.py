@@ -4,19 +4,29 @@ from contextlib import suppress
 from typing import Any
 
 from fastapi import FastAPI
+from opentelemetry import metrics
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.context import close_event_context, open_event_context, pop_events
 from app.core.logging import logger
 from app.core.webhooks.events import V2Event
-from app.core.webhooks.v2 import emit_all_events
+from app.core.webhooks.v2 import (
+    close_webhook_client,
+    dropped_events,
+    emit_all_events,
+)
 from app.settings import settings
 
-_EVENT_QUEUE_MAXSIZE = 1000
 _INFLIGHT_DRAIN_TIMEOUT_SECONDS = 10.0
 _QUEUE_DRAIN_TIMEOUT_SECONDS = 10.0
 _DISPATCHER_STATE_KEY = "webhook_v2_dispatcher"
 
+meter = metrics.get_meter(__name__)
+_queue_depth = meter.create_up_down_counter(
+    "webhook.queue.depth",
+    description="Webhook v2 events waiting in the dispatcher queue",
+)
+
 
 class EventDispatcher:
     """Dispatches webhook v2 events to a background worker.
@@ -24,11 +34,14 @@ class EventDispatcher:
     Requests hand off their events to a queue so the response is not delayed by
     the webhook call. Shutdown waits for in-flight requests to submit their
     events and for the queue to drain, both under a bounded timeout.
+
+    The worker takes everything queued at once, so events that pile up while a
+    delivery is in progress go out together in the next one.
     """
 
     def __init__(self) -> None:
         self._queue: asyncio.Queue[list[V2Event]] = asyncio.Queue(
-            maxsize=_EVENT_QUEUE_MAXSIZE
+            maxsize=settings.WEBHOOK_V2_QUEUE_SIZE
         )
         self._inflight_requests = 0
         self._idle = asyncio.Event()
@@ -50,15 +63,21 @@ class EventDispatcher:
     async def _worker(self) -> None:
         while True:
             try:
-                events = await self._queue.get()
+                batches = [await self._queue.get()]
             except asyncio.QueueShutDown:
                 return
+            with suppress(asyncio.QueueEmpty, asyncio.QueueShutDown):
+                while True:
+                    batches.append(self._queue.get_nowait())
+            events = [event for batch in batches for event in batch]
+            _queue_depth.add(-len(events))
             try:
                 await emit_all_events(events)
             except Exception:
                 logger.exception("Failed to dispatch queued webhook v2 events")
             finally:
-                self._queue.task_done()
+                for _ in batches:
+                    self._queue.task_done()
 
     def request_started(self) -> None:
         self._inflight_requests += 1
@@ -76,10 +95,14 @@ class EventDispatcher:
             logger.warning(
                 "Webhook v2 event queue is full, dropping %s events", len(events)
             )
+            dropped_events.add(len(events), {"reason": "queue_full"})
         except asyncio.QueueShutDown:
             logger.warning(
                 "Webhook v2 event queue is shut down, dropping %s events", len(events)
             )
+            dropped_events.add(len(events), {"reason": "shutdown"})
+        else:
+            _queue_depth.add(len(events))
 
     async def stop(self) -> None:
         # The queue stays open here so in-flight requests can still submit.
@@ -137,6 +160,7 @@ async def stop_event_dispatcher(app: FastAPI) -> None:
     dispatcher = getattr(app.state, _DISPATCHER_STATE_KEY, None)
     if dispatcher is not None:
         await dispatcher.stop()
+    await close_webhook_client()
 
 
 def _get_event_dispatcher(app: FastAPI) -> EventDispatcher:
@@ -0,0 +1,64 @@
+import uuid
+from datetime import timezone
+from typing import Any
+
+from sqlalchemy import BigInteger, Column, DateTime, Identity, Index, String, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+
+from app.core.webhooks.v2 import envelope
+from app.database.database import Base
+from app.shared.model import utcnow
+
+
+class OutboxEvent(Base):
+    """A webhook v2 event, written in the same transaction as the change it
+    describes. Subscribers replay events in the order their transactions became
+    visible, keyed on the transaction and the id.
+    """
+
+    __tablename__ = "webhook_outbox"
+
+    id = Column(BigInteger, Identity(), primary_key=True)
+    # The writing transaction, ids are assigned on insert rather than on commit
+    transaction_id = Column(
+        BigInteger,
+        nullable=False,
+        server_default=text("pg_current_xact_id()::text::bigint"),
+    )
+    event_id = Column(UUID(as_uuid=True), nullable=False, default=uuid.uuid4)
+    type = Column(String, nullable=False)
+    # Events with the same ordering key are delivered in order
+    ordering_key = Column(String, nullable=False)
+    data = Column(JSONB, nullable=False)
+    created_on = Column(DateTime(timezone=False), server_default=utcnow())
+    # Set while a relay delivers the event, or holds it back after a failed delivery
+    claimed_until = Column(DateTime(timezone=False), nullable=True)
+    delivered_on = Column(DateTime(timezone=False), nullable=True)
+
+    __table_args__ = (
+        Index(
+            "idx_webhook_outbox_pending",
+            "id",
+            postgresql_where=text("delivered_on IS NULL"),
+        ),
+        Index(
+            "idx_webhook_outbox_pending_ordering_key",
+            "ordering_key",
+            "id",
+            postgresql_where=text("delivered_on IS NULL"),
+        ),
+        Index("idx_webhook_outbox_transaction_id", "transaction_id", "id"),
+        Index("idx_webhook_outbox_created_on", "created_on"),
+    )
+
+    def to_envelope(self) -> dict[str, Any]:
+        """The CloudEvents envelope, identical for every (re)delivery of the event.
+        The `sequence` extension carries the outbox offset.
+        """
+        return envelope(
+            self.type,
+            self.data,
+            event_id=str(self.event_id),
+            timestamp=self.created_on.replace(tzinfo=timezone.utc),
+            sequence=str(self.id),
+        )
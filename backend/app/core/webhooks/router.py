@@ -0,0 +1,36 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+from pydantic.json_schema import SkipJsonSchema
+from sqlalchemy.orm import Session
+
+from app.core.authz import Action, Authorization
+from app.core.authz.resolvers import EmptyResolver
+from app.core.webhooks.schema_response import WebhookEventsGet
+from app.core.webhooks.service import WebhookOutboxService
+from app.database.database import get_db_session
+
+router = APIRouter(tags=["Webhooks"], prefix="/v2/webhooks")
+
+
+@router.get(
+    "/events",
+    dependencies=[
+        Depends(
+            Authorization.enforce(Action.GLOBAL__UPDATE_CONFIGURATION, EmptyResolver)
+        ),
+    ],
+)
+def get_webhook_events(
+    cursor: Annotated[
+        str | SkipJsonSchema[None],
+        Query(description="The next_cursor of the previous page"),
+    ] = None,
+    limit: int = Query(default=100, ge=1, le=1000),
+    db: Session = Depends(get_db_session),
+) -> WebhookEventsGet:
+    """Replays the webhook v2 events after `cursor`, or from the start of the
+    outbox, e.g. to catch up after downtime. Pass the returned `next_cursor` to
+    read the following page.
+    """
+    return WebhookOutboxService(db).get_events(cursor, limit)
@@ -0,0 +1,20 @@
+from typing import Any, Optional, Sequence
+from uuid import UUID
+
+from app.shared.schema import ORMModel
+
+
+class CloudEvent(ORMModel):
+    specversion: str
+    id: UUID
+    source: str
+    type: str
+    time: str
+    sequence: str
+    data: dict[str, Any]
+
+
+class WebhookEventsGet(ORMModel):
+    events: Sequence[CloudEvent]
+    next_cursor: Optional[str]
+    delivered_cursor: Optional[str]
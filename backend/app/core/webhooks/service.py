@@ -0,0 +1,168 @@
+from datetime import datetime, timedelta
+from typing import Optional, Sequence
+
+from sqlalchemy import (
+    BigInteger,
+    ColumnElement,
+    Connection,
+    delete,
+    exists,
+    func,
+    insert,
+    literal_column,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.orm import Session, aliased
+
+from app.core.webhooks.events import V2Event
+from app.core.webhooks.model import OutboxEvent
+from app.core.webhooks.schema_response import CloudEvent, WebhookEventsGet
+from app.core.webhooks.v2 import ordering_key
+from app.settings import settings
+from app.shared.model import utcnow
+from app.shared.pagination import Keyset, PageRequest
+
+
+def write_outbox_events(connection: Connection, events: Sequence[V2Event]) -> None:
+    """Stores the events in the outbox, as part of the transaction on `connection`.
+    They are only delivered once that transaction commits.
+    """
+    if not events or not settings.WEBHOOK_V2_URL:
+        return
+    connection.execute(
+        insert(OutboxEvent),
+        [
+            {
+                "type": type(event).event_type(),
+                "ordering_key": ordering_key(event),
+                "data": event.model_dump(mode="json"),
+            }
+            for event in events
+        ],
+    )
+
+
+# Relays claim events one at a time, under this transaction-level advisory lock
+OUTBOX_CLAIM_LOCK_ID = 0x0B7B0C5
+
+# Transactions below this id have finished, so their events are all visible
+_VISIBLE_TRANSACTIONS: ColumnElement[int] = literal_column(
+    "pg_snapshot_xmin(pg_current_snapshot())::text::bigint", BigInteger
+)
+
+replay_keyset = Keyset(OutboxEvent.transaction_id, OutboxEvent.id)
+
+
+class WebhookOutboxService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def claim_pending_events(self, limit: int) -> Sequence[OutboxEvent]:
+        """Claims the oldest undelivered events, to be committed before delivering.
+
+        An event is skipped while an earlier event with the same ordering key is
+        claimed, so relays on every replica keep the events of a resource in
+        order. Claims are taken under an advisory lock, each relay sees the
+        claims committed before its own.
+        """
+        self.db.execute(select(func.pg_advisory_xact_lock(OUTBOX_CLAIM_LOCK_ID)))
+        earlier = aliased(OutboxEvent)
+        events = self.db.scalars(
+            select(OutboxEvent)
+            .where(
+                OutboxEvent.delivered_on.is_(None),
+                or_(
+                    OutboxEvent.claimed_until.is_(None),
+                    OutboxEvent.claimed_until < utcnow(),
+                ),
+                ~exists().where(
+                    earlier.ordering_key == OutboxEvent.ordering_key,
+                    earlier.delivered_on.is_(None),
+                    earlier.id < OutboxEvent.id,
+                    earlier.claimed_until >= utcnow(),
+                ),
+            )
+            .order_by(OutboxEvent.id)
+            .limit(limit)
+        ).all()
+        self._claim(
+            [event.id for event in events], settings.WEBHOOK_V2_OUTBOX_CLAIM_SECONDS
+        )
+        return events
+
+    def mark_delivered(self, ids: Sequence[int]) -> None:
+        if ids:
+            self.db.execute(
+                update(OutboxEvent)
+                .where(OutboxEvent.id.in_(ids))
+                .values(delivered_on=utcnow(), claimed_until=None)
+            )
+
+    def retry_later(self, ids: Sequence[int]) -> None:
+        """Holds back events that failed to deliver, and the later events with
+        the same ordering key, for the retry interval.
+        """
+        self._claim(ids, settings.WEBHOOK_V2_OUTBOX_RETRY_INTERVAL_SECONDS)
+
+    def _claim(self, ids: Sequence[int], seconds: int) -> None:
+        if ids:
+            self.db.execute(
+                update(OutboxEvent)
+                .where(OutboxEvent.id.in_(ids))
+                .values(claimed_until=utcnow() + timedelta(seconds=seconds))
+            )
+
+    def get_delivered_cursor(self) -> Optional[str]:
+        """The replay cursor up to which every event has been delivered."""
+        visible = OutboxEvent.transaction_id < _VISIBLE_TRANSACTIONS
+        pending = self.db.execute(
+            select(OutboxEvent.transaction_id, OutboxEvent.id)
+            .where(visible, OutboxEvent.delivered_on.is_(None))
+            .order_by(OutboxEvent.transaction_id, OutboxEvent.id)
+            .limit(1)
+        ).first()
+        if pending is not None:
+            return replay_keyset.encode(pending.transaction_id, pending.id - 1)
+        last = self.db.execute(
+            select(OutboxEvent.transaction_id, OutboxEvent.id)
+            .where(visible)
+            .order_by(OutboxEvent.transaction_id.desc(), OutboxEvent.id.desc())
+            .limit(1)
+        ).first()
+        return replay_keyset.encode(*last) if last is not None else None
+
+    def get_events(self, cursor: Optional[str], limit: int) -> WebhookEventsGet:
+        """Reads the events after `cursor`, delivered or not, in the order their
+        transactions became visible.
+
+        Only events of finished transactions are read, ordered on the transaction
+        and then the id, so an event committed later never sorts before a cursor
+        that was already handed out.
+        """
+        page = replay_keyset.fetch(
+            self.db,
+            select(OutboxEvent).where(
+                OutboxEvent.transaction_id < _VISIBLE_TRANSACTIONS
+            ),
+            PageRequest(cursor=cursor, limit=limit),
+        )
+        return WebhookEventsGet(
+            events=[CloudEvent(**event.to_envelope()) for event in page.items],
+            next_cursor=(
+                replay_keyset.encode(page.items[-1].transaction_id, page.items[-1].id)
+                if page.items
+                else cursor
+            ),
+            delivered_cursor=self.get_delivered_cursor(),
+        )
+
+    def purge_delivered_events(self, before: datetime) -> int:
+        result = self.db.execute(
+            delete(OutboxEvent).where(
+                OutboxEvent.delivered_on.is_not(None),
+                OutboxEvent.created_on < before,
+            )
+        )
+        return result.rowcount
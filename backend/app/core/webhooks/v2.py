@@ -1,37 +1,214 @@
+import asyncio
+import json
+import random
+import time
 import uuid
+from collections import defaultdict
 from datetime import datetime, timezone
-from typing import Sequence
+from enum import Enum
+from itertools import batched
+from typing import Any, Optional, Sequence
 
 import httpx
+from opentelemetry import metrics
 
 from app.core.logging import logger
 from app.core.webhooks.events import V2Event
 from app.settings import settings
 
-_MISSING = object()
+_BATCH_CONTENT_TYPE = "application/cloudevents-batch+json"
+_RETRYABLE_STATUS_CODES = {408, 425, 429}
+
+meter = metrics.get_meter(__name__)
+_delivery_duration = meter.create_histogram(
+    "webhook.delivery.duration",
+    unit="s",
+    description="Duration of a single webhook v2 delivery attempt",
+)
+dropped_events = meter.create_counter(
+    "webhook.events.dropped",
+    description="Webhook v2 events that were never delivered, by reason",
+)
+
+
+class _ClientPool:
+    """A keep-alive HTTP client shared by all deliveries on the running event loop.
+
+    Connections are bound to the loop they were opened on, so a client is only
+    reused from the loop that created it.
+    """
+
+    def __init__(self) -> None:
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def get(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            self._client = httpx.AsyncClient(
+                timeout=settings.WEBHOOK_V2_TIMEOUT_SECONDS,
+                limits=httpx.Limits(
+                    max_connections=settings.WEBHOOK_V2_CONCURRENCY,
+                    max_keepalive_connections=settings.WEBHOOK_V2_CONCURRENCY,
+                ),
+            )
+            self._loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        client, self._client = self._client, None
+        if client is not None and self._loop is asyncio.get_running_loop():
+            await client.aclose()
+
+
+_clients = _ClientPool()
+
+
+class _Outcome(Enum):
+    DELIVERED = "delivered"
+    # The receiver refused the events, retrying them would not help
+    REJECTED = "rejected"
+    # Still failing after retrying, the events may go through later
+    FAILED = "failed"
+
+
+async def close_webhook_client() -> None:
+    await _clients.aclose()
 
 
 async def emit_all_events(events: Sequence[V2Event]) -> None:
-    # Good for keeping sequential order, bad for speed, maybe also good for not DoSing the receiver.
-    # To be checked if we ever run into issues with this.
-    for event in events:
-        await call_v2_webhook(type(event).event_type(), event.model_dump(mode="json"))
+    """Delivers the events, dropping those that still fail after retrying."""
+    if not (url := settings.WEBHOOK_V2_URL) or not events:
+        return
+
+    envelopes = [
+        (
+            ordering_key(event),
+            envelope(type(event).event_type(), event.model_dump(mode="json")),
+        )
+        for event in events
+    ]
+    handled = await deliver(url, envelopes)
+    if dropped := len(envelopes) - len(handled):
+        dropped_events.add(dropped, {"reason": "delivery_failed"})
 
 
 async def call_v2_webhook(event_type: str, data: dict) -> None:
     if not (url := settings.WEBHOOK_V2_URL):
         return
-    body = {
+    await _deliver(url, [envelope(event_type, data)])
+
+
+async def deliver(
+    url: str, envelopes: Sequence[tuple[str, dict[str, Any]]]
+) -> set[str]:
+    """Delivers (ordering key, envelope) pairs over a bounded number of
+    concurrent lanes, and returns the ids of the envelopes that were handled.
+
+    Events with the same ordering key always share a lane, and a lane delivers
+    its events one request at a time, so these arrive in the order they were
+    given. A lane stops at the first delivery that still fails after retrying,
+    so a later event never overtakes it. Events the receiver rejects outright
+    count as handled, retrying them would not help.
+    """
+    lanes: defaultdict[int, list[dict[str, Any]]] = defaultdict(list)
+    for key, body in envelopes:
+        lanes[hash(key) % max(settings.WEBHOOK_V2_CONCURRENCY, 1)].append(body)
+    results = await asyncio.gather(
+        *(_deliver_lane(url, lane) for lane in lanes.values())
+    )
+    return {body["id"] for handled in results for body in handled}
+
+
+def envelope(
+    event_type: str,
+    data: dict,
+    *,
+    event_id: Optional[str] = None,
+    timestamp: Optional[datetime] = None,
+    **extensions: Any,
+) -> dict[str, Any]:
+    return {
         "specversion": "1.0",
-        "id": str(uuid.uuid4()),
+        "id": event_id or str(uuid.uuid4()),
         "source": "data-product-portal",
         "type": event_type,
-        "time": datetime.now(timezone.utc).isoformat(),
+        "time": (timestamp or datetime.now(timezone.utc)).isoformat(),
+        **extensions,
         "data": data,
     }
-    try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(url, json=body, timeout=5.0)
+
+
+def ordering_key(event: V2Event) -> str:
+    """Events about the same resource share a key, and are delivered in order."""
+    return str(getattr(event, "id", type(event).event_type()))
+
+
+async def _deliver_lane(
+    url: str, envelopes: list[dict[str, Any]]
+) -> list[dict[str, Any]]:
+    batch_size = max(settings.WEBHOOK_V2_BATCH_SIZE, 1)
+    handled: list[dict[str, Any]] = []
+    for batch in batched(envelopes, batch_size):
+        outcome = await _deliver(url, batch, as_batch=batch_size > 1)
+        if outcome is _Outcome.FAILED:
+            break
+        if outcome is _Outcome.REJECTED:
+            dropped_events.add(len(batch), {"reason": "rejected"})
+        handled.extend(batch)
+    return handled
+
+
+async def _deliver(
+    url: str, envelopes: Sequence[dict[str, Any]], *, as_batch: bool = False
+) -> "_Outcome":
+    """Posts the events, retrying with exponential backoff and full jitter
+    on connection errors, timeouts, throttling and 5xx responses.
+    """
+    request: dict[str, Any] = (
+        {
+            "content": json.dumps(list(envelopes)),
+            "headers": {"Content-Type": _BATCH_CONTENT_TYPE},
+        }
+        if as_batch
+        else {"json": envelopes[0]}
+    )
+    client = _clients.get()
+    attempts = max(settings.WEBHOOK_V2_MAX_ATTEMPTS, 1)
+    for attempt in range(1, attempts + 1):
+        start_time = time.perf_counter()
+        try:
+            resp = await client.post(url, **request)
             resp.raise_for_status()
-    except Exception as e:
-        logger.warning("v2 webhook failed: %s", e)
+        except Exception as e:
+            _delivery_duration.record(
+                time.perf_counter() - start_time, {"outcome": "failure"}
+            )
+            if not _is_retryable(e):
+                logger.warning("v2 webhook failed: %s", e)
+                return _Outcome.REJECTED
+            if attempt == attempts:
+                logger.warning("v2 webhook failed: %s", e)
+                return _Outcome.FAILED
+            await asyncio.sleep(_backoff(attempt))
+        else:
+            _delivery_duration.record(
+                time.perf_counter() - start_time, {"outcome": "success"}
+            )
+            return _Outcome.DELIVERED
+    return _Outcome.FAILED
+
+
+def _is_retryable(error: Exception) -> bool:
+    if isinstance(error, httpx.HTTPStatusError):
+        status_code = error.response.status_code
+        return status_code >= 500 or status_code in _RETRYABLE_STATUS_CODES
+    return isinstance(error, httpx.TransportError)
+
+
+def _backoff(attempt: int) -> float:
+    ceiling = min(
+        settings.WEBHOOK_V2_RETRY_MAX_BACKOFF_SECONDS,
+        settings.WEBHOOK_V2_RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1),
+    )
+    return random.uniform(0, ceiling)  # noqa: S311
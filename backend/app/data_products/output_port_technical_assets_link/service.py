@@ -168,14 +168,16 @@ class TechnicalAssetOutputPortService:
             .all()
         )
 
-        authorizer = Authorization()
+        allowed = Authorization().has_access_many(
+            sub=str(user.id),
+            objects={
+                str(a.output_port_id): str(a.output_port.data_product.domain_id)
+                for a in requested_associations
+            },
+            act=Action.OUTPUT_PORT__APPROVE_TECHNICAL_ASSET_LINK_REQUEST,
+        )
         return [
             TechnicalAssetOutputPortRequest.model_validate(a)
             for a in requested_associations
-            if authorizer.has_access(
-                sub=str(user.id),
-                dom=str(a.output_port.data_product.domain),
-                obj=str(a.output_port_id),
-                act=Action.OUTPUT_PORT__APPROVE_TECHNICAL_ASSET_LINK_REQUEST,
-            )
+            if allowed[str(a.output_port_id)]
         ]
@@ -0,0 +1,33 @@
+import asyncio
+
+from app.core.logging import logger
+from app.data_products.output_ports.service import OutputPortService
+from app.database.database import SessionLocal
+from app.settings import settings
+
+
+def recalculate_outdated_embeddings() -> int:
+    with SessionLocal() as db:
+        return OutputPortService(db).recalculate_outdated_embeddings(
+            settings.EMBEDDING_RECALCULATION_BATCH_SIZE
+        )
+
+
+async def recalculate_outdated_embeddings_task() -> None:
+    """
+    Recalculates outdated output port embeddings in batches, off the request path.
+    Model inference runs in a worker thread to keep the event loop responsive.
+    Full batches are drained back-to-back, otherwise the task waits for new changes.
+    """
+    while True:
+        recalculated = 0
+        try:
+            recalculated = await asyncio.to_thread(recalculate_outdated_embeddings)
+            if recalculated:
+                logger.info(
+                    f"[Embeddings] Recalculated embeddings of {recalculated} output ports"
+                )
+        except Exception as e:
+            logger.warning(f"[Embeddings] Recalculating embeddings failed: {e}")
+        if recalculated < settings.EMBEDDING_RECALCULATION_BATCH_SIZE:
+            await asyncio.sleep(settings.EMBEDDING_RECALCULATION_INTERVAL_SECONDS)
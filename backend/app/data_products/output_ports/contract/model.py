@@ -1,11 +1,13 @@
 import uuid
+from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, ForeignKey, SmallInteger, Text
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, SmallInteger, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database.database import Base
+from app.shared.model import utcnow
 
 
 class OutputPortSchemaObject(Base):
@@ -26,6 +28,10 @@ class OutputPortSchemaObject(Base):
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     position: Mapped[int] = mapped_column(SmallInteger, nullable=False, default=0)
 
+    __table_args__ = (
+        Index("idx_output_port_schema_objects_output_port_id", "output_port_id"),
+    )
+
 
 class OutputPortSchemaProperty(Base):
     __tablename__ = "output_port_schema_properties"
@@ -60,3 +66,29 @@ class OutputPortSchemaProperty(Base):
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     examples: Mapped[Optional[list]] = mapped_column(JSONB, nullable=True)
     position: Mapped[int] = mapped_column(SmallInteger, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("idx_output_port_schema_properties_schema_object_id", "schema_object_id"),
+        Index(
+            "idx_output_port_schema_properties_parent_property_id",
+            "parent_property_id",
+        ),
+    )
+
+
+class OutputPortContract(Base):
+    """The hash of the contract last ingested for an output port, so pushing the
+    same contract again leaves the schema untouched.
+    """
+
+    __tablename__ = "output_port_contracts"
+
+    output_port_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("datasets.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    contract_hash: Mapped[str] = mapped_column(Text, nullable=False)
+    ingested_on: Mapped[datetime] = mapped_column(
+        DateTime(timezone=False), server_default=utcnow(), onupdate=utcnow()
+    )
@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 from app.core.authz import Action, Authorization, DatasetResolver
 from app.data_products.output_ports.contract.schema_request import BitolContractRequest
 from app.data_products.output_ports.contract.schema_response import (
+    OutputPortContractIngestResponse,
     OutputPortSchemaResponse,
 )
 from app.data_products.output_ports.contract.service import OutputPortContractService
@@ -57,6 +58,6 @@ def ingest_output_port_contract(
     id: UUID,
     contract: BitolContractRequest,
     db: Session = Depends(get_db_session),
-) -> OutputPortSchemaResponse:
+) -> OutputPortContractIngestResponse:
     ds = ensure_output_port_exists(id, db, data_product_id=data_product_id)
     return OutputPortContractService(db).ingest_contract(ds.id, contract)
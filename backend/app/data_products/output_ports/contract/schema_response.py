@@ -39,3 +39,17 @@ class SchemaObjectResponse(ORMModel):
 class OutputPortSchemaResponse(ORMModel):
     output_port_id: UUID
     schema_objects: list[SchemaObjectResponse] = []
+
+
+class SchemaChangesResponse(ORMModel):
+    """Paths (`object.property.nested_property`) of what an ingest changed.
+    `unchanged` is set when the contract was ingested before as is."""
+
+    unchanged: bool = False
+    added: list[str] = []
+    removed: list[str] = []
+    changed: list[str] = []
+
+
+class OutputPortContractIngestResponse(OutputPortSchemaResponse):
+    changes: SchemaChangesResponse
@@ -1,11 +1,17 @@
+import hashlib
+import json
 import uuid
-from collections import defaultdict
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterable
+from itertools import batched
+from typing import Any, Optional, TypeVar
 from uuid import UUID
 
-from sqlalchemy import delete
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.orm import Session
 
 from app.data_products.output_ports.contract.model import (
+    OutputPortContract,
     OutputPortSchemaObject,
     OutputPortSchemaProperty,
 )
@@ -14,10 +20,87 @@ from app.data_products.output_ports.contract.schema_request import (
     SchemaPropertyRequest,
 )
 from app.data_products.output_ports.contract.schema_response import (
+    OutputPortContractIngestResponse,
     OutputPortSchemaResponse,
+    SchemaChangesResponse,
     SchemaObjectResponse,
     SchemaPropertyResponse,
 )
+from app.data_products.output_ports.model import OutputPort
+
+WRITE_BATCH_SIZE = 1000
+
+# Fields compared to tell whether an object or property changed, besides its position
+OBJECT_FIELDS = ("logical_type", "physical_type", "physical_name", "description")
+PROPERTY_FIELDS = (
+    "business_name",
+    "logical_type",
+    "physical_type",
+    "description",
+    "examples",
+    "primary_key",
+    "primary_key_position",
+    "unique",
+    "required",
+    "partitioned",
+    "partition_key_position",
+)
+
+# Objects and properties are identified by the path of names leading to them,
+# numbered to tell apart siblings with the same name
+Key = tuple[tuple[str, int], ...]
+Row = TypeVar("Row", OutputPortSchemaObject, OutputPortSchemaProperty)
+
+
+def _sibling_keys(names: Iterable[str]) -> list[tuple[str, int]]:
+    seen: Counter[str] = Counter()
+    keys = []
+    for name in names:
+        keys.append((name, seen[name]))
+        seen[name] += 1
+    return keys
+
+
+def _path(key: Key) -> str:
+    return ".".join(name for name, _ in key)
+
+
+class _Diff:
+    """The writes bringing stored objects or properties in line with a contract."""
+
+    def __init__(self) -> None:
+        self.ids: dict[Key, UUID] = {}
+        self.inserts: list[dict[str, Any]] = []
+        self.updates: list[dict[str, Any]] = []
+        self.deletes: list[UUID] = []
+        self.changes = SchemaChangesResponse()
+
+    def compare(
+        self,
+        current: dict[Key, Row],
+        desired: dict[Key, dict[str, Any]],
+        fields: tuple[str, ...],
+        parent_values: Callable[[Key], dict[str, Any]],
+    ) -> None:
+        for key, values in desired.items():
+            row = current.get(key)
+            if row is None:
+                self.ids[key] = uuid.uuid4()
+                self.inserts.append(
+                    {"id": self.ids[key], **parent_values(key), **values}
+                )
+                self.changes.added.append(_path(key))
+                continue
+            self.ids[key] = row.id
+            if any(getattr(row, field) != values[field] for field in fields):
+                self.changes.changed.append(_path(key))
+            elif row.position == values["position"]:
+                continue
+            self.updates.append({"id": row.id, **values})
+        for key, row in current.items():
+            if key not in desired:
+                self.deletes.append(row.id)
+                self.changes.removed.append(_path(key))
 
 
 class OutputPortContractService:
@@ -26,32 +109,172 @@ class OutputPortContractService:
 
     def ingest_contract(
         self, output_port_id: UUID, contract: BitolContractRequest
-    ) -> OutputPortSchemaResponse:
+    ) -> OutputPortContractIngestResponse:
+        """Brings the stored schema in line with the contract. Objects and
+        properties that are kept keep their ids, only the differences are written,
+        and a contract that was ingested before as is is skipped altogether.
+        """
+        contract_hash = self._hash(contract)
+        # Serializes concurrent ingests for the output port
         self.db.execute(
-            delete(OutputPortSchemaObject).where(
-                OutputPortSchemaObject.output_port_id == output_port_id
-            )
+            select(OutputPort.id)
+            .where(OutputPort.id == output_port_id)
+            .with_for_update(key_share=True)
         )
+        stored = self.db.get(OutputPortContract, output_port_id)
+        if stored is not None and stored.contract_hash == contract_hash:
+            self.db.commit()
+            return self._ingest_response(
+                output_port_id, SchemaChangesResponse(unchanged=True)
+            )
 
-        for position, obj_req in enumerate(contract.schema_objects):
-            obj_id = uuid.uuid4()
+        changes = self._apply_contract(output_port_id, contract)
+        if stored is None:
             self.db.add(
-                OutputPortSchemaObject(
-                    id=obj_id,
-                    output_port_id=output_port_id,
-                    name=obj_req.name,
-                    logical_type=obj_req.logical_type,
-                    physical_type=obj_req.physical_type,
-                    physical_name=obj_req.physical_name,
-                    description=obj_req.description,
-                    position=position,
+                OutputPortContract(
+                    output_port_id=output_port_id, contract_hash=contract_hash
                 )
             )
-            for prop in self._flatten_properties(obj_req.properties, obj_id, None):
-                self.db.add(prop)
-
+        else:
+            stored.contract_hash = contract_hash
         self.db.commit()
-        return self.get_schema(output_port_id)
+        return self._ingest_response(output_port_id, changes)
+
+    @staticmethod
+    def _hash(contract: BitolContractRequest) -> str:
+        canonical = json.dumps(
+            contract.model_dump(mode="json"), sort_keys=True, separators=(",", ":")
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def _ingest_response(
+        self, output_port_id: UUID, changes: SchemaChangesResponse
+    ) -> OutputPortContractIngestResponse:
+        schema = self.get_schema(output_port_id)
+        return OutputPortContractIngestResponse(
+            output_port_id=output_port_id,
+            schema_objects=schema.schema_objects,
+            changes=changes,
+        )
+
+    def _apply_contract(
+        self, output_port_id: UUID, contract: BitolContractRequest
+    ) -> SchemaChangesResponse:
+        current_objects, current_properties = self._current_schema(output_port_id)
+        desired_objects: dict[Key, dict[str, Any]] = {}
+        desired_properties: dict[Key, dict[str, Any]] = {}
+        object_keys = _sibling_keys(obj.name for obj in contract.schema_objects)
+        for position, (sibling_key, obj) in enumerate(
+            zip(object_keys, contract.schema_objects)
+        ):
+            key = (sibling_key,)
+            desired_objects[key] = {
+                "name": obj.name,
+                "position": position,
+                **{field: getattr(obj, field) for field in OBJECT_FIELDS},
+            }
+            self._desired_properties(obj.properties, key, desired_properties)
+
+        objects = _Diff()
+        objects.compare(
+            current_objects,
+            desired_objects,
+            OBJECT_FIELDS,
+            lambda key: {"output_port_id": output_port_id},
+        )
+        properties = _Diff()
+        properties.compare(
+            current_properties,
+            desired_properties,
+            PROPERTY_FIELDS,
+            # Desired properties come parents first, so their ids are known
+            lambda key: {
+                "schema_object_id": objects.ids[key[:1]],
+                "parent_property_id": (
+                    properties.ids[key[:-1]] if len(key) > 2 else None
+                ),
+            },
+        )
+
+        for model, diff in (
+            (OutputPortSchemaProperty, properties),
+            (OutputPortSchemaObject, objects),
+        ):
+            for ids in batched(diff.deletes, WRITE_BATCH_SIZE):
+                self.db.execute(delete(model).where(model.id.in_(ids)))
+        for model, diff in (
+            (OutputPortSchemaObject, objects),
+            (OutputPortSchemaProperty, properties),
+        ):
+            for rows in batched(diff.inserts, WRITE_BATCH_SIZE):
+                self.db.execute(insert(model), list(rows))
+            for rows in batched(diff.updates, WRITE_BATCH_SIZE):
+                self.db.execute(update(model), list(rows))
+
+        return SchemaChangesResponse(
+            added=objects.changes.added + properties.changes.added,
+            removed=objects.changes.removed + properties.changes.removed,
+            changed=objects.changes.changed + properties.changes.changed,
+        )
+
+    def _current_schema(
+        self, output_port_id: UUID
+    ) -> tuple[dict[Key, OutputPortSchemaObject], dict[Key, OutputPortSchemaProperty]]:
+        schema_objects = self.db.scalars(
+            select(OutputPortSchemaObject)
+            .where(OutputPortSchemaObject.output_port_id == output_port_id)
+            .order_by(OutputPortSchemaObject.position)
+        ).all()
+        siblings: dict[tuple[UUID, Optional[UUID]], list[OutputPortSchemaProperty]] = (
+            defaultdict(list)
+        )
+        for prop in self.db.scalars(
+            select(OutputPortSchemaProperty)
+            .where(
+                OutputPortSchemaProperty.schema_object_id.in_(
+                    [obj.id for obj in schema_objects]
+                )
+            )
+            .order_by(OutputPortSchemaProperty.position)
+        ):
+            siblings[prop.schema_object_id, prop.parent_property_id].append(prop)
+
+        objects: dict[Key, OutputPortSchemaObject] = {}
+        properties: dict[Key, OutputPortSchemaProperty] = {}
+
+        def add_properties(
+            schema_object_id: UUID, parent_id: Optional[UUID], parent_key: Key
+        ) -> None:
+            props = siblings[schema_object_id, parent_id]
+            for sibling_key, prop in zip(_sibling_keys(p.name for p in props), props):
+                key = (*parent_key, sibling_key)
+                properties[key] = prop
+                add_properties(schema_object_id, prop.id, key)
+
+        for sibling_key, obj in zip(
+            _sibling_keys(obj.name for obj in schema_objects), schema_objects
+        ):
+            objects[(sibling_key,)] = obj
+            add_properties(obj.id, None, (sibling_key,))
+        return objects, properties
+
+    @classmethod
+    def _desired_properties(
+        cls,
+        properties: list[SchemaPropertyRequest],
+        parent_key: Key,
+        desired: dict[Key, dict[str, Any]],
+    ) -> None:
+        for position, (sibling_key, prop) in enumerate(
+            zip(_sibling_keys(prop.name for prop in properties), properties)
+        ):
+            key = (*parent_key, sibling_key)
+            desired[key] = {
+                "name": prop.name,
+                "position": position,
+                **{field: getattr(prop, field) for field in PROPERTY_FIELDS},
+            }
+            cls._desired_properties(prop.properties, key, desired)
 
     def get_schema(self, output_port_id: UUID) -> OutputPortSchemaResponse:
         schema_objects = (
@@ -121,6 +344,7 @@ class OutputPortContractService:
                     position=p.position,
                     partitioned=p.partitioned,
                     partition_key_position=p.partition_key_position,
+                    unique=p.unique,
                     required=p.required,
                     primary_key=p.primary_key,
                     primary_key_position=p.primary_key_position,
@@ -130,41 +354,3 @@ class OutputPortContractService:
                 )
             )
         return schema_properties
-
-    @staticmethod
-    def _flatten_properties(
-        properties: list[SchemaPropertyRequest],
-        schema_object_id: UUID,
-        parent_id: UUID | None,
-        start_position: int = 0,
-    ) -> list[OutputPortSchemaProperty]:
-        result = []
-        for i, prop in enumerate(properties):
-            prop_id = uuid.uuid4()
-            result.append(
-                OutputPortSchemaProperty(
-                    id=prop_id,
-                    schema_object_id=schema_object_id,
-                    parent_property_id=parent_id,
-                    name=prop.name,
-                    business_name=prop.business_name,
-                    logical_type=prop.logical_type,
-                    physical_type=prop.physical_type,
-                    description=prop.description,
-                    examples=prop.examples,
-                    position=start_position + i,
-                    partitioned=prop.partitioned,
-                    partition_key_position=prop.partition_key_position,
-                    primary_key=prop.primary_key,
-                    primary_key_position=prop.primary_key_position,
-                    unique=prop.unique,
-                    required=prop.required,
-                )
-            )
-            if prop.properties:
-                result.extend(
-                    OutputPortContractService._flatten_properties(
-                        prop.properties, schema_object_id, prop_id
-                    )
-                )
-        return result
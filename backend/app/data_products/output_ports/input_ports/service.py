@@ -234,16 +234,20 @@ class InputPortService:
             .all()
         )
 
-        authorizer = Authorization()
+        allowed = Authorization().has_access_many(
+            sub=str(user.id),
+            objects={
+                str(a.input_port.output_port_id): str(
+                    a.input_port.output_port.data_product.domain_id
+                )
+                for a in requested_associations
+            },
+            act=Action.OUTPUT_PORT__APPROVE_DATAPRODUCT_ACCESS_REQUEST,
+        )
         return [
             InputPortRequest.model_validate(a)
             for a in requested_associations
-            if authorizer.has_access(
-                sub=str(user.id),
-                dom=str(a.input_port.output_port.data_product.domain),
-                obj=str(a.input_port.output_port_id),
-                act=Action.OUTPUT_PORT__APPROVE_DATAPRODUCT_ACCESS_REQUEST,
-            )
+            if allowed[str(a.input_port.output_port_id)]
         ]
 
     def get_user_requests(
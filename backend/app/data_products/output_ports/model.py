@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING, Optional
 
 from fastapi import HTTPException, status
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import Column, Enum, ForeignKey, String, func, select
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, String, func, select
 from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from sqlalchemy.orm import (
     Mapped,
@@ -34,7 +34,7 @@ from app.data_products.output_ports.status import OutputPortStatus
 from app.data_products.technical_assets.model import TechnicalAssetAccessMode
 from app.database.database import Base, ensure_exists
 from app.database.event_mixin import EventTrackedMixin
-from app.shared.model import BaseORM
+from app.shared.model import BaseORM, utcnow
 
 if TYPE_CHECKING:
     from app.authorization.role_assignments.output_port.model import (
@@ -77,6 +77,12 @@ class OutputPort(Base, BaseORM, EventTrackedMixin):
     usage = Column(String, nullable=True)
     search_vector = Column(TSVECTOR)
     embeddings = deferred(Column(Vector(384)))
+    # Set when the embeddings no longer reflect the output port, cleared once recalculated
+    embeddings_outdated_since = Column(
+        DateTime(timezone=False), server_default=utcnow()
+    )
+    # Set while a worker recalculates the embeddings, other workers skip the output port
+    embeddings_claimed_until = Column(DateTime(timezone=False), nullable=True)
 
     lifecycle_id: Mapped[UUID] = mapped_column(
         ForeignKey("data_product_lifecycles.id", ondelete="SET NULL")
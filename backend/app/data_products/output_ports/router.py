@@ -30,6 +30,7 @@ from app.data_products.output_ports.model import ensure_output_port_exists
 from app.data_products.output_ports.query_stats.router import (
     router as query_stats_router,
 )
+from app.data_products.output_ports.schema import OutputPort
 from app.data_products.output_ports.schema_request import (
     CreateOutputPortRequest,
     DatasetUpdate,
@@ -53,6 +54,7 @@ from app.events.schema_response import (
 )
 from app.events.service import EventService
 from app.graph.graph import Graph
+from app.shared.pagination import PageParams, list_response, page_params
 from app.users.model import User
 from app.users.notifications.service import NotificationService
 
@@ -103,9 +105,16 @@ def get_data_product_output_ports(
     data_product_id: UUID,
     db: Session = Depends(get_db_session),
     user: User = Depends(get_authenticated_user),
+    page: PageParams = Depends(page_params),
 ) -> GetDataProductOutputPortsResponse:
-    return GetDataProductOutputPortsResponse(
-        output_ports=OutputPortService(db).get_output_ports(data_product_id, user)
+    service = OutputPortService(db)
+    return list_response(
+        page,
+        lambda request: service.get_output_ports_page(data_product_id, user, request),
+        GetDataProductOutputPortsResponse,
+        "output_ports",
+        OutputPort,
+        db,
     )
 
 
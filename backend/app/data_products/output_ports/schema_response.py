@@ -20,6 +20,7 @@ from app.data_products.output_ports.status import OutputPortStatus
 from app.data_products.technical_assets.schema import (
     TechnicalAsset,
 )
+from app.shared.pagination import PaginatedResponse
 from app.shared.schema import ORMModel
 
 
@@ -70,7 +71,7 @@ class GetOutputPortResponse(BaseOutputPortGet):
     )
 
 
-class GetDataProductOutputPortsResponse(ORMModel):
+class GetDataProductOutputPortsResponse(PaginatedResponse):
     output_ports: Sequence[OutputPort]
 
 
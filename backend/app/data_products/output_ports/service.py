@@ -1,16 +1,29 @@
 import copy
-from itertools import islice
-from typing import Iterable, Optional, Sequence
+from datetime import timedelta
+from typing import Iterable, Iterator, Optional, Sequence
 from uuid import UUID
 
 from fastapi import HTTPException, status
-from sqlalchemy import func, select
+from pydantic import ValidationError
+from sqlalchemy import (
+    ColumnElement,
+    Subquery,
+    bindparam,
+    exists,
+    func,
+    or_,
+    select,
+    true,
+    union,
+    update,
+)
 from sqlalchemy.orm import Session, joinedload, raiseload, selectinload, undefer
 from sqlalchemy.sql.base import ExecutableOption
 
 from app.abstract_data_product.graph_utils import (
     get_graph_data_from_abstract_data_product,
 )
+from app.abstract_data_product.input_ports.enums import InputPortStatus
 from app.abstract_data_product.input_ports.model import (
     InputPort,
 )
@@ -18,9 +31,12 @@ from app.abstract_data_product.input_ports.model import (
     InputPort as InputPortModel,
 )
 from app.abstract_data_product.type import AbstractDataProductType
+from app.authorization.role_assignments.data_product.model import (
+    DataProductRoleAssignment as DataProductRoleAssignmentModel,
+)
 from app.authorization.role_assignments.enums import DecisionStatus
-from app.authorization.role_assignments.output_port.service import (
-    RoleAssignmentService as DatasetRoleAssignmentService,
+from app.authorization.role_assignments.output_port.model import (
+    DatasetRoleAssignment as DatasetRoleAssignmentModel,
 )
 from app.configuration.access_durations.enums import AccessDurationType
 from app.configuration.access_durations.model import (
@@ -32,7 +48,8 @@ from app.configuration.data_product_lifecycles.model import (
 from app.configuration.tags.model import Tag as TagModel
 from app.configuration.tags.model import ensure_tag_exists
 from app.core.authz import Authorization
-from app.core.embed.model import get_text_embedding_model
+from app.core.embed.model import get_embedding_engine
+from app.core.logging import logger
 from app.core.namespace.validation import (
     NamespaceValidator,
 )
@@ -63,9 +80,15 @@ from app.graph.edge import Edge
 from app.graph.graph import Graph
 from app.graph.node import Node, NodeData, NodeType
 from app.resource_names.service import ResourceNameValidityType
+from app.settings import settings
+from app.shared.model import utcnow
+from app.shared.pagination import Keyset, Page, PageRequest
 from app.users.model import User as UserModel
 from app.users.schema import User
 
+# Upper bound that pgvector accepts for hnsw.ef_search
+HNSW_MAX_EF_SEARCH = 1000
+
 
 def get_dataset_load_options() -> Sequence[ExecutableOption]:
     return [
@@ -82,11 +105,14 @@ def get_dataset_load_options() -> Sequence[ExecutableOption]:
     ]
 
 
+_keyset = Keyset(OutputPortModel.name, OutputPortModel.id)
+
+
 class OutputPortService:
     def __init__(self, db: Session):
         self.db = db
         self.namespace_validator = NamespaceValidator(OutputPortModel)
-        self.embedding_model = get_text_embedding_model()
+        self.embedding_engine = get_embedding_engine()
 
     def _ensure_data_product_not_deleting(self, data_product_id: UUID) -> None:
         dp = ensure_data_product_exists(data_product_id, self.db)
@@ -187,14 +213,24 @@ class OutputPortService:
         """An attempt was made to use the elbow method to determine a cut-off for returned results.
         The results of this method were quite poor, hence the search currently works as a sorting operation only,
         no filtering is applied other than the limit.
+
+        Rather than scoring the whole catalogue, a query first retrieves the nearest neighbours from the
+        HNSW index on the embeddings and the best keyword matches from the GIN index on the search vector.
+        Only the union of both candidate sets is ranked with the hybrid score.
         """
+        visible = self.visible_to_user_filter(user)
+        stmt = select(OutputPortModel).where(visible)
+        if current_user_assigned:
+            stmt = stmt.where(OutputPortModel.assignments.any(user_id=user.id))
+
         ordered_by = OutputPortModel.name.asc()
         if query:
-            query_embedding = self.embedding_model.embed(query)
-            semantic_score = (
-                1 - OutputPortModel.embeddings.cosine_distance(*query_embedding)
-            ).label("semantic_score")
+            query_embedding = self.embedding_engine.embed_query(query)
             ts_query = func.websearch_to_tsquery("english", query)
+            # Output ports that have not been embedded yet are ranked on keywords only
+            semantic_score = func.coalesce(
+                1 - OutputPortModel.embeddings.cosine_distance(query_embedding), 0
+            ).label("semantic_score")
             keyword_score = func.coalesce(
                 func.ts_rank_cd(OutputPortModel.search_vector, ts_query, 32), 0
             ).label("keyword_score")
@@ -207,23 +243,56 @@ class OutputPortService:
                 .desc()
             )
 
+            # The output ports assigned to a user are few, rank those exhaustively instead
+            if not current_user_assigned:
+                candidates = self._search_candidates(
+                    query_embedding,
+                    ts_query,
+                    max(limit * 2, settings.SEARCH_CANDIDATE_POOL_SIZE),
+                    visible,
+                )
+                stmt = stmt.where(OutputPortModel.id.in_(select(candidates.c.id)))
+
         stmt = (
-            select(OutputPortModel)
-            .order_by(ordered_by)
-            # We currently apply a limit times 2, the reason is that without a limit the query is really slow, however we might miss results because of that
-            .limit(limit * 2)
-        )
-        if current_user_assigned:
-            stmt = stmt.where(OutputPortModel.assignments.any(user_id=user.id))
-        stmt = stmt.options(
-            undefer(OutputPortModel.abstract_data_product_count),
-            undefer(OutputPortModel.technical_assets_count),
+            stmt.order_by(ordered_by)
+            .limit(limit)
+            .options(
+                undefer(OutputPortModel.abstract_data_product_count),
+                undefer(OutputPortModel.technical_assets_count),
+            )
         )
-        results = self.db.scalars(stmt).unique().all()
+        return self.db.scalars(stmt).unique().all()
 
-        return list(
-            islice((d for d in results if self.is_visible_to_user(d, user)), limit)
+    def _search_candidates(
+        self,
+        query_embedding: Sequence[float],
+        ts_query: ColumnElement,
+        size: int,
+        visible: ColumnElement[bool],
+    ) -> Subquery:
+        # HNSW index scans never return more rows than ef_search
+        self.db.execute(
+            select(
+                func.set_config(
+                    "hnsw.ef_search", str(min(size, HNSW_MAX_EF_SEARCH)), True
+                )
+            )
+        )
+        semantic = (
+            select(OutputPortModel.id)
+            .where(OutputPortModel.embeddings.is_not(None), visible)
+            .order_by(OutputPortModel.embeddings.cosine_distance(query_embedding))
+            .limit(size)
+        )
+        keyword = (
+            select(OutputPortModel.id)
+            .where(OutputPortModel.search_vector.op("@@")(ts_query), visible)
+            .order_by(
+                func.ts_rank_cd(OutputPortModel.search_vector, ts_query, 32).desc()
+            )
+            .limit(size)
         )
+        return union(semantic, keyword).subquery("candidates")
 
     @staticmethod
     def recalculate_embeddings_load_options():
@@ -238,33 +307,156 @@ class OutputPortService:
         self, data_product_id: UUID
     ) -> None:
         self.db.flush()
-        datasets = (
+        datasets = self.db.scalars(
+            select(OutputPortModel).where(
+                OutputPortModel.data_product_id == data_product_id
+            )
+        ).all()
+        self._recalculate_search_vector_and_outdate_embeddings(datasets)
+
+    def recalculate_search(self, dataset_id: UUID) -> None:
+        dataset = self.db.get(OutputPortModel, dataset_id)
+        self._recalculate_search_vector_and_outdate_embeddings([dataset])
+
+    def _recalculate_search_vector_and_outdate_embeddings(
+        self, datasets: Sequence[OutputPortModel]
+    ) -> None:
+        """The search vector is cheap to compute and updated straight away.
+        Embeddings are only flagged, they are recalculated in batches by a background task,
+        meanwhile search keeps using the previous embeddings.
+        """
+        for dataset in datasets:
+            self._recalculate_search_vector(dataset)
+            dataset.embeddings_outdated_since = utcnow()
+            self.db.add(dataset)
+
+    def recalculate_outdated_embeddings(self, batch_size: int) -> int:
+        """Recalculates the embeddings of (at most) batch_size outdated output ports,
+        and returns how many were claimed. The batch is claimed in a short transaction,
+        so other workers skip it, and no locks are held during inference. An output port
+        that is updated again in the meantime keeps its newer outdated marker and is picked
+        up by a later batch. Output ports failing to embed stay claimed until the claim
+        lapses, so they do not hold up the others.
+        """
+        datasets = self._claim_outdated_embeddings(batch_size)
+        if not datasets:
+            return 0
+
+        embedded = []
+        for dataset, embedding in zip(datasets, self._embed_datasets(datasets)):
+            if embedding is not None:
+                embedded.append((dataset, embedding))
+        if not embedded:
+            return len(datasets)
+
+        table = OutputPortModel.__table__
+        self.db.execute(
+            update(table)
+            .where(
+                table.c.id == bindparam("dataset_id"),
+                table.c.embeddings_outdated_since == bindparam("outdated_since"),
+            )
+            .values(
+                embeddings=bindparam("new_embeddings"), embeddings_outdated_since=None
+            ),
+            [
+                {
+                    "dataset_id": dataset.id,
+                    "outdated_since": dataset.embeddings_outdated_since,
+                    "new_embeddings": embedding,
+                }
+                for dataset, embedding in embedded
+            ],
+        )
+        self.db.execute(
+            update(table)
+            .where(table.c.id.in_([dataset.id for dataset, _ in embedded]))
+            .values(embeddings_claimed_until=None, updated_on=table.c.updated_on)
+        )
+        self.db.commit()
+        return len(datasets)
+
+    def _claim_outdated_embeddings(self, batch_size: int) -> Sequence[OutputPortModel]:
+        table = OutputPortModel.__table__
+        claimed = self.db.scalars(
+            select(table.c.id)
+            .where(
+                table.c.embeddings_outdated_since.is_not(None),
+                or_(
+                    table.c.embeddings_claimed_until.is_(None),
+                    table.c.embeddings_claimed_until < utcnow(),
+                ),
+            )
+            .order_by(table.c.embeddings_outdated_since)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        ).all()
+        if claimed:
+            self.db.execute(
+                update(table)
+                .where(table.c.id.in_(claimed))
+                .values(
+                    embeddings_claimed_until=utcnow()
+                    + timedelta(seconds=settings.EMBEDDING_RECALCULATION_CLAIM_SECONDS),
+                    updated_on=table.c.updated_on,
+                )
+            )
+        self.db.commit()
+        if not claimed:
+            return []
+        return (
             self.db.scalars(
                 select(OutputPortModel)
-                .where(OutputPortModel.data_product_id == data_product_id)
-                .options(*self.recalculate_embeddings_load_options()),
+                .where(OutputPortModel.id.in_(claimed))
+                .order_by(OutputPortModel.embeddings_outdated_since)
+                .options(*self.recalculate_embeddings_load_options())
             )
             .unique()
             .all()
         )
-        self._recalculate_embeddings_and_search_vector(datasets)
 
-    def recalculate_search(self, dataset_id: UUID) -> None:
-        dataset = self.db.scalar(
-            select(OutputPortModel)
-            .where(OutputPortModel.id == dataset_id)
-            .options(*self.recalculate_embeddings_load_options())
-        )
-        self._recalculate_embeddings_and_search_vector([dataset])
+    def _embed_datasets(
+        self, datasets: Sequence[OutputPortModel]
+    ) -> list[Optional[list[float]]]:
+        """The embeddings of the output ports, None for those that failed to embed."""
+        documents = [self._embed_input(dataset) for dataset in datasets]
+        valid = [document for document in documents if document is not None]
+        embedded: Iterator[Optional[list[float]]]
+        try:
+            embedded = iter(self.embedding_engine.embed_documents(valid))
+        except Exception:
+            logger.exception(
+                "[Embeddings] Embedding the batch failed, retrying per port"
+            )
+            embedded = iter([self._embed_document(document) for document in valid])
+        return [
+            next(embedded) if document is not None else None for document in documents
+        ]
+
+    @staticmethod
+    def _embed_input(dataset: OutputPortModel) -> Optional[str]:
+        try:
+            return DatasetEmbedModel.model_validate(dataset).model_dump_json()
+        except ValidationError:
+            logger.exception(f"[Embeddings] Output port {dataset.id} is invalid")
+            return None
+
+    def _embed_document(self, document: str) -> Optional[list[float]]:
+        try:
+            return self.embedding_engine.embed_documents([document])[0]
+        except Exception:
+            logger.exception("[Embeddings] Embedding an output port failed")
+            return None
 
     def _recalculate_embeddings_and_search_vector(
         self, datasets: Sequence[OutputPortModel]
     ) -> None:
-        embeddings = self.embedding_model.embed(
-            DatasetEmbedModel.model_validate(ds).model_dump_json() for ds in datasets
+        embeddings = self.embedding_engine.embed_documents(
+            [DatasetEmbedModel.model_validate(ds).model_dump_json() for ds in datasets]
         )
         for dataset, emb in zip(datasets, embeddings):
-            dataset.embeddings = emb.tolist()
+            dataset.embeddings = emb
+            dataset.embeddings_outdated_since = None
             self._recalculate_search_vector(dataset)
             self.db.add(dataset)
 
@@ -523,49 +715,60 @@ class OutputPortService:
 
         return Graph(nodes=set(nodes), edges=set(edges))
 
+    def visible_to_user_filter(self, user: UserModel | User) -> ColumnElement[bool]:
+        """Builds the SQL predicate selecting the output ports the user is allowed to see:
+        non-private output ports, private output ports the user has an approved role on
+        and private output ports consumed by a data product the user is a member of.
+        """
+        if Authorization().has_admin_role(user_id=str(user.id)):
+            return true()
+
+        member_of = select(DataProductRoleAssignmentModel.data_product_id).where(
+            DataProductRoleAssignmentModel.user_id == user.id,
+            DataProductRoleAssignmentModel.decision == DecisionStatus.APPROVED,
+        )
+        return or_(
+            OutputPortModel.access_type != OutputPortAccessType.PRIVATE,
+            exists().where(
+                DatasetRoleAssignmentModel.output_port_id == OutputPortModel.id,
+                DatasetRoleAssignmentModel.user_id == user.id,
+                DatasetRoleAssignmentModel.decision == DecisionStatus.APPROVED,
+            ),
+            exists().where(
+                InputPortModel.output_port_id == OutputPortModel.id,
+                InputPortModel.status == InputPortStatus.APPROVED,
+                InputPortModel.consuming_abstract_data_product_id.in_(member_of),
+            ),
+        )
+
     def is_visible_to_user(self, output_port: OutputPortModel, user: UserModel) -> bool:
-        if (
-            output_port.access_type != OutputPortAccessType.PRIVATE
-            or Authorization().has_admin_role(user_id=str(user.id))
-            or DatasetRoleAssignmentService(self.db).has_assignment(
-                dataset_id=output_port.id, user=user
-            )
-        ):
+        if output_port.access_type != OutputPortAccessType.PRIVATE:
             return True
-        output_port = self.db.scalar(
-            select(OutputPortModel)
-            .where(OutputPortModel.id == output_port.id)
-            .options(selectinload(OutputPortModel.data_product_links))
+        return bool(
+            self.db.scalar(
+                select(
+                    exists().where(
+                        OutputPortModel.id == output_port.id,
+                        self.visible_to_user_filter(user),
+                    )
+                )
+            )
         )
 
-        consuming_data_products = {
-            link.consuming_abstract_data_product
-            for link in output_port.data_product_links
-            if link.status == DecisionStatus.APPROVED
-        }
-
-        user_data_products = {
-            assignment.data_product
-            for assignment in user.data_product_roles
-            if assignment.decision == DecisionStatus.APPROVED
-        }
-
-        return bool(consuming_data_products & user_data_products)
-
     def get_output_ports(
         self, data_product_id: Optional[UUID], user: User
     ) -> Sequence[OutputPort]:
-        query = select(OutputPortModel)
+        return self.get_output_ports_page(data_product_id, user, PageRequest()).items
+
+    def get_output_ports_page(
+        self, data_product_id: Optional[UUID], user: User, page: PageRequest
+    ) -> Page[OutputPortModel]:
+        query = select(OutputPortModel).where(self.visible_to_user_filter(user))
         if data_product_id is not None:
             ensure_data_product_exists(data_product_id, self.db)
             query = query.filter(OutputPortModel.data_product_id == data_product_id)
 
-        results = self.db.scalars(query).unique().all()
-        return [
-            output_port
-            for output_port in results
-            if self.is_visible_to_user(output_port, user)
-        ]
+        return _keyset.fetch(self.db, query, page)
 
     def get_consuming_data_products(
         self, output_port_id: UUID, data_product_id: UUID
@@ -65,6 +65,7 @@ from app.events.schema_response import (
 )
 from app.events.service import EventService
 from app.graph.graph import Graph
+from app.shared.pagination import PageParams, list_response, page_params
 from app.users.notifications.service import NotificationService
 from app.users.schema import User
 
@@ -569,14 +570,18 @@ def get_data_products(
     filter_to_user_with_assigment: Annotated[
         UUID | SkipJsonSchema[None], Query()
     ] = None,
+    page: PageParams = Depends(page_params),
 ) -> GetDataProductsResponse:
-    return GetDataProductsResponse(
-        data_products=[
-            GetDataProductsResponseItem.model_validate(dp)
-            for dp in DataProductService(db).get_data_products(
-                filter_to_user_with_assigment
-            )
-        ]
+    service = DataProductService(db)
+    return list_response(
+        page,
+        lambda request: service.get_data_products_page(
+            filter_to_user_with_assigment, request
+        ),
+        GetDataProductsResponse,
+        "data_products",
+        GetDataProductsResponseItem,
+        db,
     )
 
 
@@ -12,3 +12,11 @@ class DataProduct(ORMModel):
     description: str
     status: AbstractDataProductStatus
     type: DataProductType
+
+
+class DataProductAnalytics(ORMModel):
+    # All output ports, whether or not the caller can see them
+    output_port_count: int
+    technical_asset_count: int
+    # Data products with an approved input port on one of its output ports
+    consumer_count: int
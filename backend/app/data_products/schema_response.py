@@ -11,6 +11,7 @@ from app.configuration.data_product_types.schema import DataProductType
 from app.configuration.domains.schema import Domain
 from app.configuration.tags.schema import Tag
 from app.data_products.status import AbstractDataProductStatus
+from app.shared.pagination import PaginatedResponse
 from app.shared.schema import ORMModel
 
 
@@ -76,7 +77,7 @@ class CancelInputPortForDataProductResponse(ORMModel):
     input_port_link: UUID
 
 
-class GetDataProductsResponse(ORMModel):
+class GetDataProductsResponse(PaginatedResponse):
     data_products: Sequence[GetDataProductsResponseItem]
 
 
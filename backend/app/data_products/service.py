@@ -4,12 +4,13 @@ from uuid import UUID
 from warnings import deprecated
 
 from fastapi import HTTPException, status
-from sqlalchemy import asc, select
+from sqlalchemy import distinct, func, select
 from sqlalchemy.orm import Session, joinedload, selectinload, undefer
 
 from app.abstract_data_product.graph_utils import (
     get_graph_data_from_abstract_data_product,
 )
+from app.abstract_data_product.input_ports.enums import InputPortStatus
 from app.abstract_data_product.input_ports.model import (
     InputPort as InputPortModel,
 )
@@ -34,6 +35,7 @@ from app.data_products.output_port_technical_assets_link.model import (
     DataOutputDatasetAssociation,
 )
 from app.data_products.output_ports.model import OutputPort as OutputPortModel
+from app.data_products.schema import DataProductAnalytics
 from app.data_products.schema_request import (
     DataProductAboutUpdate,
     DataProductCreate,
@@ -45,6 +47,7 @@ from app.data_products.schema_response import (
     GetDataProductResponse,
     UpdateDataProductResponse,
 )
+from app.data_products.status import AbstractDataProductStatus
 from app.data_products.technical_assets.model import (
     TechnicalAsset as TechnicalAssetModel,
 )
@@ -52,9 +55,13 @@ from app.graph.edge import Edge
 from app.graph.graph import Graph
 from app.graph.node import Node, NodeData, NodeType
 from app.resource_names.service import ResourceNameService, ResourceNameValidityType
+from app.shared.pagination import Keyset, Page, PageRequest
+from app.shared.search import keyword_document, keyword_query, keyword_score
 from app.users.model import User as UserModel
 from app.users.schema import User
 
+_keyset = Keyset(DataProductModel.name, DataProductModel.id)
+
 
 class DataProductService(AbstractDataProductService):
     def __init__(self, db: Session):
@@ -118,6 +125,15 @@ class DataProductService(AbstractDataProductService):
         self,
         filter_to_user_with_assigment: Optional[UUID] = None,
     ) -> Sequence[DataProductModel]:
+        return self.get_data_products_page(
+            filter_to_user_with_assigment, PageRequest()
+        ).items
+
+    def get_data_products_page(
+        self,
+        filter_to_user_with_assigment: Optional[UUID],
+        page: PageRequest,
+    ) -> Page[DataProductModel]:
         default_lifecycle = self.db.scalar(
             select(DataProductLifeCycleModel).filter(
                 DataProductLifeCycleModel.is_default
@@ -134,16 +150,112 @@ class DataProductService(AbstractDataProductService):
                     decision=DecisionStatus.APPROVED,
                 )
             )
-        query = query.order_by(asc(DataProductModel.name))
 
-        dps = self.db.scalars(query).unique().all()
+        dps = _keyset.fetch(self.db, query, page)
 
-        for dp in dps:
+        for dp in dps.items:
             if not dp.lifecycle:
                 dp.lifecycle = default_lifecycle
 
         return dps
 
+    def search_data_products(
+        self,
+        query: Optional[str],
+        limit: int,
+        domain_id: Optional[UUID] = None,
+        status: Optional[AbstractDataProductStatus] = None,
+    ) -> Sequence[DataProductModel]:
+        """Best keyword matches first, or all data products by name without a query."""
+        stmt = select(DataProductModel).options(
+            selectinload(DataProductModel.tags).raiseload("*"),
+            undefer(DataProductModel.input_port_count),
+        )
+        if domain_id:
+            stmt = stmt.where(DataProductModel.domain_id == domain_id)
+        if status:
+            stmt = stmt.where(DataProductModel.status == status)
+
+        ordered_by = [DataProductModel.name.asc(), DataProductModel.id]
+        if (ts_query := keyword_query(query)) is not None:
+            document = keyword_document(
+                DataProductModel.name, DataProductModel.description
+            )
+            stmt = stmt.where(document.op("@@")(ts_query))
+            ordered_by.insert(0, keyword_score(document, ts_query).desc())
+
+        data_products = self.db.scalars(stmt.order_by(*ordered_by).limit(limit)).all()
+
+        default_lifecycle = self.db.scalar(
+            select(DataProductLifeCycleModel).filter(
+                DataProductLifeCycleModel.is_default
+            )
+        )
+        for dp in data_products:
+            if not dp.lifecycle:
+                dp.lifecycle = default_lifecycle
+        return data_products
+
+    def get_analytics(
+        self, data_product_ids: Sequence[UUID]
+    ) -> dict[UUID, DataProductAnalytics]:
+        """Counts for many data products at once, with one grouped query per count
+        joined together. Unknown ids are left out of the result.
+        """
+        output_ports = (
+            select(
+                OutputPortModel.data_product_id.label("id"),
+                func.count(OutputPortModel.id).label("count"),
+            )
+            .where(OutputPortModel.data_product_id.in_(data_product_ids))
+            .group_by(OutputPortModel.data_product_id)
+            .subquery()
+        )
+        technical_assets = (
+            select(
+                TechnicalAssetModel.owner_id.label("id"),
+                func.count(TechnicalAssetModel.id).label("count"),
+            )
+            .where(TechnicalAssetModel.owner_id.in_(data_product_ids))
+            .group_by(TechnicalAssetModel.owner_id)
+            .subquery()
+        )
+        consumers = (
+            select(
+                OutputPortModel.data_product_id.label("id"),
+                func.count(
+                    distinct(InputPortModel.consuming_abstract_data_product_id)
+                ).label("count"),
+            )
+            .join(InputPortModel, InputPortModel.output_port_id == OutputPortModel.id)
+            .where(
+                OutputPortModel.data_product_id.in_(data_product_ids),
+                InputPortModel.status == InputPortStatus.APPROVED,
+            )
+            .group_by(OutputPortModel.data_product_id)
+            .subquery()
+        )
+        rows = self.db.execute(
+            select(
+                DataProductModel.id,
+                func.coalesce(output_ports.c.count, 0),
+                func.coalesce(technical_assets.c.count, 0),
+                func.coalesce(consumers.c.count, 0),
+            )
+            .outerjoin(output_ports, output_ports.c.id == DataProductModel.id)
+            .outerjoin(technical_assets, technical_assets.c.id == DataProductModel.id)
+            .outerjoin(consumers, consumers.c.id == DataProductModel.id)
+            .where(DataProductModel.id.in_(data_product_ids))
+        ).all()
+        return {
+            id: DataProductAnalytics(
+                output_port_count=output_port_count,
+                technical_asset_count=technical_asset_count,
+                consumer_count=consumer_count,
+            )
+            for id, output_port_count, technical_asset_count, consumer_count in rows
+        }
+
     def get_owners(self, id: UUID) -> Sequence[User]:
         data_product = ensure_data_product_exists(
             id,
@@ -32,6 +32,7 @@ from app.events.schema_response import (
 )
 from app.events.service import EventService
 from app.graph.graph import Graph
+from app.shared.pagination import PageParams, list_response, page_params
 from app.users.notifications.service import NotificationService
 from app.users.schema import User
 
@@ -43,15 +44,18 @@ router = APIRouter(
 
 @router.get("/")
 def get_data_product_technical_assets(
-    data_product_id: UUID, db: Session = Depends(get_db_session)
+    data_product_id: UUID,
+    db: Session = Depends(get_db_session),
+    page: PageParams = Depends(page_params),
 ) -> GetTechnicalAssetsResponse:
-    return GetTechnicalAssetsResponse(
-        technical_assets=[
-            GetTechnicalAssetsResponseItem.model_validate(do)
-            for do in TechnicalAssetService(db).get_technical_assets_for_data_product(
-                data_product_id
-            )
-        ]
+    service = TechnicalAssetService(db)
+    return list_response(
+        page,
+        lambda request: service.get_technical_assets_page(data_product_id, request),
+        GetTechnicalAssetsResponse,
+        "technical_assets",
+        GetTechnicalAssetsResponseItem,
+        db,
     )
 
 
@@ -16,6 +16,7 @@ from app.data_products.output_ports.schema import OutputPort
 from app.data_products.schema import DataProduct
 from app.data_products.technical_assets.enums import TechnicalMapping
 from app.data_products.technical_assets.status import TechnicalAssetStatus
+from app.shared.pagination import PaginatedResponse
 from app.shared.schema import ORMModel
 from app.technical_asset_configuration.schema_union import DataOutputConfiguration
 
@@ -91,7 +92,7 @@ class GetTechnicalAssetsResponseItem(ORMModel):
     tags: list[Tag]
 
 
-class GetTechnicalAssetsResponse(ORMModel):
+class GetTechnicalAssetsResponse(PaginatedResponse):
     technical_assets: Sequence[GetTechnicalAssetsResponseItem]
 
 
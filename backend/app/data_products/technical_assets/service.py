@@ -1,11 +1,11 @@
 import copy
 from datetime import datetime
-from typing import Sequence
+from typing import Optional, Sequence
 from uuid import UUID
 
 import pytz
 from fastapi import Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session, selectinload
 
 from app.authorization.role_assignments.enums import DecisionStatus
@@ -43,8 +43,11 @@ from app.data_products.technical_assets.status import TechnicalAssetStatus
 from app.database.database import get_db_session
 from app.graph.graph import Graph
 from app.resource_names.service import ResourceNameValidityType
+from app.shared.pagination import Keyset, Page, PageRequest
+from app.shared.search import keyword_document, keyword_query, keyword_score
 from app.users.schema import User
 
+_keyset = Keyset(TechnicalAssetModel.name, TechnicalAssetModel.id)
 TECHNICAL_ASSET_ACCESS_MODES_INCOMPATIBLE_ERROR = HTTPException(
     status_code=status.HTTP_409_CONFLICT,
     detail="Access modes of technical asset are incompatible with access modes of output port",
@@ -112,6 +115,25 @@ class TechnicalAssetService:
             .all()
         )
 
+    def search_technical_assets(
+        self, query: Optional[str], limit: int
+    ) -> Sequence[TechnicalAssetModel]:
+        """Best keyword matches first, or all technical assets by name without a query."""
+        stmt = select(TechnicalAssetModel).options(
+            selectinload(TechnicalAssetModel.environment_configurations),
+            selectinload(TechnicalAssetModel.dataset_links)
+            .selectinload(DataOutputDatasetAssociationModel.output_port)
+            .raiseload("*"),
+        )
+        ordered_by = [TechnicalAssetModel.name.asc(), TechnicalAssetModel.id]
+        if (ts_query := keyword_query(query)) is not None:
+            document = keyword_document(
+                TechnicalAssetModel.name, TechnicalAssetModel.description
+            )
+            stmt = stmt.where(document.op("@@")(ts_query))
+            ordered_by.insert(0, keyword_score(document, ts_query).desc())
+        return self.db.scalars(stmt.order_by(*ordered_by).limit(limit)).unique().all()
+
     def get_technical_asset(
         self, data_product_id: UUID, id: UUID
     ) -> TechnicalAssetModel:
@@ -319,18 +341,28 @@ class TechnicalAssetService:
     def get_technical_assets_for_data_product(
         self, data_product_id: UUID
     ) -> Sequence[TechnicalAssetModel]:
-        return (
-            self.db.scalars(
-                select(TechnicalAssetModel)
-                .options(
-                    selectinload(TechnicalAssetModel.environment_configurations),
-                    selectinload(TechnicalAssetModel.dataset_links)
-                    .selectinload(DataOutputDatasetAssociation.output_port)
-                    .selectinload(OutputPortModel.tags)
-                    .raiseload("*"),
-                )
-                .filter(TechnicalAssetModel.owner_id == data_product_id)
+        return self.get_technical_assets_page(data_product_id, PageRequest()).items
+
+    def count_technical_assets_for_data_product(self, data_product_id: UUID) -> int:
+        return self.db.scalar(
+            select(func.count(TechnicalAssetModel.id)).where(
+                TechnicalAssetModel.owner_id == data_product_id
             )
-            .unique()
-            .all()
+        )
+
+    def get_technical_assets_page(
+        self, data_product_id: UUID, page: PageRequest
+    ) -> Page[TechnicalAssetModel]:
+        return _keyset.fetch(
+            self.db,
+            select(TechnicalAssetModel)
+            .options(
+                selectinload(TechnicalAssetModel.environment_configurations),
+                selectinload(TechnicalAssetModel.dataset_links)
+                .selectinload(DataOutputDatasetAssociation.output_port)
+                .selectinload(OutputPortModel.tags)
+                .raiseload("*"),
+            )
+            .filter(TechnicalAssetModel.owner_id == data_product_id),
+            page,
         )
@@ -0,0 +1,46 @@
+"""Track outdated output port embeddings
+
+Revision ID: 5b2e7c1d9a40
+Revises: 44b3eff9ab38
+Create Date: 2026-10-18 09:30:12.418273
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from app.shared.model import utcnow
+
+# revision identifiers, used by Alembic.
+revision: str = "5b2e7c1d9a40"
+down_revision: Union[str, None] = "44b3eff9ab38"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "datasets",
+        sa.Column(
+            "embeddings_outdated_since",
+            sa.DateTime(),
+            server_default=utcnow(),
+            nullable=True,
+        ),
+    )
+    op.execute(
+        "UPDATE datasets SET embeddings_outdated_since = NULL WHERE embeddings IS NOT NULL"
+    )
+    op.create_index(
+        "idx_datasets_embeddings_outdated_since",
+        "datasets",
+        ["embeddings_outdated_since"],
+        postgresql_where=sa.text("embeddings_outdated_since IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_datasets_embeddings_outdated_since", "datasets")
+    op.drop_column("datasets", "embeddings_outdated_since")
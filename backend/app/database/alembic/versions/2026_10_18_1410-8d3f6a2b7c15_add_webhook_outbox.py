@@ -0,0 +1,47 @@
+"""Add webhook outbox
+
+Revision ID: 8d3f6a2b7c15
+Revises: 5b2e7c1d9a40
+Create Date: 2026-10-18 14:10:37.502816
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+from app.shared.model import utcnow
+
+# revision identifiers, used by Alembic.
+revision: str = "8d3f6a2b7c15"
+down_revision: Union[str, None] = "5b2e7c1d9a40"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "webhook_outbox",
+        sa.Column("id", sa.BigInteger(), sa.Identity(), primary_key=True),
+        sa.Column("event_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("type", sa.String(), nullable=False),
+        sa.Column("ordering_key", sa.String(), nullable=False),
+        sa.Column("data", postgresql.JSONB(), nullable=False),
+        sa.Column("created_on", sa.DateTime(timezone=False), server_default=utcnow()),
+        sa.Column("delivered_on", sa.DateTime(timezone=False), nullable=True),
+    )
+    op.create_index(
+        "idx_webhook_outbox_pending",
+        "webhook_outbox",
+        ["id"],
+        postgresql_where=sa.text("delivered_on IS NULL"),
+    )
+    op.create_index("idx_webhook_outbox_created_on", "webhook_outbox", ["created_on"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_webhook_outbox_created_on", "webhook_outbox")
+    op.drop_index("idx_webhook_outbox_pending", "webhook_outbox")
+    op.drop_table("webhook_outbox")
@@ -0,0 +1,37 @@
+"""Add keyword search indexes
+
+Revision ID: 6c1f4e9a2d83
+Revises: 8d3f6a2b7c15
+Create Date: 2026-10-18 16:20:12.118430
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6c1f4e9a2d83"
+down_revision: Union[str, None] = "8d3f6a2b7c15"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match app.shared.search.keyword_document
+TABLES = {
+    "abstract_data_products": "idx_abstract_data_products_keyword_search",
+    "data_outputs": "idx_data_outputs_keyword_search",
+    "domains": "idx_domains_keyword_search",
+}
+
+
+def upgrade() -> None:
+    for table, index in TABLES.items():
+        op.execute(
+            f"CREATE INDEX {index} ON {table} USING gin "
+            "(to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(description, '')))"
+        )
+
+
+def downgrade() -> None:
+    for table, index in TABLES.items():
+        op.drop_index(index, table)
@@ -0,0 +1,54 @@
+"""Store the grant expiry of input ports
+
+Revision ID: 3f7b2c9d1e64
+Revises: 6c1f4e9a2d83
+Create Date: 2026-10-18 18:30:41.902215
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f7b2c9d1e64"
+down_revision: Union[str, None] = "6c1f4e9a2d83"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "input_ports", sa.Column("grant_expires_on", sa.Date(), nullable=True)
+    )
+    # Grants that lapsed already get a past expiry, the next expiry run picks them up
+    op.execute(
+        """
+        UPDATE input_ports SET grant_expires_on = grants.expires_on
+        FROM (
+            SELECT input_port_id,
+                CASE WHEN bool_or(valid_until IS NULL) THEN NULL
+                ELSE max(valid_until) END AS expires_on
+            FROM input_port_requests
+            WHERE decision = 'APPROVED' AND revoked_at IS NULL
+                AND (valid_from IS NULL OR valid_from <= CURRENT_DATE)
+            GROUP BY input_port_id
+        ) AS grants
+        WHERE input_ports.id = grants.input_port_id
+            AND input_ports.status = 'APPROVED'
+        """
+    )
+    op.create_index(
+        "idx_input_ports_grant_expires_on",
+        "input_ports",
+        ["grant_expires_on"],
+        postgresql_where=sa.text(
+            "status = 'APPROVED' AND grant_expires_on IS NOT NULL"
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_input_ports_grant_expires_on", "input_ports")
+    op.drop_column("input_ports", "grant_expires_on")
@@ -0,0 +1,42 @@
+"""Add scheduled jobs
+
+Revision ID: 9a4e2d7c5b18
+Revises: 3f7b2c9d1e64
+Create Date: 2026-10-18 19:10:12.640381
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9a4e2d7c5b18"
+down_revision: Union[str, None] = "3f7b2c9d1e64"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "scheduled_jobs",
+        sa.Column("name", sa.String(), primary_key=True),
+        sa.Column("last_started_on", sa.DateTime(timezone=False), nullable=True),
+        sa.Column("last_finished_on", sa.DateTime(timezone=False), nullable=True),
+        sa.Column("last_duration_seconds", sa.Float(), nullable=True),
+        sa.Column(
+            "last_outcome",
+            sa.Enum("SUCCEEDED", "FAILED", name="joboutcome", native_enum=False),
+            nullable=True,
+        ),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("last_run_by", sa.String(), nullable=True),
+        sa.Column(
+            "consecutive_failures", sa.Integer(), nullable=False, server_default="0"
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("scheduled_jobs")
@@ -0,0 +1,65 @@
+"""Add output port contract hashes and index the schema foreign keys
+
+Revision ID: b6d1f3a8e270
+Revises: 9a4e2d7c5b18
+Create Date: 2026-10-18 19:45:03.118942
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from app.shared.model import utcnow
+
+# revision identifiers, used by Alembic.
+revision: str = "b6d1f3a8e270"
+down_revision: Union[str, None] = "9a4e2d7c5b18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "output_port_contracts",
+        sa.Column(
+            "output_port_id",
+            sa.UUID,
+            sa.ForeignKey("datasets.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("contract_hash", sa.Text(), nullable=False),
+        sa.Column("ingested_on", sa.DateTime(timezone=False), server_default=utcnow()),
+    )
+    # Deleting schema objects and properties cascades along these
+    op.create_index(
+        "idx_output_port_schema_objects_output_port_id",
+        "output_port_schema_objects",
+        ["output_port_id"],
+    )
+    op.create_index(
+        "idx_output_port_schema_properties_schema_object_id",
+        "output_port_schema_properties",
+        ["schema_object_id"],
+    )
+    op.create_index(
+        "idx_output_port_schema_properties_parent_property_id",
+        "output_port_schema_properties",
+        ["parent_property_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "idx_output_port_schema_properties_parent_property_id",
+        "output_port_schema_properties",
+    )
+    op.drop_index(
+        "idx_output_port_schema_properties_schema_object_id",
+        "output_port_schema_properties",
+    )
+    op.drop_index(
+        "idx_output_port_schema_objects_output_port_id", "output_port_schema_objects"
+    )
+    op.drop_table("output_port_contracts")
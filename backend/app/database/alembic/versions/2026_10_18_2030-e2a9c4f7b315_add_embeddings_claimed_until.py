@@ -0,0 +1,31 @@
+"""Claim output ports while their embeddings are recalculated
+
+Revision ID: e2a9c4f7b315
+Revises: b6d1f3a8e270
+Create Date: 2026-10-18 20:30:41.502117
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2a9c4f7b315"
+down_revision: Union[str, None] = "b6d1f3a8e270"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "datasets",
+        sa.Column(
+            "embeddings_claimed_until", sa.DateTime(timezone=False), nullable=True
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("datasets", "embeddings_claimed_until")
@@ -0,0 +1,52 @@
+"""Claim webhook outbox events per ordering key and replay them in commit order
+
+Revision ID: 7c4e1b9d3a62
+Revises: e2a9c4f7b315
+Create Date: 2026-10-18 20:45:12.318404
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c4e1b9d3a62"
+down_revision: Union[str, None] = "e2a9c4f7b315"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "webhook_outbox",
+        sa.Column(
+            "transaction_id",
+            sa.BigInteger(),
+            nullable=False,
+            server_default=sa.text("pg_current_xact_id()::text::bigint"),
+        ),
+    )
+    op.add_column(
+        "webhook_outbox",
+        sa.Column("claimed_until", sa.DateTime(timezone=False), nullable=True),
+    )
+    op.create_index(
+        "idx_webhook_outbox_pending_ordering_key",
+        "webhook_outbox",
+        ["ordering_key", "id"],
+        postgresql_where=sa.text("delivered_on IS NULL"),
+    )
+    op.create_index(
+        "idx_webhook_outbox_transaction_id",
+        "webhook_outbox",
+        ["transaction_id", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_webhook_outbox_transaction_id", "webhook_outbox")
+    op.drop_index("idx_webhook_outbox_pending_ordering_key", "webhook_outbox")
+    op.drop_column("webhook_outbox", "claimed_until")
+    op.drop_column("webhook_outbox", "transaction_id")
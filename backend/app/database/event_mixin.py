@@ -4,6 +4,8 @@ from sqlalchemy import event as sql_event
 
 from app.core.context import queue_events
 from app.core.webhooks.events import V2Event
+from app.core.webhooks.service import write_outbox_events
+from app.settings import settings
 
 
 class EventTrackedMixin:
@@ -19,8 +21,10 @@ class EventTrackedMixin:
 
     The event class should be inherited from V2Event: MyCreatedEvent(V2Event)
 
-    Events are flushed to the webhook after a successful HTTP response by
-    the ``dispatch_queued_events`` middleware in ``app/main.py``.
+    Events are written to the webhook outbox in the same transaction as the
+    change, and delivered by the outbox relay once it commits. With the outbox
+    disabled they are flushed to the webhook after a successful HTTP response
+    by the ``dispatch_queued_events`` middleware in ``app/main.py``.
     """
 
     def __init_subclass__(
@@ -40,8 +44,8 @@ class EventTrackedMixin:
 
     @staticmethod
     def _track(mapper, connection, target) -> None:
-        from app.core.context import queue_event
-
-        queue_event(target.to_event())
-        if events := target.generate_extra_events(connection):
+        events = [target.to_event(), *target.generate_extra_events(connection)]
+        if settings.WEBHOOK_V2_OUTBOX:
+            write_outbox_events(connection, events)
+        else:
             queue_events(events)
@@ -13,27 +13,36 @@ from fastapi.responses import RedirectResponse
 from fastapi.routing import APIRoute
 from fastmcp.utilities.lifespan import combine_lifespans
 
-from app.abstract_data_product.background_tasks import check_stuck_deletions
+from app.abstract_data_product.background_tasks import check_stuck_deletions_job
 from app.abstract_data_product.input_ports.background_tasks import (
-    expire_input_ports_task,
+    expire_input_ports_job,
 )
 from app.authorization.service import AuthorizationService
-from app.core.auth.device_flows.background_tasks import cleanup_device_flow_table_task
+from app.core.auth.device_flows.background_tasks import cleanup_device_flows_job
 from app.core.auth.jwt import get_oidc
 from app.core.auth.router import router as auth
-from app.core.authz.background_tasks import check_expired_admins
+from app.core.authz.background_tasks import (
+    check_expired_admins_job,
+    listen_for_policy_changes,
+)
+from app.core.authz.middleware import RequestDecisionsMiddleware
 from app.core.embed.model import warm_text_embedding_model
 from app.core.errors.error_handling import add_exception_handlers
 from app.core.logging import logger
 from app.core.logging.middleware import RequestLoggingMiddleware
-from app.core.logging.posthog_analytics import report_daily_metrics
+from app.core.logging.posthog_analytics import report_daily_metrics_job
 from app.core.logging.scarf_analytics import backend_analytics
+from app.core.scheduler.scheduler import Job, JobScheduler
+from app.core.webhooks.background_tasks import purge_outbox_job, relay_outbox_task
 from app.core.webhooks.middleware import (
     DispatchQueuedEventsMiddleware,
     start_event_dispatcher,
     stop_event_dispatcher,
 )
 from app.core.webhooks.webhook import register_webhooks
+from app.data_products.output_ports.background_tasks import (
+    recalculate_outdated_embeddings_task,
+)
 from app.database import database
 from app.mcp.mcp import mcp
 from app.mcp.middleware import LoggingMiddleware
@@ -88,6 +97,17 @@ async def _cancel_tasks(tasks: list[asyncio.Task[None]]) -> None:
             await task
 
 
+def scheduled_jobs() -> list[Job]:
+    return [
+        check_expired_admins_job,
+        cleanup_device_flows_job,
+        check_stuck_deletions_job,
+        expire_input_ports_job,
+        purge_outbox_job,
+        *([report_daily_metrics_job] if settings.POSTHOG_ENABLED else []),
+    ]
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     if settings.AUTHORIZER_STARTUP_SYNC:
@@ -98,24 +118,22 @@ async def lifespan(app: FastAPI):
     warm_text_embedding_model()
 
     backend_analytics(API_VERSION)
+    # These run on every replica, periodic maintenance is scheduled as a Job
     background_tasks = [
-        _create_supervised_task(check_expired_admins(), name="check_expired_admins"),
-        _create_supervised_task(
-            cleanup_device_flow_table_task(),
-            name="cleanup_device_flow_table_task",
-        ),
         _create_supervised_task(
-            report_daily_metrics(),
-            name="report_north_star_metrics",
+            listen_for_policy_changes(), name="listen_for_policy_changes"
         ),
-        _create_supervised_task(check_stuck_deletions(), name="check_stuck_deletions"),
         _create_supervised_task(
-            expire_input_ports_task(),
-            name="expire_input_ports_task",
+            recalculate_outdated_embeddings_task(),
+            name="recalculate_outdated_embeddings_task",
         ),
+        _create_supervised_task(relay_outbox_task(), name="relay_outbox_task"),
     ]
+    scheduler = JobScheduler(scheduled_jobs())
+    scheduler.start()
     start_event_dispatcher(app)
     yield
+    await scheduler.stop()
     await _cancel_tasks(background_tasks)
     await stop_event_dispatcher(app)
 
@@ -177,6 +195,7 @@ app.include_router(auth, prefix="/api")
 add_exception_handlers(app)
 register_webhooks(app)
 
+app.add_middleware(RequestDecisionsMiddleware)
 app.add_middleware(RequestLoggingMiddleware)
 app.add_middleware(DispatchQueuedEventsMiddleware, fastapi_app=app)
 app.add_middleware(
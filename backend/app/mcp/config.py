@@ -6,15 +6,12 @@ from uuid import UUID
 from fastmcp.dependencies import Depends
 from sqlalchemy.orm import Session
 
-from app.configuration.domains.schema_response import GetDomainsItem
-from app.configuration.domains.service import DomainService
 from app.configuration.environments.schema_response import EnvironmentGetItem
 from app.configuration.environments.service import EnvironmentService
 from app.data_products.output_ports.schema import OutputPort
 from app.data_products.output_ports.service import OutputPortService
 from app.data_products.schema_response import (
     GetDataProductResponse,
-    GetDataProductsResponseItem,
 )
 from app.data_products.service import DataProductService
 from app.data_products.technical_assets.schema_response import (
@@ -23,6 +20,7 @@ from app.data_products.technical_assets.schema_response import (
 from app.data_products.technical_assets.service import TechnicalAssetService
 from app.mcp.deps import get_db_session, get_mcp_authenticated_user
 from app.search_output_ports.schema_response import SearchOutputPortsResponseItem
+from app.statistics.service import StatisticsService
 from app.users.model import User as UserModel
 
 
@@ -65,45 +63,39 @@ def register_config_tools(mcp) -> None:
         db: Session = Depends(get_db_session),
         user: UserModel = Depends(get_mcp_authenticated_user),
     ) -> dict[str, Any]:
-        all_data_products = DataProductService(db).get_data_products()
-        all_output_ports = OutputPortService(db).search_output_ports(
-            query=None, limit=1000, user=user, current_user_assigned=False
+        service = StatisticsService(db)
+        snapshot = service.get_snapshot()
+        popular_datasets = OutputPortService(db).search_output_ports(
+            query=None, limit=5, user=user, current_user_assigned=False
         )
-        all_technical_assets = TechnicalAssetService(db).get_data_outputs()
-        all_domains = DomainService(db).get_domains()
-
-        popular_data_products = all_data_products[:5]
-        popular_datasets = all_output_ports[:5]
 
         return {
             "statistics": {
-                "total_data_products": len(all_data_products),
-                "total_output_ports": len(all_output_ports),
-                "total_technical_assets": len(all_technical_assets),
-                "total_domains": len(all_domains),
+                "total_data_products": snapshot.data_products,
+                "total_output_ports": service.count_visible_output_ports(
+                    user, snapshot
+                ),
+                "total_technical_assets": snapshot.technical_assets,
+                "total_domains": len(snapshot.domains),
             },
             "featured_content": {
                 "popular_data_products": [
-                    GetDataProductsResponseItem.model_validate(
-                        GetDataProductsResponseItem.model_validate(dp)
-                    ).model_dump()
-                    for dp in popular_data_products
+                    dp.model_dump() for dp in snapshot.featured_data_products
                 ],
                 "popular_output_ports": [
                     SearchOutputPortsResponseItem.model_validate(ds).model_dump()
                     for ds in popular_datasets
                 ],
             },
-            "domains": [
-                GetDomainsItem.model_validate(domain).model_dump()
-                for domain in all_domains
-            ],
+            "domains": [domain.model_dump() for domain in snapshot.domains],
         }
 
     @mcp.tool(
         description="""
-    Get analytics for a data product: its output ports and technical assets with counts.
-    Use this to answer questions like 'what does this data product expose?' or 'how many datasets does it have?'.
+    Get analytics for a data product: its output ports and technical assets with counts,
+    and the number of data products consuming its output ports.
+    Use this to answer questions like 'what does this data product expose?', 'how many datasets does it have?'
+    or 'how many data products use it?'.
 
     Args:
         data_product_id: UUID obtained from search_data_products or get_data_product_details.
@@ -114,38 +106,37 @@ def register_config_tools(mcp) -> None:
         db: Session = Depends(get_db_session),
         user: UserModel = Depends(get_mcp_authenticated_user),
     ) -> dict[str, Any]:
-        data_product = DataProductService(db).get_data_product(
-            id=UUID(data_product_id),
-        )
+        data_product_uuid = UUID(data_product_id)
+        service = DataProductService(db)
+        data_product = service.get_data_product(id=data_product_uuid)
 
         if not data_product:
             return {"error": f"Data product {data_product_id} not found"}
 
         output_ports = OutputPortService(db).get_output_ports(
-            user=user, data_product_id=UUID(data_product_id)
+            user=user, data_product_id=data_product_uuid
         )
-
-        technical_assets = TechnicalAssetService(db).get_data_outputs()
-        related_technical_assets = [
-            do
-            for do in technical_assets
-            if hasattr(do, "data_product_id")
-            and do.data_product_id == UUID(data_product_id)
-        ]
+        technical_assets = TechnicalAssetService(
+            db
+        ).get_technical_assets_for_data_product(data_product_uuid)
+        analytics = service.get_analytics([data_product_uuid])[data_product_uuid]
 
         return {
             "data_product": GetDataProductResponse.model_validate(
                 data_product
             ).model_dump(),
             "analytics": {
+                # Not analytics.output_port_count, which includes the private
+                # output ports the user cannot see
                 "output_ports_count": len(output_ports),
-                "technical_assets_count": len(related_technical_assets),
+                "technical_assets_count": analytics.technical_asset_count,
+                "consumers_count": analytics.consumer_count,
                 "output_ports": [
                     OutputPort.model_validate(ds).model_dump() for ds in output_ports
                 ],
                 "technical_assets": [
                     GetTechnicalAssetsResponseItem.model_validate(do).model_dump()
-                    for do in related_technical_assets
+                    for do in technical_assets
                 ],
             },
         }
@@ -144,10 +144,10 @@ def authorize_data_product_read_integrations(
     data_product_namespace: str,
     authorized_user=Depends(get_mcp_authenticated_user),
     db: Session = Depends(get_db_session),
-) -> None:
+) -> DataProductModel:
     """Verify authenticated user has READ_INTEGRATIONS access to the data product.
 
-    Raises an error if not authorized.
+    Returns the data product, or raises an error if not authorized.
     """
     data_product = db.scalar(
         sa_select(DataProductModel).where(
@@ -169,3 +169,4 @@ def authorize_data_product_read_integrations(
             f"User {authorized_user.id} does not have permission to read integrations "
             f"for data product {data_product_namespace}"
         )
+    return data_product
@@ -6,10 +6,12 @@ from uuid import UUID
 from fastmcp.dependencies import Depends
 from sqlalchemy.orm import Session
 
+from app.configuration.domains.schema_response import GetDomainsItem
 from app.configuration.domains.service import DomainService
 from app.data_products.output_ports.service import OutputPortService
 from app.data_products.schema_response import GetDataProductsResponseItem
 from app.data_products.service import DataProductService
+from app.data_products.status import AbstractDataProductStatus
 from app.data_products.technical_assets.schema_response import (
     GetTechnicalAssetsResponseItem,
 )
@@ -26,99 +28,44 @@ def universal_search(
     db: Session = Depends(get_db_session),
     user: UserModel = Depends(get_mcp_authenticated_user),
 ) -> dict[str, Any]:
-    results: dict[str, Any] = {
-        "query": query,
-        "results": {},
-        "total_count": 0,
-    }
-    total_count = 0
     search_types = entity_types or [
         "data_products",
         "output_ports",
         "technical_assets",
         "domains",
     ]
-    query_results = {}
+    query_results: dict[str, list[Any]] = {}
     if "data_products" in search_types:
-        all_data_products = DataProductService(db).get_data_products()
-        filtered_data_products = []
-        for dp in all_data_products:
-            if query.lower() in dp.name.lower() or (
-                dp.description and query.lower() in dp.description.lower()
-            ):
-                filtered_data_products.append(
-                    GetDataProductsResponseItem.model_validate(dp)
-                )
-                if len(filtered_data_products) >= limit:
-                    break
-
-        result_data_products = [
+        query_results["data_products"] = [
             GetDataProductsResponseItem.model_validate(dp).model_dump()
-            for dp in filtered_data_products
+            for dp in DataProductService(db).search_data_products(query, limit)
         ]
-        query_results.update({"data_products": result_data_products})
-        total_count += len(filtered_data_products)
 
     if "output_ports" in search_types:
-        all_output_ports = OutputPortService(db).search_output_ports(
-            query=None, limit=1000, user=user, current_user_assigned=False
-        )
-        filtered_output_ports = []
-        for ds in all_output_ports:
-            if query.lower() in ds.name.lower() or (
-                ds.description and query.lower() in ds.description.lower()
-            ):
-                filtered_output_ports.append(ds)
-                if len(filtered_output_ports) >= limit:
-                    break
-
-        result_datasets = [
+        query_results["output_ports"] = [
             SearchOutputPortsResponseItem.model_validate(op).model_dump()
-            for op in filtered_output_ports
+            for op in OutputPortService(db).search_output_ports(
+                query=query, limit=limit, user=user, current_user_assigned=False
+            )
         ]
-        query_results.update({"output_ports": result_datasets})
-        total_count += len(filtered_output_ports)
 
     if "technical_assets" in search_types:
-        all_data_outputs = TechnicalAssetService(db).get_data_outputs()
-        filtered_data_outputs = []
-        for do in all_data_outputs:
-            if query.lower() in do.name.lower() or (
-                do.description and query.lower() in do.description.lower()
-            ):
-                filtered_data_outputs.append(do)
-                if len(filtered_data_outputs) >= limit:
-                    break
-
-        result_data_outputs = [
+        query_results["technical_assets"] = [
             GetTechnicalAssetsResponseItem.model_validate(do)
-            for do in filtered_data_outputs
+            for do in TechnicalAssetService(db).search_technical_assets(query, limit)
         ]
-        query_results.update({"technical_assets": result_data_outputs})
-        total_count += len(filtered_data_outputs)
 
     if "domains" in search_types:
-        from app.configuration.domains.schema_response import GetDomainsItem
-
-        all_domains = DomainService(db).get_domains()
-        filtered_domains = []
-        for domain in all_domains:
-            if query.lower() in domain.name.lower() or (
-                domain.description and query.lower() in domain.description.lower()
-            ):
-                filtered_domains.append(domain)
-                if len(filtered_domains) >= limit:
-                    break
-
-        result_domains = [
+        query_results["domains"] = [
             GetDomainsItem.model_validate(domain).model_dump()
-            for domain in filtered_domains
+            for domain in DomainService(db).search_domains(query, limit)
         ]
-        query_results.update({"domains": result_domains})
-        total_count += len(filtered_domains)
-    results["total_count"] = total_count
-    results["results"] = query_results
-    return results
+
+    return {
+        "query": query,
+        "results": query_results,
+        "total_count": sum(len(results) for results in query_results.values()),
+    }
 
 
 def search_data_products(
@@ -128,30 +75,22 @@ def search_data_products(
     limit: int = 20,
     db: Session = Depends(get_db_session),
 ) -> dict[str, Any]:
-    all_data_products = DataProductService(db).get_data_products()
-    filtered_data_products = []
-
-    for dp in all_data_products:
-        if (
-            query
-            and query.lower() not in dp.name.lower()
-            and (not dp.description or query.lower() not in dp.description.lower())
-        ):
-            continue
-        if domain_id and str(dp.domain_id) != domain_id:
-            continue
-        if status and dp.status != status:
-            continue
-
-        filtered_data_products.append(GetDataProductsResponseItem.model_validate(dp))
-        if len(filtered_data_products) >= limit:
-            break
+    try:
+        domain = UUID(domain_id) if domain_id else None
+        lifecycle_status = AbstractDataProductStatus(status) if status else None
+    except ValueError:
+        # An unknown domain id or status matches no data product
+        data_products: Sequence[Any] = []
+    else:
+        data_products = DataProductService(db).search_data_products(
+            query, limit, domain_id=domain, status=lifecycle_status
+        )
     return {
         "data_products": [
             GetDataProductsResponseItem.model_validate(dp).model_dump()
-            for dp in filtered_data_products
+            for dp in data_products
         ],
-        "count": len(filtered_data_products),
+        "count": len(data_products),
         "filters_applied": {
             "query": query,
             "domain_id": domain_id,
@@ -26,6 +26,9 @@ class Settings(BaseSettings):
     CORS_ALLOWED_ORIGINS: str = ""
     AWS_DEFAULT_REGION: str = "eu-west-1"
     AWS_DEFAULT_PROFILE: Optional[str] = None
+    # Temporary AWS credentials of the MCP tools are reused until this long before they expire
+    AWS_CREDENTIALS_CACHE_SIZE: int = 1024
+    AWS_CREDENTIALS_REFRESH_MARGIN_SECONDS: int = 300
     PORTAL_API_KEY: Optional[str] = None
 
     # OIDC Configuration
@@ -35,6 +38,13 @@ class Settings(BaseSettings):
     OIDC_AUTHORITY: Optional[str] = None
     OIDC_REDIRECT_URI: Optional[str] = None
     OIDC_AUDIENCE: Optional[str] = None
+    # Signing keys are refetched after the TTL, or for an unknown key id at most once per interval
+    OIDC_JWKS_CACHE_TTL_SECONDS: int = 3600
+    OIDC_JWKS_REFRESH_INTERVAL_SECONDS: int = 30
+    OIDC_JWKS_FETCH_TIMEOUT_SECONDS: float = 2.0
+    # Verified tokens are cached until they expire, at most for the TTL
+    OIDC_TOKEN_CACHE_SIZE: int = 1024
+    OIDC_TOKEN_CACHE_TTL_SECONDS: int = 60
 
     MCP_BASE_URL: Optional[str] = None
     MCP_AUTH_REDIRECT_URIS: list[str] = []
@@ -53,6 +63,28 @@ class Settings(BaseSettings):
     # This setting enables extra events to be triggered when a Technical Asset is added or removed from an Output Port
     # This can be used when migrating infra, or when roles are not properly supported by your infrastructure
     WEBHOOK_V2_TECHNICAL_ASSET_OUTPUT_PORT_LINKS_TRIGGER_INPUT_PORT_EVENTS: bool = False
+    # Webhook v2 delivery: events about the same resource are delivered in order,
+    # over at most WEBHOOK_V2_CONCURRENCY concurrent connections. A batch size
+    # above 1 sends the events as a CloudEvents batch instead of one by one.
+    WEBHOOK_V2_CONCURRENCY: int = 8
+    WEBHOOK_V2_BATCH_SIZE: int = 1
+    WEBHOOK_V2_QUEUE_SIZE: int = 1000
+    WEBHOOK_V2_TIMEOUT_SECONDS: float = 5.0
+    WEBHOOK_V2_MAX_ATTEMPTS: int = 5
+    WEBHOOK_V2_RETRY_BACKOFF_SECONDS: float = 0.5
+    WEBHOOK_V2_RETRY_MAX_BACKOFF_SECONDS: float = 30.0
+    # Events are written to an outbox table in the same transaction as the change,
+    # and relayed from there. Disabling the outbox hands them to an in-memory
+    # queue after the response instead, losing them when the process stops.
+    WEBHOOK_V2_OUTBOX: bool = True
+    WEBHOOK_V2_OUTBOX_BATCH_SIZE: int = 100
+    WEBHOOK_V2_OUTBOX_POLL_INTERVAL_SECONDS: float = 1.0
+    # A relay claims the events it delivers for this long, later events with the same
+    # ordering key wait meanwhile. Events that failed to deliver are retried after the
+    # retry interval.
+    WEBHOOK_V2_OUTBOX_CLAIM_SECONDS: int = 300
+    WEBHOOK_V2_OUTBOX_RETRY_INTERVAL_SECONDS: int = 10
+    WEBHOOK_V2_OUTBOX_RETENTION_DAYS: int = 7
 
     # Email templating and SMTP settings
     PORTAL_NAME: str = "Data Product Portal"
@@ -68,6 +100,39 @@ class Settings(BaseSettings):
     # Authorizer
     AUTHORIZER_CACHE_SIZE: int = 128
     AUTHORIZER_STARTUP_SYNC: bool = True
+    # Replicas apply each other's changes to the casbin table via LISTEN/NOTIFY
+    AUTHORIZER_CHANGE_NOTIFICATIONS: bool = True
+    AUTHORIZER_CHANGE_LISTENER_HEALTHCHECK_SECONDS: int = 30
+
+    # Number of nearest neighbours and keyword matches ranked per output port search
+    SEARCH_CANDIDATE_POOL_SIZE: int = 100
+
+    # Embedding model: number of pooled model sessions, ONNX threads per session (None shares
+    # the cores between the sessions) and the number of documents per inference batch
+    EMBEDDING_POOL_SIZE: int = 2
+    EMBEDDING_THREADS: Optional[int] = None
+    EMBEDDING_BATCH_SIZE: int = 256
+    # Outdated output port embeddings are recalculated in batches of this size, per transaction
+    EMBEDDING_RECALCULATION_BATCH_SIZE: int = 256
+    EMBEDDING_RECALCULATION_INTERVAL_SECONDS: int = 5
+    # Output ports are claimed for this long while their embeddings are recalculated,
+    # those that failed to embed are retried once their claim lapses
+    EMBEDDING_RECALCULATION_CLAIM_SECONDS: int = 300
+    # Search query embeddings are cached, set the size to 0 to disable the cache
+    EMBEDDING_QUERY_CACHE_SIZE: int = 1024
+    EMBEDDING_QUERY_CACHE_TTL_SECONDS: Optional[int] = None
+
+    # Marketplace totals are cached for at most this long, changes made on this replica clear them straight away
+    MARKETPLACE_STATISTICS_CACHE_TTL_SECONDS: int = 30
+
+    # Approved input ports are checked for lapsed grants at this interval, in batches of this size
+    INPUT_PORT_EXPIRY_INTERVAL_SECONDS: int = 300
+    INPUT_PORT_EXPIRY_BATCH_SIZE: int = 500
+
+    # Background jobs run in a thread pool of this size. A job running on another replica,
+    # or failing to be scheduled, is retried after the retry interval.
+    SCHEDULER_MAX_WORKERS: int = 4
+    SCHEDULER_RETRY_INTERVAL_SECONDS: int = 30
 
     # Namespace validation
     NAMESPACE_MAX_LENGTH: int = 64
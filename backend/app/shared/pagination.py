@@ -0,0 +1,218 @@
+"""Keyset pagination, sparse fieldsets and NDJSON streaming for list endpoints.
+
+List endpoints keep returning the complete list when called without `limit` or
+`cursor`. With a `limit`, they return a page and the `next_cursor` to pass for
+the following page. Pages are keyed on the sort columns of the list rather than
+an offset, so a page stays cheap however deep it is, and rows inserted or
+removed meanwhile never shift later pages.
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Annotated, Any, Callable, Generic, Iterator, Optional, TypeVar
+
+from fastapi import Header, HTTPException, Query, status
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from pydantic.json_schema import SkipJsonSchema
+from sqlalchemy import ColumnElement, Select, String, func, tuple_, type_coerce
+from sqlalchemy.orm import InstrumentedAttribute, Session
+
+from app.shared.schema import ORMModel
+
+MAX_PAGE_SIZE = 1000
+STREAM_PAGE_SIZE = 500
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class PageRequest:
+    cursor: Optional[str] = None
+    # Everything after the cursor when not set
+    limit: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    items: list[T]
+    next_cursor: Optional[str] = None
+
+
+class Keyset:
+    """Orders a query on the given columns, the last of which must be unique,
+    and resumes it after the row a cursor points at.
+
+    Null strings sort as empty strings, as a row comparison skips nulls.
+    """
+
+    def __init__(self, *columns: InstrumentedAttribute) -> None:
+        self.columns = columns
+        self._types = [TypeAdapter(column.type.python_type) for column in columns]
+
+    def _key(self, column: InstrumentedAttribute) -> ColumnElement[Any]:
+        if isinstance(column.type, String) and column.nullable:
+            return func.coalesce(column, "")
+        return column
+
+    def fetch(self, db: Session, query: Select, page: PageRequest) -> Page[Any]:
+        keys = [self._key(column) for column in self.columns]
+        query = query.order_by(None).order_by(*keys)
+        if page.cursor is not None:
+            values = self._decode(page.cursor)
+            query = query.where(
+                tuple_(*keys)
+                > tuple_(
+                    *(
+                        type_coerce(value, column.type)
+                        for column, value in zip(self.columns, values)
+                    )
+                )
+            )
+        if page.limit is not None:
+            query = query.limit(page.limit + 1)
+        rows = list(db.scalars(query).unique().all())
+        if page.limit is None or len(rows) <= page.limit:
+            return Page(items=rows)
+        rows = rows[: page.limit]
+        return Page(items=rows, next_cursor=self._encode(rows[-1]))
+
+    def encode(self, *values: Any) -> str:
+        """The cursor pointing at the row with these values of the sort columns."""
+        values = tuple(
+            "" if value is None and isinstance(column.type, String) else value
+            for column, value in zip(self.columns, values)
+        )
+        payload = json.dumps(values, default=str).encode()
+        return base64.urlsafe_b64encode(payload).decode()
+
+    def _encode(self, row: Any) -> str:
+        return self.encode(*(getattr(row, column.key) for column in self.columns))
+
+    def _decode(self, cursor: str) -> list[Any]:
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            if not isinstance(values, list) or len(values) != len(self.columns):
+                raise ValueError("Cursor does not match the sort columns")
+            return [
+                adapter.validate_python(value)
+                for adapter, value in zip(self._types, values)
+            ]
+        except (binascii.Error, ValueError, ValidationError) as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+            ) from e
+
+
+class PaginatedResponse(ORMModel):
+    # Left out of the last page, so unpaginated responses keep their shape
+    next_cursor: Optional[str] = Field(
+        default=None, exclude_if=lambda cursor: cursor is None
+    )
+
+
+@dataclass(frozen=True)
+class PageParams:
+    cursor: Optional[str] = None
+    limit: Optional[int] = None
+    fields: Optional[frozenset[str]] = None
+    stream: bool = False
+
+
+def page_params(
+    limit: Annotated[
+        int | SkipJsonSchema[None],
+        Query(
+            ge=1,
+            le=MAX_PAGE_SIZE,
+            description="Return at most this many items, and a cursor to the next page",
+        ),
+    ] = None,
+    cursor: Annotated[
+        str | SkipJsonSchema[None],
+        Query(description="The next_cursor of the previous page"),
+    ] = None,
+    fields: Annotated[
+        str | SkipJsonSchema[None],
+        Query(description="Comma separated list of the item fields to return"),
+    ] = None,
+    accept: Annotated[
+        str | SkipJsonSchema[None], Header(include_in_schema=False)
+    ] = None,
+) -> PageParams:
+    """Query parameters of a list endpoint. Requesting `application/x-ndjson`
+    streams the items after the cursor one per line, instead of a single page.
+    """
+    return PageParams(
+        cursor=cursor,
+        limit=limit,
+        fields=frozenset(field.strip() for field in fields.split(",") if field.strip())
+        if fields
+        else None,
+        stream=NDJSON_MEDIA_TYPE in (accept or ""),
+    )
+
+
+def list_response(
+    params: PageParams,
+    load: Callable[[PageRequest], Page[Any]],
+    response: type[BaseModel],
+    key: str,
+    item: type[BaseModel],
+    db: Session,
+) -> Any:
+    """Builds the response of a list endpoint from the pages `load` returns:
+    the response model, a page limited to the requested fields, or a stream.
+    """
+    if params.fields is not None and (
+        unknown := params.fields - item.model_fields.keys()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+        )
+    if params.stream:
+        return StreamingResponse(
+            _stream(params, load, item, db), media_type=NDJSON_MEDIA_TYPE
+        )
+
+    page = load(PageRequest(cursor=params.cursor, limit=params.limit))
+    items = [item.model_validate(row) for row in page.items]
+    if params.fields is None:
+        return response(**{key: items, "next_cursor": page.next_cursor})
+    content: dict[str, Any] = {
+        key: [model.model_dump(mode="json", include=params.fields) for model in items]
+    }
+    if page.next_cursor is not None:
+        content["next_cursor"] = page.next_cursor
+    return JSONResponse(content)
+
+
+def _stream(
+    params: PageParams,
+    load: Callable[[PageRequest], Page[Any]],
+    item: type[BaseModel],
+    db: Session,
+) -> Iterator[str]:
+    cursor, remaining = params.cursor, params.limit
+    while remaining is None or remaining > 0:
+        size = (
+            STREAM_PAGE_SIZE if remaining is None else min(remaining, STREAM_PAGE_SIZE)
+        )
+        page = load(PageRequest(cursor=cursor, limit=size))
+        for row in page.items:
+            model = item.model_validate(row)
+            yield model.model_dump_json(include=params.fields) + "\n"
+        # Written pages are dropped from the session, so memory stays bounded
+        # by the page size rather than by the length of the list. Other objects,
+        # like the authenticated user the pages are filtered on, stay attached.
+        for row in page.items:
+            db.expunge(row)
+        if page.next_cursor is None:
+            return
+        cursor = page.next_cursor
+        if remaining is not None:
+            remaining -= len(page.items)
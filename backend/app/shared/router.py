@@ -21,6 +21,7 @@ from app.configuration.tags.router import router as tag
 from app.configuration.theme_settings.router import router as theme_settings
 from app.core.auth.auth import api_key_authenticated
 from app.core.config.env_var_parser import get_boolean_variable
+from app.core.webhooks.router import router as webhook
 from app.data_products.output_port_technical_assets_link.router import (
     router as data_output_dataset,
 )
@@ -34,6 +35,7 @@ from app.explorations.router import router as exploration
 from app.graph.router import router as graph
 from app.resource_names.router import router as resource_name
 from app.search_output_ports.router import router as search_output_ports
+from app.statistics.router import router as statistics
 from app.technical_asset_configuration.router import router as plugin
 from app.users.notifications.router import router as notification
 from app.users.router import router as user
@@ -69,3 +71,5 @@ router.include_router(resource_name)
 router.include_router(plugin)
 router.include_router(exploration)
 router.include_router(access_duration)
+router.include_router(webhook)
+router.include_router(statistics)
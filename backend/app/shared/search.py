@@ -0,0 +1,44 @@
+"""Keyword search on the name and description of catalogue entities.
+
+The search document is an expression rather than a stored column, matched by a
+GIN expression index on each searched table. Keep `keyword_document` in sync
+with the indexes created in migration `6c1f4e9a2d83`, or queries fall back to
+scanning the table.
+"""
+
+import re
+from typing import Optional
+
+from sqlalchemy import ColumnElement, func, literal_column
+from sqlalchemy.orm import InstrumentedAttribute
+
+_CONFIG = literal_column("'simple'")
+_EMPTY = literal_column("''")
+_SEPARATOR = literal_column("' '")
+_WORD = re.compile(r"\w+")
+
+
+def keyword_document(
+    name: InstrumentedAttribute, description: InstrumentedAttribute
+) -> ColumnElement:
+    return func.to_tsvector(
+        _CONFIG,
+        func.coalesce(name, _EMPTY)
+        .op("||")(_SEPARATOR)
+        .op("||")(func.coalesce(description, _EMPTY)),
+    )
+
+
+def keyword_query(query: Optional[str]) -> Optional[ColumnElement]:
+    """Matches documents containing every word of the query as a word prefix,
+    so partially typed words still match. None when the query has no words.
+    """
+    words = _WORD.findall((query or "").lower())
+    if not words:
+        return None
+    return func.to_tsquery(_CONFIG, " & ".join(f"{word}:*" for word in words))
+
+
+def keyword_score(document: ColumnElement, ts_query: ColumnElement) -> ColumnElement:
+    # Normalised to 0..1, the same scale as the semantic score of hybrid search
+    return func.ts_rank_cd(document, ts_query, 32)
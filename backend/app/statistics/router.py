@@ -0,0 +1,19 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.core.auth.auth import get_authenticated_user
+from app.database.database import get_db_session
+from app.statistics.schema_response import MarketplaceStatistics
+from app.statistics.service import StatisticsService
+from app.users.model import User
+
+router = APIRouter(tags=["Statistics"], prefix="/v2/statistics")
+
+
+@router.get("/marketplace")
+def get_marketplace_statistics(
+    db: Session = Depends(get_db_session),
+    user: User = Depends(get_authenticated_user),
+) -> MarketplaceStatistics:
+    """Totals of the marketplace, counting only the output ports the user can see."""
+    return StatisticsService(db).get_marketplace_statistics(user)
@@ -0,0 +1,8 @@
+from app.shared.schema import ORMModel
+
+
+class MarketplaceStatistics(ORMModel):
+    total_data_products: int
+    total_output_ports: int
+    total_technical_assets: int
+    total_domains: int
@@ -0,0 +1,157 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import event as sql_event
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, object_session
+
+from app.configuration.domains.model import Domain as DomainModel
+from app.configuration.domains.schema_response import GetDomainsItem
+from app.configuration.domains.service import DomainService
+from app.core.authz import Authorization
+from app.data_products.model import DataProduct as DataProductModel
+from app.data_products.output_ports.enums import OutputPortAccessType
+from app.data_products.output_ports.model import OutputPort as OutputPortModel
+from app.data_products.output_ports.service import OutputPortService
+from app.data_products.schema_response import GetDataProductsResponseItem
+from app.data_products.service import DataProductService
+from app.data_products.technical_assets.model import (
+    TechnicalAsset as TechnicalAssetModel,
+)
+from app.settings import settings
+from app.statistics.schema_response import MarketplaceStatistics
+from app.users.model import User as UserModel
+
+FEATURED_DATA_PRODUCTS = 5
+_CHANGED = "marketplace_statistics_changed"
+
+
+@dataclass(frozen=True)
+class MarketplaceSnapshot:
+    """The parts of the marketplace overview that are the same for every user."""
+
+    data_products: int
+    # Output ports any user can see, and all of them, as seen by admins
+    public_output_ports: int
+    output_ports: int
+    technical_assets: int
+    domains: list[GetDomainsItem]
+    featured_data_products: list[GetDataProductsResponseItem]
+
+
+class SnapshotCache:
+    """Holds the latest snapshot for a short time, so repeated overviews cost
+    no queries. Committed changes to the counted models clear it straight away
+    on this replica, the TTL bounds how stale other replicas can be.
+    """
+
+    def __init__(self) -> None:
+        self._snapshot: Optional[MarketplaceSnapshot] = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self) -> Optional[MarketplaceSnapshot]:
+        with self._lock:
+            if self._snapshot is None or time.monotonic() >= self._expires_at:
+                return None
+            return self._snapshot
+
+    def put(self, snapshot: MarketplaceSnapshot) -> None:
+        with self._lock:
+            self._snapshot = snapshot
+            self._expires_at = (
+                time.monotonic() + settings.MARKETPLACE_STATISTICS_CACHE_TTL_SECONDS
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshot = None
+
+
+marketplace_snapshots = SnapshotCache()
+
+
+class StatisticsService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_snapshot(self) -> MarketplaceSnapshot:
+        if (snapshot := marketplace_snapshots.get()) is not None:
+            return snapshot
+        snapshot = self._take_snapshot()
+        marketplace_snapshots.put(snapshot)
+        return snapshot
+
+    def get_marketplace_statistics(self, user: UserModel) -> MarketplaceStatistics:
+        snapshot = self.get_snapshot()
+        return MarketplaceStatistics(
+            total_data_products=snapshot.data_products,
+            total_output_ports=self.count_visible_output_ports(user, snapshot),
+            total_technical_assets=snapshot.technical_assets,
+            total_domains=len(snapshot.domains),
+        )
+
+    def count_visible_output_ports(
+        self, user: UserModel, snapshot: MarketplaceSnapshot
+    ) -> int:
+        """Only the private output ports a user may see differ between users,
+        these are counted on top of the cached public ones.
+        """
+        if Authorization().has_admin_role(user_id=str(user.id)):
+            return snapshot.output_ports
+        private = self.db.scalar(
+            select(func.count(OutputPortModel.id)).where(
+                OutputPortModel.access_type == OutputPortAccessType.PRIVATE,
+                OutputPortService(self.db).visible_to_user_filter(user),
+            )
+        )
+        return snapshot.public_output_ports + (private or 0)
+
+    def _take_snapshot(self) -> MarketplaceSnapshot:
+        output_ports, public_output_ports = self.db.execute(
+            select(
+                func.count(OutputPortModel.id),
+                func.count(OutputPortModel.id).filter(
+                    OutputPortModel.access_type != OutputPortAccessType.PRIVATE
+                ),
+            )
+        ).one()
+        return MarketplaceSnapshot(
+            data_products=self.db.scalar(select(func.count(DataProductModel.id))),
+            public_output_ports=public_output_ports,
+            output_ports=output_ports,
+            technical_assets=self.db.scalar(select(func.count(TechnicalAssetModel.id))),
+            domains=[
+                GetDomainsItem.model_validate(domain)
+                for domain in DomainService(self.db).get_domains()
+            ],
+            featured_data_products=[
+                GetDataProductsResponseItem.model_validate(dp)
+                for dp in DataProductService(self.db).search_data_products(
+                    None, FEATURED_DATA_PRODUCTS
+                )
+            ],
+        )
+
+
+def _mark_changed(mapper, connection, target) -> None:
+    if (session := object_session(target)) is not None:
+        session.info[_CHANGED] = True
+
+
+def _clear_after_commit(session: Session) -> None:
+    if session.info.pop(_CHANGED, False):
+        marketplace_snapshots.clear()
+
+
+def _forget_after_rollback(session: Session) -> None:
+    session.info.pop(_CHANGED, None)
+
+
+for _model in (DataProductModel, OutputPortModel, TechnicalAssetModel, DomainModel):
+    for _event in ("after_insert", "after_update", "after_delete"):
+        sql_event.listen(_model, _event, _mark_changed)
+sql_event.listen(Session, "after_commit", _clear_after_commit)
+sql_event.listen(Session, "after_rollback", _forget_after_rollback)
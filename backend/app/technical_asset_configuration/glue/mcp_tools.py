@@ -4,10 +4,13 @@ Registers tools that allow AI clients to query AWS Glue databases via Athena,
 using the credentials obtained through the portal's access control system.
 """
 
-from typing import TYPE_CHECKING, Any, Dict
+import csv
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional
 from uuid import UUID
 
-import boto3
+from botocore.client import BaseClient
+from botocore.response import StreamingBody
 from fastmcp import FastMCP
 from fastmcp.dependencies import Depends
 from sqlalchemy import select as sa_select
@@ -21,8 +24,10 @@ from app.configuration.environments.platform_service_configurations.schemas impo
 )
 from app.configuration.environments.service import EnvironmentService
 from app.core.auth.credentials import AWSCredentials
-from app.core.auth.service import AuthService
+from app.core.aws.credential_cache import AWSCredentialsKey, aws_credentials
+from app.core.aws.get_url import get_aws_temporary_credentials
 from app.data_products.model import DataProduct as DataProductModel
+from app.data_products.service import DataProductService
 from app.data_products.technical_assets.model import ensure_technical_asset_exists
 from app.data_products.technical_assets.schema_response import compute_technical_info
 from app.data_products.technical_assets.service import TechnicalAssetService
@@ -31,7 +36,6 @@ from app.mcp.deps import (
     get_db_session,
     get_mcp_authenticated_user,
 )
-from app.settings import settings
 from app.technical_asset_configuration.glue.model import (
     GlueTechnicalAssetConfiguration as GlueTechnicalAssetConfigurationModel,
 )
@@ -52,14 +56,19 @@ def _fetch_aws_credentials(
 ) -> AWSCredentials:
     """Fetch temporary AWS credentials for the authenticated user.
 
-    Validates READ_INTEGRATIONS authorization via Casbin, then assumes the IAM
-    role to get temporary credentials.
+    Validates READ_INTEGRATIONS authorization via Casbin on every call, then
+    assumes the IAM role to get temporary credentials. These are cached until
+    shortly before they expire, so repeated tool calls skip STS.
     """
-    authorize_data_product_read_integrations(
-        data_product_namespace=data_product_namespace,
-        authorized_user=authorized_user,
-        db=db,
-    )
+    try:
+        data_product = authorize_data_product_read_integrations(
+            data_product_namespace=data_product_namespace,
+            authorized_user=authorized_user,
+            db=db,
+        )
+    except PermissionError:
+        aws_credentials.invalidate(authorized_user.id)
+        raise
 
     envs = EnvironmentService(db).get_environments()
     if env not in [e.name for e in envs]:
@@ -67,11 +76,10 @@ def _fetch_aws_credentials(
             f"Environment '{env}' not found. "
             f"Available environments: {[e.name for e in envs]}"
         )
-    creds = AuthService().get_aws_credentials(
-        data_product_name=data_product_namespace,
-        environment=env,
-        authorized_user=authorized_user,
-        db=db,
+    role_arn = DataProductService(db).get_data_product_role_arn(data_product.id, env)
+    creds = aws_credentials.get(
+        AWSCredentialsKey(authorized_user.id, data_product.id, env, role_arn),
+        lambda: get_aws_temporary_credentials(role_arn, actor=authorized_user),
     )
 
     if not isinstance(creds, AWSCredentials):
@@ -79,6 +87,116 @@ def _fetch_aws_credentials(
     return creds
 
 
+# Long-polls for a query to finish are capped, to stay within MCP client timeouts
+ATHENA_MAX_WAIT_SECONDS = 60
+ATHENA_POLL_MAX_INTERVAL_SECONDS = 2.0
+
+
+def _wait_for_query_execution(
+    client: BaseClient, query_execution_id: str, wait_seconds: int
+) -> dict[str, Any]:
+    """The query execution, once it is no longer queued or running, or when
+    ``wait_seconds`` passed. Polls with a growing interval.
+    """
+    deadline = time.monotonic() + min(max(wait_seconds, 0), ATHENA_MAX_WAIT_SECONDS)
+    interval = 0.25
+    while True:
+        execution = client.get_query_execution(QueryExecutionId=query_execution_id)
+        state = execution["QueryExecution"]["Status"]["State"]
+        remaining = deadline - time.monotonic()
+        if state not in ("QUEUED", "RUNNING") or remaining <= 0:
+            return execution
+        time.sleep(min(interval, remaining))
+        interval = min(interval * 2, ATHENA_POLL_MAX_INTERVAL_SECONDS)
+
+
+def _read_query_results(
+    client: BaseClient, query_execution_id: str, max_results: int, next_token: str
+) -> tuple[list[str], list[dict[str, Optional[str]]], Optional[str]]:
+    """One page of query results from the Athena API, with the token of the next
+    page. Only the first page starts with the header row.
+    """
+    kwargs: Dict[str, Any] = {
+        "QueryExecutionId": query_execution_id,
+        "MaxResults": max_results,
+    }
+    if next_token:
+        kwargs["NextToken"] = next_token
+    response = client.get_query_results(**kwargs)
+    rows = response["ResultSet"]["Rows"]
+    if next_token:
+        column_info = response["ResultSet"]["ResultSetMetadata"]["ColumnInfo"]
+        columns = [column["Name"] for column in column_info]
+    elif rows:
+        columns = [col.get("VarCharValue", "") for col in rows[0]["Data"]]
+        rows = rows[1:]
+    else:
+        columns = []
+    data_rows = [
+        {columns[i]: col.get("VarCharValue") for i, col in enumerate(row["Data"])}
+        for row in rows
+    ]
+    return columns, data_rows, response.get("NextToken")
+
+
+class _CountedLines:
+    """Decoded lines of a streamed object, counting the bytes read so far."""
+
+    def __init__(self, body: StreamingBody, offset: int = 0) -> None:
+        self._lines = body.iter_lines(keepends=True)
+        self.position = offset
+
+    def __iter__(self) -> Iterator[str]:
+        return self
+
+    def __next__(self) -> str:
+        line = next(self._lines)
+        self.position += len(line)
+        return line.decode("utf-8")
+
+
+def _read_s3_results(
+    s3: BaseClient, output_location: str, max_results: int, next_token: str
+) -> tuple[list[str], list[dict[str, Optional[str]]], Optional[str]]:
+    """One page of query results, streamed from the CSV result object in S3.
+
+    The token of the next page is the byte offset of its first row, so a page
+    only downloads its own rows (and the header). Unlike the Athena API, the CSV
+    does not tell NULLs apart from empty strings.
+    """
+    bucket, _, key = output_location.removeprefix("s3://").partition("/")
+    obj = s3.get_object(Bucket=bucket, Key=key)
+    lines = _CountedLines(obj["Body"])
+    try:
+        reader = csv.reader(lines)
+        columns = next(reader, [])
+        if next_token:
+            obj["Body"].close()
+            offset = int(next_token)
+            obj = s3.get_object(Bucket=bucket, Key=key, Range=f"bytes={offset}-")
+            lines = _CountedLines(obj["Body"], offset)
+            reader = csv.reader(lines)
+        size = _object_size(obj)
+        data_rows: list[dict[str, Optional[str]]] = []
+        for values in reader:
+            data_rows.append(dict(zip(columns, values)))
+            if len(data_rows) >= max_results:
+                break
+    finally:
+        obj["Body"].close()
+    if lines.position < size:
+        return columns, data_rows, str(lines.position)
+    return columns, data_rows, None
+
+
+def _object_size(obj: dict[str, Any]) -> int:
+    # A ranged get only reports the length of the range, the total follows the slash
+    content_range = obj.get("ContentRange")
+    if content_range:
+        return int(content_range.rsplit("/", 1)[1])
+    return obj["ContentLength"]
+
+
 MCP_INSTRUCTIONS = """
     ═══════════════════════════════════════════════════════════════════════
     DATA QUERY FLOW (Glue / Athena — Steps 4–8)
@@ -116,10 +234,14 @@ MCP_INSTRUCTIONS = """
 
     Step 8: GET RESULTS
     ────────────────────
-    get_athena_query_results(query_execution_id, data_product_namespace, env)
-    → RUNNING → wait 3-5 s and retry
+    get_athena_query_results(query_execution_id, data_product_namespace, env,
+                             wait_seconds=30)
+    → Waits up to wait_seconds for the query to finish, so there is no need to poll.
+    → RUNNING → call again with wait_seconds
     → SUCCEEDED → return formatted rows
     → FAILED    → show error
+    → next_token in the result → pass it as next_token to get the following rows.
+    → For large results pass from_s3=True to stream the rows from the result CSV.
 """
 
 
@@ -267,13 +389,7 @@ def register_tools(mcp: FastMCP) -> None:
             List of table names, or error if access denied / database not found.
         """
         creds = _fetch_aws_credentials(data_product_namespace, env, authorized_user, db)
-        client = boto3.client(
-            "glue",
-            region_name=settings.AWS_DEFAULT_REGION,
-            aws_access_key_id=creds.AccessKeyId,
-            aws_secret_access_key=creds.SecretAccessKey,
-            aws_session_token=creds.SessionToken,
-        )
+        client = aws_credentials.client("glue", creds)
         paginator = client.get_paginator("get_tables")
         tables: list[dict] = [
             {
@@ -330,13 +446,7 @@ def register_tools(mcp: FastMCP) -> None:
             {'query_execution_id': '...', ...} or {'error': '...'}.
         """
         creds = _fetch_aws_credentials(data_product_namespace, env, authorized_user, db)
-        client = boto3.client(
-            "athena",
-            region_name=settings.AWS_DEFAULT_REGION,
-            aws_access_key_id=creds.AccessKeyId,
-            aws_secret_access_key=creds.SecretAccessKey,
-            aws_session_token=creds.SessionToken,
-        )
+        client = aws_credentials.client("athena", creds)
         kwargs: Dict[str, Any] = {"QueryString": query}
         if workgroup:
             kwargs["WorkGroup"] = workgroup
@@ -364,6 +474,9 @@ def register_tools(mcp: FastMCP) -> None:
         data_product_namespace: str,
         env: str,
         max_results: int = 100,
+        next_token: str = "",
+        wait_seconds: int = 0,
+        from_s3: bool = False,
         authorized_user: User = Depends(get_mcp_authenticated_user),
         db: Session = Depends(get_db_session),
     ) -> Dict[str, Any]:
@@ -374,18 +487,20 @@ def register_tools(mcp: FastMCP) -> None:
             data_product_namespace: The namespace used when submitting the query.
             env: The environment.
             max_results: Maximum rows to return (default 100).
+            next_token: The next_token of the previous page, to get the following rows.
+            wait_seconds: Wait up to this many seconds (at most 60) for the query to finish.
+            from_s3: Stream the rows from the CSV result object in S3 instead of the
+                Athena API. Tokens of one mode cannot be used in the other.
         Returns:
-            Status and result rows, or error information.
+            Status and result rows, with a next_token when more rows follow, or error
+            information.
         """
         creds = _fetch_aws_credentials(data_product_namespace, env, authorized_user, db)
-        client = boto3.client(
-            "athena",
-            region_name=settings.AWS_DEFAULT_REGION,
-            aws_access_key_id=creds.AccessKeyId,
-            aws_secret_access_key=creds.SecretAccessKey,
-            aws_session_token=creds.SessionToken,
-        )
-        execution = client.get_query_execution(QueryExecutionId=query_execution_id)
+        client = aws_credentials.client("athena", creds)
+        if wait_seconds > 0:
+            # Don't hold on to a database connection while waiting
+            db.close()
+        execution = _wait_for_query_execution(client, query_execution_id, wait_seconds)
         exec_status = execution["QueryExecution"]["Status"]["State"]
         stats = execution["QueryExecution"]["Statistics"]
 
@@ -404,34 +519,41 @@ def register_tools(mcp: FastMCP) -> None:
             )
 
         if exec_status in ("QUEUED", "RUNNING"):
-            result["message"] = f"Query is {exec_status.lower()}. Retry in a moment."
+            result["message"] = (
+                f"Query is {exec_status.lower()}. Retry with wait_seconds to wait "
+                "for it to finish."
+            )
             return result
 
         if exec_status == "SUCCEEDED":
-            rows_response = client.get_query_results(
-                QueryExecutionId=query_execution_id, MaxResults=max_results
-            )
-            rows = rows_response["ResultSet"]["Rows"]
-            if not rows:
+            if from_s3:
+                output_location = execution["QueryExecution"]["ResultConfiguration"][
+                    "OutputLocation"
+                ]
+                headers, data_rows, following = _read_s3_results(
+                    aws_credentials.client("s3", creds),
+                    output_location,
+                    max_results,
+                    next_token,
+                )
+            else:
+                headers, data_rows, following = _read_query_results(
+                    client, query_execution_id, max_results, next_token
+                )
+            if not headers:
                 result.update({"rows": [], "row_count": 0})
                 return result
 
-            headers = [col.get("VarCharValue", "") for col in rows[0]["Data"]]
-            data_rows = [
-                {
-                    headers[i]: col.get("VarCharValue")
-                    for i, col in enumerate(row["Data"])
-                }
-                for row in rows[1:]
-            ]
             result.update(
                 {
                     "columns": headers,
                     "rows": data_rows,
                     "row_count": len(data_rows),
-                    "truncated": len(data_rows) >= max_results,
+                    "truncated": following is not None,
                 }
             )
+            if following is not None:
+                result["next_token"] = following
             return result
 
         result["message"] = f"Unexpected query status: {exec_status}"
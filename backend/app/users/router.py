@@ -7,6 +7,7 @@ from app.core.auth.auth import authorize_user, get_authenticated_user
 from app.core.authz import Action, Authorization
 from app.core.authz.resolvers import EmptyResolver
 from app.database.database import get_db_session
+from app.shared.pagination import PageParams, list_response, page_params
 from app.users.schema import User
 from app.users.schema_request import CanBecomeAdminUpdate, UserCreate
 from app.users.schema_response import (
@@ -14,6 +15,7 @@ from app.users.schema_response import (
     MyRequestsResponse,
     PendingActionResponse,
     UserCreateResponse,
+    UsersGet,
 )
 from app.users.service import UserService
 
@@ -72,8 +74,13 @@ def set_can_become_admin(
 
 
 @router.get("")
-def get_users(db: Session = Depends(get_db_session)) -> GetUsersResponse:
-    return GetUsersResponse(users=UserService(db).get_users())
+def get_users(
+    db: Session = Depends(get_db_session),
+    page: PageParams = Depends(page_params),
+) -> GetUsersResponse:
+    return list_response(
+        page, UserService(db).get_users_page, GetUsersResponse, "users", UsersGet, db
+    )
 
 
 @router.post("/current/seen_tour")
@@ -17,6 +17,7 @@ from app.data_products.output_port_technical_assets_link.schema_response import
 )
 from app.data_products.output_ports.input_ports.schema import InputPortRequestBase
 from app.data_products.output_ports.schema import OutputPort
+from app.shared.pagination import PaginatedResponse
 from app.shared.schema import ORMModel
 from app.users.enums import RequestTypes
 
@@ -40,7 +41,7 @@ class UsersGet(BaseUserGet):
     global_role: Optional[GlobalRoleAssignmentResponse]
 
 
-class GetUsersResponse(ORMModel):
+class GetUsersResponse(PaginatedResponse):
     users: Sequence[UsersGet]
 
 
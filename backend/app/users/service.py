@@ -2,7 +2,7 @@ from itertools import chain
 from typing import Final, Sequence
 from uuid import UUID
 
-from sqlalchemy import asc, select
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.authorization.role_assignments.data_product.service import (
@@ -12,6 +12,7 @@ from app.data_products.output_port_technical_assets_link.service import (
     TechnicalAssetOutputPortService,
 )
 from app.data_products.output_ports.input_ports.service import InputPortService
+from app.shared.pagination import Keyset, Page, PageRequest
 from app.users.model import User, ensure_user_exists
 from app.users.model import User as UserModel
 from app.users.schema_request import CanBecomeAdminUpdate, UserCreate
@@ -25,19 +26,24 @@ from app.users.schema_response import (
 
 SYSTEM_ACCOUNT: Final[str] = "systemaccount@noreply.com"
 
+_keyset = Keyset(UserModel.last_name, UserModel.first_name, UserModel.id)
+
 
 class UserService:
     def __init__(self, db: Session):
         self.db = db
 
     def get_users(self) -> Sequence[UsersGet]:
-        users = self.db.scalars(
+        return self.get_users_page(PageRequest()).items
+
+    def get_users_page(self, page: PageRequest) -> Page[UserModel]:
+        return _keyset.fetch(
+            self.db,
             select(UserModel)
             .outerjoin(UserModel.global_role)
-            .where(UserModel.email != SYSTEM_ACCOUNT)
-            .order_by(asc(UserModel.last_name), asc(UserModel.first_name))
-        ).all()
-        return users
+            .where(UserModel.email != SYSTEM_ACCOUNT),
+            page,
+        )
 
     def remove_user(self, id: UUID) -> None:
         user = ensure_user_exists(id, self.db)
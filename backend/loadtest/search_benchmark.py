@@ -0,0 +1,128 @@
+"""Latency benchmark of the output port search against the size of the catalogue.
+
+Synthetic output ports are added to an existing (seeded) portal database in steps,
+after which every query is run through the search service and the p50/p99 latencies
+are reported per catalogue size. The synthetic output ports are removed afterwards.
+
+    poetry run poe benchmark-search
+"""
+
+import os
+import statistics
+import time
+
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+import app.main  # noqa: F401 - registers all ORM models
+from app.core.embed.model import warm_text_embedding_model
+from app.data_products.output_ports.service import OutputPortService
+from app.database.database import SessionLocal
+from app.settings import settings
+from app.users.model import User
+
+CATALOGUE_SIZES = [
+    int(size)
+    for size in os.getenv(
+        "BENCHMARK_CATALOGUE_SIZES", "1000,5000,10000,25000,50000"
+    ).split(",")
+]
+QUERIES = os.getenv(
+    "BENCHMARK_QUERIES", "customer,sales orders,Which campaigns delivered the best ROI?"
+).split(",")
+ITERATIONS = int(os.getenv("BENCHMARK_ITERATIONS", "20"))
+LIMIT = int(os.getenv("BENCHMARK_LIMIT", "100"))
+USER_EXTERNAL_ID = os.getenv("BENCHMARK_USER_EXTERNAL_ID", settings.DEFAULT_USERNAME)
+NAMESPACE_PREFIX = "search-benchmark-"
+
+GROW_CATALOGUE = text(
+    """
+    WITH template AS (
+        SELECT data_product_id FROM datasets
+        WHERE namespace NOT LIKE :prefix || '%' LIMIT 1
+    ),
+    words AS (
+        SELECT ARRAY['customer', 'sales', 'orders', 'churn', 'revenue', 'inventory',
+                     'campaign', 'forecast', 'privacy', 'engagement', 'daily',
+                     'weekly', 'monthly', 'summary', 'report', 'segment'] AS w
+    ),
+    generated AS (
+        SELECT gen_random_uuid() AS id, n,
+               words.w[1 + (n * 7) % 16] || ' ' || words.w[1 + (n * 13) % 16]
+                   || ' ' || words.w[1 + (n * 3) % 16] AS name
+        FROM generate_series(:offset, :size - 1) AS n, words
+    )
+    INSERT INTO datasets (id, namespace, name, description, access_type, status,
+                          data_product_id, search_vector, embeddings)
+    SELECT generated.id,
+           :prefix || generated.n,
+           generated.name || ' ' || generated.n,
+           'Synthetic output port for benchmarking ' || generated.name,
+           'UNRESTRICTED',
+           'ACTIVE',
+           template.data_product_id,
+           setweight(to_tsvector('english', generated.name), 'A'),
+           (SELECT array_agg(random() - 0.5) FROM generate_series(1, 384)
+            WHERE generated.n IS NOT NULL)::vector
+    FROM generated, template
+    """
+)
+
+
+def grow_catalogue(db: Session, size: int) -> None:
+    offset = db.scalar(
+        text("SELECT count(*) FROM datasets WHERE namespace LIKE :prefix || '%'"),
+        {"prefix": NAMESPACE_PREFIX},
+    )
+    if offset < size:
+        db.execute(
+            GROW_CATALOGUE,
+            {"prefix": NAMESPACE_PREFIX, "offset": offset, "size": size},
+        )
+        db.commit()
+        db.execute(text("ANALYZE datasets"))
+
+
+def measure(db: Session, user: User) -> list[float]:
+    service = OutputPortService(db)
+    latencies = []
+    for _ in range(ITERATIONS):
+        for query in QUERIES:
+            start_time = time.perf_counter()
+            service.search_output_ports(
+                query=query, limit=LIMIT, user=user, current_user_assigned=False
+            )
+            latencies.append(time.perf_counter() - start_time)
+            db.rollback()
+    return latencies
+
+
+def main() -> None:
+    with SessionLocal() as db:
+        user = db.scalar(select(User).where(User.external_id == USER_EXTERNAL_ID))
+        if user is None:
+            raise ValueError(
+                f"User {USER_EXTERNAL_ID} not found, seed the database first"
+            )
+
+        warm_text_embedding_model()
+
+        try:
+            print(f"{'catalogue size':>15} {'p50 (ms)':>10} {'p99 (ms)':>10}")  # noqa: T201
+            for size in CATALOGUE_SIZES:
+                grow_catalogue(db, size)
+                percentiles = statistics.quantiles(measure(db, user), n=100)
+                print(  # noqa: T201
+                    f"{size:>15} {percentiles[49] * 1000:>10.1f} "
+                    f"{percentiles[98] * 1000:>10.1f}"
+                )
+        finally:
+            db.execute(
+                text("DELETE FROM datasets WHERE namespace LIKE :prefix || '%'"),
+                {"prefix": NAMESPACE_PREFIX},
+            )
+            db.commit()
+
+
+if __name__ == "__main__":
+    main()
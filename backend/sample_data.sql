@@ -2935,3 +2935,17 @@ SELECT
     timezone('utc'::text, current_timestamp),
     NULL
 FROM link;
+
+-- Grant expiry of the approved input ports seeded above
+UPDATE public.input_ports SET grant_expires_on = grants.expires_on
+FROM (
+    SELECT input_port_id,
+        CASE WHEN bool_or(valid_until IS NULL) THEN NULL
+        ELSE max(valid_until) END AS expires_on
+    FROM public.input_port_requests
+    WHERE decision = 'APPROVED' AND revoked_at IS NULL
+        AND (valid_from IS NULL OR valid_from <= current_date)
+    GROUP BY input_port_id
+) AS grants
+WHERE public.input_ports.id = grants.input_port_id
+    AND public.input_ports.status = 'APPROVED';
@@ -1,20 +1,29 @@
 import asyncio
+from contextlib import contextmanager
 from datetime import date, timedelta
 from unittest.mock import AsyncMock, patch
 
+from freezegun import freeze_time
+
 from app.abstract_data_product.input_ports.background_tasks import expire_input_ports
 from app.abstract_data_product.input_ports.enums import InputPortStatus
 from tests import test_session
-from tests.factories import InputPortFactory
+from tests.conftest import webhook_v2_outbox
+from tests.factories import InputPortFactory, InputPortRequestFactory
 
 TODAY = date.today()
 
 
+@contextmanager
 def _mock_emit():
-    return patch(
-        "app.abstract_data_product.input_ports.background_tasks.emit_all_events",
-        AsyncMock(),
-    )
+    with (
+        webhook_v2_outbox(enabled=False),
+        patch(
+            "app.abstract_data_product.input_ports.background_tasks.emit_all_events",
+            AsyncMock(),
+        ) as mock_emit,
+    ):
+        yield mock_emit
 
 
 class TestExpireInputPorts:
@@ -67,6 +76,80 @@ class TestExpireInputPorts:
         assert link.status == InputPortStatus.EXPIRED
         mock_emit.assert_awaited_once_with([])
 
+    def test_expire_input_ports__renewed_grant_stays_approved(self):
+        link = InputPortFactory(
+            status=InputPortStatus.APPROVED,
+            request__valid_until=TODAY - timedelta(days=1),
+            request__decided_by=None,
+        )
+        InputPortRequestFactory(
+            input_port=link, valid_until=TODAY + timedelta(days=30), decided_by=None
+        )
+        test_session.commit()
+
+        with _mock_emit() as mock_emit:
+            asyncio.run(expire_input_ports(test_session))
+
+        test_session.refresh(link)
+        assert link.status == InputPortStatus.APPROVED
+        assert link.grant_expires_on == TODAY + timedelta(days=30)
+        mock_emit.assert_awaited_once()
+        (events,) = mock_emit.call_args.args
+        assert [event.id for event in events] == [link.id]
+
+    def test_expire_input_ports__expires_in_batches(self):
+        links = [
+            InputPortFactory(
+                status=InputPortStatus.APPROVED,
+                request__valid_until=TODAY - timedelta(days=1),
+                request__decided_by=None,
+            )
+            for _ in range(5)
+        ]
+        test_session.commit()
+
+        with (
+            _mock_emit() as mock_emit,
+            patch(
+                "app.abstract_data_product.input_ports.background_tasks.settings.INPUT_PORT_EXPIRY_BATCH_SIZE",
+                2,
+            ),
+        ):
+            expired = asyncio.run(expire_input_ports(test_session))
+
+        assert expired == 5
+        assert mock_emit.await_count == 3
+        for link in links:
+            test_session.refresh(link)
+            assert link.status == InputPortStatus.EXPIRED
+            assert link.grant_expires_on is None
+
+    def test_expire_input_ports__expires_grants_lapsed_by_a_later_date(self):
+        links = [
+            InputPortFactory(
+                status=InputPortStatus.APPROVED,
+                request__valid_until=TODAY + timedelta(days=10),
+                request__decided_by=None,
+            )
+            for _ in range(2)
+        ]
+        test_session.commit()
+
+        with (
+            _mock_emit(),
+            patch(
+                "app.abstract_data_product.input_ports.background_tasks.settings.INPUT_PORT_EXPIRY_BATCH_SIZE",
+                2,
+            ),
+            freeze_time(TODAY + timedelta(days=20)),
+        ):
+            expired = asyncio.run(expire_input_ports(test_session))
+
+        assert expired == 2
+        for link in links:
+            test_session.refresh(link)
+            assert link.status == InputPortStatus.EXPIRED
+
     def test_expire_input_ports__pending_only_link_is_ignored(self):
         link = InputPortFactory(status=InputPortStatus.PENDING)
         test_session.commit()
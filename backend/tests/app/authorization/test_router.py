@@ -2,10 +2,10 @@ import uuid
 
 from fastapi.testclient import TestClient
 
-from app.authorization.schema_response import AccessResponse
+from app.authorization.schema_response import AccessBatchResponse, AccessResponse
 from app.core.authz import Action, Authorization
 from app.settings import settings
-from tests.factories import UserFactory
+from tests.factories import DataProductFactory, UserFactory
 
 ENDPOINT = "/api/v2/authz"
 
@@ -41,6 +41,27 @@ class TestAuthorizationRouter:
         access = AccessResponse(**response.json())
         assert access.allowed is True
 
+    def test_check_access_batch(self, client: TestClient, authorizer: Authorization):
+        user = UserFactory(external_id=settings.DEFAULT_USERNAME)
+        role_id = str(uuid.uuid4())
+        action = Action.DATA_PRODUCT__UPDATE_PROPERTIES
+        allowed, denied = DataProductFactory(), DataProductFactory()
+        unknown = uuid.uuid4()
+
+        authorizer.sync_role_permissions(role_id=role_id, actions=[action])
+        authorizer.assign_domain_role(
+            user_id=str(user.id), role_id=role_id, domain_id=str(allowed.domain_id)
+        )
+
+        response = client.post(
+            f"{ENDPOINT}/access/{action}/batch",
+            json={"resources": [str(allowed.id), str(denied.id), str(unknown)]},
+        )
+        assert response.status_code == 200
+
+        access = AccessBatchResponse(**response.json())
+        assert access.allowed == {allowed.id: True, denied.id: False, unknown: False}
+
     def test_is_admin(self, client: TestClient):
         response = client.get(f"{ENDPOINT}/admin")
         assert response.status_code == 200
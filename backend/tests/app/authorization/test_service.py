@@ -1,8 +1,20 @@
 from casbin_sqlalchemy_adapter import CasbinRule
+from sqlalchemy import select
 
+from app.authorization.role_assignments.enums import DecisionStatus
+from app.authorization.roles import ADMIN_UUID
+from app.authorization.roles.model import Role
+from app.authorization.roles.schema import Prototype
 from app.authorization.service import AuthorizationService
 from app.core.authz import Authorization
 from app.database.database import get_db_session
+from tests.factories import (
+    DataProductFactory,
+    DataProductRoleAssignmentFactory,
+    GlobalRoleAssignmentFactory,
+    RoleFactory,
+    UserFactory,
+)
 
 
 class TestAuthorizationService:
@@ -22,3 +34,71 @@ class TestAuthorizationService:
         service._clear_casbin_table()
 
         assert len(db.query(CasbinRule).all()) == 0, "database not cleared"
+
+    def test_reload_enforcer(self, authorizer: Authorization):
+        db = next(get_db_session())
+        role = RoleFactory(scope="data_product")
+        approved = self._assignment(role)
+        pending = self._assignment(role, decision=DecisionStatus.PENDING)
+        admin = GlobalRoleAssignmentFactory(
+            user_id=UserFactory().id, role_id=ADMIN_UUID
+        )
+        authorizer.assign_resource_role(
+            user_id="stale", role_id=str(role.id), resource_id="stale"
+        )
+        kept = db.scalar(
+            select(CasbinRule.id).where(CasbinRule.v0 == str(approved.user_id))
+        )
+
+        AuthorizationService(db).reload_enforcer()
+
+        assert kept == db.scalar(
+            select(CasbinRule.id).where(CasbinRule.v0 == str(approved.user_id))
+        ), "unchanged rules are kept"
+        assert (
+            authorizer.has_resource_role(
+                user_id="stale", role_id=str(role.id), resource_id="stale"
+            )
+            is False
+        )
+        assert (
+            authorizer.has_resource_role(
+                user_id=approved.user_id,
+                role_id=role.id,
+                resource_id=approved.data_product_id,
+            )
+            is True
+        )
+        assert (
+            authorizer.has_resource_role(
+                user_id=pending.user_id,
+                role_id=role.id,
+                resource_id=pending.data_product_id,
+            )
+            is False
+        )
+        assert authorizer.has_admin_role(user_id=admin.user_id) is True
+        everyone = db.scalar(select(Role).where(Role.prototype == Prototype.EVERYONE))
+        assert len(everyone.permissions) == len(
+            authorizer._enforcer.get_filtered_policy(0, "*")
+        )
+
+    def test_reload_enforcer_is_idempotent(self, authorizer: Authorization):
+        db = next(get_db_session())
+        self._assignment(RoleFactory(scope="data_product"))
+        service = AuthorizationService(db)
+        service.reload_enforcer()
+        rows = db.execute(select(CasbinRule.id)).scalars().all()
+
+        service.reload_enforcer()
+
+        assert db.execute(select(CasbinRule.id)).scalars().all() == rows
+
+    @staticmethod
+    def _assignment(role: Role, **kwargs):
+        return DataProductRoleAssignmentFactory(
+            user_id=UserFactory().id,
+            role_id=role.id,
+            data_product_id=DataProductFactory().id,
+            **kwargs,
+        )
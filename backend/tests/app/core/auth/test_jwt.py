@@ -0,0 +1,117 @@
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+from app.core.auth import jwt as portal_jwt
+from app.core.auth.jwt import JWTTokenValid, jwks_cache, verified_tokens
+
+AUTHORITY = "https://issuer.example.com"
+AUDIENCE = "portal"
+
+
+def signing_key(kid: str) -> tuple[rsa.RSAPrivateKey, dict]:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+    return private_key, {**jwk, "kid": kid}
+
+
+def bearer(private_key: rsa.RSAPrivateKey, kid: str, **claims) -> str:
+    payload = {
+        "sub": "user",
+        "iss": AUTHORITY,
+        "aud": AUDIENCE,
+        "exp": int(time.time()) + 300,
+        **claims,
+    }
+    return "Bearer " + jwt.encode(
+        payload, private_key, algorithm="RS256", headers={"kid": kid}
+    )
+
+
+@pytest.fixture
+def keys(monkeypatch):
+    private_key, jwk = signing_key("key-1")
+    oidc = portal_jwt.oidc
+    monkeypatch.setattr(oidc, "jwks_keys", {"keys": [jwk]}, raising=False)
+    monkeypatch.setattr(oidc, "authority", AUTHORITY, raising=False)
+    monkeypatch.setattr(oidc, "audience", AUDIENCE, raising=False)
+    jwks_cache.clear()
+    verified_tokens.clear()
+    yield private_key
+    jwks_cache.clear()
+    verified_tokens.clear()
+
+
+class TestJWTTokenValid:
+    def test_valid_token(self, keys):
+        token = JWTTokenValid(bearer(keys, "key-1"))
+
+        assert token.is_valid() is True
+        assert token.valid_jwt_token["sub"] == "user"
+
+    def test_verified_token_is_cached(self, keys):
+        token = bearer(keys, "key-1")
+        assert JWTTokenValid(token).is_valid() is True
+
+        with patch.object(portal_jwt.jwt, "decode") as decode:
+            validated = JWTTokenValid(token)
+            assert validated.is_valid() is True
+            decode.assert_not_called()
+        assert validated.valid_jwt_token["sub"] == "user"
+
+    def test_expired_token_is_not_served_from_cache(self, keys):
+        token = bearer(keys, "key-1", exp=int(time.time()) + 1)
+        assert JWTTokenValid(token).is_valid() is True
+
+        time.sleep(1.1)
+
+        assert JWTTokenValid(token).is_valid() is False
+
+    def test_rotated_key_is_fetched(self, keys):
+        assert JWTTokenValid(bearer(keys, "key-1")).is_valid() is True
+        rotated_key, rotated_jwk = signing_key("key-2")
+        response = MagicMock()
+        response.json.return_value = {"keys": [rotated_jwk]}
+
+        with patch.object(portal_jwt.httpx, "get", return_value=response) as get:
+            assert JWTTokenValid(bearer(rotated_key, "key-2")).is_valid() is True
+            assert JWTTokenValid(bearer(rotated_key, "key-3")).is_valid() is False
+            assert get.call_count == 1, "unknown key ids are rate limited"
+
+    def test_current_keys_are_served_during_a_refresh(self, keys):
+        assert JWTTokenValid(bearer(keys, "key-1")).is_valid() is True
+        rotated_key, rotated_jwk = signing_key("key-2")
+        fetching = threading.Event()
+        release = threading.Event()
+        response = MagicMock()
+        response.json.return_value = {"keys": [rotated_jwk]}
+
+        def slow_get(**kwargs):
+            fetching.set()
+            release.wait(timeout=5)
+            return response
+
+        with patch.object(portal_jwt.httpx, "get", side_effect=slow_get) as get:
+            rotated = threading.Thread(
+                target=JWTTokenValid(bearer(rotated_key, "key-2")).is_valid
+            )
+            rotated.start()
+            assert fetching.wait(timeout=5)
+            verified_tokens.clear()
+            assert JWTTokenValid(bearer(keys, "key-1")).is_valid() is True
+            release.set()
+            rotated.join()
+
+            assert get.call_count == 1
+            assert get.call_args.kwargs["timeout"] > 0
+
+    def test_forged_token(self, keys):
+        forged_key, _ = signing_key("key-1")
+
+        assert JWTTokenValid(bearer(forged_key, "key-1")).is_valid() is False
@@ -1,7 +1,10 @@
 from typing import cast
 
+import pytest
+
 from app.core.authz.actions import AuthorizationAction
 from app.core.authz.authorization import Authorization
+from app.core.authz.context import close_decision_context, open_decision_context
 
 ANY: str = "does_not_matter"
 ANY_ACT: AuthorizationAction = cast("AuthorizationAction", 0)
@@ -42,6 +45,43 @@ class TestAuthorization:
         authorizer.revoke_resource_role(user_id=user, role_id=role, resource_id=obj)
         assert authorizer.has_access(sub=user, dom=ANY, obj=obj, act=allowed) is False
 
+    def test_role_assignment_only_evicts_affected_decisions(
+        self, authorizer: Authorization
+    ):
+        role = "test_role"
+        allowed = AuthorizationAction.DATA_PRODUCT__UPDATE_PROPERTIES
+        authorizer.sync_role_permissions(role_id=role, actions=[allowed])
+        authorizer.has_access(
+            sub="other_user", dom=ANY, obj="test_resource", act=allowed
+        )
+        authorizer.has_access(
+            sub="test_user", dom=ANY, obj="other_resource", act=allowed
+        )
+        authorizer.has_access(
+            sub="test_user", dom=ANY, obj="test_resource", act=allowed
+        )
+
+        authorizer.assign_resource_role(
+            user_id="test_user", role_id=role, resource_id="test_resource"
+        )
+
+        assert len(authorizer._cache) == 2
+        assert (
+            authorizer.has_access(
+                sub="test_user", dom=ANY, obj="test_resource", act=allowed
+            )
+            is True
+        )
+        authorizer.revoke_resource_role(
+            user_id="test_user", role_id=role, resource_id="test_resource"
+        )
+        assert (
+            authorizer.has_access(
+                sub="test_user", dom=ANY, obj="test_resource", act=allowed
+            )
+            is False
+        )
+
     def test_domain_role(self, authorizer: Authorization):
         role = "test_role"
         user = "test_user"
@@ -256,3 +296,62 @@ class TestAuthorization:
             user_id=user, role_id=role, domain_id=dom1
         )
         assert authorizer.has_domain_role(user_id=user, role_id=role, domain_id=dom2)
+
+    @pytest.mark.parametrize(
+        "setup",
+        [
+            lambda authorizer: authorizer.assign_admin_role(user_id="test_user"),
+            lambda authorizer: authorizer.sync_everyone_role_permissions(
+                actions=[AuthorizationAction.DATA_PRODUCT__UPDATE_PROPERTIES]
+            ),
+            lambda authorizer: authorizer.assign_global_role(
+                user_id="test_user", role_id="test_role"
+            ),
+            lambda authorizer: authorizer.assign_resource_role(
+                user_id="test_user", role_id="test_role", resource_id="resource_1"
+            ),
+            lambda authorizer: authorizer.assign_domain_role(
+                user_id="test_user", role_id="test_role", domain_id="domain_2"
+            ),
+            lambda authorizer: authorizer.assign_resource_role(
+                user_id="test_user", role_id="other_role", resource_id="resource_1"
+            ),
+        ],
+    )
+    def test_has_access_many_matches_has_access(self, authorizer: Authorization, setup):
+        act = AuthorizationAction.DATA_PRODUCT__UPDATE_PROPERTIES
+        authorizer.sync_role_permissions(role_id="test_role", actions=[act])
+        authorizer.sync_role_permissions(
+            role_id="other_role",
+            actions=[AuthorizationAction.DATA_PRODUCT__UPDATE_SETTINGS],
+        )
+        setup(authorizer)
+        objects = {"resource_1": "domain_1", "resource_2": "domain_2", "*": "*"}
+
+        decisions = authorizer.has_access_many(
+            sub="test_user", objects=objects, act=act
+        )
+        authorizer._after_update()
+
+        assert decisions == {
+            obj: authorizer.has_access(sub="test_user", dom=dom, obj=obj, act=act)
+            for obj, dom in objects.items()
+        }
+
+    def test_request_decisions(self, authorizer: Authorization):
+        role = "test_role"
+        user = "test_user"
+        act = AuthorizationAction.DATA_PRODUCT__UPDATE_PROPERTIES
+        authorizer.sync_role_permissions(role_id=role, actions=[act])
+
+        token = open_decision_context()
+        try:
+            authorizer.has_access(sub=user, dom=ANY, obj=ANY, act=act)
+            lookups = authorizer._cache.hits + authorizer._cache.misses
+            assert authorizer.has_access(sub=user, dom=ANY, obj=ANY, act=act) is False
+            assert authorizer._cache.hits + authorizer._cache.misses == lookups
+
+            authorizer.assign_global_role(user_id=user, role_id=role)
+            assert authorizer.has_access(sub=user, dom=ANY, obj=ANY, act=act) is True
+        finally:
+            close_decision_context(token)
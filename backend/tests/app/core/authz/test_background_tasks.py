@@ -1,8 +1,17 @@
 import asyncio
+import threading
+import time
+from contextlib import suppress
 from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from casbin_sqlalchemy_adapter import CasbinRule
 
 from app.core.authz.authorization import Authorization
-from app.core.authz.background_tasks import revoke_expired_admins
+from app.core.authz.background_tasks import (
+    listen_for_policy_changes,
+    revoke_expired_admins,
+)
 from tests import test_session
 from tests.factories import UserFactory
 
@@ -17,7 +26,7 @@ class TestRevokeExpiredAdmins:
         test_session.commit()
         authorizer.assign_admin_role(user_id=user.id)
 
-        asyncio.run(revoke_expired_admins(test_session))
+        revoke_expired_admins(test_session)
 
         test_session.refresh(user)
         assert authorizer.has_admin_role(user_id=user.id) is False
@@ -30,7 +39,7 @@ class TestRevokeExpiredAdmins:
         test_session.commit()
         authorizer.assign_admin_role(user_id=user.id)
 
-        asyncio.run(revoke_expired_admins(test_session))
+        revoke_expired_admins(test_session)
 
         test_session.refresh(user)
         assert authorizer.has_admin_role(user_id=user.id) is True
@@ -43,8 +52,98 @@ class TestRevokeExpiredAdmins:
         test_session.commit()
         authorizer.assign_admin_role(user_id=user.id)
 
-        asyncio.run(revoke_expired_admins(test_session))
+        revoke_expired_admins(test_session)
 
         test_session.refresh(user)
         assert authorizer.has_admin_role(user_id=user.id) is True
         assert user.admin_expiry is None
+
+
+class TestListenForPolicyChanges:
+    def test_listen_for_policy_changes__applies_changes_of_other_replicas(
+        self, authorizer: Authorization
+    ):
+        async def listen_until_assigned() -> bool:
+            task = asyncio.create_task(listen_for_policy_changes())
+            await asyncio.sleep(0.5)
+            await asyncio.to_thread(self._assign_remotely)
+            for _ in range(50):
+                if authorizer.has_global_role(user_id="test_user", role_id="*"):
+                    break
+                await asyncio.sleep(0.1)
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+            return authorizer.has_global_role(user_id="test_user", role_id="*")
+
+        assert asyncio.run(listen_until_assigned()) is True
+
+    def test_listen_for_policy_changes__applies_changes_made_during_reload(
+        self, authorizer: Authorization
+    ):
+        reload_policy = Authorization.reload_policy
+        applied_during_reload = []
+
+        def reload_and_assign(self_: Authorization) -> None:
+            reload_policy(self_)
+            self._assign_remotely()
+            time.sleep(0.5)
+            applied_during_reload.append(
+                authorizer.has_global_role(user_id="test_user", role_id="*")
+            )
+
+        async def listen_until_reloaded() -> bool:
+            task = asyncio.create_task(listen_for_policy_changes())
+            for _ in range(50):
+                if applied_during_reload:
+                    break
+                await asyncio.sleep(0.1)
+            await asyncio.sleep(0.1)
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+            return authorizer.has_global_role(user_id="test_user", role_id="*")
+
+        with patch.object(Authorization, "reload_policy", reload_and_assign):
+            assert asyncio.run(listen_until_reloaded()) is True
+        assert applied_during_reload == [False]
+
+    def test_listen_for_policy_changes__keeps_the_loop_running_while_locked(
+        self, authorizer: Authorization
+    ):
+        locked, release = threading.Event(), threading.Event()
+
+        def hold_policy_lock() -> None:
+            with authorizer._policy_lock:
+                locked.set()
+                release.wait(timeout=10)
+
+        async def listen_while_locked() -> tuple[float, bool]:
+            task = asyncio.create_task(listen_for_policy_changes())
+            await asyncio.sleep(0.5)
+            holder = threading.Thread(target=hold_policy_lock)
+            holder.start()
+            await asyncio.to_thread(locked.wait, 5)
+            await asyncio.to_thread(self._assign_remotely)
+            started = time.monotonic()
+            await asyncio.sleep(0.5)
+            slept = time.monotonic() - started
+            release.set()
+            await asyncio.to_thread(holder.join)
+            for _ in range(50):
+                if authorizer.has_global_role(user_id="test_user", role_id="*"):
+                    break
+                await asyncio.sleep(0.1)
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+            return slept, authorizer.has_global_role(user_id="test_user", role_id="*")
+
+        slept, assigned = asyncio.run(listen_while_locked())
+        assert slept < 1.0
+        assert assigned is True
+
+    @staticmethod
+    def _assign_remotely() -> None:
+        test_session.add(CasbinRule(ptype="g3", v0="test_user", v1="*"))
+        test_session.commit()
@@ -0,0 +1,57 @@
+from app.core.authz.cache import Decision, DecisionCache
+
+ALICE_READ = Decision(sub="alice", dom="domain", obj="dataset", act="read")
+ALICE_WRITE = Decision(sub="alice", dom="domain", obj="product", act="write")
+BOB_READ = Decision(sub="bob", dom="domain", obj="dataset", act="read")
+
+
+class TestDecisionCache:
+    def test_lookup_counts_hits_and_misses(self):
+        cache = DecisionCache(maxsize=8)
+        assert cache.lookup(ALICE_READ) is None
+
+        cache[ALICE_READ] = False
+
+        assert cache.lookup(ALICE_READ) is False
+        assert (cache.hits, cache.misses, cache.hit_rate) == (1, 1, 0.5)
+
+    def test_invalidate_evicts_matching_decisions(self):
+        cache = DecisionCache(maxsize=8)
+        for key in (ALICE_READ, ALICE_WRITE, BOB_READ):
+            cache[key] = True
+
+        assert cache.invalidate(sub="alice", obj="dataset") == 1
+        assert set(cache) == {ALICE_WRITE, BOB_READ}
+        assert cache.invalidate(act="read") == 1
+        assert set(cache) == {ALICE_WRITE}
+        assert cache.invalidate(sub="carol") == 0
+        assert cache.invalidations == 2
+
+    def test_capacity_evictions_are_removed_from_the_index(self):
+        cache = DecisionCache(maxsize=1)
+        cache[ALICE_READ] = True
+        cache[BOB_READ] = True
+
+        assert cache.evictions == 1
+        assert cache.invalidate(sub="alice") == 0
+        assert set(cache) == {BOB_READ}
+
+    def test_store_skips_decisions_made_before_an_invalidation(self):
+        cache = DecisionCache(maxsize=8)
+        generation = cache.generation
+        cache.invalidate(sub="alice")
+
+        cache.store(ALICE_READ, True, generation)
+        assert ALICE_READ not in cache
+
+        cache.store(ALICE_READ, True, cache.generation)
+        assert ALICE_READ in cache
+
+    def test_clear(self):
+        cache = DecisionCache(maxsize=8)
+        cache[ALICE_READ] = True
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.evictions == 0
+        assert cache.invalidate(sub="alice") == 0
@@ -0,0 +1,117 @@
+import select
+from collections.abc import Iterator
+
+import psycopg2
+import pytest
+from casbin_sqlalchemy_adapter import CasbinRule
+from sqlalchemy import delete
+
+from app.core.authz.actions import AuthorizationAction
+from app.core.authz.authorization import Authorization
+from app.core.authz.policy_changes import CHANNEL, ORIGIN, PolicyChange
+from app.database.database import get_url
+from tests import test_session
+
+ANY: str = "does_not_matter"
+ROLE: str = "test_role"
+USER: str = "test_user"
+RESOURCE: str = "test_resource"
+ACTION = AuthorizationAction.DATA_PRODUCT__UPDATE_PROPERTIES
+
+
+@pytest.fixture
+def listener() -> Iterator["psycopg2.extensions.connection"]:
+    connection = psycopg2.connect(get_url())
+    connection.autocommit = True
+    connection.cursor().execute(f"LISTEN {CHANNEL}")
+    yield connection
+    connection.close()
+
+
+def receive(connection: "psycopg2.extensions.connection") -> list[PolicyChange]:
+    select.select([connection], [], [], 5)
+    connection.poll()
+    changes = [PolicyChange.parse(notify.payload) for notify in connection.notifies]
+    connection.notifies.clear()
+    return changes
+
+
+class TestPolicyChanges:
+    def test_changes_by_other_replicas_are_applied(
+        self, authorizer: Authorization, listener
+    ):
+        authorizer.sync_role_permissions(role_id=ROLE, actions=[ACTION])
+        receive(listener)
+
+        test_session.add(CasbinRule(ptype="g", v0=USER, v1=ROLE, v2=RESOURCE))
+        test_session.commit()
+        (change,) = receive(listener)
+        assert change == PolicyChange(
+            op="INSERT", origin=change.origin, ptype="g", rule=[USER, ROLE, RESOURCE]
+        )
+        assert change.origin != ORIGIN
+        assert (
+            authorizer.has_access(sub=USER, dom=ANY, obj=RESOURCE, act=ACTION) is False
+        )
+
+        assert authorizer.apply_policy_change(change) is True
+        assert (
+            authorizer.has_access(sub=USER, dom=ANY, obj=RESOURCE, act=ACTION) is True
+        )
+
+        test_session.execute(delete(CasbinRule).where(CasbinRule.v0 == USER))
+        test_session.commit()
+        (change,) = receive(listener)
+
+        assert authorizer.apply_policy_change(change) is True
+        assert (
+            authorizer.has_access(sub=USER, dom=ANY, obj=RESOURCE, act=ACTION) is False
+        )
+
+    def test_own_changes_are_ignored(self, authorizer: Authorization, listener):
+        authorizer.sync_role_permissions(role_id=ROLE, actions=[ACTION])
+        authorizer.assign_resource_role(
+            user_id=USER, role_id=ROLE, resource_id=RESOURCE
+        )
+        authorizer.revoke_resource_role(
+            user_id=USER, role_id=ROLE, resource_id=RESOURCE
+        )
+
+        changes = receive(listener)
+        assert {change.origin for change in changes} == {ORIGIN}
+        for change in changes:
+            assert authorizer.apply_policy_change(change) is False
+        assert (
+            authorizer.has_resource_role(
+                user_id=USER, role_id=ROLE, resource_id=RESOURCE
+            )
+            is False
+        )
+
+    def test_reload_policy__keeps_deciding_on_the_current_policy(
+        self, authorizer: Authorization
+    ):
+        authorizer.sync_role_permissions(role_id=ROLE, actions=[ACTION])
+        authorizer.assign_resource_role(
+            user_id=USER, role_id=ROLE, resource_id=RESOURCE
+        )
+        current = authorizer._enforcer
+
+        authorizer.reload_policy()
+
+        assert authorizer._enforcer is not current
+        assert current.enforce(USER, ANY, RESOURCE, str(ACTION)) is True
+        assert (
+            authorizer.has_access(sub=USER, dom=ANY, obj=RESOURCE, act=ACTION) is True
+        )
+
+    def test_reload_policy(self, authorizer: Authorization):
+        authorizer.sync_role_permissions(role_id=ROLE, actions=[ACTION])
+        test_session.add(CasbinRule(ptype="g", v0=USER, v1=ROLE, v2=RESOURCE))
+        test_session.commit()
+
+        authorizer.reload_policy()
+
+        assert (
+            authorizer.has_access(sub=USER, dom=ANY, obj=RESOURCE, act=ACTION) is True
+        )
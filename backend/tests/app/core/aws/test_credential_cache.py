@@ -0,0 +1,143 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+from uuid import uuid4
+
+from app.core.auth.credentials import AWSCredentials
+from app.core.aws.credential_cache import AWSCredentialCache, AWSCredentialsKey
+
+KEY = AWSCredentialsKey(uuid4(), uuid4(), "prod", "arn:aws:iam::1:role/product")
+
+
+def _credentials(access_key: str, expires_in: timedelta) -> AWSCredentials:
+    return AWSCredentials(
+        AccessKeyId=access_key,
+        SecretAccessKey="secret",
+        SessionToken="token",
+        Expiration=datetime.now(timezone.utc) + expires_in,
+    )
+
+
+class TestAWSCredentialCache:
+    def test_reuses_credentials_until_due_for_refresh(self):
+        cache = AWSCredentialCache()
+        fresh = _credentials("fresh", timedelta(hours=1))
+
+        assert cache.get(KEY, lambda: fresh) is fresh
+        assert (
+            cache.get(KEY, lambda: _credentials("other", timedelta(hours=1))) is fresh
+        )
+
+    def test_refreshes_credentials_ahead_of_expiry(self):
+        cache = AWSCredentialCache()
+        expiring = _credentials("expiring", timedelta(seconds=30))
+        refreshed = _credentials("refreshed", timedelta(hours=1))
+
+        cache.get(KEY, lambda: expiring)
+
+        assert cache.get(KEY, lambda: refreshed) is refreshed
+
+    def test_assumes_role_once_for_concurrent_callers(self):
+        cache = AWSCredentialCache()
+        calls = []
+
+        def assume() -> AWSCredentials:
+            calls.append(1)
+            time.sleep(0.05)
+            return _credentials("fresh", timedelta(hours=1))
+
+        threads = [
+            threading.Thread(target=cache.get, args=(KEY, assume)) for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+
+    def test_serves_valid_credentials_during_refresh(self):
+        cache = AWSCredentialCache()
+        expiring = _credentials("expiring", timedelta(seconds=30))
+        cache.get(KEY, lambda: expiring)
+        refreshing, release = threading.Event(), threading.Event()
+
+        def slow_assume() -> AWSCredentials:
+            refreshing.set()
+            release.wait(timeout=5)
+            return _credentials("refreshed", timedelta(hours=1))
+
+        refresher = threading.Thread(target=cache.get, args=(KEY, slow_assume))
+        refresher.start()
+        refreshing.wait(timeout=5)
+
+        assert cache.get(KEY, slow_assume) is expiring
+        release.set()
+        refresher.join()
+        assert cache.get(KEY, slow_assume).AccessKeyId == "refreshed"
+
+    def test_invalidate_drops_credentials_of_user(self):
+        cache = AWSCredentialCache()
+        other = KEY._replace(user_id=uuid4())
+        cache.get(KEY, lambda: _credentials("mine", timedelta(hours=1)))
+        kept = cache.get(other, lambda: _credentials("theirs", timedelta(hours=1)))
+
+        cache.invalidate(KEY.user_id)
+
+        refreshed = _credentials("refreshed", timedelta(hours=1))
+        assert cache.get(KEY, lambda: refreshed) is refreshed
+        assert cache.get(other, lambda: refreshed) is kept
+
+    def test_caches_clients_per_access_key(self):
+        cache = AWSCredentialCache()
+        first = _credentials("first", timedelta(hours=1))
+        second = _credentials("second", timedelta(hours=1))
+
+        with patch.object(
+            cache._session, "client", side_effect=lambda *a, **kw: object()
+        ) as client:
+            athena = cache.client("athena", first)
+            assert cache.client("athena", first) is athena
+            assert cache.client("glue", first) is not athena
+            assert cache.client("athena", second) is not athena
+
+        assert client.call_count == 3
+
+    def test_keeps_refresh_locks_only_while_in_use(self):
+        cache = AWSCredentialCache()
+        expiring = _credentials("expiring", timedelta(seconds=30))
+        cache.get(KEY, lambda: expiring)
+        refreshing, release = threading.Event(), threading.Event()
+
+        def slow_assume() -> AWSCredentials:
+            refreshing.set()
+            release.wait(timeout=5)
+            return _credentials("refreshed", timedelta(hours=1))
+
+        refresher = threading.Thread(target=cache.get, args=(KEY, slow_assume))
+        refresher.start()
+        refreshing.wait(timeout=5)
+
+        assert KEY in cache._refreshing
+        release.set()
+        refresher.join()
+        assert cache._refreshing == {}
+
+    def test_builds_clients_outside_the_cache_lock(self):
+        cache = AWSCredentialCache()
+        credentials = _credentials("fresh", timedelta(hours=1))
+        lookups = []
+
+        def build(*args, **kwargs) -> object:
+            lookup = threading.Thread(
+                target=lambda: lookups.append(cache.get(KEY, lambda: credentials))
+            )
+            lookup.start()
+            lookup.join(timeout=5)
+            return object()
+
+        with patch.object(cache._session, "client", side_effect=build):
+            cache.client("athena", credentials)
+
+        assert lookups == [credentials]
@@ -0,0 +1,83 @@
+import asyncio
+import threading
+from unittest.mock import patch
+
+from app.core.embed.model import (
+    EmbeddingEngine,
+    QueryEmbeddingCache,
+    get_embedding_engine,
+    session_threads,
+)
+
+
+class TestEmbeddingEngine:
+    def test_embed_query(self):
+        embedding = get_embedding_engine().embed_query("customer orders")
+
+        assert len(embedding) == 384
+        assert all(isinstance(value, float) for value in embedding)
+
+    def test_embed_documents(self):
+        embeddings = get_embedding_engine().embed_documents(["customer", "sales"])
+
+        assert len(embeddings) == 2
+        assert embeddings[0] != embeddings[1]
+
+    def test_embed_no_documents(self):
+        assert get_embedding_engine().embed_documents([]) == []
+
+    def test_async_embedding_matches_sync(self):
+        engine = get_embedding_engine()
+
+        async def embed():
+            return await asyncio.gather(
+                engine.aembed_query("customer"),
+                engine.aembed_documents(["customer", "sales"]),
+            )
+
+        query_embedding, document_embeddings = asyncio.run(embed())
+
+        assert query_embedding == engine.embed_query("customer")
+        assert document_embeddings == engine.embed_documents(["customer", "sales"])
+
+    def test_callers_wait_for_a_free_session(self):
+        engine = EmbeddingEngine(pool_size=1, threads=1, batch_size=8)
+        with engine._session():
+            waiter = threading.Thread(target=engine.embed_query, args=("customer",))
+            waiter.start()
+            while engine.queue_depth == 0:
+                waiter.join(timeout=0.01)
+            assert engine.queue_depth == 1
+        waiter.join()
+
+        assert engine.queue_depth == 0
+
+    def test_query_cache_skips_inference(self):
+        cache = QueryEmbeddingCache(maxsize=8)
+        engine = EmbeddingEngine(
+            pool_size=1, threads=1, batch_size=8, query_cache=cache
+        )
+        embedding = engine.embed_query("Customer  orders")
+
+        with patch.object(engine, "_session") as session:
+            assert engine.embed_query(" customer orders ") == embedding
+            session.assert_not_called()
+
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_query_cache_evicts_least_recently_used(self):
+        cache = QueryEmbeddingCache(maxsize=1)
+        engine = EmbeddingEngine(
+            pool_size=1, threads=1, batch_size=8, query_cache=cache
+        )
+        engine.embed_query("customer")
+        engine.embed_query("sales")
+        engine.embed_query("customer")
+
+        assert (cache.hits, cache.misses) == (0, 3)
+
+    def test_sessions_share_the_cores(self):
+        with patch("app.core.embed.model.os.cpu_count", return_value=8):
+            assert session_threads(pool_size=2) == 4
+            assert session_threads(pool_size=16) == 1
+            assert session_threads(pool_size=2, threads=3) == 3
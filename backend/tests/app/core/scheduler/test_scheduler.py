@@ -0,0 +1,137 @@
+import asyncio
+import threading
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import func, select
+
+from app.core.scheduler.enums import JobOutcome
+from app.core.scheduler.model import ScheduledJob
+from app.core.scheduler.scheduler import (
+    JOB_LOCK_NAMESPACE,
+    Job,
+    JobScheduler,
+    daily,
+    every,
+)
+from app.database import database
+from app.main import scheduled_jobs
+from app.settings import settings
+from tests import test_session
+
+
+def _last_run(job: Job) -> ScheduledJob:
+    test_session.expire_all()
+    return test_session.get(ScheduledJob, job.name)
+
+
+class TestJobScheduler:
+    def test_run__records_successful_run(self):
+        calls = []
+        job = Job("successful", lambda: calls.append(1), every(3600))
+
+        assert asyncio.run(JobScheduler([job]).run(job)) is True
+
+        run = _last_run(job)
+        assert calls == [1]
+        assert run.last_outcome == JobOutcome.SUCCEEDED
+        assert run.last_finished_on >= run.last_started_on
+        assert run.last_duration_seconds >= 0
+        assert run.last_error is None
+        assert run.consecutive_failures == 0
+
+    def test_run__records_failures(self):
+        def fail() -> None:
+            raise ValueError("boom")
+
+        job = Job("failing", fail, every(0))
+        scheduler = JobScheduler([job])
+
+        asyncio.run(scheduler.run(job))
+        asyncio.run(scheduler.run(job))
+
+        run = _last_run(job)
+        assert run.last_outcome == JobOutcome.FAILED
+        assert "boom" in run.last_error
+        assert run.consecutive_failures == 2
+
+    def test_run__skips_job_that_is_not_due(self):
+        calls = []
+        job = Job("not_due", lambda: calls.append(1), every(3600))
+        scheduler = JobScheduler([job])
+
+        asyncio.run(scheduler.run(job))
+
+        assert asyncio.run(scheduler.run(job)) is False
+        assert calls == [1]
+
+    def test_run__skips_job_running_on_another_replica(self):
+        calls = []
+        job = Job("locked", lambda: calls.append(1), every(0))
+
+        with database.engine.connect() as other_replica:
+            other_replica.execute(
+                select(func.pg_advisory_lock(JOB_LOCK_NAMESPACE, job.lock_id))
+            )
+            assert asyncio.run(JobScheduler([job]).run(job)) is False
+            other_replica.execute(
+                select(func.pg_advisory_unlock(JOB_LOCK_NAMESPACE, job.lock_id))
+            )
+
+        assert calls == []
+        assert _last_run(job) is None
+
+    def test_run__runs_coroutine_functions_on_the_loop(self):
+        loops = []
+
+        async def run() -> None:
+            loops.append(asyncio.get_running_loop())
+
+        job = Job("coroutine", run, every(3600))
+
+        async def run_job() -> bool:
+            ran = await JobScheduler([job]).run(job)
+            return ran and loops == [asyncio.get_running_loop()]
+
+        assert asyncio.run(run_job()) is True
+        assert _last_run(job).last_outcome == JobOutcome.SUCCEEDED
+
+    def test_start__runs_due_jobs_until_stopped(self):
+        ran = threading.Event()
+        job = Job("scheduled", ran.set, every(3600))
+
+        async def schedule() -> None:
+            scheduler = JobScheduler([job])
+            scheduler.start()
+            await asyncio.to_thread(ran.wait, 5)
+            await scheduler.stop()
+
+        asyncio.run(schedule())
+
+        assert ran.is_set()
+        assert _last_run(job).last_outcome == JobOutcome.SUCCEEDED
+
+
+class TestSchedules:
+    def test_every__runs_straight_away_then_after_interval(self):
+        schedule = every(60)
+        started_on = datetime(2026, 10, 18, 12, 0, 0)
+
+        assert schedule(None) == datetime.min
+        assert schedule(started_on) == datetime(2026, 10, 18, 12, 1, 0)
+
+    @pytest.mark.parametrize(
+        "last_started_on",
+        [datetime(2026, 10, 18, 0, 0, 1), datetime(2026, 10, 18, 23, 59, 59)],
+    )
+    def test_daily__runs_at_next_midnight(self, last_started_on: datetime):
+        assert daily()(last_started_on) == datetime(2026, 10, 19)
+
+
+def test_scheduled_jobs_have_distinct_locks():
+    with patch.object(settings, "POSTHOG_ENABLED", True):
+        jobs = scheduled_jobs()
+
+    assert len({job.name for job in jobs}) == len(jobs)
+    assert len({job.lock_id for job in jobs}) == len(jobs)
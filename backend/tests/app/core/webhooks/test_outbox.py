@@ -0,0 +1,233 @@
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import select, update
+
+from app.core.webhooks import background_tasks
+from app.core.webhooks.background_tasks import (
+    purge_delivered_outbox_events,
+    relay_outbox,
+)
+from app.core.webhooks.model import OutboxEvent
+from app.core.webhooks.service import WebhookOutboxService, replay_keyset
+from app.settings import settings
+from tests import TestingSessionLocal, test_session
+from tests.conftest import webhook_v2_config
+from tests.factories import DataProductFactory
+
+ENDPOINT = "/api/v2/webhooks/events"
+
+
+def _outbox() -> list[OutboxEvent]:
+    test_session.expire_all()
+    return list(test_session.scalars(select(OutboxEvent).order_by(OutboxEvent.id)))
+
+
+def _write_events(*ordering_keys: str) -> list[int]:
+    events = [
+        OutboxEvent(type="test.event", ordering_key=key, data={})
+        for key in ordering_keys
+    ]
+    test_session.add_all(events)
+    test_session.commit()
+    return [event.id for event in events]
+
+
+def _retry_immediately():
+    return patch.object(settings, "WEBHOOK_V2_OUTBOX_RETRY_INTERVAL_SECONDS", 0)
+
+
+def _mock_deliver(handled=None):
+    async def _deliver(url, envelopes):
+        return {body["id"] for _, body in envelopes} if handled is None else handled
+
+    return patch.object(background_tasks, "deliver", AsyncMock(side_effect=_deliver))
+
+
+class TestWriteOutboxEvents:
+    def test_change_writes_event_in_the_same_transaction(self):
+        with webhook_v2_config():
+            data_product = DataProductFactory()
+
+        (event,) = [e for e in _outbox() if e.type == "data_product.event"]
+        assert event.ordering_key == str(data_product.id)
+        assert event.data == {"id": str(data_product.id)}
+        assert event.delivered_on is None
+
+    def test_rolled_back_change_writes_nothing(self):
+        with webhook_v2_config():
+            data_product = DataProductFactory()
+            before = len(_outbox())
+            data_product.name = "renamed"
+            test_session.flush()
+            test_session.rollback()
+
+        assert len(_outbox()) == before
+
+    def test_nothing_is_written_without_webhook(self):
+        with webhook_v2_config(url=None):
+            DataProductFactory()
+
+        assert _outbox() == []
+
+
+class TestRelayOutbox:
+    def test_delivers_pending_events_in_order(self):
+        with webhook_v2_config():
+            DataProductFactory.create_batch(3)
+            pending = _outbox()
+
+            with _mock_deliver() as deliver:
+                relayed = asyncio.run(relay_outbox(test_session))
+
+        (url, envelopes), _ = deliver.call_args
+        assert [int(body["sequence"]) for _, body in envelopes] == [
+            event.id for event in pending
+        ]
+        assert relayed == len(pending)
+        assert all(event.delivered_on is not None for event in _outbox())
+
+    def test_failed_events_stay_pending(self):
+        with webhook_v2_config():
+            DataProductFactory()
+            with _mock_deliver(handled=set()):
+                relayed = asyncio.run(relay_outbox(test_session))
+
+        assert relayed == 0
+        assert all(event.delivered_on is None for event in _outbox())
+
+    def test_redelivery_keeps_the_event_id(self):
+        with webhook_v2_config(), _retry_immediately():
+            DataProductFactory()
+            envelopes = []
+            for handled in (set(), None):
+                with _mock_deliver(handled) as deliver:
+                    asyncio.run(relay_outbox(test_session))
+                envelopes.append(deliver.call_args.args[1])
+
+        assert envelopes[0] == envelopes[1]
+
+    def test_failed_events_are_held_back_with_later_events_of_their_key(self):
+        first, later, other = _write_events("a", "a", "b")
+        with webhook_v2_config():
+            with _mock_deliver(handled=set()):
+                asyncio.run(relay_outbox(test_session))
+            _write_events("a")
+            with _mock_deliver() as deliver:
+                asyncio.run(relay_outbox(test_session))
+
+        assert deliver.call_count == 0
+        assert all(event.delivered_on is None for event in _outbox())
+        assert {first, later, other} <= {event.id for event in _outbox()}
+
+    def test_skips_events_claimed_by_another_relay(self):
+        claimed, later, other = _write_events("a", "a", "b")
+        with TestingSessionLocal.session_factory() as relay:
+            (event,) = WebhookOutboxService(relay).claim_pending_events(1)
+            assert event.id == claimed
+            relay.commit()
+
+        with webhook_v2_config(), _mock_deliver() as deliver:
+            asyncio.run(relay_outbox(test_session))
+
+        delivered = [int(body["sequence"]) for _, body in deliver.call_args.args[1]]
+        assert delivered == [other], "later events of a claimed key wait"
+
+    def test_claims_lapse(self):
+        (claimed,) = _write_events("a")
+        with TestingSessionLocal.session_factory() as relay:
+            WebhookOutboxService(relay).claim_pending_events(1)
+            relay.execute(
+                update(OutboxEvent).values(claimed_until=datetime(2000, 1, 1))
+            )
+            relay.commit()
+
+        with webhook_v2_config(), _mock_deliver() as deliver:
+            asyncio.run(relay_outbox(test_session))
+
+        delivered = [int(body["sequence"]) for _, body in deliver.call_args.args[1]]
+        assert delivered == [claimed]
+
+
+class TestPurgeOutbox:
+    def test_purges_delivered_events_past_retention(self):
+        expired, recent, pending = _write_events("a", "b", "c")
+        old = datetime.now() - timedelta(
+            days=settings.WEBHOOK_V2_OUTBOX_RETENTION_DAYS + 1
+        )
+        test_session.execute(
+            update(OutboxEvent)
+            .where(OutboxEvent.id == expired)
+            .values(created_on=old, delivered_on=old)
+        )
+        test_session.execute(
+            update(OutboxEvent)
+            .where(OutboxEvent.id == recent)
+            .values(delivered_on=datetime.now())
+        )
+        test_session.execute(
+            update(OutboxEvent).where(OutboxEvent.id == pending).values(created_on=old)
+        )
+        test_session.commit()
+
+        purge_delivered_outbox_events(test_session)
+
+        assert [event.id for event in _outbox()] == [recent, pending]
+
+
+class TestReplayEvents:
+    @pytest.mark.usefixtures("admin")
+    def test_replays_events_after_cursor(self, client):
+        with webhook_v2_config():
+            DataProductFactory.create_batch(3)
+        events = _outbox()
+
+        first = client.get(ENDPOINT, params={"limit": 1}).json()
+        response = client.get(
+            ENDPOINT, params={"cursor": first["next_cursor"], "limit": 1}
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [event["sequence"] for event in first["events"]] == [str(events[0].id)]
+        assert [event["sequence"] for event in body["events"]] == [str(events[1].id)]
+        assert body["delivered_cursor"] == replay_keyset.encode(
+            events[0].transaction_id, events[0].id - 1
+        )
+
+    @pytest.mark.usefixtures("admin")
+    def test_replay_does_not_skip_events_committed_later(self, client):
+        _write_events("a")
+        cursor = client.get(ENDPOINT).json()["next_cursor"]
+        with TestingSessionLocal.session_factory() as slow:
+            slow.add(OutboxEvent(type="test.event", ordering_key="b", data={}))
+            slow.flush()
+            (committed,) = _write_events("c")
+
+            before = client.get(ENDPOINT, params={"cursor": cursor}).json()
+            slow.commit()
+        after = client.get(ENDPOINT, params={"cursor": cursor}).json()
+
+        assert before["events"] == []
+        assert before["next_cursor"] == cursor
+        assert [int(event["sequence"]) for event in after["events"]] == [
+            committed - 1,
+            committed,
+        ]
+
+    @pytest.mark.usefixtures("admin")
+    def test_replay_returns_the_cursor_when_caught_up(self, client):
+        _write_events("a")
+        caught_up = client.get(ENDPOINT).json()
+
+        response = client.get(ENDPOINT, params={"cursor": caught_up["next_cursor"]})
+
+        assert response.json()["events"] == []
+        assert response.json()["next_cursor"] == caught_up["next_cursor"]
+
+    def test_replay_requires_permission(self, client):
+        response = client.get(ENDPOINT)
+
+        assert response.status_code == 403
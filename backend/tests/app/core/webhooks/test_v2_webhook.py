@@ -1,27 +1,66 @@
+import asyncio
+import json
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID, uuid4
 
+import httpx
+
+from app.core.webhooks import v2
+from app.core.webhooks.events import DataProductEvent, V2Event
+from app.settings import settings
 from tests.conftest import webhook_v2_config
 
 
+class _SequencedEvent(V2Event):
+    @classmethod
+    def event_type(cls) -> str:
+        return "webhook.sequenced.event"
+
+    id: UUID
+    sequence: int
+
+
+@contextmanager
+def mock_transport(
+    handler: Callable[[httpx.Request], httpx.Response],
+) -> Iterator[None]:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    with (
+        webhook_v2_config(),
+        patch.object(v2._clients, "get", return_value=client),
+        patch.object(v2, "_backoff", return_value=0),
+    ):
+        yield
+
+
+@contextmanager
+def delivery_settings(**overrides: object) -> Iterator[None]:
+    original = {name: getattr(settings, name) for name in overrides}
+    for name, value in overrides.items():
+        setattr(settings, name, value)
+    try:
+        yield
+    finally:
+        for name, value in original.items():
+            setattr(settings, name, value)
+
+
 class TestCallV2Webhook:
     def test_posts_cloudevents_envelope(self):
         """call_v2_webhook sends a CloudEvents-shaped body."""
-        import asyncio
-
-        from app.core.webhooks.v2 import call_v2_webhook
-
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_post = AsyncMock(return_value=mock_response)
 
         with webhook_v2_config(), patch("httpx.AsyncClient") as mock_cls:
-            mock_http = AsyncMock()
-            mock_http.post = mock_post
-            mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_http)
-            mock_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+            mock_cls.return_value.post = mock_post
 
             asyncio.run(
-                call_v2_webhook("data_product.created", {"data_product": {"id": "abc"}})
+                v2.call_v2_webhook(
+                    "data_product.created", {"data_product": {"id": "abc"}}
+                )
             )
 
         mock_post.assert_awaited_once()
@@ -35,10 +74,133 @@ class TestCallV2Webhook:
 
     def test_does_nothing_when_url_not_configured(self):
         """call_v2_webhook is a no-op when WEBHOOK_V2_URL is None."""
-        import asyncio
-
-        from app.core.webhooks.v2 import call_v2_webhook
-
         with webhook_v2_config(url=None), patch("httpx.AsyncClient") as mock_cls:
-            asyncio.run(call_v2_webhook("data_product.created", {}))
+            asyncio.run(v2.call_v2_webhook("data_product.created", {}))
             mock_cls.assert_not_called()
+
+    def test_retries_server_errors(self):
+        statuses = iter([503, 502, 200])
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(next(statuses))
+
+        with mock_transport(handler):
+            asyncio.run(v2.call_v2_webhook("data_product.created", {}))
+
+        assert len(requests) == 3
+
+    def test_does_not_retry_client_errors(self):
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(400)
+
+        with mock_transport(handler), patch.object(v2.logger, "warning") as warning:
+            asyncio.run(v2.call_v2_webhook("data_product.created", {}))
+
+        assert len(requests) == 1
+        assert "v2 webhook failed" in warning.call_args.args[0]
+
+    def test_gives_up_after_max_attempts(self):
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            raise httpx.ConnectError("refused", request=request)
+
+        with (
+            mock_transport(handler),
+            delivery_settings(WEBHOOK_V2_MAX_ATTEMPTS=3),
+            patch.object(v2.logger, "warning") as warning,
+        ):
+            asyncio.run(v2.call_v2_webhook("data_product.created", {}))
+
+        assert len(requests) == 3
+        warning.assert_called_once()
+
+    def test_backoff_is_capped(self):
+        with (
+            delivery_settings(
+                WEBHOOK_V2_RETRY_BACKOFF_SECONDS=1.0,
+                WEBHOOK_V2_RETRY_MAX_BACKOFF_SECONDS=4.0,
+            ),
+            patch.object(v2.random, "uniform", side_effect=lambda _, b: b),
+        ):
+            assert [v2._backoff(attempt) for attempt in range(1, 6)] == [
+                1.0,
+                2.0,
+                4.0,
+                4.0,
+                4.0,
+            ]
+
+
+class TestEmitAllEvents:
+    def test_keeps_order_of_events_about_the_same_resource(self):
+        resources = [uuid4() for _ in range(4)]
+        events = [
+            _SequencedEvent(id=resource, sequence=sequence)
+            for sequence in range(5)
+            for resource in resources
+        ]
+        delivered: dict[str, list[int]] = {str(resource): [] for resource in resources}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            data = json.loads(request.content)["data"]
+            # Let the other lanes run, so deliveries interleave across resources
+            await asyncio.sleep(0)
+            delivered[data["id"]].append(data["sequence"])
+            return httpx.Response(200)
+
+        with mock_transport(handler):
+            asyncio.run(v2.emit_all_events(events))
+
+        assert all(sequences == list(range(5)) for sequences in delivered.values())
+
+    def test_sends_cloudevents_batches(self):
+        events = [DataProductEvent(id=uuid4()) for _ in range(5)]
+        batches: list[list[dict]] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert (
+                request.headers["Content-Type"] == "application/cloudevents-batch+json"
+            )
+            batches.append(json.loads(request.content))
+            return httpx.Response(200)
+
+        with (
+            mock_transport(handler),
+            delivery_settings(WEBHOOK_V2_CONCURRENCY=1, WEBHOOK_V2_BATCH_SIZE=2),
+        ):
+            asyncio.run(v2.emit_all_events(events))
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert [envelope["data"]["id"] for batch in batches for envelope in batch] == [
+            str(event.id) for event in events
+        ]
+
+
+class TestClientPool:
+    def test_reuses_client_on_the_same_loop(self):
+        pool = v2._ClientPool()
+
+        async def _clients() -> tuple[httpx.AsyncClient, httpx.AsyncClient]:
+            first, second = pool.get(), pool.get()
+            await pool.aclose()
+            return first, second
+
+        first, second = asyncio.run(_clients())
+
+        assert first is second
+        assert first.is_closed
+
+    def test_creates_new_client_for_another_loop(self):
+        pool = v2._ClientPool()
+
+        async def _client() -> httpx.AsyncClient:
+            return pool.get()
+
+        assert asyncio.run(_client()) is not asyncio.run(_client())
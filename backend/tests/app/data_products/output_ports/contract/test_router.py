@@ -1,3 +1,5 @@
+import copy
+
 from app.authorization.roles.schema import Scope
 from app.core.authz.actions import AuthorizationAction
 from app.settings import settings
@@ -318,3 +320,108 @@ class TestContractRouter:
             f"{ENDPOINT}/{dataset.data_product.id}/output_ports/{dataset.id}"
         )
         assert response.status_code == 200
+
+    def test_post_contract_reports_added_schema(self, client, session):
+        dataset = OutputPortFactory()
+        _assign_update_role(session, dataset.id)
+
+        response = client.post(
+            f"{ENDPOINT}/{dataset.data_product.id}/output_ports/{dataset.id}/data_contract",
+            json=DEFAULT_PAYLOAD,
+        )
+
+        changes = response.json()["changes"]
+        assert changes["unchanged"] is False
+        assert "trial_master" in changes["added"]
+        assert "retention_metrics.patient_id" in changes["added"]
+        assert len(changes["added"]) == 7
+        assert changes["removed"] == []
+        assert changes["changed"] == []
+
+    def test_post_same_contract_is_unchanged(self, client, session):
+        dataset = OutputPortFactory()
+        _assign_update_role(session, dataset.id)
+        url = f"{ENDPOINT}/{dataset.data_product.id}/output_ports/{dataset.id}/data_contract"
+
+        first = client.post(url, json=DEFAULT_PAYLOAD).json()
+        second = client.post(url, json=DEFAULT_PAYLOAD).json()
+
+        assert second["changes"] == {
+            "unchanged": True,
+            "added": [],
+            "removed": [],
+            "changed": [],
+        }
+        assert second["schema_objects"] == first["schema_objects"]
+
+    def test_post_contract_diffs_and_keeps_ids(self, client, session):
+        dataset = OutputPortFactory()
+        _assign_update_role(session, dataset.id)
+        url = f"{ENDPOINT}/{dataset.data_product.id}/output_ports/{dataset.id}/data_contract"
+        first = client.post(url, json=DEFAULT_PAYLOAD).json()
+
+        payload = copy.deepcopy(DEFAULT_PAYLOAD)
+        trial_master, retention_metrics = payload["schema"]
+        trial_master["properties"].insert(
+            0, {"name": "site_id", "logicalType": "string"}
+        )
+        trial_master["properties"][2]["description"] = "Patients enrolled so far"
+        del retention_metrics["properties"][2]
+        response = client.post(url, json=payload)
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["changes"] == {
+            "unchanged": False,
+            "added": ["trial_master.site_id"],
+            "removed": ["retention_metrics.visits_count"],
+            "changed": ["trial_master.enrollment_count"],
+        }
+        before = _property_ids(first)
+        after = _property_ids(body)
+        assert after.pop(("trial_master", "site_id"))
+        del before[("retention_metrics", "visits_count")]
+        assert after == before
+        props = body["schema_objects"][0]["properties"]
+        assert [p["name"] for p in props] == ["site_id", "trial_id", "enrollment_count"]
+        assert [p["position"] for p in props] == [0, 1, 2]
+        assert props[2]["description"] == "Patients enrolled so far"
+
+    def test_post_contract_diffs_nested_properties(self, client, session):
+        dataset = OutputPortFactory()
+        _assign_update_role(session, dataset.id)
+        url = f"{ENDPOINT}/{dataset.data_product.id}/output_ports/{dataset.id}/data_contract"
+
+        def orders(*address_fields: str) -> dict:
+            return {
+                "schema": [
+                    {
+                        "name": "orders",
+                        "properties": [
+                            {
+                                "name": "shipping_address",
+                                "properties": [
+                                    {"name": name} for name in address_fields
+                                ],
+                            }
+                        ],
+                    }
+                ]
+            }
+
+        first = client.post(url, json=orders("street", "city")).json()
+        body = client.post(url, json=orders("street", "zip_code")).json()
+
+        assert body["changes"]["added"] == ["orders.shipping_address.zip_code"]
+        assert body["changes"]["removed"] == ["orders.shipping_address.city"]
+        address = body["schema_objects"][0]["properties"][0]
+        assert address["id"] == first["schema_objects"][0]["properties"][0]["id"]
+        assert [p["name"] for p in address["properties"]] == ["street", "zip_code"]
+
+
+def _property_ids(schema: dict) -> dict[tuple[str, str], str]:
+    return {
+        (obj["name"], prop["name"]): prop["id"]
+        for obj in schema["schema_objects"]
+        for prop in obj["properties"]
+    }
@@ -0,0 +1,122 @@
+from datetime import datetime
+from unittest.mock import patch
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.data_products.output_ports.model import OutputPort
+from app.data_products.output_ports.service import OutputPortService
+from tests import engine, test_session
+from tests.factories import OutputPortFactory
+
+
+def _embeddings(output_port: OutputPort):
+    return test_session.scalar(
+        select(OutputPort.embeddings).where(OutputPort.id == output_port.id)
+    )
+
+
+class TestRecalculateOutdatedEmbeddings:
+    def test_new_output_port_is_outdated(self):
+        ds = OutputPortFactory()
+        test_session.refresh(ds)
+
+        assert ds.embeddings_outdated_since is not None
+        assert _embeddings(ds) is None
+
+    def test_recalculate_outdated_embeddings(self):
+        ds = OutputPortFactory()
+
+        recalculated = OutputPortService(test_session).recalculate_outdated_embeddings(
+            batch_size=10
+        )
+
+        test_session.refresh(ds)
+        assert recalculated == 1
+        assert ds.embeddings_outdated_since is None
+        assert _embeddings(ds) is not None
+
+    def test_recalculate_outdated_embeddings_in_batches(self):
+        for _ in range(3):
+            OutputPortFactory()
+        service = OutputPortService(test_session)
+
+        assert service.recalculate_outdated_embeddings(batch_size=2) == 2
+        assert service.recalculate_outdated_embeddings(batch_size=2) == 1
+        assert service.recalculate_outdated_embeddings(batch_size=2) == 0
+
+    def test_recalculate_search_keeps_previous_embeddings(self):
+        ds = OutputPortFactory()
+        service = OutputPortService(test_session)
+        service.recalculate_outdated_embeddings(batch_size=10)
+        previous = _embeddings(ds)
+
+        service.recalculate_search(ds.id)
+        test_session.commit()
+
+        test_session.refresh(ds)
+        assert ds.embeddings_outdated_since is not None
+        assert list(_embeddings(ds)) == list(previous)
+
+    def test_output_port_updated_during_recalculation_stays_outdated(self):
+        ds = OutputPortFactory()
+        service = OutputPortService(test_session)
+        embed_documents = service.embedding_engine.embed_documents
+        updated_since = datetime(2100, 1, 1)
+
+        def embed_while_updating(documents):
+            with Session(engine) as other:
+                other.execute(
+                    update(OutputPort)
+                    .where(OutputPort.id == ds.id)
+                    .values(embeddings_outdated_since=updated_since)
+                )
+                other.commit()
+            return embed_documents(documents)
+
+        with patch.object(
+            service.embedding_engine, "embed_documents", embed_while_updating
+        ):
+            service.recalculate_outdated_embeddings(batch_size=10)
+
+        test_session.refresh(ds)
+        assert ds.embeddings_outdated_since == updated_since
+
+    def test_claimed_output_ports_are_skipped(self):
+        claimed, unclaimed = OutputPortFactory(), OutputPortFactory()
+        with Session(engine) as other:
+            OutputPortService(other)._claim_outdated_embeddings(batch_size=1)
+
+        recalculated = OutputPortService(test_session).recalculate_outdated_embeddings(
+            batch_size=10
+        )
+
+        test_session.refresh(claimed)
+        test_session.refresh(unclaimed)
+        assert recalculated == 1
+        assert claimed.embeddings_outdated_since is not None
+        assert claimed.embeddings_claimed_until is not None
+        assert unclaimed.embeddings_outdated_since is None
+        assert unclaimed.embeddings_claimed_until is None
+
+    def test_failing_output_port_does_not_block_the_others(self):
+        failing, ds = OutputPortFactory(), OutputPortFactory()
+        service = OutputPortService(test_session)
+        embed_documents = service.embedding_engine.embed_documents
+
+        def embed_failing(documents):
+            if any(f'"{failing.namespace}"' in document for document in documents):
+                raise RuntimeError("Embedding failed")
+            return embed_documents(documents)
+
+        with patch.object(service.embedding_engine, "embed_documents", embed_failing):
+            assert service.recalculate_outdated_embeddings(batch_size=10) == 2
+            # The failing output port stays claimed until its claim lapses
+            assert service.recalculate_outdated_embeddings(batch_size=10) == 0
+
+        test_session.refresh(failing)
+        test_session.refresh(ds)
+        assert ds.embeddings_outdated_since is None
+        assert _embeddings(ds) is not None
+        assert failing.embeddings_outdated_since is not None
+        assert failing.embeddings_claimed_until is not None
@@ -167,6 +167,47 @@ class TestDatasetsService:
             "Owner should also see public datasets"
         )
 
+    def test_search_output_ports_fills_limit_with_visible_datasets(self):
+        user = UserFactory(external_id=settings.DEFAULT_USERNAME)
+        for i in range(5):
+            OutputPortFactory(
+                name=f"A Private Dataset {i}", access_type=OutputPortAccessType.PRIVATE
+            )
+        visible = {
+            OutputPortFactory(
+                name=f"B Unrestricted Dataset {i}",
+                access_type=OutputPortAccessType.UNRESTRICTED,
+            ).id
+            for i in range(2)
+        }
+
+        search_results = OutputPortService(test_session).search_output_ports(
+            query=None, limit=2, user=user, current_user_assigned=False
+        )
+
+        assert {ds.id for ds in search_results} == visible
+
+    def test_get_output_ports_filters_private_datasets(self):
+        user = UserFactory(external_id=settings.DEFAULT_USERNAME)
+        dp = DataProductFactory()
+        DataProductRoleAssignmentFactory(
+            role_id=RoleFactory(scope=Scope.DATA_PRODUCT).id,
+            data_product_id=dp.id,
+            user_id=user.id,
+        )
+        consumed = OutputPortFactory(access_type=OutputPortAccessType.PRIVATE)
+        InputPortFactory(consuming_abstract_data_product=dp, output_port=consumed)
+        hidden = OutputPortFactory(access_type=OutputPortAccessType.PRIVATE)
+        unrestricted = OutputPortFactory(access_type=OutputPortAccessType.UNRESTRICTED)
+
+        result_ids = {
+            ds.id for ds in OutputPortService(test_session).get_output_ports(None, user)
+        }
+
+        assert consumed.id in result_ids
+        assert unrestricted.id in result_ids
+        assert hidden.id not in result_ids
+
     @staticmethod
     def get_output_port(output_port: OutputPort) -> OutputPort:
         return test_session.get(
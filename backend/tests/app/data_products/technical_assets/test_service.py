@@ -0,0 +1,17 @@
+from app.data_products.technical_assets.service import TechnicalAssetService
+from tests import test_session
+from tests.factories import DataProductFactory, TechnicalAssetFactory
+
+
+class TestTechnicalAssetService:
+    def test_count_technical_assets_for_data_product(self):
+        data_product = DataProductFactory()
+        TechnicalAssetFactory(owner=data_product)
+        TechnicalAssetFactory(owner=data_product)
+        TechnicalAssetFactory()
+
+        count = TechnicalAssetService(
+            test_session
+        ).count_technical_assets_for_data_product(data_product.id)
+
+        assert count == 2
@@ -162,6 +162,57 @@ class TestDataProductsRouter:
         assert len(data) == 1
         assert data["data_products"][0]["id"] == str(data_product.id)
 
+    def test_get_data_products_paginated(self, client):
+        names = ["b", "a", "d", "c", "e"]
+        for name in names:
+            DataProductFactory(name=name)
+
+        pages, cursor = [], None
+        while True:
+            params = {"limit": 2} | ({"cursor": cursor} if cursor else {})
+            response = client.get(ENDPOINT, params=params)
+            assert response.status_code == 200, response.text
+            data = response.json()
+            pages.append([dp["name"] for dp in data["data_products"]])
+            if (cursor := data.get("next_cursor")) is None:
+                break
+
+        assert pages == [["a", "b"], ["c", "d"], ["e"]]
+
+    def test_get_data_products_sparse_fieldset(self, client):
+        data_product = DataProductFactory()
+
+        response = client.get(ENDPOINT, params={"fields": "id,name"})
+
+        assert response.status_code == 200, response.text
+        assert response.json() == {
+            "data_products": [{"id": str(data_product.id), "name": data_product.name}]
+        }
+
+    def test_get_data_products_unknown_field(self, client):
+        response = client.get(ENDPOINT, params={"fields": "id,secret"})
+
+        assert response.status_code == 400
+
+    def test_get_data_products_invalid_cursor(self, client):
+        response = client.get(ENDPOINT, params={"cursor": "not-a-cursor"})
+
+        assert response.status_code == 400
+
+    def test_get_data_products_ndjson(self, client):
+        ids = {str(DataProductFactory().id) for _ in range(3)}
+
+        response = client.get(
+            ENDPOINT,
+            params={"fields": "id"},
+            headers={"Accept": "application/x-ndjson"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert {line["id"] for line in lines} == ids
+
     def test_get_data_product(self, client):
         data_product = DataProductFactory()
 
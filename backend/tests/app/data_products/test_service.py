@@ -0,0 +1,52 @@
+from app.abstract_data_product.input_ports.enums import InputPortStatus
+from app.data_products.schema import DataProductAnalytics
+from app.data_products.service import DataProductService
+from tests import test_session
+from tests.factories import (
+    DataProductFactory,
+    InputPortFactory,
+    OutputPortFactory,
+    TechnicalAssetFactory,
+)
+
+
+class TestDataProductService:
+    def test_get_analytics(self):
+        data_product = DataProductFactory()
+        output_port = OutputPortFactory(data_product=data_product)
+        OutputPortFactory(data_product=data_product)
+        TechnicalAssetFactory(owner=data_product)
+        consumer = DataProductFactory()
+        InputPortFactory(
+            output_port=output_port, consuming_abstract_data_product=consumer
+        )
+        InputPortFactory(consuming_abstract_data_product=consumer)
+        InputPortFactory(output_port=output_port, status=InputPortStatus.PENDING)
+        other = DataProductFactory()
+        TechnicalAssetFactory(owner=other)
+
+        analytics = DataProductService(test_session).get_analytics(
+            [data_product.id, other.id]
+        )
+
+        assert analytics == {
+            data_product.id: DataProductAnalytics(
+                output_port_count=2, technical_asset_count=1, consumer_count=1
+            ),
+            other.id: DataProductAnalytics(
+                output_port_count=0, technical_asset_count=1, consumer_count=0
+            ),
+        }
+
+    def test_get_analytics_counts_each_consumer_once(self):
+        data_product = DataProductFactory()
+        consumer = DataProductFactory()
+        for _ in range(2):
+            InputPortFactory(
+                output_port=OutputPortFactory(data_product=data_product),
+                consuming_abstract_data_product=consumer,
+            )
+
+        analytics = DataProductService(test_session).get_analytics([data_product.id])
+
+        assert analytics[data_product.id].consumer_count == 1
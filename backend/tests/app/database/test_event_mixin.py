@@ -12,6 +12,7 @@ from sqlalchemy.orm import DeclarativeBase, Session
 
 from app.core.context import _pending_events, pop_events
 from app.database.event_mixin import EventTrackedMixin
+from tests.conftest import webhook_v2_outbox
 
 
 class _Base(DeclarativeBase):
@@ -55,7 +56,8 @@ def db():
 def event_context():
     """Initialise the ContextVar queue for each test."""
     token = _pending_events.set([])
-    yield
+    with webhook_v2_outbox(enabled=False):
+        yield
     _pending_events.reset(token)
 
 
@@ -5,12 +5,17 @@ from app.mcp.details import (
     get_output_port_details,
     get_technical_asset_details,
 )
-from app.mcp.search import search_data_products, search_output_ports
+from app.mcp.search import (
+    search_data_products,
+    search_output_ports,
+    universal_search,
+)
 from tests.factories import (
     DataProductFactory,
     DomainFactory,
     OutputPortFactory,
     TechnicalAssetFactory,
+    UserFactory,
 )
 
 
@@ -19,7 +24,7 @@ def test_search_output_ports(session):
     ds2 = OutputPortFactory(name="Sales Data")
     OutputPortService(db=session).recalculate_search_for_all_output_ports()
 
-    result = search_output_ports(query="Data", db=session)
+    result = search_output_ports(query="Data", db=session, user=UserFactory())
 
     assert "output_ports" in result
     assert result["count"] >= 2
@@ -32,7 +37,7 @@ def test_search_output_ports_no_query(session):
     OutputPortFactory(name="Customer Data")
     OutputPortService(db=session).recalculate_search_for_all_output_ports()
 
-    result = search_output_ports(query=None, db=session)
+    result = search_output_ports(query=None, db=session, user=UserFactory())
 
     assert "output_ports" in result
     assert result["count"] == 1
@@ -143,3 +148,67 @@ def test_search_data_products_matches_description(session):
 
     assert result["count"] == 1
     assert result["data_products"][0]["id"] == dp.id
+
+
+def test_search_data_products_matches_word_prefix(session):
+    dp = DataProductFactory(name="Quarterly Revenue", description="finance")
+    DataProductFactory(name="Churn", description="customers")
+
+    result = search_data_products(query="revenu quart", db=session)
+
+    assert result["count"] == 1
+    assert result["data_products"][0]["id"] == dp.id
+
+
+def test_search_data_products_ranks_better_matches_first(session):
+    weak = DataProductFactory(name="Orders", description="invoices from the shop")
+    strong = DataProductFactory(name="Invoices", description="all invoices")
+
+    result = search_data_products(query="invoices", db=session)
+
+    assert [dp["id"] for dp in result["data_products"]] == [strong.id, weak.id]
+
+
+def test_search_data_products_unknown_status(session):
+    DataProductFactory()
+
+    result = search_data_products(status="unknown", db=session)
+
+    assert result["count"] == 0
+
+
+def test_universal_search(session):
+    domain = DomainFactory(name="Logistics", description="shipping")
+    data_product = DataProductFactory(name="Shipping Events", domain=domain)
+    technical_asset = TechnicalAssetFactory(name="shipping_table")
+    DataProductFactory(name="Payroll")
+
+    result = universal_search(
+        query="shipping",
+        entity_types=["data_products", "technical_assets", "domains"],
+        db=session,
+        user=UserFactory(),
+    )
+
+    assert [dp["id"] for dp in result["results"]["data_products"]] == [data_product.id]
+    assert [ta.id for ta in result["results"]["technical_assets"]] == [
+        technical_asset.id
+    ]
+    assert [d["id"] for d in result["results"]["domains"]] == [domain.id]
+    assert result["total_count"] == 3
+
+
+def test_universal_search_limit(session):
+    for i in range(3):
+        DataProductFactory(name=f"Inventory {i}")
+
+    result = universal_search(
+        query="inventory",
+        entity_types=["data_products"],
+        limit=2,
+        db=session,
+        user=UserFactory(),
+    )
+
+    assert len(result["results"]["data_products"]) == 2
+    assert result["total_count"] == 2
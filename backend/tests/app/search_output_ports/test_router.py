@@ -61,6 +61,19 @@ class TestOutputPortSearchRouter:
         output = SearchOutputPortsResponse.model_validate(response.json())
         assert len(output.output_ports) == 1
 
+    def test_search_output_ports_small_candidate_pool(
+        self, session, client, monkeypatch
+    ):
+        _, ds_2, _ = self.setup(session)
+        monkeypatch.setattr(settings, "SEARCH_CANDIDATE_POOL_SIZE", 1)
+
+        response = client.get(
+            "/api/v2/search/output_ports", params={"query": "Sales", "limit": 1}
+        )
+        assert response.status_code == 200, response.text
+        output = SearchOutputPortsResponse.model_validate(response.json())
+        assert ds_2.name in {port.name for port in output.output_ports}
+
     def test_search_output_ports_no_query(self, session, client):
         output_ports = self.setup(session)
 
@@ -0,0 +1,32 @@
+import json
+from unittest.mock import patch
+
+from app.configuration.domains.schema_response import GetDomainsItem
+from app.configuration.domains.service import DomainService
+from app.shared import pagination
+from app.shared.pagination import PageParams
+from tests import test_session
+from tests.factories import DomainFactory, UserFactory
+
+
+class TestStream:
+    def test_stream_drops_written_pages_only(self):
+        user = UserFactory()
+        ids = {str(DomainFactory().id) for _ in range(3)}
+        streamed = []
+
+        def load(request):
+            page = DomainService(test_session).get_domains_page(request)
+            streamed.extend(page.items)
+            return page
+
+        with patch.object(pagination, "STREAM_PAGE_SIZE", 1):
+            lines = list(
+                pagination._stream(
+                    PageParams(stream=True), load, GetDomainsItem, test_session
+                )
+            )
+
+        assert {json.loads(line)["id"] for line in lines} == ids
+        assert not any(domain in test_session for domain in streamed)
+        assert user in test_session
@@ -0,0 +1,72 @@
+from unittest.mock import patch
+
+import pytest
+
+from app.data_products.output_ports.enums import OutputPortAccessType
+from app.settings import settings
+from app.statistics.service import StatisticsService
+from tests.factories import (
+    DataProductFactory,
+    OutputPortFactory,
+    TechnicalAssetFactory,
+    UserFactory,
+)
+
+ENDPOINT = "/api/v2/statistics/marketplace"
+
+
+class TestStatisticsRouter:
+    def test_get_marketplace_statistics(self, client):
+        UserFactory(external_id=settings.DEFAULT_USERNAME)
+        data_product = DataProductFactory()
+        OutputPortFactory(data_product=data_product)
+        OutputPortFactory(
+            data_product=data_product, access_type=OutputPortAccessType.PRIVATE
+        )
+        TechnicalAssetFactory(owner=data_product)
+
+        response = client.get(ENDPOINT)
+
+        assert response.status_code == 200, response.text
+        assert response.json() == {
+            "total_data_products": 1,
+            # The private output port is not visible to the user
+            "total_output_ports": 1,
+            "total_technical_assets": 1,
+            "total_domains": 1,
+        }
+
+    @pytest.mark.usefixtures("admin")
+    def test_admin_counts_private_output_ports(self, client):
+        OutputPortFactory()
+        OutputPortFactory(access_type=OutputPortAccessType.PRIVATE)
+
+        response = client.get(ENDPOINT)
+
+        assert response.status_code == 200, response.text
+        assert response.json()["total_output_ports"] == 2
+
+    def test_snapshot_is_cached(self, client):
+        UserFactory(external_id=settings.DEFAULT_USERNAME)
+        DataProductFactory()
+
+        with patch.object(
+            StatisticsService,
+            "_take_snapshot",
+            autospec=True,
+            side_effect=StatisticsService._take_snapshot,
+        ) as take_snapshot:
+            client.get(ENDPOINT)
+            response = client.get(ENDPOINT)
+
+        assert response.json()["total_data_products"] == 1
+        assert take_snapshot.call_count == 1
+
+    def test_commit_clears_snapshot(self, client):
+        UserFactory(external_id=settings.DEFAULT_USERNAME)
+        DataProductFactory()
+        assert client.get(ENDPOINT).json()["total_data_products"] == 1
+
+        DataProductFactory()
+
+        assert client.get(ENDPOINT).json()["total_data_products"] == 2
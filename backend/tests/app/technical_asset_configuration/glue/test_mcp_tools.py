@@ -1,12 +1,18 @@
 import asyncio as _asyncio
+import io
+from contextlib import contextmanager
 from unittest.mock import MagicMock, patch
+from uuid import uuid4
 
 import pytest
+from botocore.response import StreamingBody
 
 from app.core.auth.credentials import AWSCredentials
 from app.technical_asset_configuration.glue.mcp_tools import _fetch_aws_credentials
 from tests.factories import UserFactory
 
+DATA_PRODUCT_ID = uuid4()
+
 
 @pytest.fixture
 def user(session):
@@ -25,6 +31,27 @@ def mock_creds():
     )
 
 
+@contextmanager
+def _patch_credential_lookup():
+    mock_env = MagicMock()
+    mock_env.name = "prod"
+    with (
+        patch(
+            "app.technical_asset_configuration.glue.mcp_tools.authorize_data_product_read_integrations",
+            return_value=MagicMock(id=DATA_PRODUCT_ID),
+        ),
+        patch(
+            "app.technical_asset_configuration.glue.mcp_tools.EnvironmentService.get_environments",
+            return_value=[mock_env],
+        ),
+        patch(
+            "app.technical_asset_configuration.glue.mcp_tools.DataProductService.get_data_product_role_arn",
+            return_value="arn:aws:iam::1:role/my-product",
+        ),
+    ):
+        yield
+
+
 class TestFetchAwsCredentials:
     def test_raises_tool_error_on_permission_denied(self, session, user):
         with (
@@ -47,18 +74,10 @@ class TestFetchAwsCredentials:
             _fetch_aws_credentials("unknown", "prod", user, session)
 
     def test_raises_tool_error_when_auth_service_fails(self, session, user):
-        mock_env = MagicMock()
-        mock_env.name = "prod"
         with (
+            _patch_credential_lookup(),
             patch(
-                "app.technical_asset_configuration.glue.mcp_tools.authorize_data_product_read_integrations"
-            ),
-            patch(
-                "app.technical_asset_configuration.glue.mcp_tools.EnvironmentService.get_environments",
-                return_value=[mock_env],
-            ),
-            patch(
-                "app.technical_asset_configuration.glue.mcp_tools.AuthService.get_aws_credentials",
+                "app.technical_asset_configuration.glue.mcp_tools.get_aws_temporary_credentials",
                 side_effect=Exception("STS error"),
             ),
             pytest.raises(Exception, match="STS error"),
@@ -66,18 +85,10 @@ class TestFetchAwsCredentials:
             _fetch_aws_credentials("my-product", "prod", user, session)
 
     def test_returns_credentials_on_success(self, session, user, mock_creds):
-        mock_env = MagicMock()
-        mock_env.name = "prod"
         with (
+            _patch_credential_lookup(),
             patch(
-                "app.technical_asset_configuration.glue.mcp_tools.authorize_data_product_read_integrations"
-            ),
-            patch(
-                "app.technical_asset_configuration.glue.mcp_tools.EnvironmentService.get_environments",
-                return_value=[mock_env],
-            ),
-            patch(
-                "app.technical_asset_configuration.glue.mcp_tools.AuthService.get_aws_credentials",
+                "app.technical_asset_configuration.glue.mcp_tools.get_aws_temporary_credentials",
                 return_value=mock_creds,
             ),
         ):
@@ -86,6 +97,45 @@ class TestFetchAwsCredentials:
         assert result.AccessKeyId == "AKIA..."
         assert result.SessionToken == "token"
 
+    def test_reuses_credentials_until_refresh(self, session, user, mock_creds):
+        with (
+            _patch_credential_lookup(),
+            patch(
+                "app.technical_asset_configuration.glue.mcp_tools.get_aws_temporary_credentials",
+                return_value=mock_creds,
+            ) as assume_role,
+        ):
+            _fetch_aws_credentials("my-product", "prod", user, session)
+            result = _fetch_aws_credentials("my-product", "prod", user, session)
+
+        assert result == mock_creds
+        assume_role.assert_called_once_with(
+            "arn:aws:iam::1:role/my-product", actor=user
+        )
+
+    def test_drops_cached_credentials_when_access_is_revoked(
+        self, session, user, mock_creds
+    ):
+        with (
+            _patch_credential_lookup(),
+            patch(
+                "app.technical_asset_configuration.glue.mcp_tools.get_aws_temporary_credentials",
+                return_value=mock_creds,
+            ) as assume_role,
+        ):
+            _fetch_aws_credentials("my-product", "prod", user, session)
+            with (
+                patch(
+                    "app.technical_asset_configuration.glue.mcp_tools.authorize_data_product_read_integrations",
+                    side_effect=PermissionError("no access"),
+                ),
+                pytest.raises(PermissionError),
+            ):
+                _fetch_aws_credentials("my-product", "prod", user, session)
+            _fetch_aws_credentials("my-product", "prod", user, session)
+
+        assert assume_role.call_count == 2
+
 
 class TestListGlueTables:
     def test_returns_tables_from_paginator(self, session, user, mock_creds):
@@ -105,7 +155,7 @@ class TestListGlueTables:
                 "app.technical_asset_configuration.glue.mcp_tools._fetch_aws_credentials",
                 return_value=mock_creds,
             ),
-            patch("boto3.client", return_value=mock_client),
+            patch("boto3.session.Session.client", return_value=mock_client),
         ):
             result = _call_list_glue_tables(
                 data_product_namespace="my-product",
@@ -133,7 +183,7 @@ class TestListGlueTables:
                 "app.technical_asset_configuration.glue.mcp_tools._fetch_aws_credentials",
                 return_value=mock_creds,
             ),
-            patch("boto3.client", return_value=mock_client),
+            patch("boto3.session.Session.client", return_value=mock_client),
             pytest.raises(EntityNotFoundException, match="missing_db"),
         ):
             _call_list_glue_tables(
@@ -155,7 +205,7 @@ class TestQueryAthena:
                 "app.technical_asset_configuration.glue.mcp_tools._fetch_aws_credentials",
                 return_value=mock_creds,
             ),
-            patch("boto3.client", return_value=mock_client),
+            patch("boto3.session.Session.client", return_value=mock_client),
         ):
             result = _call_query_athena(
                 data_product_namespace="my-product",
@@ -177,7 +227,7 @@ class TestQueryAthena:
                 "app.technical_asset_configuration.glue.mcp_tools._fetch_aws_credentials",
                 return_value=mock_creds,
             ),
-            patch("boto3.client", return_value=mock_client),
+            patch("boto3.session.Session.client", return_value=mock_client),
         ):
             result = _call_query_athena(
                 data_product_namespace="my-product",
@@ -206,7 +256,7 @@ class TestQueryAthena:
                 "app.technical_asset_configuration.glue.mcp_tools._fetch_aws_credentials",
                 return_value=mock_creds,
             ),
-            patch("boto3.client", return_value=mock_client),
+            patch("boto3.session.Session.client", return_value=mock_client),
             pytest.raises(InvalidRequestException, match="bad SQL"),
         ):
             _call_query_athena(
@@ -242,7 +292,7 @@ class TestGetAthenaQueryResults:
                 "app.technical_asset_configuration.glue.mcp_tools._fetch_aws_credentials",
                 return_value=mock_creds,
             ),
-            patch("boto3.client", return_value=mock_client),
+            patch("boto3.session.Session.client", return_value=mock_client),
         ):
             result = _call_get_athena_query_results(
                 query_execution_id="qry-123",
@@ -266,7 +316,7 @@ class TestGetAthenaQueryResults:
                 "app.technical_asset_configuration.glue.mcp_tools._fetch_aws_credentials",
                 return_value=mock_creds,
             ),
-            patch("boto3.client", return_value=mock_client),
+            patch("boto3.session.Session.client", return_value=mock_client),
             pytest.raises(RuntimeError, match="Syntax error in SQL"),
         ):
             _call_get_athena_query_results(
@@ -295,7 +345,7 @@ class TestGetAthenaQueryResults:
                 "app.technical_asset_configuration.glue.mcp_tools._fetch_aws_credentials",
                 return_value=mock_creds,
             ),
-            patch("boto3.client", return_value=mock_client),
+            patch("boto3.session.Session.client", return_value=mock_client),
         ):
             result = _call_get_athena_query_results(
                 query_execution_id="qry-123",
@@ -320,7 +370,7 @@ class TestGetAthenaQueryResults:
                 "app.technical_asset_configuration.glue.mcp_tools._fetch_aws_credentials",
                 return_value=mock_creds,
             ),
-            patch("boto3.client", return_value=mock_client),
+            patch("boto3.session.Session.client", return_value=mock_client),
         ):
             result = _call_get_athena_query_results(
                 query_execution_id="qry-123",
@@ -333,6 +383,132 @@ class TestGetAthenaQueryResults:
         assert result["row_count"] == 0
         assert result["rows"] == []
 
+    def test_passes_next_token_and_returns_following_token(
+        self, session, user, mock_creds
+    ):
+        mock_client = MagicMock()
+        mock_client.get_query_execution.return_value = self._make_execution("SUCCEEDED")
+        mock_client.get_query_results.return_value = {
+            "ResultSet": {
+                "ResultSetMetadata": {"ColumnInfo": [{"Name": "id"}, {"Name": "name"}]},
+                "Rows": [
+                    {"Data": [{"VarCharValue": "3"}, {"VarCharValue": "Carol"}]},
+                ],
+            },
+            "NextToken": "page-3",
+        }
+
+        with (
+            patch(
+                "app.technical_asset_configuration.glue.mcp_tools._fetch_aws_credentials",
+                return_value=mock_creds,
+            ),
+            patch("boto3.session.Session.client", return_value=mock_client),
+        ):
+            result = _call_get_athena_query_results(
+                query_execution_id="qry-123",
+                data_product_namespace="my-product",
+                env="prod",
+                max_results=1,
+                next_token="page-2",  # noqa: S106
+                authorized_user=user,
+                db=session,
+            )
+
+        mock_client.get_query_results.assert_called_once_with(
+            QueryExecutionId="qry-123", MaxResults=1, NextToken="page-2"
+        )
+        assert result["rows"] == [{"id": "3", "name": "Carol"}]
+        assert result["truncated"] is True
+        assert result["next_token"] == "page-3"
+
+    def test_waits_for_query_to_finish(self, session, user, mock_creds):
+        mock_client = MagicMock()
+        mock_client.get_query_execution.side_effect = [
+            self._make_execution("QUEUED"),
+            self._make_execution("RUNNING"),
+            self._make_execution("SUCCEEDED"),
+        ]
+        mock_client.get_query_results.return_value = {"ResultSet": {"Rows": []}}
+
+        with (
+            patch(
+                "app.technical_asset_configuration.glue.mcp_tools._fetch_aws_credentials",
+                return_value=mock_creds,
+            ),
+            patch("boto3.session.Session.client", return_value=mock_client),
+            patch(
+                "app.technical_asset_configuration.glue.mcp_tools.time.sleep"
+            ) as sleep,
+        ):
+            result = _call_get_athena_query_results(
+                query_execution_id="qry-123",
+                data_product_namespace="my-product",
+                env="prod",
+                wait_seconds=30,
+                authorized_user=user,
+                db=session,
+            )
+
+        assert result["status"] == "SUCCEEDED"
+        assert sleep.call_count == 2
+
+    def test_streams_pages_from_s3(self, session, user, mock_creds):
+        csv_body = b'"id","name"\n"1","Alice"\n"2","Bob"\n"3","multi\nline"\n'
+        execution = self._make_execution("SUCCEEDED")
+        execution["QueryExecution"]["ResultConfiguration"] = {
+            "OutputLocation": "s3://results/athena-results/qry-123.csv"
+        }
+        mock_client = MagicMock()
+        mock_client.get_query_execution.return_value = execution
+
+        def get_object(Bucket, Key, Range=None):
+            assert (Bucket, Key) == ("results", "athena-results/qry-123.csv")
+            start = int(Range.removeprefix("bytes=").rstrip("-")) if Range else 0
+            content = csv_body[start:]
+            response = {
+                "Body": StreamingBody(io.BytesIO(content), len(content)),
+                "ContentLength": len(content),
+            }
+            if Range:
+                response["ContentRange"] = (
+                    f"bytes {start}-{len(csv_body) - 1}/{len(csv_body)}"
+                )
+            return response
+
+        mock_client.get_object.side_effect = get_object
+
+        def page(next_token=""):
+            return _call_get_athena_query_results(
+                query_execution_id="qry-123",
+                data_product_namespace="my-product",
+                env="prod",
+                max_results=2,
+                next_token=next_token,
+                from_s3=True,
+                authorized_user=user,
+                db=session,
+            )
+
+        with (
+            patch(
+                "app.technical_asset_configuration.glue.mcp_tools._fetch_aws_credentials",
+                return_value=mock_creds,
+            ),
+            patch("boto3.session.Session.client", return_value=mock_client),
+        ):
+            first = page()
+            second = page(first["next_token"])
+
+        assert first["columns"] == ["id", "name"]
+        assert first["rows"] == [
+            {"id": "1", "name": "Alice"},
+            {"id": "2", "name": "Bob"},
+        ]
+        assert second["rows"] == [{"id": "3", "name": "multi\nline"}]
+        assert "next_token" not in second
+        mock_client.get_query_results.assert_not_called()
+
 
 _TOOLS = None
 
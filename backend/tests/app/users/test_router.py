@@ -32,6 +32,19 @@ class TestUsersRouter:
         data = response.json()
         assert len(data) == 1
 
+    def test_get_users_paginated(self, client):
+        for last_name in ["c", "d", "a", "b"]:
+            UserFactory(last_name=last_name)
+
+        first = client.get(ENDPOINT, params={"limit": 3}).json()
+        second = client.get(
+            ENDPOINT, params={"limit": 3, "cursor": first["next_cursor"]}
+        ).json()
+
+        assert [user["last_name"] for user in first["users"]] == ["a", "b", "c"]
+        assert [user["last_name"] for user in second["users"]] == ["d"]
+        assert "next_cursor" not in second
+
     def test_get_users_v2(self, client):
         UserFactory()
 
@@ -12,12 +12,14 @@ from starlette.routing import _DefaultLifespan
 from app.authorization.service import AuthorizationService
 from app.core.auth.device_flows.service import verify_auth_header
 from app.core.authz.authorization import Authorization
+from app.core.aws.credential_cache import aws_credentials
 from app.core.context import _pending_events
 from app.core.webhooks.events import V2Event
 from app.data_products.output_ports.enums import OutputPortAccessType
 from app.database.database import Base, get_db_session
 from app.main import app
 from app.settings import settings
+from app.statistics.service import marketplace_snapshots
 from tests.factories import reset_unique_fakers
 from tests.factories.role import RoleFactory
 from tests.factories.role_assignment_global import GlobalRoleAssignmentFactory
@@ -120,6 +122,8 @@ def clear_db(session: scoped_session[Session]) -> None:
             session.execute(table.delete())
     session.commit()
     AuthorizationService._clear_casbin_table()
+    marketplace_snapshots.clear()
+    aws_credentials.clear()
     reset_unique_fakers()
 
 
@@ -146,6 +150,16 @@ def webhook_v2_config(url: str | None = "http://test-v2.example.com/hook"):
         settings.WEBHOOK_V2_URL = original
 
 
+@contextmanager
+def webhook_v2_outbox(enabled: bool = True):
+    original = settings.WEBHOOK_V2_OUTBOX
+    settings.WEBHOOK_V2_OUTBOX = enabled
+    try:
+        yield
+    finally:
+        settings.WEBHOOK_V2_OUTBOX = original
+
+
 @contextmanager
 def webhook_v2_input_port_events_from_technical_asset_output_port_link(
     enabled: bool = True,
@@ -189,6 +203,10 @@ def capture_events() -> Iterator["CapturedEventsMock"]:
         patch("app.core.context.queue_event", side_effect=_queue_event),
         patch("app.core.context.queue_events", side_effect=_queue_events),
         patch("app.database.event_mixin.queue_events", side_effect=_queue_events),
+        patch(
+            "app.database.event_mixin.write_outbox_events",
+            side_effect=lambda _, events: _queue_events(events),
+        ),
         webhook_v2_config(),
     ):
         yield mock
@@ -46,4 +46,6 @@ class InputPortFactory(factory.alchemy.SQLAlchemyModelFactory):
         if obj.status == InputPortStatus.REVOKED:
             kwargs.setdefault("revoked_at", datetime.now(timezone.utc))
             kwargs.setdefault("revoked_by", UserFactory())
-        InputPortRequestFactory(input_port=obj, **kwargs)
+        request = InputPortRequestFactory(input_port=obj, **kwargs)
+        if obj.status == InputPortStatus.APPROVED:
+            obj.grant_expires_on = request.valid_until
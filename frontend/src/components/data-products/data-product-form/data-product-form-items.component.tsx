@@ -41,10 +41,10 @@ export const DataProductFormItems = <T extends DataProductCreate>({
     const currentUser = useSelector(selectCurrentUser);
 
     const { data: lifecycles = undefined, isFetching: isFetchingLifecycles } = useGetDataProductsLifecyclesQuery();
-    const { data: { domains = [] } = {}, isFetching: isFetchingDomains } = useGetDomainsQuery();
+    const { data: { domains = [] } = {}, isFetching: isFetchingDomains } = useGetDomainsQuery({});
     const { data: dataProductTypes = undefined, isFetching: isFetchingDataProductTypes } =
         useGetDataProductsTypesQuery();
-    const { data: { users: dataProductOwners = [] } = {}, isFetching: isFetchingUsers } = useGetUsersQuery();
+    const { data: { users: dataProductOwners = [] } = {}, isFetching: isFetchingUsers } = useGetUsersQuery({});
     const { data: { tags: availableTags = [] } = {}, isFetching: isFetchingTags } = useGetTagsQuery();
     const [sanitizeResourceName, { data: sanitizedResourceName, isSuccess: sanitizedResourceNameSuccess }] =
         useLazySanitizeResourceNameQuery();
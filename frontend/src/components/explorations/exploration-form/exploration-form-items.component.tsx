@@ -10,7 +10,7 @@ const { TextArea } = Input;
 export const ExplorationFormItems = () => {
     const { t } = useTranslation();
 
-    const { data: { domains = [] } = {}, isFetching: isFetchingDomains } = useGetDomainsQuery();
+    const { data: { domains = [] } = {}, isFetching: isFetchingDomains } = useGetDomainsQuery({});
 
     return (
         <>
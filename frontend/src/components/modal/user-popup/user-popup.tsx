@@ -29,7 +29,7 @@ const handleUserListFilter = (users: UsersGet[], searchTerm: string) => {
 
 export function UserPopup({ onClose, isOpen, roles, item, isLoading, userIdsToHide }: Props) {
     const { t } = useTranslation();
-    const { data: { users = [] } = {}, isFetching: isFetchingUsers } = useGetUsersQuery();
+    const { data: { users = [] } = {}, isFetching: isFetchingUsers } = useGetUsersQuery({});
 
     const [searchTerm, setSearchTerm] = useState<string>('');
 
@@ -33,7 +33,7 @@ export function TechnicalAssetLinkModal({ onClose, dataProductId, datasetId, dat
     const [approveLink] = useApproveOutputPortTechnicalAssetLinkMutation();
 
     const { data: { technical_assets: technicalAssets = [] } = {} } = useGetDataProductTechnicalAssetsQuery(
-        dataProductId,
+        { dataProductId },
         { skip: !dataProductId },
     );
 
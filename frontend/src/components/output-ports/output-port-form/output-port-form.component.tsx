@@ -274,7 +274,7 @@ export function OutputPortForm({
         skip: mode === 'edit' || !dataProductId,
     });
     const { data: lifecycles = undefined, isFetching: isFetchingLifecycles } = useGetDataProductsLifecyclesQuery();
-    const { data: { users = [] } = {}, isFetching: isFetchingUsers } = useGetUsersQuery();
+    const { data: { users = [] } = {}, isFetching: isFetchingUsers } = useGetUsersQuery({});
     const { data: { tags: availableTags = [] } = {}, isFetching: isFetchingTags } = useGetTagsQuery();
     const [createDataset, { isLoading: isCreating }] = useCreateOutputPortMutation();
     const [requestDatasetsAccessForDataOutput] = useLinkOutputPortToTechnicalAssetMutation();
@@ -115,7 +115,7 @@ export const ExistingDataProductForm = ({ setSelectedDataProductId }: Props) =>
     };
     const currentUser = useSelector(selectCurrentUser);
     const { data: { data_products: userDataProducts = [] } = {}, isFetching: isFetchingUserDataProducts } =
-        useGetDataProductsQuery(currentUser?.id, {
+        useGetDataProductsQuery({ filterToUserWithAssigment: currentUser?.id }, {
             skip: currentUser === null || !currentUser?.id,
         });
     const options = userDataProducts.map((dp) => ({
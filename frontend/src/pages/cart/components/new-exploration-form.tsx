@@ -37,7 +37,7 @@ export const NewExplorationForm = () => {
     const posthog = usePostHog();
     const navigate = useNavigate();
     const [form] = Form.useForm<CreateExplorationRequestForm>();
-    const { data: { domains = [] } = {}, isFetching: isFetchingDomains } = useGetDomainsQuery();
+    const { data: { domains = [] } = {}, isFetching: isFetchingDomains } = useGetDomainsQuery({});
     const currentUser = useSelector(selectCurrentUser);
 
     const [createExploration, { isLoading: isCreatingExploration }] = useCreateExplorationMutation();
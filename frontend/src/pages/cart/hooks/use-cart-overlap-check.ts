@@ -20,7 +20,7 @@ export function useCartOverlapCheck({
     const cartDatasetIds = useSelector(selectCartOutputPortIds);
 
     const { data: { output_ports: selectedDataProductOutputPorts = [] } = {} } = useGetDataProductOutputPortsQuery(
-        selectedDataProductId ?? '',
+        { dataProductId: selectedDataProductId ?? '' },
         { skip: !selectedDataProductId },
     );
 
@@ -23,7 +23,7 @@ export const DataProductRequestAccessButton = ({ dataProductId, userId }: Props)
         useRequestDataProductRoleAssignmentMutation();
     const { data: { roles: DATA_PRODUCT_ROLES = [] } = {} } = useGetRolesQuery(Scope.DATA_PRODUCT);
 
-    const { data: { users = [] } = {}, isFetching: isFetchingUsers } = useGetUsersQuery();
+    const { data: { users = [] } = {}, isFetching: isFetchingUsers } = useGetUsersQuery({});
     const isLoading = isFetchingUsers || isRequestingAccess;
 
     const userIdsToHide = useMemo(() => {
@@ -16,7 +16,7 @@ type Props = {
 
 export function OutputPortsTable({ dataProductId, draggedDataOutputId }: Props) {
     const { t } = useTranslation();
-    const { data: { output_ports: outputPorts = [] } = {} } = useGetDataProductOutputPortsQuery(dataProductId);
+    const { data: { output_ports: outputPorts = [] } = {} } = useGetDataProductOutputPortsQuery({ dataProductId });
     const { isVisible, handleOpen, handleClose } = useModal();
     const { data: dataProduct, isLoading: isLoadingDataProduct } = useGetDataProductQuery(dataProductId);
 
@@ -18,7 +18,7 @@ type Props = {
 export function TechnicalAssetsTable({ dataProductId, onDragStart, onDragEnd }: Props) {
     const { t } = useTranslation();
     const { data: { technical_assets: technicalAssets = [] } = {} } =
-        useGetDataProductTechnicalAssetsQuery(dataProductId);
+        useGetDataProductTechnicalAssetsQuery({ dataProductId });
     const { data: dataProduct, isLoading: isLoadingDataProduct } = useGetDataProductQuery(dataProductId);
     const { isVisible, handleOpen, handleClose } = useModal();
     const { data: access } = useCheckAccessQuery(
@@ -47,7 +47,7 @@ export function PeoplePage() {
         ]);
     }, [setBreadcrumbs, t]);
 
-    const { data: { users = [] } = {}, isFetching } = useGetUsersQuery();
+    const { data: { users = [] } = {}, isFetching } = useGetUsersQuery({});
     const { data: { roles = [] } = {} } = useGetRolesQuery(Scope.GLOBAL);
     const { data: access } = useCheckAccessQuery({ action: AuthorizationAction.GLOBAL__CREATE_USER });
     const canAssignGlobalRole = access?.allowed ?? false;
@@ -49,7 +49,7 @@ export function DataProductsTab() {
     const [selectedProductIds, setSelectedProductIds] = useState<string[]>([]);
 
     const { data: { data_products: dataProducts = [] } = {}, isFetching } = useGetDataProductsQuery(
-        showAllProducts ? undefined : (currentUser?.id ?? ''),
+        { filterToUserWithAssigment: showAllProducts ? undefined : (currentUser?.id ?? '') },
         { skip: !currentUser },
     );
 
@@ -22,7 +22,7 @@ type Props = {
 export function CreateDomainMigrateModal({ isOpen, onClose, migrateFrom }: Props) {
     const { t } = useTranslation();
     const [form] = Form.useForm();
-    const { data: { domains = [] } = {} } = useGetDomainsQuery();
+    const { data: { domains = [] } = {} } = useGetDomainsQuery({});
     const [migrateDomain] = useMigrateDomainMutation();
     const [onRemoveDomain] = useRemoveDomainMutation();
 
@@ -16,7 +16,7 @@ import { getDomainTableColumns } from './domain-table-columns';
 
 export function DomainTable() {
     const { t } = useTranslation();
-    const { data: { domains = [] } = {}, isFetching } = useGetDomainsQuery();
+    const { data: { domains = [] } = {}, isFetching } = useGetDomainsQuery({});
     const { isVisible, handleOpen, handleClose } = useModal();
     const {
         isVisible: migrateModalVisible,
@@ -10,6 +10,16 @@ const injectedRtkApi = api.injectEndpoints({
         },
       }),
     }),
+    checkAccessBatch: build.mutation<
+      CheckAccessBatchApiResponse,
+      CheckAccessBatchApiArg
+    >({
+      query: (queryArg) => ({
+        url: `/api/v2/authz/access/${queryArg.action}/batch`,
+        method: "POST",
+        body: queryArg.accessBatchRequest,
+      }),
+    }),
     isAdmin: build.query<IsAdminApiResponse, IsAdminApiArg>({
       query: () => ({ url: `/api/v2/authz/admin` }),
     }),
@@ -24,6 +34,12 @@ export type CheckAccessApiArg = {
   resource?: string;
   domain?: string;
 };
+export type CheckAccessBatchApiResponse =
+  /** status 200 Successful Response */ AccessBatchResponse;
+export type CheckAccessBatchApiArg = {
+  action: AuthorizationAction;
+  accessBatchRequest: AccessBatchRequest;
+};
 export type IsAdminApiResponse =
   /** status 200 Successful Response */ IsAdminResponse;
 export type IsAdminApiArg = void;
@@ -79,6 +95,14 @@ export type AuthorizationAction =
   | 413
   | 414
   | 415;
+export type AccessBatchResponse = {
+  allowed: {
+    [key: string]: boolean;
+  };
+};
+export type AccessBatchRequest = {
+  resources: string[];
+};
 export type IsAdminResponse = {
   is_admin: boolean;
   time?: string | null;
@@ -86,6 +110,7 @@ export type IsAdminResponse = {
 export const {
   useCheckAccessQuery,
   useLazyCheckAccessQuery,
+  useCheckAccessBatchMutation,
   useIsAdminQuery,
   useLazyIsAdminQuery,
 } = injectedRtkApi;
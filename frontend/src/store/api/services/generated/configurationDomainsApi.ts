@@ -2,7 +2,14 @@ import { api } from "@/store/api/services/generated/configurationDataProductType
 const injectedRtkApi = api.injectEndpoints({
   endpoints: (build) => ({
     getDomains: build.query<GetDomainsApiResponse, GetDomainsApiArg>({
-      query: () => ({ url: `/api/v2/configuration/domains` }),
+      query: (queryArg) => ({
+        url: `/api/v2/configuration/domains`,
+        params: {
+          limit: queryArg.limit,
+          cursor: queryArg.cursor,
+          fields: queryArg.fields,
+        },
+      }),
     }),
     createDomain: build.mutation<CreateDomainApiResponse, CreateDomainApiArg>({
       query: (queryArg) => ({
@@ -44,7 +51,14 @@ const injectedRtkApi = api.injectEndpoints({
 export { injectedRtkApi as api };
 export type GetDomainsApiResponse =
   /** status 200 Successful Response */ GetDomainsResponse;
-export type GetDomainsApiArg = void;
+export type GetDomainsApiArg = {
+  /** Return at most this many items, and a cursor to the next page */
+  limit?: number;
+  /** The next_cursor of the previous page */
+  cursor?: string;
+  /** Comma separated list of the item fields to return */
+  fields?: string;
+};
 export type CreateDomainApiResponse =
   /** status 200 Domain successfully created */ CreateDomainResponse;
 export type CreateDomainApiArg = DomainCreate;
@@ -72,6 +86,7 @@ export type GetDomainsItem = {
   abstract_data_product_count: number;
 };
 export type GetDomainsResponse = {
+  next_cursor?: string | null;
   domains: GetDomainsItem[];
 };
 export type CreateDomainResponse = {
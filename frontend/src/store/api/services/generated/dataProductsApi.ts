@@ -18,7 +18,10 @@ const injectedRtkApi = api.injectEndpoints({
       query: (queryArg) => ({
         url: `/api/v2/data_products`,
         params: {
-          filter_to_user_with_assigment: queryArg,
+          filter_to_user_with_assigment: queryArg.filterToUserWithAssigment,
+          limit: queryArg.limit,
+          cursor: queryArg.cursor,
+          fields: queryArg.fields,
         },
       }),
     }),
@@ -206,7 +209,15 @@ export type CreateDataProductApiResponse =
 export type CreateDataProductApiArg = DataProductCreate;
 export type GetDataProductsApiResponse =
   /** status 200 Successful Response */ GetDataProductsResponse;
-export type GetDataProductsApiArg = string | undefined;
+export type GetDataProductsApiArg = {
+  filterToUserWithAssigment?: string;
+  /** Return at most this many items, and a cursor to the next page */
+  limit?: number;
+  /** The next_cursor of the previous page */
+  cursor?: string;
+  /** Comma separated list of the item fields to return */
+  fields?: string;
+};
 export type RemoveDataProductApiResponse =
   /** status 200 Data Product deleted */ any;
 export type RemoveDataProductApiArg = string;
@@ -376,6 +387,7 @@ export type GetDataProductsResponseItem = {
   technical_asset_count: number;
 };
 export type GetDataProductsResponse = {
+  next_cursor?: string | null;
   data_products: GetDataProductsResponseItem[];
 };
 export type UpdateDataProductResponse = {
@@ -102,7 +102,12 @@ const injectedRtkApi = api.injectEndpoints({
       GetDataProductOutputPortsApiArg
     >({
       query: (queryArg) => ({
-        url: `/api/v2/data_products/${queryArg}/output_ports`,
+        url: `/api/v2/data_products/${queryArg.dataProductId}/output_ports`,
+        params: {
+          limit: queryArg.limit,
+          cursor: queryArg.cursor,
+          fields: queryArg.fields,
+        },
       }),
     }),
     createOutputPort: build.mutation<
@@ -265,7 +270,7 @@ export type GetOutputPortSchemaApiArg = {
   id: string;
 };
 export type IngestOutputPortContractApiResponse =
-  /** status 200 Successful Response */ OutputPortSchemaResponse;
+  /** status 200 Successful Response */ OutputPortContractIngestResponse;
 export type IngestOutputPortContractApiArg = {
   dataProductId: string;
   id: string;
@@ -273,7 +278,15 @@ export type IngestOutputPortContractApiArg = {
 };
 export type GetDataProductOutputPortsApiResponse =
   /** status 200 Successful Response */ GetDataProductOutputPortsResponse;
-export type GetDataProductOutputPortsApiArg = string;
+export type GetDataProductOutputPortsApiArg = {
+  dataProductId: string;
+  /** Return at most this many items, and a cursor to the next page */
+  limit?: number;
+  /** The next_cursor of the previous page */
+  cursor?: string;
+  /** Comma separated list of the item fields to return */
+  fields?: string;
+};
 export type CreateOutputPortApiResponse =
   /** status 200 Successful Response */ CreateOutputPortResponse;
 export type CreateOutputPortApiArg = {
@@ -448,6 +461,17 @@ export type OutputPortSchemaResponse = {
   output_port_id: string;
   schema_objects?: SchemaObjectResponse[];
 };
+export type SchemaChangesResponse = {
+  unchanged?: boolean;
+  added?: string[];
+  removed?: string[];
+  changed?: string[];
+};
+export type OutputPortContractIngestResponse = {
+  output_port_id: string;
+  schema_objects?: SchemaObjectResponse[];
+  changes: SchemaChangesResponse;
+};
 export type SchemaPropertyRequest = {
   name: string;
   businessName?: string | null;
@@ -495,6 +519,7 @@ export type OutputPort = {
   access_modes: AccessMode[];
 };
 export type GetDataProductOutputPortsResponse = {
+  next_cursor?: string | null;
   output_ports: OutputPort[];
 };
 export type CreateOutputPortResponse = {
@@ -46,7 +46,12 @@ const injectedRtkApi = api.injectEndpoints({
       GetDataProductTechnicalAssetsApiArg
     >({
       query: (queryArg) => ({
-        url: `/api/v2/data_products/${queryArg}/technical_assets/`,
+        url: `/api/v2/data_products/${queryArg.dataProductId}/technical_assets/`,
+        params: {
+          limit: queryArg.limit,
+          cursor: queryArg.cursor,
+          fields: queryArg.fields,
+        },
       }),
     }),
     createTechnicalAsset: build.mutation<
@@ -149,7 +154,15 @@ export type UnlinkOutputPortFromTechnicalAssetApiArg = {
 };
 export type GetDataProductTechnicalAssetsApiResponse =
   /** status 200 Successful Response */ GetTechnicalAssetsResponse;
-export type GetDataProductTechnicalAssetsApiArg = string;
+export type GetDataProductTechnicalAssetsApiArg = {
+  dataProductId: string;
+  /** Return at most this many items, and a cursor to the next page */
+  limit?: number;
+  /** The next_cursor of the previous page */
+  cursor?: string;
+  /** Comma separated list of the item fields to return */
+  fields?: string;
+};
 export type CreateTechnicalAssetApiResponse =
   /** status 200 Technical asset successfully created */ CreateTechnicalAssetResponse;
 export type CreateTechnicalAssetApiArg = {
@@ -375,6 +388,7 @@ export type GetTechnicalAssetsResponseItem = {
   technical_info: TechnicalInfo[];
 };
 export type GetTechnicalAssetsResponse = {
+  next_cursor?: string | null;
   technical_assets: GetTechnicalAssetsResponseItem[];
 };
 export type CreateTechnicalAssetResponse = {
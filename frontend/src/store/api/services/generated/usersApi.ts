@@ -8,7 +8,14 @@ const injectedRtkApi = api.injectEndpoints({
       }),
     }),
     getUsers: build.query<GetUsersApiResponse, GetUsersApiArg>({
-      query: () => ({ url: `/api/v2/users` }),
+      query: (queryArg) => ({
+        url: `/api/v2/users`,
+        params: {
+          limit: queryArg.limit,
+          cursor: queryArg.cursor,
+          fields: queryArg.fields,
+        },
+      }),
     }),
     createUser: build.mutation<CreateUserApiResponse, CreateUserApiArg>({
       query: (queryArg) => ({
@@ -64,7 +71,14 @@ export type RemoveUserApiResponse = /** status 200 Successful Response */ any;
 export type RemoveUserApiArg = string;
 export type GetUsersApiResponse =
   /** status 200 Successful Response */ GetUsersResponse;
-export type GetUsersApiArg = void;
+export type GetUsersApiArg = {
+  /** Return at most this many items, and a cursor to the next page */
+  limit?: number;
+  /** The next_cursor of the previous page */
+  cursor?: string;
+  /** Comma separated list of the item fields to return */
+  fields?: string;
+};
 export type CreateUserApiResponse =
   /** status 200 User successfully created */ UserCreateResponse;
 export type CreateUserApiArg = UserCreate;
@@ -176,6 +190,7 @@ export type UsersGet = {
   global_role: GlobalRoleAssignmentResponse | null;
 };
 export type GetUsersResponse = {
+  next_cursor?: string | null;
   users: UsersGet[];
 };
 export type UserCreateResponse = {
@@ -51,10 +51,10 @@ const invalidateDeletedOutputPort = (
 
 export const dataProductOutputPortTags = {
     getDataProductOutputPorts: {
-        providesTags: (_, __, id) => [
+        providesTags: (_, __, { dataProductId }) => [
             {
                 type: TagTypes.DataProductOutputPorts,
-                id: id,
+                id: dataProductId,
             },
         ],
     },
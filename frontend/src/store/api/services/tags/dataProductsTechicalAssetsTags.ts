@@ -49,10 +49,10 @@ const invalidateTechnicalAssetOutputPort = (dataProductId: string, outputPortId:
 
 export const dataProductTechnicalAssetsTags = {
     getDataProductTechnicalAssets: {
-        providesTags: (_, __, id) => [
+        providesTags: (_, __, { dataProductId }) => [
             {
                 type: TagTypes.DataProductTechnicalAssets,
-                id: id,
+                id: dataProductId,
             },
         ],
     },
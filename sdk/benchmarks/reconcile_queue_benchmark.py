@@ -0,0 +1,64 @@
+"""Throughput benchmark of the reconcile queue against the number of queued keys.
+
+Every size enqueues that many distinct keys without delay, as the initial sync
+does, and then drains them with a pool of workers. The enqueue and dequeue
+throughput are reported per queue size; both should stay roughly flat as the
+queue grows.
+
+    task benchmark:queue
+"""
+
+import asyncio
+import os
+import time
+import uuid
+
+from sdk.provisioner.reconcile_queue import DelayingDeduplicatingQueue
+
+QUEUE_SIZES = [
+    int(size)
+    for size in os.getenv("BENCHMARK_QUEUE_SIZES", "1000,10000,50000,100000").split(",")
+]
+WORKERS = int(os.getenv("BENCHMARK_WORKERS", "8"))
+
+
+async def _drain(queue: DelayingDeduplicatingQueue[uuid.UUID], count: int) -> None:
+    remaining = count
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            key = await queue.get()
+            if key is None:
+                return
+            await queue.done(key)
+            remaining -= 1
+            if remaining == 0:
+                await queue.shutdown()
+
+    await asyncio.gather(*(worker() for _ in range(WORKERS)))
+
+
+async def _measure(size: int) -> tuple[float, float]:
+    queue: DelayingDeduplicatingQueue[uuid.UUID] = DelayingDeduplicatingQueue()
+    keys = [uuid.uuid4() for _ in range(size)]
+
+    start = time.perf_counter()
+    for key in keys:
+        await queue.add(key, delay=0.0)
+    enqueued = time.perf_counter()
+    await _drain(queue, size)
+    drained = time.perf_counter()
+
+    return size / (enqueued - start), size / (drained - enqueued)
+
+
+async def main() -> None:
+    print(f"{'keys':>10} {'enqueue/s':>12} {'dequeue/s':>12}  ({WORKERS} workers)")
+    for size in QUEUE_SIZES:
+        enqueue_rate, dequeue_rate = await _measure(size)
+        print(f"{size:>10} {enqueue_rate:>12,.0f} {dequeue_rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
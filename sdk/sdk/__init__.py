@@ -1,18 +1,24 @@
 from sdk.api_client.client import AuthenticatedClient, Client
 from sdk.auth import PortalAuth
+from sdk.provisioner.instrumentation import Instrumentation
 from sdk.provisioner.reconcile_manager import (
+    IdPage,
     ReconcileEventHandler,
     ReconcileManager,
     Reconciler,
     ResourceType,
+    SyncProgress,
 )
 
 __all__ = [
     "AuthenticatedClient",
     "Client",
+    "IdPage",
+    "Instrumentation",
     "PortalAuth",
     "Reconciler",
     "ReconcileEventHandler",
     "ReconcileManager",
     "ResourceType",
+    "SyncProgress",
 ]
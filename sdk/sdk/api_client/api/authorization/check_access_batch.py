@@ -0,0 +1,211 @@
+from http import HTTPStatus
+from typing import Any
+from urllib.parse import quote
+
+import httpx
+
+from ... import errors
+from ...client import AuthenticatedClient, Client
+from ...models.access_batch_request import AccessBatchRequest
+from ...models.access_batch_response import AccessBatchResponse
+from ...models.authorization_action import AuthorizationAction
+from ...models.http_validation_error import HTTPValidationError
+from ...types import Response
+
+
+def _get_kwargs(
+    action: AuthorizationAction,
+    *,
+    body: AccessBatchRequest,
+) -> dict[str, Any]:
+    headers: dict[str, Any] = {}
+
+    _kwargs: dict[str, Any] = {
+        "method": "post",
+        "url": "/api/v2/authz/access/{action}/batch".format(
+            action=quote(str(action), safe=""),
+        ),
+    }
+
+    _kwargs["json"] = body.to_dict()
+
+    headers["Content-Type"] = "application/json"
+
+    _kwargs["headers"] = headers
+    return _kwargs
+
+
+def _parse_response(
+    *, client: AuthenticatedClient | Client, response: httpx.Response
+) -> AccessBatchResponse | HTTPValidationError | None:
+    if response.status_code == 200:
+        response_200 = AccessBatchResponse.from_dict(response.json())
+
+        return response_200
+
+    if response.status_code == 422:
+        response_422 = HTTPValidationError.from_dict(response.json())
+
+        return response_422
+
+    if client.raise_on_unexpected_status:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    else:
+        return None
+
+
+def _build_response(
+    *, client: AuthenticatedClient | Client, response: httpx.Response
+) -> Response[AccessBatchResponse | HTTPValidationError]:
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=_parse_response(client=client, response=response),
+    )
+
+
+def sync_detailed(
+    action: AuthorizationAction,
+    *,
+    client: AuthenticatedClient | Client,
+    body: AccessBatchRequest,
+) -> Response[AccessBatchResponse | HTTPValidationError]:
+    """Check Access Batch
+
+     Checks the access of the requesting user to many resources at once.
+    The domains of the resources are looked up based on the action.
+
+    Args:
+        action (AuthorizationAction): The integer values for the authorization actions are stored
+            directly in the DB.
+            This means you can change the name of the actions, but not their integer values.
+            The values for the actions are spaced on purpose, to make it easier to extend.
+            This has no technical benefit, but it makes it easier to read for developers.
+        body (AccessBatchRequest):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[AccessBatchResponse | HTTPValidationError]
+    """
+
+    kwargs = _get_kwargs(
+        action=action,
+        body=body,
+    )
+
+    response = client.get_httpx_client().request(
+        **kwargs,
+    )
+
+    return _build_response(client=client, response=response)
+
+
+def sync(
+    action: AuthorizationAction,
+    *,
+    client: AuthenticatedClient | Client,
+    body: AccessBatchRequest,
+) -> AccessBatchResponse | HTTPValidationError | None:
+    """Check Access Batch
+
+     Checks the access of the requesting user to many resources at once.
+    The domains of the resources are looked up based on the action.
+
+    Args:
+        action (AuthorizationAction): The integer values for the authorization actions are stored
+            directly in the DB.
+            This means you can change the name of the actions, but not their integer values.
+            The values for the actions are spaced on purpose, to make it easier to extend.
+            This has no technical benefit, but it makes it easier to read for developers.
+        body (AccessBatchRequest):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        AccessBatchResponse | HTTPValidationError
+    """
+
+    return sync_detailed(
+        action=action,
+        client=client,
+        body=body,
+    ).parsed
+
+
+async def asyncio_detailed(
+    action: AuthorizationAction,
+    *,
+    client: AuthenticatedClient | Client,
+    body: AccessBatchRequest,
+) -> Response[AccessBatchResponse | HTTPValidationError]:
+    """Check Access Batch
+
+     Checks the access of the requesting user to many resources at once.
+    The domains of the resources are looked up based on the action.
+
+    Args:
+        action (AuthorizationAction): The integer values for the authorization actions are stored
+            directly in the DB.
+            This means you can change the name of the actions, but not their integer values.
+            The values for the actions are spaced on purpose, to make it easier to extend.
+            This has no technical benefit, but it makes it easier to read for developers.
+        body (AccessBatchRequest):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[AccessBatchResponse | HTTPValidationError]
+    """
+
+    kwargs = _get_kwargs(
+        action=action,
+        body=body,
+    )
+
+    response = await client.get_async_httpx_client().request(**kwargs)
+
+    return _build_response(client=client, response=response)
+
+
+async def asyncio(
+    action: AuthorizationAction,
+    *,
+    client: AuthenticatedClient | Client,
+    body: AccessBatchRequest,
+) -> AccessBatchResponse | HTTPValidationError | None:
+    """Check Access Batch
+
+     Checks the access of the requesting user to many resources at once.
+    The domains of the resources are looked up based on the action.
+
+    Args:
+        action (AuthorizationAction): The integer values for the authorization actions are stored
+            directly in the DB.
+            This means you can change the name of the actions, but not their integer values.
+            The values for the actions are spaced on purpose, to make it easier to extend.
+            This has no technical benefit, but it makes it easier to read for developers.
+        body (AccessBatchRequest):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        AccessBatchResponse | HTTPValidationError
+    """
+
+    return (
+        await asyncio_detailed(
+            action=action,
+            client=client,
+            body=body,
+        )
+    ).parsed
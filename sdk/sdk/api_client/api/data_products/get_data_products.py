@@ -14,6 +14,9 @@ from ...types import UNSET, Response, Unset
 def _get_kwargs(
     *,
     filter_to_user_with_assigment: UUID | Unset = UNSET,
+    limit: int | Unset = UNSET,
+    cursor: str | Unset = UNSET,
+    fields: str | Unset = UNSET,
 ) -> dict[str, Any]:
 
     params: dict[str, Any] = {}
@@ -23,6 +26,12 @@ def _get_kwargs(
         json_filter_to_user_with_assigment = str(filter_to_user_with_assigment)
     params["filter_to_user_with_assigment"] = json_filter_to_user_with_assigment
 
+    params["limit"] = limit
+
+    params["cursor"] = cursor
+
+    params["fields"] = fields
+
     params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
 
     _kwargs: dict[str, Any] = {
@@ -68,11 +77,17 @@ def sync_detailed(
     *,
     client: AuthenticatedClient | Client,
     filter_to_user_with_assigment: UUID | Unset = UNSET,
+    limit: int | Unset = UNSET,
+    cursor: str | Unset = UNSET,
+    fields: str | Unset = UNSET,
 ) -> Response[GetDataProductsResponse | HTTPValidationError]:
     """Get Data Products
 
     Args:
         filter_to_user_with_assigment (UUID | Unset):
+        limit (int | Unset): Return at most this many items, and a cursor to the next page
+        cursor (str | Unset): The next_cursor of the previous page
+        fields (str | Unset): Comma separated list of the item fields to return
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -84,6 +99,9 @@ def sync_detailed(
 
     kwargs = _get_kwargs(
         filter_to_user_with_assigment=filter_to_user_with_assigment,
+        limit=limit,
+        cursor=cursor,
+        fields=fields,
     )
 
     response = client.get_httpx_client().request(
@@ -97,11 +115,17 @@ def sync(
     *,
     client: AuthenticatedClient | Client,
     filter_to_user_with_assigment: UUID | Unset = UNSET,
+    limit: int | Unset = UNSET,
+    cursor: str | Unset = UNSET,
+    fields: str | Unset = UNSET,
 ) -> GetDataProductsResponse | HTTPValidationError | None:
     """Get Data Products
 
     Args:
         filter_to_user_with_assigment (UUID | Unset):
+        limit (int | Unset): Return at most this many items, and a cursor to the next page
+        cursor (str | Unset): The next_cursor of the previous page
+        fields (str | Unset): Comma separated list of the item fields to return
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -114,6 +138,9 @@ def sync(
     return sync_detailed(
         client=client,
         filter_to_user_with_assigment=filter_to_user_with_assigment,
+        limit=limit,
+        cursor=cursor,
+        fields=fields,
     ).parsed
 
 
@@ -121,11 +148,17 @@ async def asyncio_detailed(
     *,
     client: AuthenticatedClient | Client,
     filter_to_user_with_assigment: UUID | Unset = UNSET,
+    limit: int | Unset = UNSET,
+    cursor: str | Unset = UNSET,
+    fields: str | Unset = UNSET,
 ) -> Response[GetDataProductsResponse | HTTPValidationError]:
     """Get Data Products
 
     Args:
         filter_to_user_with_assigment (UUID | Unset):
+        limit (int | Unset): Return at most this many items, and a cursor to the next page
+        cursor (str | Unset): The next_cursor of the previous page
+        fields (str | Unset): Comma separated list of the item fields to return
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -137,6 +170,9 @@ async def asyncio_detailed(
 
     kwargs = _get_kwargs(
         filter_to_user_with_assigment=filter_to_user_with_assigment,
+        limit=limit,
+        cursor=cursor,
+        fields=fields,
     )
 
     response = await client.get_async_httpx_client().request(**kwargs)
@@ -148,11 +184,17 @@ async def asyncio(
     *,
     client: AuthenticatedClient | Client,
     filter_to_user_with_assigment: UUID | Unset = UNSET,
+    limit: int | Unset = UNSET,
+    cursor: str | Unset = UNSET,
+    fields: str | Unset = UNSET,
 ) -> GetDataProductsResponse | HTTPValidationError | None:
     """Get Data Products
 
     Args:
         filter_to_user_with_assigment (UUID | Unset):
+        limit (int | Unset): Return at most this many items, and a cursor to the next page
+        cursor (str | Unset): The next_cursor of the previous page
+        fields (str | Unset): Comma separated list of the item fields to return
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -166,5 +208,8 @@ async def asyncio(
         await asyncio_detailed(
             client=client,
             filter_to_user_with_assigment=filter_to_user_with_assigment,
+            limit=limit,
+            cursor=cursor,
+            fields=fields,
         )
     ).parsed
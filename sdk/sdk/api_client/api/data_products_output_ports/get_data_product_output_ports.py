@@ -11,18 +11,33 @@ from ...models.get_data_product_output_ports_response import (
     GetDataProductOutputPortsResponse,
 )
 from ...models.http_validation_error import HTTPValidationError
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
     data_product_id: UUID,
+    *,
+    limit: int | Unset = UNSET,
+    cursor: str | Unset = UNSET,
+    fields: str | Unset = UNSET,
 ) -> dict[str, Any]:
 
+    params: dict[str, Any] = {}
+
+    params["limit"] = limit
+
+    params["cursor"] = cursor
+
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
     _kwargs: dict[str, Any] = {
         "method": "get",
         "url": "/api/v2/data_products/{data_product_id}/output_ports".format(
             data_product_id=quote(str(data_product_id), safe=""),
         ),
+        "params": params,
     }
 
     return _kwargs
@@ -62,11 +77,17 @@ def sync_detailed(
     data_product_id: UUID,
     *,
     client: AuthenticatedClient | Client,
+    limit: int | Unset = UNSET,
+    cursor: str | Unset = UNSET,
+    fields: str | Unset = UNSET,
 ) -> Response[GetDataProductOutputPortsResponse | HTTPValidationError]:
     """Get Data Product Output Ports
 
     Args:
         data_product_id (UUID):
+        limit (int | Unset): Return at most this many items, and a cursor to the next page
+        cursor (str | Unset): The next_cursor of the previous page
+        fields (str | Unset): Comma separated list of the item fields to return
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -78,6 +99,9 @@ def sync_detailed(
 
     kwargs = _get_kwargs(
         data_product_id=data_product_id,
+        limit=limit,
+        cursor=cursor,
+        fields=fields,
     )
 
     response = client.get_httpx_client().request(
@@ -91,11 +115,17 @@ def sync(
     data_product_id: UUID,
     *,
     client: AuthenticatedClient | Client,
+    limit: int | Unset = UNSET,
+    cursor: str | Unset = UNSET,
+    fields: str | Unset = UNSET,
 ) -> GetDataProductOutputPortsResponse | HTTPValidationError | None:
     """Get Data Product Output Ports
 
     Args:
         data_product_id (UUID):
+        limit (int | Unset): Return at most this many items, and a cursor to the next page
+        cursor (str | Unset): The next_cursor of the previous page
+        fields (str | Unset): Comma separated list of the item fields to return
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -108,6 +138,9 @@ def sync(
     return sync_detailed(
         data_product_id=data_product_id,
         client=client,
+        limit=limit,
+        cursor=cursor,
+        fields=fields,
     ).parsed
 
 
@@ -115,11 +148,17 @@ async def asyncio_detailed(
     data_product_id: UUID,
     *,
     client: AuthenticatedClient | Client,
+    limit: int | Unset = UNSET,
+    cursor: str | Unset = UNSET,
+    fields: str | Unset = UNSET,
 ) -> Response[GetDataProductOutputPortsResponse | HTTPValidationError]:
     """Get Data Product Output Ports
 
     Args:
         data_product_id (UUID):
+        limit (int | Unset): Return at most this many items, and a cursor to the next page
+        cursor (str | Unset): The next_cursor of the previous page
+        fields (str | Unset): Comma separated list of the item fields to return
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -131,6 +170,9 @@ async def asyncio_detailed(
 
     kwargs = _get_kwargs(
         data_product_id=data_product_id,
+        limit=limit,
+        cursor=cursor,
+        fields=fields,
     )
 
     response = await client.get_async_httpx_client().request(**kwargs)
@@ -142,11 +184,17 @@ async def asyncio(
     data_product_id: UUID,
     *,
     client: AuthenticatedClient | Client,
+    limit: int | Unset = UNSET,
+    cursor: str | Unset = UNSET,
+    fields: str | Unset = UNSET,
 ) -> GetDataProductOutputPortsResponse | HTTPValidationError | None:
     """Get Data Product Output Ports
 
     Args:
         data_product_id (UUID):
+        limit (int | Unset): Return at most this many items, and a cursor to the next page
+        cursor (str | Unset): The next_cursor of the previous page
+        fields (str | Unset): Comma separated list of the item fields to return
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -160,5 +208,8 @@ async def asyncio(
         await asyncio_detailed(
             data_product_id=data_product_id,
             client=client,
+            limit=limit,
+            cursor=cursor,
+            fields=fields,
         )
     ).parsed
@@ -9,7 +9,9 @@ from ... import errors
 from ...client import AuthenticatedClient, Client
 from ...models.bitol_contract_request import BitolContractRequest
 from ...models.http_validation_error import HTTPValidationError
-from ...models.output_port_schema_response import OutputPortSchemaResponse
+from ...models.output_port_contract_ingest_response import (
+    OutputPortContractIngestResponse,
+)
 from ...types import Response
 
 
@@ -39,9 +41,9 @@ def _get_kwargs(
 
 def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
-) -> Any | HTTPValidationError | OutputPortSchemaResponse | None:
+) -> Any | HTTPValidationError | OutputPortContractIngestResponse | None:
     if response.status_code == 200:
-        response_200 = OutputPortSchemaResponse.from_dict(response.json())
+        response_200 = OutputPortContractIngestResponse.from_dict(response.json())
 
         return response_200
 
@@ -62,7 +64,7 @@ def _parse_response(
 
 def _build_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
-) -> Response[Any | HTTPValidationError | OutputPortSchemaResponse]:
+) -> Response[Any | HTTPValidationError | OutputPortContractIngestResponse]:
     return Response(
         status_code=HTTPStatus(response.status_code),
         content=response.content,
@@ -77,7 +79,7 @@ def sync_detailed(
     *,
     client: AuthenticatedClient | Client,
     body: BitolContractRequest,
-) -> Response[Any | HTTPValidationError | OutputPortSchemaResponse]:
+) -> Response[Any | HTTPValidationError | OutputPortContractIngestResponse]:
     """Ingest Output Port Contract
 
     Args:
@@ -92,7 +94,7 @@ def sync_detailed(
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[Any | HTTPValidationError | OutputPortSchemaResponse]
+        Response[Any | HTTPValidationError | OutputPortContractIngestResponse]
     """
 
     kwargs = _get_kwargs(
@@ -114,7 +116,7 @@ def sync(
     *,
     client: AuthenticatedClient | Client,
     body: BitolContractRequest,
-) -> Any | HTTPValidationError | OutputPortSchemaResponse | None:
+) -> Any | HTTPValidationError | OutputPortContractIngestResponse | None:
     """Ingest Output Port Contract
 
     Args:
@@ -129,7 +131,7 @@ def sync(
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Any | HTTPValidationError | OutputPortSchemaResponse
+        Any | HTTPValidationError | OutputPortContractIngestResponse
     """
 
     return sync_detailed(
@@ -146,7 +148,7 @@ async def asyncio_detailed(
     *,
     client: AuthenticatedClient | Client,
     body: BitolContractRequest,
-) -> Response[Any | HTTPValidationError | OutputPortSchemaResponse]:
+) -> Response[Any | HTTPValidationError | OutputPortContractIngestResponse]:
     """Ingest Output Port Contract
 
     Args:
@@ -161,7 +163,7 @@ async def asyncio_detailed(
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[Any | HTTPValidationError | OutputPortSchemaResponse]
+        Response[Any | HTTPValidationError | OutputPortContractIngestResponse]
     """
 
     kwargs = _get_kwargs(
@@ -181,7 +183,7 @@ async def asyncio(
     *,
     client: AuthenticatedClient | Client,
     body: BitolContractRequest,
-) -> Any | HTTPValidationError | OutputPortSchemaResponse | None:
+) -> Any | HTTPValidationError | OutputPortContractIngestResponse | None:
     """Ingest Output Port Contract
 
     Args:
@@ -196,7 +198,7 @@ async def asyncio(
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Any | HTTPValidationError | OutputPortSchemaResponse
+        Any | HTTPValidationError | OutputPortContractIngestResponse
     """
 
     return (
@@ -6,14 +6,31 @@ import httpx
 from ... import errors
 from ...client import AuthenticatedClient, Client
 from ...models.get_users_response import GetUsersResponse
-from ...types import Response
+from ...models.http_validation_error import HTTPValidationError
+from ...types import UNSET, Response, Unset
 
 
-def _get_kwargs() -> dict[str, Any]:
+def _get_kwargs(
+    *,
+    limit: int | Unset = UNSET,
+    cursor: str | Unset = UNSET,
+    fields: str | Unset = UNSET,
+) -> dict[str, Any]:
+
+    params: dict[str, Any] = {}
+
+    params["limit"] = limit
+
+    params["cursor"] = cursor
+
+    params["fields"] = fields
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
 
     _kwargs: dict[str, Any] = {
         "method": "get",
         "url": "/api/v2/users",
+        "params": params,
     }
 
     return _kwargs
@@ -21,12 +38,17 @@ def _get_kwargs() -> dict[str, Any]:
 
 def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
-) -> GetUsersResponse | None:
+) -> GetUsersResponse | HTTPValidationError | None:
     if response.status_code == 200:
         response_200 = GetUsersResponse.from_dict(response.json())
 
         return response_200
 
+    if response.status_code == 422:
+        response_422 = HTTPValidationError.from_dict(response.json())
+
+        return response_422
+
     if client.raise_on_unexpected_status:
         raise errors.UnexpectedStatus(response.status_code, response.content)
     else:
@@ -35,7 +57,7 @@ def _parse_response(
 
 def _build_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
-) -> Response[GetUsersResponse]:
+) -> Response[GetUsersResponse | HTTPValidationError]:
     return Response(
         status_code=HTTPStatus(response.status_code),
         content=response.content,
@@ -47,18 +69,30 @@ def _build_response(
 def sync_detailed(
     *,
     client: AuthenticatedClient | Client,
-) -> Response[GetUsersResponse]:
+    limit: int | Unset = UNSET,
+    cursor: str | Unset = UNSET,
+    fields: str | Unset = UNSET,
+) -> Response[GetUsersResponse | HTTPValidationError]:
     """Get Users
 
+    Args:
+        limit (int | Unset): Return at most this many items, and a cursor to the next page
+        cursor (str | Unset): The next_cursor of the previous page
+        fields (str | Unset): Comma separated list of the item fields to return
+
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[GetUsersResponse]
+        Response[GetUsersResponse | HTTPValidationError]
     """
 
-    kwargs = _get_kwargs()
+    kwargs = _get_kwargs(
+        limit=limit,
+        cursor=cursor,
+        fields=fields,
+    )
 
     response = client.get_httpx_client().request(
         **kwargs,
@@ -70,37 +104,60 @@ def sync_detailed(
 def sync(
     *,
     client: AuthenticatedClient | Client,
-) -> GetUsersResponse | None:
+    limit: int | Unset = UNSET,
+    cursor: str | Unset = UNSET,
+    fields: str | Unset = UNSET,
+) -> GetUsersResponse | HTTPValidationError | None:
     """Get Users
 
+    Args:
+        limit (int | Unset): Return at most this many items, and a cursor to the next page
+        cursor (str | Unset): The next_cursor of the previous page
+        fields (str | Unset): Comma separated list of the item fields to return
+
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        GetUsersResponse
+        GetUsersResponse | HTTPValidationError
     """
 
     return sync_detailed(
         client=client,
+        limit=limit,
+        cursor=cursor,
+        fields=fields,
     ).parsed
 
 
 async def asyncio_detailed(
     *,
     client: AuthenticatedClient | Client,
-) -> Response[GetUsersResponse]:
+    limit: int | Unset = UNSET,
+    cursor: str | Unset = UNSET,
+    fields: str | Unset = UNSET,
+) -> Response[GetUsersResponse | HTTPValidationError]:
     """Get Users
 
+    Args:
+        limit (int | Unset): Return at most this many items, and a cursor to the next page
+        cursor (str | Unset): The next_cursor of the previous page
+        fields (str | Unset): Comma separated list of the item fields to return
+
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[GetUsersResponse]
+        Response[GetUsersResponse | HTTPValidationError]
     """
 
-    kwargs = _get_kwargs()
+    kwargs = _get_kwargs(
+        limit=limit,
+        cursor=cursor,
+        fields=fields,
+    )
 
     response = await client.get_async_httpx_client().request(**kwargs)
 
@@ -110,19 +167,30 @@ async def asyncio_detailed(
 async def asyncio(
     *,
     client: AuthenticatedClient | Client,
-) -> GetUsersResponse | None:
+    limit: int | Unset = UNSET,
+    cursor: str | Unset = UNSET,
+    fields: str | Unset = UNSET,
+) -> GetUsersResponse | HTTPValidationError | None:
     """Get Users
 
+    Args:
+        limit (int | Unset): Return at most this many items, and a cursor to the next page
+        cursor (str | Unset): The next_cursor of the previous page
+        fields (str | Unset): Comma separated list of the item fields to return
+
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        GetUsersResponse
+        GetUsersResponse | HTTPValidationError
     """
 
     return (
         await asyncio_detailed(
             client=client,
+            limit=limit,
+            cursor=cursor,
+            fields=fields,
         )
     ).parsed
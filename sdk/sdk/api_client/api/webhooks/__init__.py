@@ -0,0 +1 @@
+"""Contains endpoint functions for accessing the API"""
@@ -4,6 +4,9 @@ from .abstract_data_product_info import AbstractDataProductInfo
 from .abstract_data_product_input_port import AbstractDataProductInputPort
 from .abstract_data_product_status import AbstractDataProductStatus
 from .abstract_data_product_type import AbstractDataProductType
+from .access_batch_request import AccessBatchRequest
+from .access_batch_response import AccessBatchResponse
+from .access_batch_response_allowed import AccessBatchResponseAllowed
 from .access_duration import AccessDuration
 from .access_duration_type import AccessDurationType
 from .access_duration_update import AccessDurationUpdate
@@ -41,6 +44,8 @@ from .cancel_input_port_for_data_product_response import (
 from .cancel_input_port_for_exploration_response import (
     CancelInputPortForExplorationResponse,
 )
+from .cloud_event import CloudEvent
+from .cloud_event_data import CloudEventData
 from .cloud_event_data_product_event import CloudEventDataProductEvent
 from .cloud_event_data_product_role_assignment_event import (
     CloudEventDataProductRoleAssignmentEvent,
@@ -210,6 +215,7 @@ from .list_global_role_assignments_response import ListGlobalRoleAssignmentsResp
 from .list_output_port_role_assignments_response import (
     ListOutputPortRoleAssignmentsResponse,
 )
+from .marketplace_statistics import MarketplaceStatistics
 from .modify_data_product_role_assignment import ModifyDataProductRoleAssignment
 from .modify_global_role_assignment import ModifyGlobalRoleAssignment
 from .modify_output_port_role_assignment import ModifyOutputPortRoleAssignment
@@ -225,6 +231,7 @@ from .output_port import OutputPort
 from .output_port_about_update import OutputPortAboutUpdate
 from .output_port_access_duration import OutputPortAccessDuration
 from .output_port_access_type import OutputPortAccessType
+from .output_port_contract_ingest_response import OutputPortContractIngestResponse
 from .output_port_curated_queries import OutputPortCuratedQueries
 from .output_port_curated_queries_update import OutputPortCuratedQueriesUpdate
 from .output_port_curated_query import OutputPortCuratedQuery
@@ -314,6 +321,7 @@ from .revoke_input_port_for_exploration_response import (
 from .revoke_output_port_as_input_port_request import RevokeOutputPortAsInputPortRequest
 from .role import Role
 from .s3_technical_asset_configuration import S3TechnicalAssetConfiguration
+from .schema_changes_response import SchemaChangesResponse
 from .schema_object_request import SchemaObjectRequest
 from .schema_object_response import SchemaObjectResponse
 from .schema_property_request import SchemaPropertyRequest
@@ -368,12 +376,16 @@ from .user_input_port import UserInputPort
 from .users_get import UsersGet
 from .validation_error import ValidationError
 from .validation_error_context import ValidationErrorContext
+from .webhook_events_get import WebhookEventsGet
 
 __all__ = (
     "AbstractDataProductInfo",
     "AbstractDataProductInputPort",
     "AbstractDataProductStatus",
     "AbstractDataProductType",
+    "AccessBatchRequest",
+    "AccessBatchResponse",
+    "AccessBatchResponseAllowed",
     "AccessDuration",
     "AccessDurationType",
     "AccessDurationUpdate",
@@ -399,6 +411,8 @@ __all__ = (
     "CanBecomeAdminUpdate",
     "CancelInputPortForDataProductResponse",
     "CancelInputPortForExplorationResponse",
+    "CloudEvent",
+    "CloudEventData",
     "CloudEventDataProductEvent",
     "CloudEventDataProductRoleAssignmentEvent",
     "CloudEventDataProductSettingValueEvent",
@@ -534,6 +548,7 @@ __all__ = (
     "ListDataProductRoleAssignmentsResponse",
     "ListGlobalRoleAssignmentsResponse",
     "ListOutputPortRoleAssignmentsResponse",
+    "MarketplaceStatistics",
     "ModifyDataProductRoleAssignment",
     "ModifyGlobalRoleAssignment",
     "ModifyOutputPortRoleAssignment",
@@ -547,6 +562,7 @@ __all__ = (
     "OutputPortAboutUpdate",
     "OutputPortAccessDuration",
     "OutputPortAccessType",
+    "OutputPortContractIngestResponse",
     "OutputPortCuratedQueries",
     "OutputPortCuratedQueriesUpdate",
     "OutputPortCuratedQuery",
@@ -606,6 +622,7 @@ __all__ = (
     "RevokeOutputPortAsInputPortRequest",
     "Role",
     "S3TechnicalAssetConfiguration",
+    "SchemaChangesResponse",
     "SchemaObjectRequest",
     "SchemaObjectResponse",
     "SchemaPropertyRequest",
@@ -656,4 +673,5 @@ __all__ = (
     "UsersGet",
     "ValidationError",
     "ValidationErrorContext",
+    "WebhookEventsGet",
 )
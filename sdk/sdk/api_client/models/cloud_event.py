@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, TypeVar
+from uuid import UUID
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+if TYPE_CHECKING:
+    from ..models.cloud_event_data import CloudEventData
+
+
+T = TypeVar("T", bound="CloudEvent")
+
+
+@_attrs_define
+class CloudEvent:
+    """
+    Attributes:
+        specversion (str):
+        id (UUID):
+        source (str):
+        type_ (str):
+        time (str):
+        sequence (str):
+        data (CloudEventData):
+    """
+
+    specversion: str
+    id: UUID
+    source: str
+    type_: str
+    time: str
+    sequence: str
+    data: CloudEventData
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        specversion = self.specversion
+
+        id = str(self.id)
+
+        source = self.source
+
+        type_ = self.type_
+
+        time = self.time
+
+        sequence = self.sequence
+
+        data = self.data.to_dict()
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        field_dict.update(
+            {
+                "specversion": specversion,
+                "id": id,
+                "source": source,
+                "type": type_,
+                "time": time,
+                "sequence": sequence,
+                "data": data,
+            }
+        )
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        from ..models.cloud_event_data import CloudEventData
+
+        d = dict(src_dict)
+        specversion = d.pop("specversion")
+
+        id = UUID(d.pop("id"))
+
+        source = d.pop("source")
+
+        type_ = d.pop("type")
+
+        time = d.pop("time")
+
+        sequence = d.pop("sequence")
+
+        data = CloudEventData.from_dict(d.pop("data"))
+
+        cloud_event = cls(
+            specversion=specversion,
+            id=id,
+            source=source,
+            type_=type_,
+            time=time,
+            sequence=sequence,
+            data=data,
+        )
+
+        cloud_event.additional_properties = d
+        return cloud_event
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import UNSET, Unset
+
 if TYPE_CHECKING:
     from ..models.get_data_products_response_item import GetDataProductsResponseItem
 
@@ -18,9 +20,11 @@ class GetDataProductsResponse:
     """
     Attributes:
         data_products (list[GetDataProductsResponseItem]):
+        next_cursor (None | str | Unset):
     """
 
     data_products: list[GetDataProductsResponseItem]
+    next_cursor: None | str | Unset = UNSET
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
@@ -29,6 +33,12 @@ class GetDataProductsResponse:
             data_products_item = data_products_item_data.to_dict()
             data_products.append(data_products_item)
 
+        next_cursor: None | str | Unset
+        if isinstance(self.next_cursor, Unset):
+            next_cursor = UNSET
+        else:
+            next_cursor = self.next_cursor
+
         field_dict: dict[str, Any] = {}
         field_dict.update(self.additional_properties)
         field_dict.update(
@@ -36,6 +46,8 @@ class GetDataProductsResponse:
                 "data_products": data_products,
             }
         )
+        if next_cursor is not UNSET:
+            field_dict["next_cursor"] = next_cursor
 
         return field_dict
 
@@ -53,8 +65,18 @@ class GetDataProductsResponse:
 
             data_products.append(data_products_item)
 
+        def _parse_next_cursor(data: object) -> None | str | Unset:
+            if data is None:
+                return data
+            if isinstance(data, Unset):
+                return data
+            return cast(None | str | Unset, data)
+
+        next_cursor = _parse_next_cursor(d.pop("next_cursor", UNSET))
+
         get_data_products_response = cls(
             data_products=data_products,
+            next_cursor=next_cursor,
         )
 
         get_data_products_response.additional_properties = d
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import UNSET, Unset
+
 if TYPE_CHECKING:
     from ..models.get_technical_assets_response_item import (
         GetTechnicalAssetsResponseItem,
@@ -20,9 +22,11 @@ class GetTechnicalAssetsResponse:
     """
     Attributes:
         technical_assets (list[GetTechnicalAssetsResponseItem]):
+        next_cursor (None | str | Unset):
     """
 
     technical_assets: list[GetTechnicalAssetsResponseItem]
+    next_cursor: None | str | Unset = UNSET
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
@@ -31,6 +35,12 @@ class GetTechnicalAssetsResponse:
             technical_assets_item = technical_assets_item_data.to_dict()
             technical_assets.append(technical_assets_item)
 
+        next_cursor: None | str | Unset
+        if isinstance(self.next_cursor, Unset):
+            next_cursor = UNSET
+        else:
+            next_cursor = self.next_cursor
+
         field_dict: dict[str, Any] = {}
         field_dict.update(self.additional_properties)
         field_dict.update(
@@ -38,6 +48,8 @@ class GetTechnicalAssetsResponse:
                 "technical_assets": technical_assets,
             }
         )
+        if next_cursor is not UNSET:
+            field_dict["next_cursor"] = next_cursor
 
         return field_dict
 
@@ -57,8 +69,18 @@ class GetTechnicalAssetsResponse:
 
             technical_assets.append(technical_assets_item)
 
+        def _parse_next_cursor(data: object) -> None | str | Unset:
+            if data is None:
+                return data
+            if isinstance(data, Unset):
+                return data
+            return cast(None | str | Unset, data)
+
+        next_cursor = _parse_next_cursor(d.pop("next_cursor", UNSET))
+
         get_technical_assets_response = cls(
             technical_assets=technical_assets,
+            next_cursor=next_cursor,
         )
 
         get_technical_assets_response.additional_properties = d
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, TypeVar
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+T = TypeVar("T", bound="MarketplaceStatistics")
+
+
+@_attrs_define
+class MarketplaceStatistics:
+    """
+    Attributes:
+        total_data_products (int):
+        total_output_ports (int):
+        total_technical_assets (int):
+        total_domains (int):
+    """
+
+    total_data_products: int
+    total_output_ports: int
+    total_technical_assets: int
+    total_domains: int
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        total_data_products = self.total_data_products
+
+        total_output_ports = self.total_output_ports
+
+        total_technical_assets = self.total_technical_assets
+
+        total_domains = self.total_domains
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        field_dict.update(
+            {
+                "total_data_products": total_data_products,
+                "total_output_ports": total_output_ports,
+                "total_technical_assets": total_technical_assets,
+                "total_domains": total_domains,
+            }
+        )
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        d = dict(src_dict)
+        total_data_products = d.pop("total_data_products")
+
+        total_output_ports = d.pop("total_output_ports")
+
+        total_technical_assets = d.pop("total_technical_assets")
+
+        total_domains = d.pop("total_domains")
+
+        marketplace_statistics = cls(
+            total_data_products=total_data_products,
+            total_output_ports=total_output_ports,
+            total_technical_assets=total_technical_assets,
+            total_domains=total_domains,
+        )
+
+        marketplace_statistics.additional_properties = d
+        return marketplace_statistics
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
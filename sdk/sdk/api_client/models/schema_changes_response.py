@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, TypeVar, cast
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+from ..types import UNSET, Unset
+
+T = TypeVar("T", bound="SchemaChangesResponse")
+
+
+@_attrs_define
+class SchemaChangesResponse:
+    """Paths (`object.property.nested_property`) of what an ingest changed.
+    `unchanged` is set when the contract was ingested before as is.
+
+        Attributes:
+            unchanged (bool | Unset):  Default: False.
+            added (list[str] | Unset):
+            removed (list[str] | Unset):
+            changed (list[str] | Unset):
+    """
+
+    unchanged: bool | Unset = False
+    added: list[str] | Unset = UNSET
+    removed: list[str] | Unset = UNSET
+    changed: list[str] | Unset = UNSET
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        unchanged = self.unchanged
+
+        added: list[str] | Unset = UNSET
+        if not isinstance(self.added, Unset):
+            added = self.added
+
+        removed: list[str] | Unset = UNSET
+        if not isinstance(self.removed, Unset):
+            removed = self.removed
+
+        changed: list[str] | Unset = UNSET
+        if not isinstance(self.changed, Unset):
+            changed = self.changed
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        field_dict.update({})
+        if unchanged is not UNSET:
+            field_dict["unchanged"] = unchanged
+        if added is not UNSET:
+            field_dict["added"] = added
+        if removed is not UNSET:
+            field_dict["removed"] = removed
+        if changed is not UNSET:
+            field_dict["changed"] = changed
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        d = dict(src_dict)
+        unchanged = d.pop("unchanged", UNSET)
+
+        added = cast(list[str], d.pop("added", UNSET))
+
+        removed = cast(list[str], d.pop("removed", UNSET))
+
+        changed = cast(list[str], d.pop("changed", UNSET))
+
+        schema_changes_response = cls(
+            unchanged=unchanged,
+            added=added,
+            removed=removed,
+            changed=changed,
+        )
+
+        schema_changes_response.additional_properties = d
+        return schema_changes_response
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
@@ -0,0 +1,77 @@
+"""Iterators over the paginated list endpoints of the portal API.
+
+```python
+from sdk.api_client.api.data_products import get_data_products
+from sdk.pagination import paginate
+
+for data_product in paginate(get_data_products, "data_products", client=client):
+    ...
+```
+
+Pages are requested one at a time as the iterator is consumed, following the
+`next_cursor` of each page until the last one.
+"""
+
+from collections.abc import AsyncIterator, Iterator
+from types import ModuleType
+from typing import Any
+
+from sdk.api_client.client import AuthenticatedClient, Client
+from sdk.api_client.errors import UnexpectedStatus
+from sdk.api_client.types import UNSET, Response, Unset
+
+DEFAULT_PAGE_SIZE = 100
+
+
+def paginate(
+    endpoint: ModuleType,
+    items: str,
+    *,
+    client: AuthenticatedClient | Client,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    **kwargs: Any,
+) -> Iterator[Any]:
+    """Yields the `items` of every page of a list endpoint module, such as
+    `get_data_products`. Other keyword arguments are passed to the endpoint.
+    """
+    cursor: str | Unset = UNSET
+    while True:
+        response = endpoint.sync_detailed(
+            client=client, limit=page_size, cursor=cursor, **kwargs
+        )
+        page = _parse(response, items)
+        yield from getattr(page, items)
+        if not (cursor := _next_cursor(page)):
+            return
+
+
+async def apaginate(
+    endpoint: ModuleType,
+    items: str,
+    *,
+    client: AuthenticatedClient | Client,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    **kwargs: Any,
+) -> AsyncIterator[Any]:
+    """Async version of `paginate`."""
+    cursor: str | Unset = UNSET
+    while True:
+        response = await endpoint.asyncio_detailed(
+            client=client, limit=page_size, cursor=cursor, **kwargs
+        )
+        page = _parse(response, items)
+        for item in getattr(page, items):
+            yield item
+        if not (cursor := _next_cursor(page)):
+            return
+
+
+def _parse(response: Response[Any], items: str) -> Any:
+    if not hasattr(response.parsed, items):
+        raise UnexpectedStatus(response.status_code, response.content)
+    return response.parsed
+
+
+def _next_cursor(page: Any) -> str | Unset:
+    cursor = page.next_cursor
+    return cursor if isinstance(cursor, str) else UNSET
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from contextlib import AbstractContextManager, ExitStack, nullcontext
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+if TYPE_CHECKING:
+    from sdk.provisioner.reconcile_manager import ResourceType
+
+
+class Instrumentation:
+    """Receives the measurements of a :class:`ReconcileManager` and its queue.
+
+    Every method does nothing by default; implementations override the ones they
+    export. See :class:`~sdk.provisioner.prometheus.PrometheusInstrumentation` and
+    :class:`~sdk.provisioner.tracing.OpenTelemetryInstrumentation`. Methods are
+    called from the event loop of the manager and must not block.
+    """
+
+    def queue_depth(self, waiting: int, in_flight: int, dirty: int) -> None:
+        """Report the number of waiting, in-flight and dirty keys in the queue."""
+
+    def dequeued(self, resource_type: ResourceType, time_in_queue: float) -> None:
+        """Report a key handed to a worker ``time_in_queue`` seconds after it was
+        ready.
+        """
+
+    def reconciled(
+        self,
+        resource_type: ResourceType,
+        duration: float,
+        succeeded: int,
+        failed: int,
+    ) -> None:
+        """Report a reconcile call that took ``duration`` seconds.
+
+        A batched call reports all of its ids; a single reconcile reports one.
+        Called within the :meth:`span` of the call.
+        """
+
+    def requeued(self, resource_type: ResourceType, delay: float) -> None:
+        """Report a failed key retried with a backoff of ``delay`` seconds."""
+
+    def span(
+        self, resource_type: ResourceType, resource_ids: Sequence[UUID]
+    ) -> AbstractContextManager[object]:
+        """Context wrapping a reconcile call for ``resource_ids``."""
+        return nullcontext()
+
+
+class CombinedInstrumentation(Instrumentation):
+    """Reports every measurement to each of several instrumentations, e.g. to
+    export metrics to Prometheus and traces with OpenTelemetry.
+    """
+
+    def __init__(self, *instrumentations: Instrumentation) -> None:
+        self._instrumentations = instrumentations
+
+    def queue_depth(self, waiting: int, in_flight: int, dirty: int) -> None:
+        for instrumentation in self._instrumentations:
+            instrumentation.queue_depth(waiting, in_flight, dirty)
+
+    def dequeued(self, resource_type: ResourceType, time_in_queue: float) -> None:
+        for instrumentation in self._instrumentations:
+            instrumentation.dequeued(resource_type, time_in_queue)
+
+    def reconciled(
+        self,
+        resource_type: ResourceType,
+        duration: float,
+        succeeded: int,
+        failed: int,
+    ) -> None:
+        for instrumentation in self._instrumentations:
+            instrumentation.reconciled(resource_type, duration, succeeded, failed)
+
+    def requeued(self, resource_type: ResourceType, delay: float) -> None:
+        for instrumentation in self._instrumentations:
+            instrumentation.requeued(resource_type, delay)
+
+    def span(
+        self, resource_type: ResourceType, resource_ids: Sequence[UUID]
+    ) -> AbstractContextManager[object]:
+        stack = ExitStack()
+        for instrumentation in self._instrumentations:
+            stack.enter_context(instrumentation.span(resource_type, resource_ids))
+        return stack
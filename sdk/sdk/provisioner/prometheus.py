@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Gauge, Histogram
+
+from sdk.provisioner.instrumentation import Instrumentation
+
+if TYPE_CHECKING:
+    from sdk.provisioner.reconcile_manager import ResourceType
+
+# Covers reconciles from a quick API call up to a slow cloud provisioning run.
+DURATION_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+
+class PrometheusInstrumentation(Instrumentation):
+    """Exports the reconcile queue and worker metrics with ``prometheus_client``.
+
+    Requires the ``prometheus-client`` package. Workers that keep up show a low
+    ``reconcile_queue_duration_seconds``; when it grows while reconciles are not
+    getting slower, add workers.
+    """
+
+    def __init__(
+        self,
+        registry: CollectorRegistry = REGISTRY,
+        namespace: str = "dpp_provisioner",
+    ) -> None:
+        self._depth = Gauge(
+            "reconcile_queue_depth",
+            "Keys in the reconcile queue by state",
+            ["state"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self._time_in_queue = Histogram(
+            "reconcile_queue_duration_seconds",
+            "Seconds a ready key waited for a worker",
+            ["resource_type"],
+            namespace=namespace,
+            registry=registry,
+            buckets=DURATION_BUCKETS,
+        )
+        self._duration = Histogram(
+            "reconcile_duration_seconds",
+            "Seconds spent in a reconcile call",
+            ["resource_type"],
+            namespace=namespace,
+            registry=registry,
+            buckets=DURATION_BUCKETS,
+        )
+        self._reconciles = Counter(
+            "reconciles",
+            "Reconciled resources by result",
+            ["resource_type", "result"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self._requeues = Counter(
+            "reconcile_requeues",
+            "Failed resources retried with backoff",
+            ["resource_type"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self._backoff = Counter(
+            "reconcile_backoff_seconds",
+            "Seconds of backoff before retrying failed resources",
+            ["resource_type"],
+            namespace=namespace,
+            registry=registry,
+        )
+
+    def queue_depth(self, waiting: int, in_flight: int, dirty: int) -> None:
+        self._depth.labels("waiting").set(waiting)
+        self._depth.labels("in_flight").set(in_flight)
+        self._depth.labels("dirty").set(dirty)
+
+    def dequeued(self, resource_type: ResourceType, time_in_queue: float) -> None:
+        self._time_in_queue.labels(resource_type.value).observe(time_in_queue)
+
+    def reconciled(
+        self,
+        resource_type: ResourceType,
+        duration: float,
+        succeeded: int,
+        failed: int,
+    ) -> None:
+        self._duration.labels(resource_type.value).observe(duration)
+        if succeeded:
+            self._reconciles.labels(resource_type.value, "success").inc(succeeded)
+        if failed:
+            self._reconciles.labels(resource_type.value, "failure").inc(failed)
+
+    def requeued(self, resource_type: ResourceType, delay: float) -> None:
+        self._requeues.labels(resource_type.value).inc()
+        self._backoff.labels(resource_type.value).inc(delay)
@@ -2,8 +2,18 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from abc import ABC, abstractmethod
-from collections.abc import Iterable, Mapping
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum
 from uuid import UUID
@@ -21,6 +31,7 @@ from sdk.api_client.models import (
     TechnicalAssetEvent,
 )
 from sdk.provisioner.event_handler import AbstractEventHandler
+from sdk.provisioner.instrumentation import Instrumentation
 from sdk.provisioner.reconcile_queue import (
     DEFAULT_DELAY,
     DelayingDeduplicatingQueue,
@@ -30,6 +41,7 @@ from sdk.provisioner.reconcile_queue import (
 logger = logging.getLogger(__name__)
 
 INITIAL_SYNC_MAX_BACKOFF: float = 60.0
+INITIAL_SYNC_HIGH_WATER_MARK: int = 1000
 
 
 class ResourceType(str, Enum):
@@ -47,14 +59,48 @@ class ReconcileKey:
     id: UUID
 
 
+@dataclass(frozen=True)
+class IdPage:
+    """One page of resource ids returned by :meth:`Reconciler.list_ids_page`."""
+
+    ids: Sequence[UUID]
+    # Cursor of the following page; None on the last page.
+    next_cursor: str | None = None
+
+
+@dataclass
+class SyncProgress:
+    """Progress of the initial sync of one resource type.
+
+    ``reconciled`` counts the enqueued ids that have since been reconciled
+    successfully, so the sync is finished once it catches up with ``enqueued``.
+    """
+
+    listed: int = 0
+    enqueued: int = 0
+    reconciled: int = 0
+    listing_complete: bool = False
+
+    @property
+    def done(self) -> bool:
+        return self.listing_complete and self.reconciled == self.enqueued
+
+
 class Reconciler(ABC):
     """Level-based reconciler for a single resource type.
 
     Implementations receive only the resource id and are expected to re-fetch the
     current state of the resource themselves, making reconciliation idempotent and
     resilient to coalesced events.
+
+    Set ``batch_size`` above 1 to have :meth:`reconcile_batch` called with up to that
+    many ready ids at once, e.g. to use the bulk operations of a cloud API. A worker
+    waits up to ``batch_linger`` seconds for a batch to fill.
     """
 
+    batch_size: int = 1
+    batch_linger: float = 0.0
+
     @abstractmethod
     async def reconcile(self, resource_id: UUID):
         """Reconcile the resource identified by ``resource_id``.
@@ -63,17 +109,49 @@ class Reconciler(ABC):
         """
         raise NotImplementedError
 
+    async def reconcile_batch(self, resource_ids: Sequence[UUID]) -> Iterable[UUID]:
+        """Reconcile several resources, returning the ids that failed and should be
+        retried. When an exception is raised, the whole batch is retried.
+
+        The default reconciles each id in turn with :meth:`reconcile`.
+        """
+        failed = []
+        for resource_id in resource_ids:
+            try:
+                await self.reconcile(resource_id)
+            except Exception:
+                logger.exception("Reconcile failed for %s", resource_id)
+                failed.append(resource_id)
+        return failed
+
     async def list_ids(self) -> Iterable[UUID]:
         """Return the ids of every resource this reconciler is responsible for.
 
         Called once when the :class:`ReconcileManager` starts so that every existing
         resource is reconciled on startup, independent of any webhook events.
-        Implementations are expected to fetch the current set of ids.
+        Implementations are expected to fetch the current set of ids. It may also
+        be an async generator, yielding ids as they are fetched; they are enqueued
+        as they arrive. A failed listing is started over.
 
         The default returns an empty iterable, which disables the startup resync.
         """
         return []
 
+    async def list_ids_page(self, cursor: str | None) -> IdPage | None:
+        """Return the page of resource ids at ``cursor``, ``None`` for the first.
+
+        Implement this instead of :meth:`list_ids` for listings that are paged with
+        cursors: a failed page is retried with the same cursor, so the initial sync
+        resumes where it stopped rather than listing everything again.
+
+        The default returns ``None``, which lists the ids with :meth:`list_ids`.
+        """
+        return None
+
+
+def _resource_type(key: ReconcileKey) -> ResourceType:
+    return key.resource_type
+
 
 class ReconcileManager:
     """Drives one or more :class:`Reconciler` from a shared work queue.
@@ -83,6 +161,20 @@ class ReconcileManager:
     type, so the manager hands it to the matching reconciler. A given key is never
     reconciled by two workers concurrently (guaranteed by the queue's in-flight
     tracking). Failures and explicit requeues are retried with exponential backoff.
+
+    On start, the ids listed by every reconciler are enqueued for an initial sync.
+    Listing is paused while ``sync_high_water_mark`` keys are queued, so memory
+    stays bounded however many resources exist; :attr:`sync_progress` reports how
+    far the sync got.
+
+    Queue depth, time in queue, reconcile durations and backoffs are reported to
+    ``instrumentation``, e.g. a
+    :class:`~sdk.provisioner.prometheus.PrometheusInstrumentation`.
+
+    For reconcilers with a ``batch_size`` above 1, a worker takes the ready keys of
+    the same resource type along with the first one and hands them over in a single
+    :meth:`Reconciler.reconcile_batch` call. Every key in the batch stays in flight
+    until the call returns.
     """
 
     def __init__(
@@ -92,29 +184,48 @@ class ReconcileManager:
         default_delay: float = DEFAULT_DELAY,
         num_workers: int = 1,
         rate_limiter: RateLimiter[ReconcileKey] | None = None,
+        sync_high_water_mark: int = INITIAL_SYNC_HIGH_WATER_MARK,
+        instrumentation: Instrumentation | None = None,
     ) -> None:
         self._reconcilers: dict[ResourceType, Reconciler] = dict(reconcilers or {})
         self._queue: DelayingDeduplicatingQueue[ReconcileKey] = (
-            DelayingDeduplicatingQueue[ReconcileKey](default_delay=default_delay)
+            DelayingDeduplicatingQueue[ReconcileKey](
+                default_delay=default_delay, partition=_resource_type
+            )
         )
 
         self._rate_limiter = rate_limiter if rate_limiter else RateLimiter()
+        self._instrumentation = (
+            instrumentation if instrumentation else Instrumentation()
+        )
         self._workers: list[asyncio.Task[None]] = []
         self._initial_sync_task: asyncio.Task[None] | None = None
         if num_workers < 1:
             raise ValueError("num_workers must be >= 1")
         self._num_workers = num_workers
+        if sync_high_water_mark < 1:
+            raise ValueError("sync_high_water_mark must be >= 1")
+        self._sync_high_water_mark = sync_high_water_mark
+        self._sync_progress: dict[ResourceType, SyncProgress] = {}
+        # Keys enqueued by the initial sync and not reconciled successfully yet.
+        self._sync_pending: set[ReconcileKey] = set()
 
     @property
     def queue(self) -> DelayingDeduplicatingQueue[ReconcileKey]:
         return self._queue
 
+    @property
+    def sync_progress(self) -> Mapping[ResourceType, SyncProgress]:
+        """Initial sync progress of each resource type whose listing has started."""
+        return self._sync_progress
+
     def has_reconciler(self, resource_type: ResourceType) -> bool:
         """Return whether a reconciler is registered for ``resource_type``."""
         return resource_type in self._reconcilers
 
     async def enqueue(self, resource_type: ResourceType, resource_id: UUID) -> None:
         await self._queue.add(ReconcileKey(resource_type, resource_id))
+        self._observe_queue()
 
     def start(self) -> None:
         """This methods starts the reconciler and makes it active"""
@@ -143,7 +254,8 @@ class ReconcileManager:
 
         Each registered reconciler is listed in turn; listing is retried with
         exponential backoff so a transiently broken listing (e.g. the portal being
-        briefly unavailable) doesn't drop the startup resync.
+        briefly unavailable) doesn't drop the startup resync. Ids are enqueued as
+        they are listed, waiting while the queue is at its high-water mark.
         """
         for resource_type, reconciler in self._reconcilers.items():
             await self._initial_sync_one(resource_type, reconciler)
@@ -151,47 +263,117 @@ class ReconcileManager:
     async def _initial_sync_one(
         self, resource_type: ResourceType, reconciler: Reconciler
     ) -> None:
+        progress = self._sync_progress[resource_type] = SyncProgress()
+        async for resource_id in self._list_ids(resource_type, reconciler):
+            progress.listed += 1
+            await self._queue.wait_below(self._sync_high_water_mark)
+            key = ReconcileKey(resource_type, resource_id)
+            if key not in self._sync_pending:
+                self._sync_pending.add(key)
+                progress.enqueued += 1
+            await self._queue.add(key, delay=0)
+            self._observe_queue()
+        progress.listing_complete = True
+        logger.info(
+            "Initial sync enqueued %d %s resource(s)",
+            progress.enqueued,
+            resource_type.value,
+        )
+
+    async def _list_ids(
+        self, resource_type: ResourceType, reconciler: Reconciler
+    ) -> AsyncIterator[UUID]:
+        """Every id listed by ``reconciler``, retrying failures with backoff.
+
+        A paged listing resumes at the page that failed; any other listing starts
+        over, listing the ids before the failure again.
+        """
         attempt = 0
+        cursor: str | None = None
         while True:
             try:
-                ids = await reconciler.list_ids()
+                page = await reconciler.list_ids_page(cursor)
             except Exception:
-                delay = min(2.0 ** (attempt - 1), INITIAL_SYNC_MAX_BACKOFF)
                 logger.exception(
-                    "Initial sync listing for %s failed (attempt %d), retrying in %.1fs",
+                    "Initial sync listing for %s failed (attempt %d)",
                     resource_type.value,
                     attempt,
-                    delay,
                 )
-                await asyncio.sleep(delay)
-                attempt += 1
+                attempt = await self._listing_backoff(attempt)
                 continue
+            if page is None:
+                break
+            attempt = 0
+            for resource_id in page.ids:
+                yield resource_id
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
 
-            count = 0
-            for resource_id in ids:
-                await self._queue.add(ReconcileKey(resource_type, resource_id), delay=0)
-                count += 1
+        ids = _iterate_ids(reconciler.list_ids())
+        while True:
+            try:
+                resource_id = await anext(ids)
+            except StopAsyncIteration:
+                return
+            except Exception:
+                logger.exception(
+                    "Initial sync listing for %s failed (attempt %d)",
+                    resource_type.value,
+                    attempt,
+                )
+                attempt = await self._listing_backoff(attempt)
+                ids = _iterate_ids(reconciler.list_ids())
+                continue
+            attempt = 0
+            yield resource_id
+
+    async def _listing_backoff(self, attempt: int) -> int:
+        """Sleep before retrying a failed listing, returning the next attempt."""
+        await asyncio.sleep(min(2.0 ** (attempt - 1), INITIAL_SYNC_MAX_BACKOFF))
+        return attempt + 1
+
+    def _reconciled(self, key: ReconcileKey) -> None:
+        self._rate_limiter.forget(key)
+        if key not in self._sync_pending:
+            return
+        self._sync_pending.discard(key)
+        progress = self._sync_progress[key.resource_type]
+        progress.reconciled += 1
+        if progress.done:
             logger.info(
-                "Initial sync enqueued %d %s resource(s)", count, resource_type.value
+                "Initial sync reconciled %d %s resource(s)",
+                progress.reconciled,
+                key.resource_type.value,
             )
-            return
 
     async def _worker_loop(self) -> None:
         while True:
             key = await self._queue.get()
             if key is None:
                 return
+            keys = [key]
             try:
-                await self._process(key)
+                reconciler = self._reconcilers.get(key.resource_type)
+                if reconciler is not None and reconciler.batch_size > 1:
+                    keys += await self._get_batch(reconciler, key)
+                    self._observe_dequeued(keys)
+                    await self._process_batch(reconciler, keys)
+                else:
+                    self._observe_dequeued(keys)
+                    await self._process(key)
             finally:
-                await self._queue.done(key)
+                for done in keys:
+                    await self._queue.done(done)
+                self._observe_queue()
 
     async def _process(self, key: ReconcileKey) -> None:
         reconciler = self._reconcilers.get(key.resource_type)
         if reconciler is None:
             return
         try:
-            await reconciler.reconcile(key.id)
+            with self._observe_reconcile(key.resource_type, [key.id]):
+                await reconciler.reconcile(key.id)
         except Exception:
             logger.exception(
                 "Reconcile failed for %s %s", key.resource_type.value, key.id
@@ -199,12 +381,98 @@ class ReconcileManager:
             await self._requeue_with_backoff(key)
             return
 
-        self._rate_limiter.forget(key)
+        self._reconciled(key)
+
+    async def _get_batch(
+        self, reconciler: Reconciler, key: ReconcileKey
+    ) -> list[ReconcileKey]:
+        """Ready keys of the same resource type, to reconcile along with ``key``."""
+        return await self._queue.get_ready(
+            key.resource_type,
+            reconciler.batch_size - 1,
+            linger=reconciler.batch_linger,
+        )
+
+    async def _process_batch(
+        self, reconciler: Reconciler, keys: list[ReconcileKey]
+    ) -> None:
+        ids = [key.id for key in keys]
+        try:
+            with self._observe_reconcile(keys[0].resource_type, ids) as failed:
+                failed.update(
+                    set(await reconciler.reconcile_batch(ids)).intersection(ids)
+                )
+        except Exception:
+            logger.exception(
+                "Reconcile failed for a batch of %d %s resource(s)",
+                len(keys),
+                keys[0].resource_type.value,
+            )
+            failed = set(ids)
+
+        for key in keys:
+            if key.id in failed:
+                await self._requeue_with_backoff(key)
+            else:
+                self._reconciled(key)
 
     async def _requeue_with_backoff(self, key: ReconcileKey) -> None:
         delay = self._rate_limiter.when(key)
+        self._instrumentation.requeued(key.resource_type, delay)
         await self._queue.add_after(key, delay)
 
+    @contextmanager
+    def _observe_reconcile(
+        self, resource_type: ResourceType, resource_ids: Sequence[UUID]
+    ) -> Iterator[set[UUID]]:
+        """Wrap a reconcile call in a span of the instrumentation and report its
+        duration. The ids that failed are added to the yielded set; an exception
+        fails them all.
+        """
+        failed: set[UUID] = set()
+        started = time.monotonic()
+        with self._instrumentation.span(resource_type, resource_ids):
+            try:
+                yield failed
+            except Exception:
+                failed.update(resource_ids)
+                raise
+            finally:
+                self._instrumentation.reconciled(
+                    resource_type,
+                    time.monotonic() - started,
+                    succeeded=len(resource_ids) - len(failed),
+                    failed=len(failed),
+                )
+
+    def _observe_dequeued(self, keys: list[ReconcileKey]) -> None:
+        for key in keys:
+            self._instrumentation.dequeued(
+                key.resource_type, self._queue.time_in_queue(key)
+            )
+        self._observe_queue()
+
+    def _observe_queue(self) -> None:
+        self._instrumentation.queue_depth(
+            waiting=self._queue.num_waiting(),
+            in_flight=self._queue.num_in_flight(),
+            dirty=self._queue.num_dirty(),
+        )
+
+
+async def _iterate_ids(
+    listing: Awaitable[Iterable[UUID]] | AsyncIterable[UUID],
+) -> AsyncIterator[UUID]:
+    """Iterate the result of :meth:`Reconciler.list_ids`, whether a coroutine
+    returning the ids or an async generator yielding them.
+    """
+    if isinstance(listing, AsyncIterable):
+        async for resource_id in listing:
+            yield resource_id
+    else:
+        for resource_id in await listing:
+            yield resource_id
+
 
 class ReconcileEventHandler(AbstractEventHandler):
     """Webhook handler that enqueues a reconcile for each supported portal event.
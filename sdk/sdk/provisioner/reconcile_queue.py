@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
+import itertools
 import logging
 import time
-from collections.abc import Hashable
+from collections.abc import Callable, Hashable
 from typing import Generic, TypeVar
 
 logger = logging.getLogger(__name__)
@@ -55,6 +57,10 @@ class RateLimiter(Generic[KeyT]):
         self._failures.pop(key, None)
 
 
+def _single_partition(key: Hashable) -> None:
+    return None
+
+
 class DelayingDeduplicatingQueue(Generic[KeyT]):
     """An asyncio work queue keyed by an arbitrary hashable key.
 
@@ -68,17 +74,47 @@ class DelayingDeduplicatingQueue(Generic[KeyT]):
       not be returned again until :meth:`done` is called for it. If the key is added
       again while processing, it is remembered as "dirty" and re-queued immediately
       once :meth:`done` runs.
+
+    Waiting keys are ordered in a min-heap on their ready time per ``partition``
+    of the keys, so ``add`` costs O(log n) and ``get`` O(p + log n) for p
+    partitions, and :meth:`get_ready` only touches the keys of its partition.
+    Shortening the ready time of a waiting key pushes a new heap entry, the
+    outdated one is skipped once it reaches the top. Every newly waiting key wakes
+    a single worker, and a worker taking a key wakes the next one while more keys
+    are ready.
     """
 
-    def __init__(self, default_delay: float = DEFAULT_DELAY) -> None:
+    def __init__(
+        self,
+        default_delay: float = DEFAULT_DELAY,
+        partition: Callable[[KeyT], Hashable] | None = None,
+    ) -> None:
         self._default_delay = default_delay
-        # key -> time at which the key becomes eligible for processing.
-        self._waiting: dict[KeyT, float] = {}
-        # keys currently handed out to a worker (in flight).
-        self._processing: set[KeyT] = set()
+        self._partition: Callable[[KeyT], Hashable] = (
+            partition if partition else _single_partition
+        )
+        # key -> (time at which the key becomes eligible for processing,
+        # insertion order) of its current heap entry.
+        self._waiting: dict[KeyT, tuple[float, int]] = {}
+        # partition -> heap of (ready time, insertion order, key); entries that no
+        # longer match _waiting are outdated and skipped. Keys need not be orderable.
+        self._heaps: dict[Hashable, list[tuple[float, int, KeyT]]] = {}
+        # partition -> number of its keys that are waiting.
+        self._sizes: dict[Hashable, int] = {}
+        self._sequence = itertools.count()
+        # key currently handed out to a worker (in flight) -> seconds it waited
+        # for a worker after becoming ready.
+        self._processing: dict[KeyT, float] = {}
         # keys re-added while in flight; re-queued on done().
         self._dirty: set[KeyT] = set()
-        self._cond = asyncio.Condition()
+        lock = asyncio.Lock()
+        self._cond = asyncio.Condition(lock)
+        # Notified whenever a key leaves the queue, for producers waiting on space.
+        self._drained = asyncio.Condition(lock)
+        # partition -> notified when one of its keys is added, for get_ready; kept
+        # apart from _cond so lingering batches do not take wake-ups from get.
+        self._batching: dict[Hashable, asyncio.Condition] = {}
+        self._lock = lock
         self._shutdown = False
 
     @property
@@ -99,9 +135,8 @@ class DelayingDeduplicatingQueue(Generic[KeyT]):
                 return
             existing = self._waiting.get(key)
             # Coalesce: keep the earliest ready time so an explicit shorter delay wins.
-            if existing is None or ready_at < existing:
-                self._waiting[key] = ready_at
-            self._cond.notify_all()
+            if existing is None or ready_at < existing[0]:
+                self._schedule(key, ready_at)
 
     async def add_after(self, key: KeyT, delay: float) -> None:
         """Explicit delayed add; alias for :meth:`add` used by retry/backoff paths."""
@@ -117,54 +152,167 @@ class DelayingDeduplicatingQueue(Generic[KeyT]):
                 if self._shutdown and not self._waiting:
                     return None
 
+                partition, next_ready = self._peek_any()
                 now = time.monotonic()
-                ready_key: KeyT | None = None
-                next_ready: float | None = None
-                for candidate, ready_at in self._waiting.items():
-                    if ready_at <= now:
-                        if ready_key is None or ready_at < self._waiting[ready_key]:
-                            ready_key = candidate
-                    else:
-                        next_ready = (
-                            ready_at
-                            if next_ready is None
-                            else min(next_ready, ready_at)
-                        )
-
-                if ready_key is not None:
-                    del self._waiting[ready_key]
-                    self._processing.add(ready_key)
-                    return ready_key
+                if next_ready is not None and next_ready <= now:
+                    key = self._pop(partition, now)
+                    # Hand over to another worker while more keys are ready.
+                    _, following = self._peek_any()
+                    if following is not None and following <= now:
+                        self._cond.notify(1)
+                    return key
 
                 # Nothing ready yet: wait until the next ready time or a new add.
                 if next_ready is not None:
-                    timeout = max(next_ready - time.monotonic(), 0.0)
                     try:
-                        await asyncio.wait_for(self._cond.wait(), timeout=timeout)
+                        await asyncio.wait_for(
+                            self._cond.wait(), timeout=next_ready - now
+                        )
                     except asyncio.TimeoutError:
                         pass
                 else:
                     await self._cond.wait()
 
+    async def get_ready(
+        self, partition: Hashable, limit: int, linger: float = 0.0
+    ) -> list[KeyT]:
+        """Take up to ``limit`` more eligible keys of ``partition``, marked in
+        flight like :meth:`get`, without blocking for the first one.
+
+        Waits up to ``linger`` seconds for more keys of the partition while fewer
+        than ``limit`` were found, to build larger batches.
+        """
+        taken: list[KeyT] = []
+        deadline = time.monotonic() + max(linger, 0.0)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while len(taken) < limit:
+                    next_ready = self._peek(partition)
+                    if next_ready is None or next_ready > now:
+                        break
+                    taken.append(self._pop(partition, now))
+                remaining = deadline - now
+                if len(taken) >= limit or self._shutdown or remaining <= 0:
+                    return taken
+                next_ready = self._peek(partition)
+                timeout = (
+                    remaining
+                    if next_ready is None
+                    else min(remaining, max(next_ready - now, 0.0))
+                )
+                batching = self._batching.setdefault(
+                    partition, asyncio.Condition(self._lock)
+                )
+                try:
+                    await asyncio.wait_for(batching.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
+
     async def done(self, key: KeyT) -> None:
         """Mark an in-flight ``key`` as finished.
 
         If the key was re-added while in flight it is immediately re-queued.
         """
         async with self._cond:
-            self._processing.discard(key)
+            self._processing.pop(key, None)
             if key in self._dirty:
                 self._dirty.discard(key)
                 if key not in self._waiting:
-                    self._waiting[key] = time.monotonic()
-                self._cond.notify_all()
+                    self._schedule(key, time.monotonic())
+                else:
+                    self._cond.notify(1)
+            else:
+                self._drained.notify_all()
+
+    async def wait_below(self, size: int) -> None:
+        """Block until fewer than ``size`` keys are waiting or in flight, or the
+        queue is shut down.
+        """
+        async with self._drained:
+            while self.qsize() >= size and not self._shutdown:
+                await self._drained.wait()
 
     async def shutdown(self) -> None:
         """Stop the queue and wake up all waiting workers."""
         async with self._cond:
             self._shutdown = True
             self._cond.notify_all()
+            self._drained.notify_all()
+            for batching in self._batching.values():
+                batching.notify_all()
 
     def qsize(self) -> int:
         """Number of keys currently waiting or in flight."""
         return len(self._waiting) + len(self._processing)
+
+    def num_waiting(self) -> int:
+        """Number of keys waiting to be handed out, ready or not."""
+        return len(self._waiting)
+
+    def num_in_flight(self) -> int:
+        """Number of keys handed out to a worker and not done yet."""
+        return len(self._processing)
+
+    def num_dirty(self) -> int:
+        """Number of in-flight keys that were added again, to re-queue on done."""
+        return len(self._dirty)
+
+    def time_in_queue(self, key: KeyT) -> float:
+        """Seconds the in-flight ``key`` waited for a worker once it was ready.
+
+        The delay it was added with is not included, so this measures how far the
+        workers lag behind. Returns 0 for keys that are not in flight.
+        """
+        return self._processing.get(key, 0.0)
+
+    def _schedule(self, key: KeyT, ready_at: float) -> None:
+        """Make ``key`` wait until ``ready_at`` and wake a worker that can take it."""
+        partition = self._partition(key)
+        if key not in self._waiting:
+            self._sizes[partition] = self._sizes.get(partition, 0) + 1
+        sequence = next(self._sequence)
+        self._waiting[key] = (ready_at, sequence)
+        heap = self._heaps.setdefault(partition, [])
+        heapq.heappush(heap, (ready_at, sequence, key))
+        # Rebuild once outdated entries outnumber the waiting keys, so memory
+        # stays proportional to the queue size.
+        if len(heap) > 2 * self._sizes[partition] + 64:
+            heap[:] = [
+                entry
+                for entry in heap
+                if self._waiting.get(entry[2]) == (entry[0], entry[1])
+            ]
+            heapq.heapify(heap)
+        self._cond.notify(1)
+        if (batching := self._batching.get(partition)) is not None:
+            batching.notify(1)
+
+    def _pop(self, partition: Hashable, now: float) -> KeyT:
+        """Hand out the first key of ``partition``, call after :meth:`_peek`."""
+        ready_at, _, key = heapq.heappop(self._heaps[partition])
+        del self._waiting[key]
+        self._sizes[partition] -= 1
+        self._processing[key] = now - ready_at
+        return key
+
+    def _peek(self, partition: Hashable) -> float | None:
+        """Ready time of the first waiting key of ``partition``, dropping outdated
+        heap entries.
+        """
+        heap = self._heaps.get(partition)
+        while heap:
+            ready_at, sequence, key = heap[0]
+            if self._waiting.get(key) == (ready_at, sequence):
+                return ready_at
+            heapq.heappop(heap)
+        return None
+
+    def _peek_any(self) -> tuple[Hashable, float | None]:
+        """The partition with the earliest ready key, and its ready time."""
+        first: tuple[Hashable, float | None] = (None, None)
+        for partition in self._heaps:
+            ready_at = self._peek(partition)
+            if ready_at is not None and (first[1] is None or ready_at < first[1]):
+                first = (partition, ready_at)
+        return first
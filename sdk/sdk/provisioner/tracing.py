@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from contextlib import AbstractContextManager
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from opentelemetry import trace
+from opentelemetry.trace import Status, StatusCode, TracerProvider
+
+from sdk.provisioner.instrumentation import Instrumentation
+
+if TYPE_CHECKING:
+    from sdk.provisioner.reconcile_manager import ResourceType
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """Traces every reconcile call as an OpenTelemetry span.
+
+    Requires the ``opentelemetry-api`` package; spans go to the global tracer
+    provider unless ``tracer_provider`` is given. Spans of calls with failed ids
+    get an error status, and exceptions raised by the reconciler are recorded.
+    """
+
+    def __init__(self, tracer_provider: TracerProvider | None = None) -> None:
+        self._tracer = trace.get_tracer(__name__, tracer_provider=tracer_provider)
+
+    def span(
+        self, resource_type: ResourceType, resource_ids: Sequence[UUID]
+    ) -> AbstractContextManager[object]:
+        return self._tracer.start_as_current_span(
+            f"reconcile {resource_type.value}",
+            attributes={
+                "dpp.resource_type": resource_type.value,
+                "dpp.resource_ids": [str(resource_id) for resource_id in resource_ids],
+                "dpp.batch_size": len(resource_ids),
+            },
+        )
+
+    def reconciled(
+        self,
+        resource_type: ResourceType,
+        duration: float,
+        succeeded: int,
+        failed: int,
+    ) -> None:
+        if failed:
+            trace.get_current_span().set_status(
+                Status(StatusCode.ERROR, f"{failed} of {succeeded + failed} failed")
+            )
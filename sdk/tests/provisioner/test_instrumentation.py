@@ -0,0 +1,166 @@
+import asyncio
+import uuid
+
+import pytest
+
+from sdk.provisioner.instrumentation import CombinedInstrumentation, Instrumentation
+from sdk.provisioner.reconcile_manager import (
+    ReconcileManager,
+    Reconciler,
+    ResourceType,
+)
+from sdk.provisioner.reconcile_queue import RateLimiter
+
+
+class FlakyReconciler(Reconciler):
+    """Fails the first reconcile of every id in ``fail_once``."""
+
+    def __init__(self) -> None:
+        self.fail_once: set[uuid.UUID] = set()
+        self.calls = 0
+
+    async def reconcile(self, resource_id: uuid.UUID):
+        self.calls += 1
+        if resource_id in self.fail_once:
+            self.fail_once.discard(resource_id)
+            raise RuntimeError("boom")
+
+
+class RecordingInstrumentation(Instrumentation):
+    def __init__(self) -> None:
+        self.depths: list[tuple[int, int, int]] = []
+        self.dequeued_times: list[float] = []
+        self.reconciles: list[tuple[int, int]] = []
+        self.requeue_delays: list[float] = []
+        self.spans: list[list[uuid.UUID]] = []
+
+    def queue_depth(self, waiting, in_flight, dirty):
+        self.depths.append((waiting, in_flight, dirty))
+
+    def dequeued(self, resource_type, time_in_queue):
+        self.dequeued_times.append(time_in_queue)
+
+    def reconciled(self, resource_type, duration, succeeded, failed):
+        assert duration >= 0
+        self.reconciles.append((succeeded, failed))
+
+    def requeued(self, resource_type, delay):
+        self.requeue_delays.append(delay)
+
+    def span(self, resource_type, resource_ids):
+        self.spans.append(list(resource_ids))
+        return super().span(resource_type, resource_ids)
+
+
+async def _run(
+    reconciler: FlakyReconciler, instrumentation: Instrumentation, ids, expected_calls
+):
+    manager = ReconcileManager(
+        {ResourceType.EXPLORATION: reconciler},
+        default_delay=0.0,
+        rate_limiter=RateLimiter(base_delay=0.01, max_delay=10),
+        instrumentation=instrumentation,
+    )
+    manager.start()
+    for resource_id in ids:
+        await manager.enqueue(ResourceType.EXPLORATION, resource_id)
+    deadline = asyncio.get_running_loop().time() + 2.0
+    while reconciler.calls < expected_calls:
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.05)
+    await manager.stop()
+
+
+async def test_manager_reports_reconciles_and_backoff():
+    reconciler = FlakyReconciler()
+    ids = [uuid.uuid4(), uuid.uuid4()]
+    reconciler.fail_once.add(ids[0])
+    instrumentation = RecordingInstrumentation()
+
+    await _run(reconciler, instrumentation, ids, expected_calls=3)
+
+    assert sorted(instrumentation.reconciles) == [(0, 1), (1, 0), (1, 0)]
+    assert instrumentation.requeue_delays == [0.01]
+    assert len(instrumentation.dequeued_times) == 3
+    assert sorted(map(tuple, instrumentation.spans)) == sorted(
+        [(ids[0],), (ids[0],), (ids[1],)]
+    )
+    assert instrumentation.depths[-1] == (0, 0, 0)
+
+
+async def test_combined_instrumentation_reports_to_each():
+    reconciler = FlakyReconciler()
+    first, second = RecordingInstrumentation(), RecordingInstrumentation()
+
+    await _run(
+        reconciler,
+        CombinedInstrumentation(first, second),
+        [uuid.uuid4()],
+        expected_calls=1,
+    )
+
+    assert first.reconciles == second.reconciles == [(1, 0)]
+    assert len(first.spans) == len(second.spans) == 1
+
+
+async def test_prometheus_instrumentation_exports_metrics():
+    prometheus_client = pytest.importorskip("prometheus_client")
+    from sdk.provisioner.prometheus import PrometheusInstrumentation
+
+    registry = prometheus_client.CollectorRegistry()
+    reconciler = FlakyReconciler()
+    resource_id = uuid.uuid4()
+    reconciler.fail_once.add(resource_id)
+
+    await _run(
+        reconciler,
+        PrometheusInstrumentation(registry=registry),
+        [resource_id],
+        expected_calls=2,
+    )
+
+    def sample(name, **labels):
+        return registry.get_sample_value(f"dpp_provisioner_{name}", labels)
+
+    exploration = ResourceType.EXPLORATION.value
+    assert sample("reconciles_total", resource_type=exploration, result="success") == 1
+    assert sample("reconciles_total", resource_type=exploration, result="failure") == 1
+    assert sample("reconcile_requeues_total", resource_type=exploration) == 1
+    assert sample("reconcile_duration_seconds_count", resource_type=exploration) == 2
+    assert sample("reconcile_queue_depth", state="in_flight") == 0
+
+
+async def test_opentelemetry_instrumentation_traces_reconciles():
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+    from opentelemetry.trace import StatusCode
+
+    from sdk.provisioner.tracing import OpenTelemetryInstrumentation
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    reconciler = FlakyReconciler()
+    resource_id = uuid.uuid4()
+    reconciler.fail_once.add(resource_id)
+
+    await _run(
+        reconciler,
+        OpenTelemetryInstrumentation(tracer_provider=provider),
+        [resource_id],
+        expected_calls=2,
+    )
+
+    spans = exporter.get_finished_spans()
+    assert [span.name for span in spans] == ["reconcile exploration"] * 2
+    assert [span.status.status_code for span in spans] == [
+        StatusCode.ERROR,
+        StatusCode.UNSET,
+    ]
+    assert spans[0].events[0].name == "exception"
+    assert spans[0].attributes["dpp.resource_ids"] == (str(resource_id),)
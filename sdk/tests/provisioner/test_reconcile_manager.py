@@ -7,7 +7,9 @@ from fastapi import Request
 from fastapi.datastructures import Headers
 
 from sdk.provisioner.reconcile_manager import (
+    IdPage,
     ReconcileEventHandler,
+    ReconcileKey,
     ReconcileManager,
     Reconciler,
     ResourceType,
@@ -212,6 +214,103 @@ async def test_initial_sync_retries_listing_then_succeeds():
     assert set(reconciler.calls) == set(ids)
 
 
+class StreamingReconciler(RecordingReconciler):
+    """Yields its ids one at a time, recording the queue depth at each."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.manager: ReconcileManager | None = None
+        self.queue_sizes: list[int] = []
+
+    async def list_ids(self):
+        for resource_id in self.ids_to_list:
+            assert self.manager is not None
+            self.queue_sizes.append(self.manager.queue.qsize())
+            yield resource_id
+
+
+async def test_initial_sync_streams_ids_below_high_water_mark():
+    reconciler = StreamingReconciler()
+    ids = [uuid.uuid4() for _ in range(20)]
+    reconciler.ids_to_list = ids
+    reconciler.delay = 0.01
+    manager = _manager(
+        reconciler, default_delay=0.0, num_workers=2, sync_high_water_mark=3
+    )
+    reconciler.manager = manager
+    manager.start()
+
+    await _drain(reconciler, expected=len(ids))
+    await asyncio.sleep(0.05)
+    await manager.stop()
+
+    assert set(reconciler.calls) == set(ids)
+    assert max(reconciler.queue_sizes) <= 3
+
+
+class PagedReconciler(RecordingReconciler):
+    """Lists its ids in pages of two, failing once on the page at ``fail_cursor``."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.cursors: list[str | None] = []
+        self.fail_cursor: str | None = None
+
+    async def list_ids_page(self, cursor: str | None) -> IdPage:
+        self.cursors.append(cursor)
+        if cursor is not None and cursor == self.fail_cursor:
+            self.fail_cursor = None
+            raise RuntimeError("page boom")
+        start = int(cursor or 0)
+        end = start + 2
+        return IdPage(
+            ids=self.ids_to_list[start:end],
+            next_cursor=str(end) if end < len(self.ids_to_list) else None,
+        )
+
+
+async def test_paged_initial_sync_resumes_at_failed_page():
+    reconciler = PagedReconciler()
+    ids = [uuid.uuid4() for _ in range(5)]
+    reconciler.ids_to_list = ids
+    reconciler.fail_cursor = "2"
+    manager = _manager(reconciler, default_delay=0.0, num_workers=1)
+    manager.start()
+
+    await _drain(reconciler, expected=len(ids), timeout=3.0)
+    await asyncio.sleep(0.05)
+    await manager.stop()
+
+    assert reconciler.cursors == [None, "2", "2", "4"]
+    assert reconciler.list_ids_calls == 0
+    assert sorted(reconciler.calls) == sorted(ids)
+
+
+async def test_initial_sync_reports_progress():
+    reconciler = RecordingReconciler()
+    ids = [uuid.uuid4() for _ in range(3)]
+    reconciler.ids_to_list = ids
+    reconciler.fail_times[ids[0]] = 1
+    manager = _manager(
+        reconciler,
+        default_delay=0.0,
+        num_workers=1,
+        rate_limiter=RateLimiter(base_delay=0.01, max_delay=10),
+    )
+    manager.start()
+
+    await _drain(reconciler, expected=len(ids) + 1)
+    await asyncio.sleep(0.05)
+    await _enqueue(manager, ids[1])
+    await _drain(reconciler, expected=len(ids) + 2)
+    await asyncio.sleep(0.05)
+    await manager.stop()
+
+    progress = manager.sync_progress[ResourceType.EXPLORATION]
+    assert (progress.listed, progress.enqueued, progress.reconciled) == (3, 3, 3)
+    assert progress.done
+
+
 async def test_failure_requeues_with_backoff_then_succeeds():
     reconciler = RecordingReconciler()
     key = uuid.uuid4()
@@ -359,3 +458,150 @@ async def test_event_handler_ignores_unregistered_resource_type():
     )
     assert manager.queue.qsize() == 0
     await manager.stop()
+
+
+class BatchRecordingReconciler(RecordingReconciler):
+    """Reconciler that records every batch it is handed."""
+
+    batch_size = 3
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[list[uuid.UUID]] = []
+        self.fail_in_batch: set[uuid.UUID] = set()
+        self.raise_batches = 0
+
+    async def reconcile_batch(self, resource_ids):
+        self.batches.append(list(resource_ids))
+        self.calls.extend(resource_ids)
+        if self.raise_batches > 0:
+            self.raise_batches -= 1
+            raise RuntimeError("batch boom")
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        failed = self.fail_in_batch & set(resource_ids)
+        self.fail_in_batch -= failed
+        return failed
+
+
+async def test_batches_ready_keys():
+    reconciler = BatchRecordingReconciler()
+    reconciler.ids_to_list = [uuid.uuid4() for _ in range(7)]
+    manager = _manager(reconciler, default_delay=0.0, num_workers=1)
+    manager.start()
+
+    await _drain(reconciler, expected=7)
+    await manager.stop()
+
+    assert [len(batch) for batch in reconciler.batches] == [3, 3, 1]
+    assert reconciler.calls == reconciler.ids_to_list
+
+
+async def test_batch_lingers_for_more_keys():
+    reconciler = BatchRecordingReconciler()
+    reconciler.batch_linger = 0.2
+    manager = _manager(reconciler, default_delay=0.0, num_workers=1)
+    manager.start()
+    k1, k2 = uuid.uuid4(), uuid.uuid4()
+
+    await _enqueue(manager, k1)
+    await asyncio.sleep(0.05)
+    await _enqueue(manager, k2)
+
+    await _drain(reconciler, expected=2)
+    await manager.stop()
+
+    assert reconciler.batches == [[k1, k2]]
+
+
+async def test_batches_do_not_mix_resource_types():
+    exploration = BatchRecordingReconciler()
+    data_product = BatchRecordingReconciler()
+    manager = ReconcileManager(
+        {
+            ResourceType.EXPLORATION: exploration,
+            ResourceType.DATA_PRODUCT: data_product,
+        },
+        default_delay=0.0,
+        num_workers=1,
+    )
+    exp_ids = [uuid.uuid4() for _ in range(2)]
+    dp_ids = [uuid.uuid4() for _ in range(2)]
+    for exp_id, dp_id in zip(exp_ids, dp_ids):
+        await manager.enqueue(ResourceType.EXPLORATION, exp_id)
+        await manager.enqueue(ResourceType.DATA_PRODUCT, dp_id)
+    manager.start()
+
+    await _drain(exploration, expected=2)
+    await _drain(data_product, expected=2)
+    await manager.stop()
+
+    assert exploration.batches == [exp_ids]
+    assert data_product.batches == [dp_ids]
+
+
+async def test_batch_retries_only_failed_keys():
+    reconciler = BatchRecordingReconciler()
+    ok, failing = uuid.uuid4(), uuid.uuid4()
+    reconciler.fail_in_batch = {failing}
+    rate_limiter = RateLimiter(base_delay=0.05, max_delay=10, factor=2.0)
+    manager = _manager(
+        reconciler, default_delay=0.0, rate_limiter=rate_limiter, num_workers=1
+    )
+    await _enqueue(manager, ok)
+    await _enqueue(manager, failing)
+    manager.start()
+
+    await _drain(reconciler, expected=3)
+    await manager.stop()
+
+    assert reconciler.batches == [[ok, failing], [failing]]
+    assert rate_limiter.failures(ReconcileKey(ResourceType.EXPLORATION, failing)) == 0
+
+
+async def test_batch_exception_retries_whole_batch():
+    reconciler = BatchRecordingReconciler()
+    reconciler.raise_batches = 1
+    keys = [uuid.uuid4(), uuid.uuid4()]
+    rate_limiter = RateLimiter(base_delay=0.05, max_delay=10, factor=2.0)
+    manager = _manager(
+        reconciler, default_delay=0.0, rate_limiter=rate_limiter, num_workers=1
+    )
+    for key in keys:
+        await _enqueue(manager, key)
+    manager.start()
+
+    await _drain(reconciler, expected=4)
+    await manager.stop()
+
+    assert reconciler.batches == [keys, keys]
+
+
+async def test_key_added_during_batch_is_reconciled_again():
+    reconciler = BatchRecordingReconciler()
+    reconciler.delay = 0.1
+    manager = _manager(reconciler, default_delay=0.0, num_workers=2)
+    manager.start()
+    key = uuid.uuid4()
+
+    await _enqueue(manager, key)
+    while not reconciler.batches:
+        await asyncio.sleep(0.005)
+    await _enqueue(manager, key)
+
+    await _drain(reconciler, expected=2)
+    await asyncio.sleep(0.15)
+    await manager.stop()
+
+    assert reconciler.batches == [[key], [key]]
+
+
+async def test_default_reconcile_batch_reports_failures():
+    reconciler = RecordingReconciler()
+    ok, failing = uuid.uuid4(), uuid.uuid4()
+    reconciler.fail_times[failing] = 1
+
+    failed = await reconciler.reconcile_batch([ok, failing])
+
+    assert list(failed) == [failing]
+    assert reconciler.calls == [ok, failing]
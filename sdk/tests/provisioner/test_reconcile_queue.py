@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 
 from sdk.provisioner.reconcile_queue import (
@@ -22,3 +23,141 @@ def test_rate_limiter_backoff_progression():
 def test_queue_default_delay():
     q = DelayingDeduplicatingQueue()
     assert q.default_delay == DEFAULT_DELAY
+
+
+async def test_queue_returns_keys_in_ready_order():
+    q: DelayingDeduplicatingQueue[str] = DelayingDeduplicatingQueue()
+    await q.add("late", delay=0.05)
+    await q.add("early", delay=0.0)
+    await q.add("middle", delay=0.02)
+
+    assert [await q.get() for _ in range(3)] == ["early", "middle", "late"]
+
+
+async def test_queue_coalesces_and_shortens_delay():
+    q: DelayingDeduplicatingQueue[str] = DelayingDeduplicatingQueue()
+    await q.add("a", delay=60.0)
+    await q.add("b", delay=0.01)
+    await q.add("a", delay=0.0)
+    await q.add("a", delay=30.0)
+
+    assert await q.get() == "a"
+    assert await q.get() == "b"
+    assert q.qsize() == 2
+    assert not q._waiting and not any(q._heaps.values())
+
+
+async def test_queue_requeues_dirty_key_on_done():
+    q: DelayingDeduplicatingQueue[str] = DelayingDeduplicatingQueue()
+    await q.add("a", delay=0.0)
+    assert await q.get() == "a"
+    await q.add("a", delay=0.0)
+    assert q.qsize() == 1
+
+    await q.done("a")
+
+    assert await asyncio.wait_for(q.get(), timeout=1.0) == "a"
+
+
+async def test_queue_wakes_a_waiting_worker_per_key():
+    q: DelayingDeduplicatingQueue[int] = DelayingDeduplicatingQueue()
+    workers = [asyncio.create_task(q.get()) for _ in range(4)]
+    await asyncio.sleep(0)
+
+    await q.add(1, delay=0.0)
+    await q.add(2, delay=0.0)
+    done, pending = await asyncio.wait(workers, timeout=0.1)
+
+    assert sorted(task.result() for task in done) == [1, 2]
+    await q.shutdown()
+    assert await asyncio.gather(*pending) == [None, None]
+
+
+async def test_queue_wakes_worker_when_earlier_key_is_added():
+    q: DelayingDeduplicatingQueue[str] = DelayingDeduplicatingQueue()
+    await q.add("late", delay=60.0)
+    worker = asyncio.create_task(q.get())
+    await asyncio.sleep(0)
+
+    await q.add("now", delay=0.0)
+
+    assert await asyncio.wait_for(worker, timeout=1.0) == "now"
+
+
+async def test_queue_heap_stays_bounded_when_delays_shrink():
+    q: DelayingDeduplicatingQueue[str] = DelayingDeduplicatingQueue()
+    for i in range(1000):
+        await q.add("a", delay=1000.0 - i)
+
+    assert len(q._heaps[None]) <= 2 * len(q._waiting) + 64
+
+
+async def test_queue_drains_many_keys():
+    q: DelayingDeduplicatingQueue[int] = DelayingDeduplicatingQueue()
+    for key in range(20_000):
+        await q.add(key, delay=0.0)
+
+    received = [await q.get() for _ in range(20_000)]
+
+    assert received == list(range(20_000))
+
+
+async def test_queue_counts_keys_by_state():
+    q: DelayingDeduplicatingQueue[str] = DelayingDeduplicatingQueue()
+    await q.add("a", delay=0.0)
+    await q.add("b", delay=60.0)
+    key = await q.get()
+    await q.add(key)
+
+    assert (q.num_waiting(), q.num_in_flight(), q.num_dirty()) == (1, 1, 1)
+
+
+async def test_queue_time_in_queue_excludes_delay():
+    q: DelayingDeduplicatingQueue[str] = DelayingDeduplicatingQueue()
+    await q.add("a", delay=0.05)
+    key = await q.get()
+
+    assert 0.0 <= q.time_in_queue(key) < 0.05
+    await q.done(key)
+    assert q.time_in_queue(key) == 0.0
+
+
+async def test_queue_returns_keys_of_all_partitions_in_ready_order():
+    q: DelayingDeduplicatingQueue[str] = DelayingDeduplicatingQueue(
+        partition=lambda key: key[0]
+    )
+    await q.add("a-late", delay=0.05)
+    await q.add("b-early", delay=0.0)
+    await q.add("a-middle", delay=0.02)
+
+    assert [await q.get() for _ in range(3)] == ["b-early", "a-middle", "a-late"]
+
+
+async def test_queue_get_ready_only_touches_its_partition():
+    q: DelayingDeduplicatingQueue[str] = DelayingDeduplicatingQueue(
+        partition=lambda key: key[0]
+    )
+    for i in range(100):
+        await q.add(f"b{i}", delay=0.0)
+    await q.add("a1", delay=0.0)
+    await q.add("a2", delay=0.0)
+    heap = list(q._heaps["b"])
+
+    assert await q.get_ready("a", limit=5) == ["a1", "a2"]
+    assert q._heaps["b"] == heap
+    assert q.num_waiting() == 100
+
+
+async def test_queue_get_ready_lingers_for_keys_of_its_partition():
+    q: DelayingDeduplicatingQueue[str] = DelayingDeduplicatingQueue(
+        partition=lambda key: key[0]
+    )
+    batch = asyncio.create_task(q.get_ready("a", limit=1, linger=5.0))
+    worker = asyncio.create_task(q.get())
+    await asyncio.sleep(0)
+
+    await q.add("b1", delay=0.0)
+    await q.add("a1", delay=0.0)
+
+    assert await asyncio.wait_for(worker, timeout=1.0) == "b1"
+    assert await asyncio.wait_for(batch, timeout=1.0) == ["a1"]
@@ -0,0 +1,81 @@
+import httpx
+import pytest
+
+from sdk.api_client.api.configuration_domains import get_domains
+from sdk.api_client.client import Client
+from sdk.api_client.errors import UnexpectedStatus
+from sdk.pagination import apaginate, paginate
+
+DOMAINS = [
+    {
+        "id": f"00000000-0000-0000-0000-00000000000{i}",
+        "name": f"domain-{i}",
+        "description": "",
+        "abstract_data_product_count": 0,
+    }
+    for i in range(5)
+]
+
+
+def _client(requests: list[httpx.Request]) -> Client:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        limit = int(request.url.params["limit"])
+        start = int(request.url.params.get("cursor", 0))
+        body: dict = {"domains": DOMAINS[start : start + limit]}
+        if start + limit < len(DOMAINS):
+            body["next_cursor"] = str(start + limit)
+        return httpx.Response(200, json=body)
+
+    transport = httpx.MockTransport(handler)
+    return Client(
+        base_url="http://portal",
+        httpx_args={"transport": transport},
+    )
+
+
+def test_paginate_follows_cursors():
+    requests: list[httpx.Request] = []
+    domains = list(
+        paginate(get_domains, "domains", client=_client(requests), page_size=2)
+    )
+
+    assert [domain.name for domain in domains] == [d["name"] for d in DOMAINS]
+    assert len(requests) == 3
+    assert "cursor" not in requests[0].url.params
+    assert requests[1].url.params["cursor"] == "2"
+
+
+def test_paginate_is_lazy():
+    requests: list[httpx.Request] = []
+    domains = paginate(get_domains, "domains", client=_client(requests), page_size=2)
+
+    next(domains)
+    assert len(requests) == 1
+
+
+async def test_apaginate_follows_cursors():
+    requests: list[httpx.Request] = []
+    domains = [
+        domain
+        async for domain in apaginate(
+            get_domains, "domains", client=_client(requests), page_size=2
+        )
+    ]
+
+    assert [domain.name for domain in domains] == [d["name"] for d in DOMAINS]
+    assert len(requests) == 3
+
+
+def test_paginate_raises_on_error_response():
+    client = Client(
+        base_url="http://portal",
+        httpx_args={
+            "transport": httpx.MockTransport(
+                lambda request: httpx.Response(422, json={"detail": []})
+            )
+        },
+    )
+
+    with pytest.raises(UnexpectedStatus):
+        list(paginate(get_domains, "domains", client=client))